@@ -14,7 +14,10 @@ from .const import DOMAIN
 from .const.config import Config
 from .const.defaults import Defaults
 from .coordinator import UnifiedPriceCoordinator  # Import only the new coordinator
+from .coordinator.shared_store import SHARED_STORE_KEY
 from .api.base.session_manager import register_shutdown_task
+from .api.parsers.registry import PARSER_REGISTRY
+from .utils.byte_budget import BYTE_BUDGET_KEY
 from .utils.exchange_service import get_exchange_service
 from .price.currency_service import get_default_currency
 
@@ -117,6 +120,17 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await coordinator.async_close()
         hass.data[DOMAIN].pop(entry.entry_id)
 
+        # Pooled parsers hold the timezone service (and hass) of the entry
+        # that created them, and the shared store keeps raw payloads and
+        # series; drop them (and the byte budget) once no entry is left
+        if not any(
+            other.entry_id in hass.data[DOMAIN]
+            for other in hass.config_entries.async_entries(DOMAIN)
+        ):
+            PARSER_REGISTRY.clear()
+            hass.data[DOMAIN].pop(SHARED_STORE_KEY, None)
+            hass.data[DOMAIN].pop(BYTE_BUDGET_KEY, None)
+
     return unload_ok
 
 
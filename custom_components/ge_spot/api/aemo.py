@@ -9,6 +9,7 @@ import aiohttp
 
 from .base.api_client import ApiClient
 from .base.base_price_api import BasePriceAPI
+from .parsers.registry import get_parser
 from ..const.sources import Source
 from ..const.api import Aemo
 from ..const.currencies import Currency
@@ -250,6 +251,4 @@ class AemoAPI(BasePriceAPI):
         Returns:
             AemoParser instance
         """
-        from .parsers.aemo_parser import AemoParser
-
-        return AemoParser(timezone_service=self.timezone_service)
+        return get_parser(Source.AEMO, self.timezone_service)
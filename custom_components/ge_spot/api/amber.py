@@ -8,7 +8,7 @@ from aiohttp import ClientSession
 
 from .base.base_price_api import BasePriceAPI
 from .base.error_handler import retry_with_backoff
-from .parsers.amber_parser import AmberParser
+from .parsers.registry import get_parser
 from ..const.sources import Source
 from ..const.currencies import Currency
 from ..const.network import Network
@@ -143,4 +143,4 @@ class AmberAPI(BasePriceAPI):
         Returns:
             Parser instance
         """
-        return AmberParser()
+        return get_parser(Source.AMBER, self.timezone_service)
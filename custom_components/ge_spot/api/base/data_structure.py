@@ -1,5 +1,6 @@
 """Standardized data structure for price data."""
 
+import sys
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, asdict, field
 from datetime import datetime
@@ -41,6 +42,61 @@ class PriceStatistics:
         return asdict(self)
 
 
+@dataclass(frozen=True, slots=True)
+class FrozenPriceStatistics:
+    """Immutable, slotted price statistics.
+
+    Same fields as PriceStatistics, for results that are computed once and
+    then shared (e.g. memoized on IntervalPriceData) and so must not change.
+    Timestamps are interned, and empty statistics share one instance.
+    """
+
+    avg: Optional[float] = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+    min_timestamp: Optional[str] = None
+    max_timestamp: Optional[str] = None
+
+    @classmethod
+    def create(
+        cls,
+        avg: Optional[float] = None,
+        min: Optional[float] = None,
+        max: Optional[float] = None,
+        min_timestamp: Optional[str] = None,
+        max_timestamp: Optional[str] = None,
+    ) -> "FrozenPriceStatistics":
+        """Create statistics, returning the shared empty instance if all unset."""
+        if avg is None and min is None and max is None:
+            return EMPTY_PRICE_STATISTICS
+        return cls(
+            avg=avg,
+            min=min,
+            max=max,
+            min_timestamp=_intern(min_timestamp),
+            max_timestamp=_intern(max_timestamp),
+        )
+
+    @classmethod
+    def from_statistics(cls, stats: PriceStatistics) -> "FrozenPriceStatistics":
+        """Create a frozen copy of mutable statistics."""
+        return cls.create(
+            stats.avg, stats.min, stats.max, stats.min_timestamp, stats.max_timestamp
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+EMPTY_PRICE_STATISTICS = FrozenPriceStatistics()
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a string so repeated keys and timestamps share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 @dataclass
 class PeakHourStatistics(PriceStatistics):
     """Peak hour statistics."""
@@ -11,6 +11,15 @@ from ...timezone.timezone_utils import get_timezone_object  # Import helper
 
 _LOGGER = logging.getLogger(__name__)
 
+# Date + time formats tried in order for non-ISO timestamps
+_DATETIME_FORMATS = (
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d %H:%M:%S",
+    "%d.%m.%Y %H:%M",
+    "%m/%d/%Y %H:%M",
+    "%m/%d/%Y %H:%M:%S",  # US format with seconds
+)
+
 
 class BasePriceParser(ABC):
     """Base class for price data parsers."""
@@ -150,14 +159,7 @@ class BasePriceParser(ABC):
                 raise ValueError(f"Cannot parse ISO timestamp: {timestamp_str} - {e}")
 
         elif " " in timestamp_str:  # Date + time format (e.g. "2023-05-15 12:00")
-            formats = [
-                "%Y-%m-%d %H:%M",
-                "%Y-%m-%d %H:%M:%S",
-                "%d.%m.%Y %H:%M",
-                "%m/%d/%Y %H:%M",
-                "%m/%d/%Y %H:%M:%S",  # Added format with seconds for US
-            ]
-            for fmt in formats:
+            for fmt in _DATETIME_FORMATS:
                 try:
                     dt_naive = datetime.strptime(timestamp_str, fmt)
                     # Assume naive timestamps are in the source timezone
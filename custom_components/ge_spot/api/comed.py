@@ -12,7 +12,7 @@ from ..const.sources import Source
 from ..const.api import ComEd
 from ..const.energy import EnergyUnit
 from ..const.network import Network
-from .parsers.comed_parser import ComedParser
+from .parsers.registry import get_parser
 from ..utils.date_range import generate_date_ranges
 from .base.base_price_api import BasePriceAPI
 
@@ -99,7 +99,7 @@ class ComedAPI(BasePriceAPI):
         Returns:
             Parser instance
         """
-        return ComedParser()
+        return get_parser(Source.COMED, self.timezone_service)
 
     async def _fetch_data(self, client, area, reference_time):
         """Fetch data from ComEd 5-Minute Pricing API.
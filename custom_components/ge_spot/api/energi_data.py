@@ -9,7 +9,7 @@ from typing import Dict, Any
 from .base.api_client import ApiClient
 from ..const.sources import Source
 from ..const.network import Network
-from .parsers.energi_data_parser import EnergiDataParser
+from .parsers.registry import get_parser
 from ..utils.date_range import generate_date_ranges
 from .base.base_price_api import BasePriceAPI
 from .utils import fetch_with_retry
@@ -169,7 +169,7 @@ class EnergiDataAPI(BasePriceAPI):
         Returns:
             Parser instance
         """
-        return EnergiDataParser()
+        return get_parser(Source.ENERGI_DATA_SERVICE, self.timezone_service)
 
     async def _fetch_data(self, client, area, date_str):
         """Fetch data from Energi Data Service.
@@ -7,7 +7,7 @@ from typing import Dict, Any, Optional
 from .base.api_client import ApiClient
 from ..const.sources import Source
 from ..const.currencies import Currency
-from .parsers.energy_charts_parser import EnergyChartsParser
+from .parsers.registry import get_parser
 from .base.base_price_api import BasePriceAPI
 from .base.error_handler import ErrorHandler
 
@@ -40,7 +40,7 @@ class EnergyChartsAPI(BasePriceAPI):
         """
         super().__init__(config, session, timezone_service=timezone_service)
         self.error_handler = ErrorHandler(self.source_type)
-        self.parser = EnergyChartsParser(timezone_service=timezone_service)
+        self.parser = get_parser(Source.ENERGY_CHARTS, timezone_service)
 
     def _get_base_url(self) -> str:
         """Get the base URL for the API.
@@ -14,7 +14,7 @@ from ..const.areas import AreaMapping
 from ..const.config import Config
 from ..const.network import Network, ContentType
 from ..const.time import TimeFormat
-from .parsers.entsoe_parser import EntsoeParser
+from .parsers.registry import get_parser
 from .base.base_price_api import BasePriceAPI
 from .base.error_handler import ErrorHandler
 from .utils import fetch_with_retry
@@ -44,7 +44,7 @@ class EntsoeAPI(BasePriceAPI):
         """
         super().__init__(config, session, timezone_service=timezone_service)
         self.error_handler = ErrorHandler(self.source_type)
-        self.parser = EntsoeParser(timezone_service=timezone_service)
+        self.parser = get_parser(Source.ENTSOE, timezone_service)
 
     def _get_base_url(self) -> str:
         """Get the base URL for the API.
@@ -10,7 +10,7 @@ from ..const.currencies import Currency
 from ..const.areas import AreaMapping
 from ..const.time import TimeFormat
 from ..const.network import Network
-from .parsers.nordpool_parser import NordpoolParser
+from .parsers.registry import get_parser
 from ..utils.date_range import generate_date_ranges
 from .base.base_price_api import BasePriceAPI
 from .base.error_handler import ErrorHandler
@@ -41,7 +41,7 @@ class NordpoolAPI(BasePriceAPI):
         """
         super().__init__(config, session, timezone_service=timezone_service)
         self.error_handler = ErrorHandler(self.source_type)
-        self.parser = NordpoolParser(timezone_service=timezone_service)
+        self.parser = get_parser(Source.NORDPOOL, timezone_service)
 
     def _get_base_url(self) -> str:
         """Get the base URL for the API.
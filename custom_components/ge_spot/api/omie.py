@@ -6,7 +6,7 @@ import aiohttp
 from typing import Dict, Any, Optional
 
 from .base.base_price_api import BasePriceAPI
-from .parsers.omie_parser import OmieParser
+from .parsers.registry import get_parser
 from ..const.sources import Source
 from .base.api_client import ApiClient
 from ..const.network import Network
@@ -41,7 +41,7 @@ class OmieAPI(BasePriceAPI):
         super().__init__(config, session, timezone_service)
         self.area = config.get("area") if config else None
         self.error_handler = ErrorHandler(self.source_type)
-        self.parser = OmieParser(timezone_service=self.timezone_service)
+        self.parser = get_parser(Source.OMIE, self.timezone_service)
 
     def _get_base_url(self) -> str:
         """Get the base URL template for API requests.
@@ -8,8 +8,8 @@ from .energy_charts_parser import EnergyChartsParser
 from .omie_parser import OmieParser
 from .comed_parser import ComedParser
 from .stromligning_parser import StromligningParser
-
-from ...const.sources import Source
+from .amber_parser import AmberParser
+from .registry import ParserRegistry, get_parser
 
 
 def get_parser_for_source(source_type: str, timezone_service=None):
@@ -20,22 +20,11 @@ def get_parser_for_source(source_type: str, timezone_service=None):
         timezone_service: Optional timezone service
 
     Returns:
-        Parser instance for the source
+        Shared parser instance for the source (see registry.ParserRegistry)
     """
-    parsers = {
-        Source.NORDPOOL: NordpoolParser,
-        Source.ENTSOE: EntsoeParser,
-        Source.AEMO: AemoParser,
-        Source.ENERGI_DATA_SERVICE: EnergiDataParser,
-        Source.ENERGY_CHARTS: EnergyChartsParser,
-        Source.OMIE: OmieParser,
-        Source.COMED: ComedParser,
-        Source.STROMLIGNING: StromligningParser,
-    }
-
-    if source_type in parsers:
-        parser_class = parsers[source_type]
-        return parser_class(timezone_service=timezone_service)
+    parser = get_parser(source_type, timezone_service)
+    if parser is not None:
+        return parser
 
     # No fallback - unknown sources should raise an error
     raise ValueError(f"No parser available for source: {source_type}")
@@ -50,5 +39,8 @@ __all__ = [
     "OmieParser",
     "ComedParser",
     "StromligningParser",
+    "AmberParser",
+    "ParserRegistry",
+    "get_parser",
     "get_parser_for_source",
 ]
@@ -15,6 +15,9 @@ from ..interval_expander import convert_to_target_intervals
 
 _LOGGER = logging.getLogger(__name__)
 
+# Adjacent quotes where a comma between properties is missing
+_MISSING_COMMA_RE = re.compile(r'""')
+
 
 class ComedParser(BasePriceParser):
     """Parser for ComEd API responses."""
@@ -153,7 +156,7 @@ class ComedParser(BasePriceParser):
             # If that fails, try to fix the malformed JSON
             try:
                 # Add missing commas between properties
-                fixed_json = re.sub(r'""', '","', raw_data)
+                fixed_json = _MISSING_COMMA_RE.sub('","', raw_data)
                 # Fix array brackets if needed
                 if not fixed_json.startswith("["):
                     fixed_json = "[" + fixed_json
@@ -25,6 +25,8 @@ class EnergiDataParser(BasePriceParser):
             timezone_service: Optional timezone service
         """
         super().__init__(source, timezone_service)
+        # Naive timestamps are Danish local time
+        self._local_tz = ZoneInfo(TimezoneName.EUROPE_COPENHAGEN)
 
     def parse(self, raw_data: Any) -> Dict[str, Any]:
         """Parse Energi Data Service API response.
@@ -119,8 +121,7 @@ class EnergiDataParser(BasePriceParser):
 
                     # If datetime is naive (no timezone), localize it to Copenhagen time
                     if dt.tzinfo is None:
-                        copenhagen_tz = ZoneInfo(TimezoneName.EUROPE_COPENHAGEN)
-                        dt = dt.replace(tzinfo=copenhagen_tz)
+                        dt = dt.replace(tzinfo=self._local_tz)
 
                     # Convert to UTC for consistent storage
                     dt_utc = dt.astimezone(timezone.utc)
@@ -0,0 +1,123 @@
+"""Shared parser instances, built once per source and timezone."""
+
+import logging
+from typing import Any, Dict, Hashable, Optional, Tuple, Type
+
+from ...const.sources import Source
+from ...timezone.service import TimezoneService
+from ..base.price_parser import BasePriceParser
+from .aemo_parser import AemoParser
+from .amber_parser import AmberParser
+from .comed_parser import ComedParser
+from .energi_data_parser import EnergiDataParser
+from .energy_charts_parser import EnergyChartsParser
+from .entsoe_parser import EntsoeParser
+from .nordpool_parser import NordpoolParser
+from .omie_parser import OmieParser
+from .stromligning_parser import StromligningParser
+
+_LOGGER = logging.getLogger(__name__)
+
+PARSER_CLASSES: Dict[str, Type[BasePriceParser]] = {
+    Source.NORDPOOL: NordpoolParser,
+    Source.ENTSOE: EntsoeParser,
+    Source.STROMLIGNING: StromligningParser,
+    Source.ENERGI_DATA_SERVICE: EnergiDataParser,
+    Source.OMIE: OmieParser,
+    Source.AEMO: AemoParser,
+    Source.ENERGY_CHARTS: EnergyChartsParser,
+    Source.COMED: ComedParser,
+    Source.AMBER: AmberParser,
+}
+
+
+def timezone_key(timezone_service: Optional[TimezoneService]) -> Hashable:
+    """Key identifying the timezones a service resolves to.
+
+    Services for different entries that end up with the same system, area and
+    target timezones (and reference mode) get the same key, so they can share
+    parser instances.
+    """
+    if timezone_service is None:
+        return None
+    return (
+        str(getattr(timezone_service, "system_timezone", None)),
+        str(getattr(timezone_service, "area_timezone", None)),
+        str(getattr(timezone_service, "target_timezone", None)),
+        getattr(timezone_service, "timezone_reference", None),
+    )
+
+
+class ParserRegistry:
+    """Pool of parser instances keyed by source and timezone.
+
+    Parsers keep no state between parse() calls (everything a parse produces
+    is in its result), so one instance per source and timezone can serve
+    every entry and every update cycle, on the event loop or in the executor.
+    Building
+    a parser without a timezone service creates a fresh TimezoneService, which
+    the pool also avoids repeating.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._parsers: Dict[Tuple[str, Hashable], BasePriceParser] = {}
+        self._created = 0
+        self._reused = 0
+
+    def get(
+        self, source: str, timezone_service: Optional[TimezoneService] = None
+    ) -> Optional[BasePriceParser]:
+        """Get the shared parser for a source.
+
+        Args:
+            source: Source identifier
+            timezone_service: Timezone service of the requesting entry
+
+        Returns:
+            Parser instance, or None if there is no parser for the source
+        """
+        key = (source, timezone_key(timezone_service))
+        parser = self._parsers.get(key)
+        if parser is not None:
+            self._reused += 1
+            return parser
+
+        parser_class = PARSER_CLASSES.get(source)
+        if parser_class is None:
+            return None
+
+        parser = parser_class(timezone_service=timezone_service)
+        self._parsers[key] = parser
+        self._created += 1
+        _LOGGER.debug(
+            f"Created shared {parser_class.__name__} for timezone key {key[1]}"
+        )
+        return parser
+
+    def clear(self) -> None:
+        """Drop all pooled parsers."""
+        self._parsers.clear()
+
+    def get_info(self) -> Dict[str, Any]:
+        """Get pool statistics.
+
+        Returns:
+            Dictionary with pool size and creation/reuse counts
+        """
+        return {
+            "parsers": len(self._parsers),
+            "created": self._created,
+            "reused": self._reused,
+        }
+
+
+# Process-wide pool shared by all config entries
+PARSER_REGISTRY = ParserRegistry()
+
+
+def get_parser(
+    source: str, timezone_service: Optional[TimezoneService] = None
+) -> Optional[BasePriceParser]:
+    """Get the shared parser for a source from the process-wide registry."""
+    return PARSER_REGISTRY.get(source, timezone_service)
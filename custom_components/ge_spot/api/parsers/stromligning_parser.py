@@ -12,6 +12,14 @@ from ...const.energy import EnergyUnit  # Add this import
 
 _LOGGER = logging.getLogger(__name__)
 
+# Common Stromligning timestamp formats, tried when ISO parsing fails
+_TIMESTAMP_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S",  # ISO without timezone
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%dT%H",  # Date with hour only
+)
+
 
 class StromligningParser(BasePriceParser):
     """Parser for Stromligning API responses."""
@@ -32,18 +40,16 @@ class StromligningParser(BasePriceParser):
             raw_data: Raw API response data
 
         Returns:
-            Parsed data with interval prices
+            Parsed data with interval prices and their price components
         """
         result = {
             "interval_raw": {},
+            "price_components": {},
             "currency": Currency.DKK,
             "timezone": "Europe/Copenhagen",
             "source_unit": EnergyUnit.KWH,  # Stromligning provides prices in kWh
         }
 
-        # Reset price components
-        self._price_components = {}
-
         # Check for valid data
         if not raw_data:
             _LOGGER.warning("Empty Stromligning data received")
@@ -169,8 +175,9 @@ class StromligningParser(BasePriceParser):
 
         Args:
             prices: List of price data
-            result: Result dictionary to update
+            result: Result dictionary to update (interval_raw, price_components)
         """
+        price_components = result["price_components"]
         for price_data in prices:
             # Ensure essential keys exist
             if (
@@ -243,7 +250,7 @@ class StromligningParser(BasePriceParser):
                         if "details" in price_data and isinstance(
                             price_data["details"], dict
                         ):
-                            self._price_components[interval_key] = {}
+                            price_components[interval_key] = {}
                             for component_name, component_data in price_data[
                                 "details"
                             ].items():
@@ -253,7 +260,7 @@ class StromligningParser(BasePriceParser):
                                 ):
                                     try:
                                         component_value = float(component_data["value"])
-                                        self._price_components[interval_key][
+                                        price_components[interval_key][
                                             component_name
                                         ] = component_value
                                     except (ValueError, TypeError):
@@ -270,7 +277,7 @@ class StromligningParser(BasePriceParser):
                                         ):
                                             try:
                                                 sub_value = float(sub_data["value"])
-                                                self._price_components[interval_key][
+                                                price_components[interval_key][
                                                     f"{component_name}.{sub_name}"
                                                 ] = sub_value
                                             except (ValueError, TypeError):
@@ -289,14 +296,6 @@ class StromligningParser(BasePriceParser):
             else:
                 _LOGGER.debug(f"Skipping invalid price item structure: {price_data}")
 
-    def get_price_components(self) -> Dict[str, Dict[str, float]]:
-        """Get price components extracted during parsing.
-
-        Returns:
-            Dictionary of price components per hour
-        """
-        return self._price_components
-
     def _parse_timestamp(self, timestamp_str: str) -> Optional[datetime]:
         """Parse timestamp from Stromligning format.
 
@@ -311,14 +310,7 @@ class StromligningParser(BasePriceParser):
             return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
         except (ValueError, AttributeError):
             # Try common Stromligning formats
-            formats = [
-                "%Y-%m-%dT%H:%M:%S",  # ISO without timezone
-                "%Y-%m-%d %H:%M:%S",
-                "%Y-%m-%d %H:%M",
-                "%Y-%m-%dT%H",  # Date with hour only
-            ]
-
-            for fmt in formats:
+            for fmt in _TIMESTAMP_FORMATS:
                 try:
                     return datetime.strptime(timestamp_str, fmt)
                 except (ValueError, TypeError):
@@ -8,7 +8,7 @@ import aiohttp
 from .base.api_client import ApiClient
 from ..const.sources import Source
 from ..const.currencies import Currency
-from .parsers.stromligning_parser import StromligningParser
+from .parsers.registry import get_parser
 from ..utils.date_range import generate_date_ranges
 from .base.base_price_api import BasePriceAPI
 from ..const.api import Stromligning
@@ -233,4 +233,4 @@ class StromligningAPI(BasePriceAPI):
             Parser instance
         """
         # Stromligning uses the same parser regardless of area
-        return StromligningParser()
+        return get_parser(Source.STROMLIGNING, self.timezone_service)
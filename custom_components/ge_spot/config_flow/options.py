@@ -13,6 +13,8 @@ from ..const.defaults import Defaults
 from ..const.time import TimezoneReference
 from ..api import get_sources_for_region
 from ..api import entsoe
+from ..price.price_profiles import parse_price_profiles
+from ..price.tariff_schedule import TariffSchedule
 from .schemas import get_options_schema, get_default_values
 
 _LOGGER = logging.getLogger(__name__)
@@ -86,6 +88,24 @@ class GSpotOptionsFlow(OptionsFlow):
                     # Remove the API key field from options to avoid duplication
                     user_input.pop(f"{Source.ENTSOE}_api_key")
 
+                # Reject a tariff schedule that cannot be parsed
+                if user_input.get(Config.TARIFF_SCHEDULE):
+                    try:
+                        TariffSchedule.from_config(user_input[Config.TARIFF_SCHEDULE])
+                    except ValueError as e:
+                        _LOGGER.warning(f"Invalid tariff schedule: {e}")
+                        self._errors[Config.TARIFF_SCHEDULE] = "invalid_tariff_schedule"
+                        return await self._show_form()
+
+                # Reject price profiles that cannot be parsed
+                if user_input.get(Config.PRICE_PROFILES):
+                    try:
+                        parse_price_profiles(user_input[Config.PRICE_PROFILES])
+                    except ValueError as e:
+                        _LOGGER.warning(f"Invalid price profiles: {e}")
+                        self._errors[Config.PRICE_PROFILES] = "invalid_price_profiles"
+                        return await self._show_form()
+
                 # Convert VAT from percentage to decimal if present
                 if Config.VAT in user_input:
                     user_input[Config.VAT] = user_input[Config.VAT] / 100
@@ -101,12 +121,14 @@ class GSpotOptionsFlow(OptionsFlow):
                     Config.IMPORT_MULTIPLIER,
                     Config.ADDITIONAL_TARIFF,
                     Config.ENERGY_TAX,
+                    Config.TARIFF_SCHEDULE,
                     Config.DISPLAY_UNIT,
                     # Export settings also affect cached prices
                     Config.EXPORT_ENABLED,
                     Config.EXPORT_MULTIPLIER,
                     Config.EXPORT_OFFSET,
                     Config.EXPORT_VAT,
+                    Config.PRICE_PROFILES,
                 ]
                 settings_changed = False
                 for setting in price_affecting_settings:
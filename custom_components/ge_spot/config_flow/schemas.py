@@ -181,6 +181,19 @@ def get_options_schema(defaults, supported_sources, area):
                 mode=selector.NumberSelectorMode.BOX,
             )
         ),
+        vol.Optional(
+            Config.TARIFF_SCHEDULE,
+            default=defaults.get(Config.TARIFF_SCHEDULE, Defaults.TARIFF_SCHEDULE),
+            description=(
+                "Time-of-use tariffs, one rule per line: "
+                "[HH:MM-HH:MM] [mon-fri] [nov-mar] = tariff.\n"
+                "First matching rule wins; other times use the additional tariff."
+            ),
+        ): selector.TextSelector(
+            selector.TextSelectorConfig(
+                type=selector.TextSelectorType.TEXT, multiline=True
+            )
+        ),
         vol.Optional(
             Config.DISPLAY_UNIT,
             default=defaults.get(Config.DISPLAY_UNIT, Defaults.DISPLAY_UNIT),
@@ -312,6 +325,20 @@ def get_options_schema(defaults, supported_sources, area):
         vol.Range(min=0.0, max=100.0),
     )
 
+    schema[
+        vol.Optional(
+            Config.PRICE_PROFILES,
+            default=defaults.get(Config.PRICE_PROFILES, Defaults.PRICE_PROFILES),
+            description=(
+                "Extra price formulas, one per line: name: [export|import] "
+                "multiplier=1 offset=0 vat=0.\n"
+                "Each gets its own sensors, computed from the same spot prices."
+            ),
+        )
+    ] = selector.TextSelector(
+        selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT, multiline=True)
+    )
+
     # Add Clear Cache button
     schema[vol.Optional("clear_cache", default=False)] = selector.BooleanSelector(
         selector.BooleanSelectorConfig()
@@ -345,6 +372,12 @@ def get_default_values(options, data):
             Config.ENERGY_TAX, data.get(Config.ENERGY_TAX, Defaults.ENERGY_TAX)
         )
 
+        # Time-of-use tariff schedule
+        defaults[Config.TARIFF_SCHEDULE] = options.get(
+            Config.TARIFF_SCHEDULE,
+            data.get(Config.TARIFF_SCHEDULE, Defaults.TARIFF_SCHEDULE),
+        )
+
         # Display unit
         defaults[Config.DISPLAY_UNIT] = options.get(
             Config.DISPLAY_UNIT, data.get(Config.DISPLAY_UNIT, Defaults.DISPLAY_UNIT)
@@ -392,6 +425,10 @@ def get_default_values(options, data):
             Config.EXPORT_VAT, data.get(Config.EXPORT_VAT, Defaults.EXPORT_VAT)
         )
         defaults[Config.EXPORT_VAT] = export_vat_decimal * 100
+        defaults[Config.PRICE_PROFILES] = options.get(
+            Config.PRICE_PROFILES,
+            data.get(Config.PRICE_PROFILES, Defaults.PRICE_PROFILES),
+        )
 
         return defaults
     except Exception as e:
@@ -12,6 +12,7 @@ class Config:
     IMPORT_MULTIPLIER = "import_multiplier"  # e.g. 0.1068 for Belgian tariffs
     ADDITIONAL_TARIFF = "additional_tariff"  # Energy provider fees (per kWh)
     ENERGY_TAX = "energy_tax"  # Government levy (per kWh, applied before VAT)
+    TARIFF_SCHEDULE = "tariff_schedule"  # Time-of-use additional tariff rules
     UPDATE_INTERVAL = "update_interval"
     DISPLAY_UNIT = "display_unit"
     CURRENCY = "currency"
@@ -20,8 +21,12 @@ class Config:
     # Cache Settings
     CACHE_MAX_ENTRIES = "cache_max_entries"
     CACHE_TTL = "cache_ttl"
+    CACHE_MAX_BYTES = "cache_max_bytes"  # Estimated in-memory byte budget
     PERSIST_CACHE = "persist_cache"
     CACHE_DIR = "cache_dir"  # Added cache directory config key
+    RAW_PAYLOAD_MAX_BYTES = "raw_payload_max_bytes"  # Compressed raw payload budget
+    ARCHIVE_RETENTION_YEARS = "archive_retention_years"  # Price history kept
+    PARSE_OFFLOAD_BYTES = "parse_offload_bytes"  # Payload size parsed off-loop
 
     # API & Network
     # API Keys (Sensitive - Handled separately)
@@ -64,3 +69,4 @@ class Config:
     )
     EXPORT_OFFSET = "export_offset"  # Offset added after multiplier (can be negative)
     EXPORT_VAT = "export_vat"  # VAT rate for export prices (often 0%)
+    PRICE_PROFILES = "price_profiles"  # Extra named import/export price formulas
@@ -13,6 +13,7 @@ class Defaults:
     IMPORT_MULTIPLIER = 1.0  # Default multiplier for import prices (1.0 = no scaling)
     ADDITIONAL_TARIFF = 0.0  # Default additional tariff (transfer fees, etc.) per kWh
     ENERGY_TAX = 0.0  # Default energy tax per kWh (applied before VAT)
+    TARIFF_SCHEDULE = ""  # No time-of-use rules: additional tariff applies always
     UPDATE_INTERVAL = 15  # Update every 15 minutes to match interval granularity
     # Display & Formatting
     DISPLAY_UNIT = DisplayUnit.DECIMAL
@@ -24,11 +25,30 @@ class Defaults:
     CACHE_TTL = 60 * 24 * 3  # minutes
     # Max entries: 3 days × 24h × 4 intervals × ~12 areas = ~3500
     CACHE_MAX_ENTRIES = 3500
+    # Integration-wide byte budget (estimated in-memory sizes) shared by the
+    # price caches of all entries. The raw payload store and in-memory archive
+    # years are reported alongside but bounded by their own caps. Entries range
+    # from a few KB to hundreds of KB, so this, not the entry count, is what
+    # bounds memory on small hardware.
+    CACHE_MAX_BYTES = 8 * 1024 * 1024
     # Disk persistence disabled to avoid blocking I/O in HA event loop
     # Cache is in-memory only (cleared on reload), enable via config if needed.
     # See: https://developers.home-assistant.io/docs/asyncio_blocking_op...
     PERSIST_CACHE = False
     CACHE_DIR = "cache"  # Cache directory for persistent storage (if enabled)
+    # Raw API payloads (XML/JSON) are kept compressed outside the price cache,
+    # capped at this many compressed bytes (oldest evicted first).
+    RAW_PAYLOAD_MAX_BYTES = 2 * 1024 * 1024
+    # Calendar years of price history kept in the archive per area (the
+    # current year counts as one).
+    ARCHIVE_RETENTION_YEARS = 2
+    # Fresh payloads at least this large (estimated bytes) are parsed and
+    # normalized in the executor instead of on the event loop. A day of
+    # ENTSO-E XML is ~30-60 KB per document; small JSON responses stay inline.
+    PARSE_OFFLOAD_BYTES = 32 * 1024
+    # Processed results kept for repeat runs on identical input (process-wide,
+    # keyed by payload digest, exchange rate and price config).
+    PROCESSING_MEMO_ENTRIES = 16
 
     # API & Network
 
@@ -64,3 +84,4 @@ class Defaults:
     EXPORT_MULTIPLIER = 1.0  # Default multiplier (1.0 = no scaling)
     EXPORT_OFFSET = 0.0  # Default offset (0.0 = no offset)
     EXPORT_VAT = 0.0  # Default export VAT (0.0 = no VAT, common for feed-in)
+    PRICE_PROFILES = ""  # No extra price formula profiles
@@ -105,8 +105,8 @@ class TimeInterval:
         Returns:
             92 (spring forward), 96 (normal), or 100 (fall back)
         """
-        # Import here to avoid circular dependency (DSTHandler uses TimeInterval)
-        from ..timezone.dst_handler import DSTHandler
+        # Import here to avoid circular dependency (the table uses TimeInterval)
+        from ..timezone.interval_table import get_interval_table
 
         # Normalize timezone to a ZoneInfo object.
         if isinstance(timezone_str, ZoneInfo):
@@ -133,17 +133,8 @@ class TimeInterval:
         if hasattr(date, "tzinfo") and date.tzinfo is None:
             date = date.replace(tzinfo=tz)
 
-        # Use DST handler to check if this is a transition day
-        dst_handler = DSTHandler(timezone=tz)
-        is_dst, dst_type = dst_handler.is_dst_transition_day(dt=date)
-
-        if is_dst:
-            if dst_type == DSTTransitionType.SPRING_FORWARD:
-                return TimeInterval.get_intervals_per_day_dst_spring()  # 92
-            else:  # FALL_BACK
-                return TimeInterval.get_intervals_per_day_dst_fall()  # 100
-        else:
-            return TimeInterval.get_intervals_per_day()  # 96
+        # The day's shared interval table knows its DST-aware length
+        return get_interval_table(date.date(), date.tzinfo).expected_intervals
 
 
 class TimeFormat:
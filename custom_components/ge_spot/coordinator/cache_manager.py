@@ -2,12 +2,16 @@
 
 import logging
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
 
 from ..utils.advanced_cache import AdvancedCache
+from ..utils.byte_budget import get_byte_budget
+from ..utils.cache_stats import CacheStats
+from ..utils.price_archive import PriceArchive, archive_series
+from ..utils.raw_payload_store import RawPayloadStore
 from ..const.defaults import Defaults
 from ..const.network import Network
 from .data_models import IntervalPriceData
@@ -18,12 +22,19 @@ _LOGGER = logging.getLogger(__name__)
 class CacheManager:
     """Manager for cache operations."""
 
-    def __init__(self, hass: HomeAssistant, config: Dict[str, Any]):
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config: Dict[str, Any],
+        raw_payload_store: Optional[RawPayloadStore] = None,
+    ):
         """Initialize the cache manager.
 
         Args:
             hass: Home Assistant instance
             config: Configuration dictionary
+            raw_payload_store: Optional (shared) store for raw API payloads;
+                a private one is created if not given
         """
         self.hass = hass
         self.config = config
@@ -35,7 +46,29 @@ class CacheManager:
             **config,
             "cache_ttl": default_ttl_minutes * Network.Defaults.SECONDS_PER_MINUTE,
         }
-        self._price_cache = AdvancedCache(hass, config_with_ttl_seconds)
+        # One byte budget for the whole integration, shared by the caches
+        # and stores of every entry
+        self.budget = get_byte_budget(hass, config)
+        self._price_cache = AdvancedCache(
+            hass, config_with_ttl_seconds, budget=self.budget
+        )
+        # Raw API payloads live in their own compressed, byte-capped store; the
+        # price cache only keeps a reference to them.
+        self.raw_payloads = (
+            raw_payload_store
+            if raw_payload_store is not None
+            else RawPayloadStore(hass, config, budget=self.budget)
+        )
+        # Decoded IntervalPriceData per cache key, alongside the stored dict it
+        # was decoded from. get_data() runs on every coordinator update (more
+        # than once on some fallback paths), so repeated reads reuse the same
+        # object instead of rebuilding it through from_cache_dict().
+        self._decoded_cache: Dict[str, Tuple[Dict[str, Any], IntervalPriceData]] = {}
+        # History beyond today/tomorrow, for range and aggregate queries
+        self.archive = PriceArchive(hass, config, budget=self.budget)
+        # get_data() outcomes per area/source (key-level counters live in
+        # AdvancedCache.stats)
+        self._lookup_stats = CacheStats()
 
     def store(
         self,
@@ -57,6 +90,11 @@ class CacheManager:
         # Convert IntervalPriceData to cache dict (only source data, no computed fields)
         cache_dict = data.to_cache_dict()
 
+        # Keep raw API payloads out of the price cache, storing only a reference
+        if cache_dict.get("raw_data"):
+            cache_dict["raw_data_ref"] = self.raw_payloads.put(cache_dict["raw_data"])
+            cache_dict["raw_data"] = None
+
         if not timestamp:
             timestamp = dt_util.utcnow()
         elif timestamp.tzinfo is None:
@@ -92,11 +130,24 @@ class CacheManager:
         }
 
         # Store only source data (no computed fields)
+        self._decoded_cache.pop(cache_key, None)
         self._price_cache.set(cache_key, cache_dict, metadata=metadata)
+        self._prune_decoded_cache()
         _LOGGER.debug(
             f"Stored IntervalPriceData for {area}/{source}/{actual_target_date}"
         )
 
+        # Day-ahead prices for a day are final once published, so each stored
+        # day is (re)written to the archive; later days stay queryable after
+        # the cache entry has expired.
+        if data.today_interval_prices:
+            self.archive.archive_day(
+                archive_series(area, data),
+                actual_target_date,
+                data.today_interval_prices,
+                data.target_timezone,
+            )
+
     def _generate_cache_key(self, area: str, source: str, target_date: date) -> str:
         """Generate a consistent cache key including the target date."""
         date_str = target_date.isoformat()  # Format date as YYYY-MM-DD
@@ -140,15 +191,41 @@ class CacheManager:
 
         Returns:
             IntervalPriceData instance, or None if not available or too old.
+            The instance is shared between calls until the entry is replaced,
+            so callers must not mutate it; wrap it in a PriceDataEnvelope for
+            per-update metadata, or use dataclasses.replace() to change prices.
         """
         # Get raw dict from cache
-        cache_dict = self._get_data_dict(area, target_date, source, max_age_minutes)
+        cache_key, cache_dict = self._get_data_entry(
+            area, target_date, source, max_age_minutes
+        )
 
         if not cache_dict:
+            self._lookup_stats.record("misses", f"{area}/{source or '*'}")
             return None
 
+        stats_group = f"{area}/{cache_dict.get('source') or source or '*'}"
+        self._lookup_stats.record("hits", stats_group)
+
+        # Reuse the decoded object if it was built from this exact stored dict
+        # with the current timezone service.
+        if cache_key is not None:
+            decoded = self._decoded_cache.get(cache_key)
+            if (
+                decoded is not None
+                and decoded[0] is cache_dict
+                and decoded[1]._tz_service is self._timezone_service
+            ):
+                self._lookup_stats.record("decoded_reuses", stats_group)
+                return decoded[1]
+
         # Convert to IntervalPriceData (properties will compute automatically)
-        return IntervalPriceData.from_cache_dict(cache_dict, self._timezone_service)
+        price_data = IntervalPriceData.from_cache_dict(
+            cache_dict, self._timezone_service
+        )
+        if cache_key is not None:
+            self._decoded_cache[cache_key] = (cache_dict, price_data)
+        return price_data
 
     def _get_data_dict(
         self,
@@ -162,6 +239,22 @@ class CacheManager:
         Returns:
             Dictionary with source data only, or None if not available.
         """
+        return self._get_data_entry(area, target_date, source, max_age_minutes)[1]
+
+    def _get_data_entry(
+        self,
+        area: str,
+        target_date: date,
+        source: Optional[str] = None,
+        max_age_minutes: Optional[int] = None,
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Internal method to retrieve the cache key and raw dict from cache.
+
+        Returns:
+            Tuple of (cache key, dictionary with source data only). The key is
+            None when the dict is not a stored entry (midnight migration result),
+            and both are None if nothing is available.
+        """
         # If source is specified, try that first using AdvancedCache.get()
         if source:
             cache_key = self._generate_cache_key(
@@ -186,18 +279,18 @@ class CacheManager:
                         _LOGGER.debug(
                             f"Cache hit for specific key {cache_key} within max_age."
                         )
-                        return entry_data
+                        return cache_key, entry_data
                     else:
                         _LOGGER.debug(
                             f"Cache entry {cache_key} found but is older than max_age_minutes ({max_age_minutes}) or metadata mismatch."
                         )
-                        return None  # Treat as expired for this request
+                        return None, None  # Treat as expired for this request
                 else:
                     # No max_age check needed, TTL check passed in .get()
                     _LOGGER.debug(
                         f"Cache hit for specific key: {cache_key} (TTL check only)."
                     )
-                    return entry_data  # Return the data part directly
+                    return cache_key, entry_data  # Return the data part directly
 
         # If specific source not found/expired or not specified, search all entries for the area AND date
         # Only log if source was specified but not found (actual fallback scenario)
@@ -240,7 +333,7 @@ class CacheManager:
                                 ):  # Ensure timezone aware for sorting
                                     created_at = created_at.replace(tzinfo=timezone.utc)
                                 valid_entries_with_timestamp.append(
-                                    (created_at, entry_data)
+                                    (created_at, key, entry_data)
                                 )
                             except Exception as e:
                                 _LOGGER.warning(
@@ -312,21 +405,44 @@ class CacheManager:
                             )
 
                             # Return as dict for now (will be converted back to IntervalPriceData by get_data)
-                            return price_data.to_cache_dict()
+                            return None, price_data.to_cache_dict()
 
         if not valid_entries_with_timestamp:
             _LOGGER.debug(
                 f"No valid (non-expired, within max_age) cache entries found for area {area} and date {target_date_str}"
             )
-            return None
+            return None, None
 
         # Sort valid entries by timestamp (datetime object), newest first
         valid_entries_with_timestamp.sort(key=lambda x: x[0], reverse=True)
         _LOGGER.debug(
             f"Found {len(valid_entries_with_timestamp)} valid cache entries for area {area} date {target_date_str}. Returning newest."
         )
-        # Return the data part of the newest valid entry
-        return valid_entries_with_timestamp[0][1]
+        # Return the key and data part of the newest valid entry
+        return valid_entries_with_timestamp[0][1:]
+
+    def get_raw_payload(self, price_data: IntervalPriceData) -> Any:
+        """Load the raw API payload behind price data, for diagnostics/reparsing.
+
+        Args:
+            price_data: IntervalPriceData carrying raw_data or raw_data_ref
+
+        Returns:
+            The raw payload, or None if it was never stored or has been evicted
+        """
+        if price_data.raw_data:
+            return price_data.raw_data
+        return self.raw_payloads.get(price_data.raw_data_ref)
+
+    def _prune_decoded_cache(self) -> None:
+        """Drop decoded objects whose cache entry was deleted or evicted."""
+        stale_keys = [
+            key
+            for key, (cache_dict, _) in self._decoded_cache.items()
+            if self._price_cache.peek(key) is not cache_dict
+        ]
+        for key in stale_keys:
+            del self._decoded_cache[key]
 
     def _is_entry_within_max_age(
         self, entry_info: Dict[str, Any], max_age_minutes: int
@@ -392,6 +508,7 @@ class CacheManager:
 
         deleted = False
         for key in keys_to_delete:
+            self._decoded_cache.pop(key, None)
             if self._price_cache.delete(key):
                 deleted = True
                 _LOGGER.debug("Deleted cache key %s", key)
@@ -411,6 +528,7 @@ class CacheManager:
             return False  # Or implement if needed, but less common use case
         else:
             # Clear all areas using AdvancedCache's clear method
+            self._decoded_cache.clear()
             self._price_cache.clear()
             _LOGGER.info("Cleared all cache entries.")
             return True  # Assume clear() succeeded if no exception
@@ -419,6 +537,7 @@ class CacheManager:
         """Clean up expired cache entries."""
         # Delegate to AdvancedCache's internal cleanup/eviction logic
         self._price_cache._evict_if_needed()
+        self._prune_decoded_cache()
         _LOGGER.debug("Cache cleanup triggered.")
 
     def update_cache(self, price_data: IntervalPriceData):
@@ -454,6 +573,27 @@ class CacheManager:
 
         self.store(area=area, source=source, data=price_data, target_date=target_date)
 
+    async def async_close(self) -> None:
+        """Release resources held for this entry.
+
+        Finishes and unmaps the archive, and stops charging the byte budget.
+        """
+        self._price_cache.close()
+        await self.archive.async_close()
+
     def get_cache_stats(self) -> Dict[str, Any]:
-        """Get statistics about the cache."""
-        return self._price_cache.get_info()
+        """Get statistics about the cache.
+
+        Returns:
+            Price cache info (entries, bytes in memory/on disk, key-level
+            counters and save/load/serialize timings), plus get_data() lookup
+            counters per area/source, the raw payload and archive stores and
+            the integration-wide byte budget.
+        """
+        return {
+            **self._price_cache.get_info(),
+            "byte_budget": self.budget.get_info(),
+            "lookups": self._lookup_stats.as_dict(),
+            "raw_payloads": self.raw_payloads.get_info(),
+            "archive": self.archive.get_info(),
+        }
@@ -11,17 +11,49 @@ Core Principle: Single Source of Truth
 """
 
 import logging
-from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+import sys
+from dataclasses import dataclass, field, fields
+from datetime import timedelta
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from homeassistant.util import dt as dt_util
 
-from ..api.base.data_structure import PriceStatistics
+from ..api.base.data_structure import EMPTY_PRICE_STATISTICS, FrozenPriceStatistics
 from ..const.time import TimeInterval
-from .data_validity import DataValidity, calculate_data_validity
+from ..utils.interval_series import IntervalSeries
+from ..utils.series_statistics import (
+    EMPTY_SUMMARY,
+    SeriesSummary,
+    summarize,
+)
+from .data_validity import (
+    EMPTY_DATA_VALIDITY,
+    FrozenDataValidity,
+    calculate_data_validity,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fields the computed properties depend on. Assigning any of them drops the
+# memoized results; other fields (last_updated, _error, ...) do not.
+_MEMO_INPUTS = frozenset(
+    {
+        "today_interval_prices",
+        "tomorrow_interval_prices",
+        "today_raw_prices",
+        "tomorrow_raw_prices",
+        "export_today_prices",
+        "export_tomorrow_prices",
+        "export_enabled",
+        "profile_today_prices",
+        "profile_tomorrow_prices",
+        "target_timezone",
+        "_tz_service",
+    }
+)
+
 
 @dataclass
 class IntervalPriceData:
@@ -66,6 +98,11 @@ class IntervalPriceData:
     export_tomorrow_prices: Dict[str, float] = field(default_factory=dict)
     export_enabled: bool = False  # Whether export prices are calculated
 
+    # Named price profile data: {profile name: {interval key: price}}, each
+    # calculated from spot prices with its own export-style formula
+    profile_today_prices: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    profile_tomorrow_prices: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
     # Source metadata
     source: str = ""
     area: str = ""
@@ -92,6 +129,8 @@ class IntervalPriceData:
     applied_import_multiplier: float = 1.0
     applied_additional_tariff: float = 0.0
     applied_energy_tax: float = 0.0
+    applied_tariff_schedule: str = ""  # TariffSchedule.version ("" for none)
+    applied_price_profiles: str = ""  # profiles_version() ("" for none)
 
     # Timestamps
     fetched_at: Optional[str] = None
@@ -121,125 +160,239 @@ class IntervalPriceData:
     # Attribution (for sources requiring it)
     data_source_attribution: Optional[str] = None
 
-    # Raw API data (for debugging)
+    # Raw API data (for debugging). Normally offloaded to the RawPayloadStore,
+    # leaving only raw_data_ref here; resolve it via CacheManager.get_raw_payload().
     raw_data: Optional[Dict[str, Any]] = None
+    raw_data_ref: Optional[str] = None
     raw_interval_prices_original: Optional[Dict[str, float]] = None
 
     # Timezone service (NOT serialized to cache)
     _tz_service: Optional[Any] = field(default=None, repr=False, compare=False)
 
-    # ========== COMPUTED PROPERTIES (NOT stored in cache) ==========
+    # Memoized computed properties live in instance attributes outside the
+    # dataclass fields (NOT serialized, compared or copied by replace()):
+    # _memo holds results that depend only on the prices, _interval_memo
+    # results that depend on the current interval, tagged by _interval_marker.
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, dropping memoized results if it is an input."""
+        object.__setattr__(self, name, value)
+        if name in _MEMO_INPUTS and (
+            "_memo" in self.__dict__ or "_interval_memo" in self.__dict__
+        ):
+            # Rebind rather than clear, so shallow copies never share results
+            object.__setattr__(self, "_memo", {})
+            object.__setattr__(self, "_interval_memo", {})
+
+    # ========== MEMOIZED PROPERTIES ==========
+    #
+    # Sensors read these once per entity per state write. Each is computed at
+    # most once per (price data, current interval): assigning a price field
+    # invalidates them, and interval-dependent ones are recomputed when the
+    # interval changes. Price dicts must be replaced, not mutated in place.
+
+    @property
+    def data_validity(self) -> FrozenDataValidity:
+        """Data validity computed from interval prices (see _compute_data_validity)."""
+        return self._memoized_per_interval("data_validity", self._compute_data_validity)
+
+    @property
+    def statistics(self) -> FrozenPriceStatistics:
+        """Statistics of today's prices (see _compute_statistics)."""
+        return self._memoized("statistics", self._compute_statistics)
+
+    @property
+    def tomorrow_statistics(self) -> FrozenPriceStatistics:
+        """Statistics of tomorrow's prices (see _compute_tomorrow_statistics)."""
+        return self._memoized("tomorrow_statistics", self._compute_tomorrow_statistics)
+
+    @property
+    def export_statistics(self) -> FrozenPriceStatistics:
+        """Statistics of today's export prices (see _compute_export_statistics)."""
+        return self._memoized("export_statistics", self._compute_export_statistics)
+
+    @property
+    def export_tomorrow_statistics(self) -> FrozenPriceStatistics:
+        """Statistics of tomorrow's export prices."""
+        return self._memoized(
+            "export_tomorrow_statistics", self._compute_export_tomorrow_statistics
+        )
+
+    @property
+    def current_price(self) -> Optional[float]:
+        """Current interval price (see _compute_current_price)."""
+        return self._memoized_per_interval("current_price", self._compute_current_price)
+
+    @property
+    def next_interval_price(self) -> Optional[float]:
+        """Next interval price (see _compute_next_interval_price)."""
+        return self._memoized_per_interval(
+            "next_interval_price", self._compute_next_interval_price
+        )
 
     @property
-    def data_validity(self) -> DataValidity:
+    def summaries(self) -> Dict[str, SeriesSummary]:
+        """Single-pass summaries of every price series.
+
+        Keys: today, tomorrow, today_raw, tomorrow_raw, export_today,
+        export_tomorrow, and profile_today:<name>/profile_tomorrow:<name> per
+        price profile. Computed together once per price data; all statistics
+        properties are views of these.
+        """
+        return self._memoized("summaries", self._compute_summaries)
+
+    @property
+    def today_series(self) -> IntervalSeries:
+        """Today's interval prices as an IntervalSeries (see _get_series)."""
+        return self._get_series("today_series", self.today_interval_prices, 0)
+
+    @property
+    def tomorrow_series(self) -> IntervalSeries:
+        """Tomorrow's interval prices as an IntervalSeries (see _get_series)."""
+        return self._get_series("tomorrow_series", self.tomorrow_interval_prices, 1)
+
+    def _get_series(
+        self, name: str, prices: Dict[str, float], days_ahead: int
+    ) -> IntervalSeries:
+        """Return prices as an array-backed series for their local day.
+
+        The series is built once per price data and day in target_timezone;
+        it is rebuilt when the prices are reassigned or the date rolls over.
+        """
+        try:
+            tz = ZoneInfo(self.target_timezone)
+        except (ValueError, TypeError, ZoneInfoNotFoundError):
+            tz = dt_util.DEFAULT_TIME_ZONE
+        day = (dt_util.now().astimezone(tz) + timedelta(days=days_ahead)).date()
+
+        series = self._memoized(
+            name, lambda: IntervalSeries.from_interval_prices(prices, day, tz)
+        )
+        if series.day != day or series.tz != tz:
+            series = IntervalSeries.from_interval_prices(prices, day, tz)
+            self.__dict__["_memo"][name] = series
+        return series
+
+    def _memoized(self, name: str, compute: Callable[[], Any]) -> Any:
+        """Return a memoized price-only result, computing it once."""
+        memo = self.__dict__.get("_memo")
+        if memo is None:
+            memo = {}
+            object.__setattr__(self, "_memo", memo)
+        try:
+            return memo[name]
+        except KeyError:
+            value = compute()
+            memo[name] = value
+            return value
+
+    def _memoized_per_interval(self, name: str, compute: Callable[[], Any]) -> Any:
+        """Return a memoized result that depends on the current interval.
+
+        The interval is identified by the absolute interval index of now and
+        the timezone service's current interval key, so results change exactly
+        when the unmemoized computation would.
+        """
+        if not self._tz_service:
+            return compute()  # Logs the missing service, as before
+        try:
+            marker = (
+                int(dt_util.now().timestamp()) // TimeInterval.get_interval_seconds(),
+                self._tz_service.get_current_interval_key(),
+            )
+        except Exception:
+            return compute()
+
+        memo = self.__dict__.get("_interval_memo")
+        if memo is None or self.__dict__.get("_interval_marker") != marker:
+            memo = {}
+            object.__setattr__(self, "_interval_memo", memo)
+            object.__setattr__(self, "_interval_marker", marker)
+
+        try:
+            return memo[name]
+        except KeyError:
+            value = compute()
+            memo[name] = value
+            return value
+
+    # ========== COMPUTED PROPERTIES (NOT stored in cache) ==========
+
+    def _compute_data_validity(self) -> FrozenDataValidity:
         """Calculate data validity from interval prices.
 
-        Always computed fresh from source data, ensuring accuracy.
+        Computed from source data (memoized per interval by data_validity).
         This eliminates the Issue #44 bug where validity wasn't recalculated
         after midnight migration.
 
         Returns:
-            DataValidity object with computed fields
+            FrozenDataValidity (shared between sensors, so read-only)
         """
         if not self._tz_service:
             _LOGGER.warning(
                 "Cannot calculate data_validity without timezone service. "
                 "Returning empty validity."
             )
-            return DataValidity()
+            return EMPTY_DATA_VALIDITY
 
         try:
             now = dt_util.now()
             current_interval_key = self._tz_service.get_current_interval_key()
 
-            return calculate_data_validity(
+            validity = calculate_data_validity(
                 interval_prices=self.today_interval_prices,
                 tomorrow_interval_prices=self.tomorrow_interval_prices,
                 now=now,
                 current_interval_key=current_interval_key,
                 target_timezone=self.target_timezone,
             )
+            return FrozenDataValidity.from_validity(validity)
         except Exception as e:
             _LOGGER.error(f"Error calculating data_validity: {e}", exc_info=True)
-            return DataValidity()
-
-    @property
-    def statistics(self) -> PriceStatistics:
+            return EMPTY_DATA_VALIDITY
+
+    def _compute_summaries(self) -> Dict[str, SeriesSummary]:
+        """Summarize all price series, one pass over each."""
+        series = {
+            "today": self.today_interval_prices,
+            "tomorrow": self.tomorrow_interval_prices,
+            "today_raw": self.today_raw_prices,
+            "tomorrow_raw": self.tomorrow_raw_prices,
+            "export_today": self.export_today_prices,
+            "export_tomorrow": self.export_tomorrow_prices,
+        }
+        for name, prices in self.profile_today_prices.items():
+            series[f"profile_today:{name}"] = prices
+        for name, prices in self.profile_tomorrow_prices.items():
+            series[f"profile_tomorrow:{name}"] = prices
+        summaries = {}
+        for name, prices in series.items():
+            try:
+                summaries[name] = summarize(prices) if prices else EMPTY_SUMMARY
+            except (TypeError, ValueError) as e:
+                _LOGGER.error(f"Error calculating {name} statistics: {e}")
+                summaries[name] = EMPTY_SUMMARY
+        return summaries
+
+    def _compute_statistics(self) -> FrozenPriceStatistics:
         """Calculate statistics from today's prices.
 
-        Computed on-demand from interval prices, always accurate.
+        Derived from the memoized single-pass summaries (see summaries).
 
         Returns:
-            PriceStatistics with avg, min, max
+            FrozenPriceStatistics with avg, min, max
         """
-        if not self.today_interval_prices:
-            return PriceStatistics()
-
-        try:
-            prices = list(self.today_interval_prices.values())
-
-            # Find min/max with timestamps
-            min_price = min(prices)
-            max_price = max(prices)
-
-            # Get timestamps for min/max
-            min_timestamp = None
-            max_timestamp = None
-            for key, price in self.today_interval_prices.items():
-                if price == min_price and min_timestamp is None:
-                    min_timestamp = key
-                if price == max_price and max_timestamp is None:
-                    max_timestamp = key
-
-            return PriceStatistics(
-                avg=sum(prices) / len(prices),
-                min=min_price,
-                max=max_price,
-                min_timestamp=min_timestamp,
-                max_timestamp=max_timestamp,
-            )
-        except Exception as e:
-            _LOGGER.error(f"Error calculating statistics: {e}", exc_info=True)
-            return PriceStatistics()
+        return self.summaries["today"].to_price_statistics()
 
-    @property
-    def tomorrow_statistics(self) -> PriceStatistics:
+    def _compute_tomorrow_statistics(self) -> FrozenPriceStatistics:
         """Calculate statistics from tomorrow's prices.
 
-        Computed on-demand from tomorrow's interval prices.
+        Derived from the memoized single-pass summaries (see summaries).
 
         Returns:
-            PriceStatistics with avg, min, max
+            FrozenPriceStatistics with avg, min, max
         """
-        if not self.tomorrow_interval_prices:
-            return PriceStatistics()
-
-        try:
-            prices = list(self.tomorrow_interval_prices.values())
-
-            # Find min/max with timestamps
-            min_price = min(prices)
-            max_price = max(prices)
-
-            # Get timestamps for min/max
-            min_timestamp = None
-            max_timestamp = None
-            for key, price in self.tomorrow_interval_prices.items():
-                if price == min_price and min_timestamp is None:
-                    min_timestamp = key
-                if price == max_price and max_timestamp is None:
-                    max_timestamp = key
-
-            return PriceStatistics(
-                avg=sum(prices) / len(prices),
-                min=min_price,
-                max=max_price,
-                min_timestamp=min_timestamp,
-                max_timestamp=max_timestamp,
-            )
-        except Exception as e:
-            _LOGGER.error(f"Error calculating tomorrow_statistics: {e}", exc_info=True)
-            return PriceStatistics()
+        return self.summaries["tomorrow"].to_price_statistics()
 
     @property
     def has_tomorrow_prices(self) -> bool:
@@ -252,8 +405,7 @@ class IntervalPriceData:
         """
         return bool(self.tomorrow_interval_prices)
 
-    @property
-    def current_price(self) -> Optional[float]:
+    def _compute_current_price(self) -> Optional[float]:
         """Get current interval price.
 
         Looks up price for the current interval key.
@@ -294,8 +446,7 @@ class IntervalPriceData:
             _LOGGER.error(f"Error getting current_raw_price: {e}", exc_info=True)
             return None
 
-    @property
-    def next_interval_price(self) -> Optional[float]:
+    def _compute_next_interval_price(self) -> Optional[float]:
         """Get next interval price.
 
         Looks up price for the next interval key.
@@ -411,79 +562,66 @@ class IntervalPriceData:
             )
             return None
 
-    @property
-    def export_statistics(self) -> PriceStatistics:
+    def _compute_export_statistics(self) -> FrozenPriceStatistics:
         """Calculate statistics from today's export prices.
 
+        Derived from the memoized single-pass summaries (see summaries).
+
         Returns:
-            PriceStatistics with avg, min, max for export prices
+            FrozenPriceStatistics with avg, min, max for export prices
         """
-        if not self.export_enabled or not self.export_today_prices:
-            return PriceStatistics()
-
-        try:
-            prices = list(self.export_today_prices.values())
-
-            min_price = min(prices)
-            max_price = max(prices)
-
-            min_timestamp = None
-            max_timestamp = None
-            for key, price in self.export_today_prices.items():
-                if price == min_price and min_timestamp is None:
-                    min_timestamp = key
-                if price == max_price and max_timestamp is None:
-                    max_timestamp = key
-
-            return PriceStatistics(
-                avg=sum(prices) / len(prices),
-                min=min_price,
-                max=max_price,
-                min_timestamp=min_timestamp,
-                max_timestamp=max_timestamp,
-            )
-        except Exception as e:
-            _LOGGER.error(f"Error calculating export_statistics: {e}", exc_info=True)
-            return PriceStatistics()
+        if not self.export_enabled:
+            return EMPTY_PRICE_STATISTICS
+        return self.summaries["export_today"].to_price_statistics()
 
-    @property
-    def export_tomorrow_statistics(self) -> PriceStatistics:
+    def _compute_export_tomorrow_statistics(self) -> FrozenPriceStatistics:
         """Calculate statistics from tomorrow's export prices.
 
+        Derived from the memoized single-pass summaries (see summaries).
+
+        Returns:
+            FrozenPriceStatistics with avg, min, max for tomorrow's export prices
+        """
+        if not self.export_enabled:
+            return EMPTY_PRICE_STATISTICS
+        return self.summaries["export_tomorrow"].to_price_statistics()
+
+    def profile_statistics(
+        self, name: str, day_offset: int = 0
+    ) -> FrozenPriceStatistics:
+        """Statistics of a price profile's prices for today (0) or tomorrow (1).
+
+        Derived from the memoized single-pass summaries (see summaries).
+
+        Args:
+            name: Price profile name
+            day_offset: 0 for today, 1 for tomorrow
+
         Returns:
-            PriceStatistics with avg, min, max for tomorrow's export prices
+            FrozenPriceStatistics with avg, min, max for the profile prices
         """
-        if not self.export_enabled or not self.export_tomorrow_prices:
-            return PriceStatistics()
+        day = "today" if day_offset == 0 else "tomorrow"
+        summary = self.summaries.get(f"profile_{day}:{name}")
+        return summary.to_price_statistics() if summary else EMPTY_PRICE_STATISTICS
+
+    def profile_current_price(self, name: str) -> Optional[float]:
+        """Get a price profile's current interval price.
+
+        Args:
+            name: Price profile name
+
+        Returns:
+            Current profile price or None if not available
+        """
+        if not self._tz_service:
+            return None
 
         try:
-            prices = list(self.export_tomorrow_prices.values())
-
-            min_price = min(prices)
-            max_price = max(prices)
-
-            min_timestamp = None
-            max_timestamp = None
-            for key, price in self.export_tomorrow_prices.items():
-                if price == min_price and min_timestamp is None:
-                    min_timestamp = key
-                if price == max_price and max_timestamp is None:
-                    max_timestamp = key
-
-            return PriceStatistics(
-                avg=sum(prices) / len(prices),
-                min=min_price,
-                max=max_price,
-                min_timestamp=min_timestamp,
-                max_timestamp=max_timestamp,
-            )
+            current_key = self._tz_service.get_current_interval_key()
+            return self.profile_today_prices.get(name, {}).get(current_key)
         except Exception as e:
-            _LOGGER.error(
-                f"Error calculating export_tomorrow_statistics: {e}", exc_info=True
-            )
-            return PriceStatistics()
-
-    # ========== METHODS ==========
+            _LOGGER.error(f"Error getting current price of profile {name}: {e}")
+            return None
 
     def migrate_to_new_day(self) -> None:
         """Migrate tomorrow's data to today after midnight.
@@ -513,6 +651,12 @@ class IntervalPriceData:
             self.export_today_prices = self.export_tomorrow_prices.copy()
             self.export_tomorrow_prices = {}
 
+        # And price profile prices
+        self.profile_today_prices = {
+            name: prices.copy() for name, prices in self.profile_tomorrow_prices.items()
+        }
+        self.profile_tomorrow_prices = {}
+
         # Mark as migrated
         self.migrated_from_tomorrow = True
         self.last_updated = dt_util.now().isoformat()
@@ -545,6 +689,9 @@ class IntervalPriceData:
             "export_today_prices": self.export_today_prices,
             "export_tomorrow_prices": self.export_tomorrow_prices,
             "export_enabled": self.export_enabled,
+            # Price profile data
+            "profile_today_prices": self.profile_today_prices,
+            "profile_tomorrow_prices": self.profile_tomorrow_prices,
             # Source metadata
             "source": self.source,
             "area": self.area,
@@ -565,6 +712,8 @@ class IntervalPriceData:
             "applied_import_multiplier": self.applied_import_multiplier,
             "applied_additional_tariff": self.applied_additional_tariff,
             "applied_energy_tax": self.applied_energy_tax,
+            "applied_tariff_schedule": self.applied_tariff_schedule,
+            "applied_price_profiles": self.applied_price_profiles,
             # Timestamps
             "fetched_at": self.fetched_at,
             "last_updated": self.last_updated,
@@ -586,6 +735,7 @@ class IntervalPriceData:
             "data_source_attribution": self.data_source_attribution,
             # Raw data
             "raw_data": self.raw_data,
+            "raw_data_ref": self.raw_data_ref,
             "raw_interval_prices_original": self.raw_interval_prices_original,
         }
 
@@ -614,6 +764,9 @@ class IntervalPriceData:
             export_today_prices=data.get("export_today_prices", {}),
             export_tomorrow_prices=data.get("export_tomorrow_prices", {}),
             export_enabled=data.get("export_enabled", False),
+            # Price profile data
+            profile_today_prices=data.get("profile_today_prices", {}),
+            profile_tomorrow_prices=data.get("profile_tomorrow_prices", {}),
             # Source metadata
             source=data.get("source", ""),
             area=data.get("area", ""),
@@ -634,6 +787,8 @@ class IntervalPriceData:
             applied_import_multiplier=data.get("applied_import_multiplier", 1.0),
             applied_additional_tariff=data.get("applied_additional_tariff", 0.0),
             applied_energy_tax=data.get("applied_energy_tax", 0.0),
+            applied_tariff_schedule=data.get("applied_tariff_schedule", ""),
+            applied_price_profiles=data.get("applied_price_profiles", ""),
             # Timestamps
             fetched_at=data.get("fetched_at"),
             last_updated=data.get("last_updated"),
@@ -655,6 +810,7 @@ class IntervalPriceData:
             data_source_attribution=data.get("data_source_attribution"),
             # Raw data
             raw_data=data.get("raw_data"),
+            raw_data_ref=data.get("raw_data_ref"),
             raw_interval_prices_original=data.get("raw_interval_prices_original"),
             # Timezone service (for property computation)
             _tz_service=tz_service,
@@ -670,3 +826,199 @@ class IntervalPriceData:
             f"tomorrow_intervals={len(self.tomorrow_interval_prices)}, "
             f"migrated={self.migrated_from_tomorrow})"
         )
+
+
+class PriceDataEnvelope:
+    """Per-update metadata around unchanged, shared price data.
+
+    Serving cached data changes only a few fields per update: the cached flag,
+    last_updated and sometimes an error. Instead of copying the whole
+    IntervalPriceData with dataclasses.replace, the envelope holds just those
+    and reads everything else, including memoized properties, from the
+    wrapped object. The wrapped object is treated as an immutable snapshot
+    and is never modified, so memoized results survive across updates.
+    """
+
+    __slots__ = (
+        "price_data",
+        "using_cached_data",
+        "last_updated",
+        "_error",
+        "_error_code",
+    )
+
+    def __init__(
+        self,
+        price_data: IntervalPriceData,
+        *,
+        using_cached_data: bool = True,
+        last_updated: Optional[str] = None,
+        error: Optional[str] = None,
+        error_code: Optional[str] = None,
+    ):
+        """Initialize the envelope.
+
+        Args:
+            price_data: Price data to serve (not copied or modified)
+            using_cached_data: Whether this update serves cached data
+            last_updated: Timestamp of this update (defaults to the data's)
+            error: Error message for this update, overriding the data's
+            error_code: Error code for this update, overriding the data's
+        """
+        if isinstance(price_data, PriceDataEnvelope):
+            price_data = price_data.price_data
+        self.price_data = price_data
+        self.using_cached_data = using_cached_data
+        self.last_updated = (
+            last_updated if last_updated is not None else price_data.last_updated
+        )
+        # Unset slots fall through to the wrapped data in __getattr__
+        if error is not None:
+            self._error = error
+        if error_code is not None:
+            self._error_code = error_code
+
+    def __getattr__(self, name: str) -> Any:
+        """Read anything not set on the envelope from the wrapped data."""
+        if name == "price_data":
+            raise AttributeError(name)
+        return getattr(self.price_data, name)
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"PriceDataEnvelope({self.price_data!r}, "
+            f"using_cached_data={self.using_cached_data}, "
+            f"last_updated={self.last_updated})"
+        )
+
+
+# Shared read-only empty containers for PriceDataSnapshot fields
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+_EMPTY_TUPLE: Tuple[Any, ...] = ()
+
+
+def _freeze(value: Any) -> Any:
+    """Convert a field value to its compact, read-only snapshot form.
+
+    Nested dicts and lists (per-profile price dicts, raw_data) are frozen as
+    well, so nothing reachable from a snapshot is shared with a mutable copy.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, (dict, MappingProxyType)):
+        if not value:
+            return _EMPTY_MAPPING
+        return MappingProxyType(
+            {
+                sys.intern(k) if isinstance(k, str) else k: _freeze_nested(v)
+                for k, v in value.items()
+            }
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_nested(v) for v in value) if value else _EMPTY_TUPLE
+    return value
+
+
+def _freeze_nested(value: Any) -> Any:
+    """Freeze a nested value (containers only; strings are not interned)."""
+    if isinstance(value, (dict, MappingProxyType, list, tuple)):
+        return _freeze(value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Convert a snapshot field value back to its mutable form (deep copy)."""
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class PriceDataSnapshot:
+    """Immutable, compact copy of an IntervalPriceData's source data.
+
+    IntervalPriceData carries a per-instance __dict__ and fresh empty dicts and
+    lists for every unused field. A snapshot has slots, read-only mappings and
+    tuples, one shared empty mapping/tuple for all empty fields, and interned
+    metadata strings and interval keys, so many areas (and copies made with
+    dataclasses.replace) cost a fraction of the memory.
+
+    Freezing is deep: nested dicts and lists (per-profile price dicts,
+    raw_data, _failed_sources) become read-only mappings and tuples, and
+    to_price_data() builds fresh containers, so a snapshot never shares
+    mutable state with the price data it was made from or converted to.
+    """
+
+    today_interval_prices: Mapping[str, float] = _EMPTY_MAPPING
+    tomorrow_interval_prices: Mapping[str, float] = _EMPTY_MAPPING
+    today_raw_prices: Mapping[str, float] = _EMPTY_MAPPING
+    tomorrow_raw_prices: Mapping[str, float] = _EMPTY_MAPPING
+    export_today_prices: Mapping[str, float] = _EMPTY_MAPPING
+    export_tomorrow_prices: Mapping[str, float] = _EMPTY_MAPPING
+    export_enabled: bool = False
+    profile_today_prices: Mapping[str, Mapping[str, float]] = _EMPTY_MAPPING
+    profile_tomorrow_prices: Mapping[str, Mapping[str, float]] = _EMPTY_MAPPING
+    source: str = ""
+    area: str = ""
+    source_currency: str = "EUR"
+    target_currency: str = "SEK"
+    source_timezone: str = "UTC"
+    target_timezone: str = "UTC"
+    ecb_rate: Optional[float] = None
+    ecb_updated: Optional[str] = None
+    vat_rate: float = 0.0
+    vat_included: bool = False
+    display_unit: str = "EUR/kWh"
+    applied_vat_rate: float = 0.0
+    applied_include_vat: bool = False
+    applied_import_multiplier: float = 1.0
+    applied_additional_tariff: float = 0.0
+    applied_energy_tax: float = 0.0
+    applied_tariff_schedule: str = ""  # TariffSchedule.version ("" for none)
+    applied_price_profiles: str = ""  # profiles_version() ("" for none)
+    fetched_at: Optional[str] = None
+    last_updated: Optional[str] = None
+    migrated_from_tomorrow: bool = False
+    original_cache_date: Optional[str] = None
+    attempted_sources: Tuple[Any, ...] = _EMPTY_TUPLE
+    fallback_sources: Tuple[Any, ...] = _EMPTY_TUPLE
+    using_cached_data: bool = False
+    _validated_sources: Tuple[Any, ...] = _EMPTY_TUPLE
+    _failed_sources: Mapping[str, Any] = _EMPTY_MAPPING
+    _error: Optional[str] = None
+    _error_code: Optional[str] = None
+    _consecutive_failures: int = 0
+    _all_attempted_sources: Tuple[Any, ...] = _EMPTY_TUPLE
+    data_source_attribution: Optional[str] = None
+    raw_data: Optional[Mapping[str, Any]] = None
+    raw_data_ref: Optional[str] = None
+    raw_interval_prices_original: Optional[Mapping[str, float]] = None
+
+    @classmethod
+    def from_price_data(cls, data: IntervalPriceData) -> "PriceDataSnapshot":
+        """Create a snapshot of an IntervalPriceData's source data.
+
+        Args:
+            data: Price data to snapshot (the timezone service is not kept)
+
+        Returns:
+            PriceDataSnapshot instance
+        """
+        return cls(**{f.name: _freeze(getattr(data, f.name)) for f in fields(cls)})
+
+    def to_price_data(self, tz_service: Optional[Any] = None) -> IntervalPriceData:
+        """Create a mutable IntervalPriceData from this snapshot.
+
+        Args:
+            tz_service: Timezone service for computing properties
+
+        Returns:
+            IntervalPriceData instance with its own containers
+        """
+        return IntervalPriceData(
+            **{f.name: _thaw(getattr(self, f.name)) for f in fields(self)},
+            _tz_service=tz_service,
+        )
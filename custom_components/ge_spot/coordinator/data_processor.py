@@ -2,42 +2,35 @@
 
 import logging
 import math
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Sequence, Tuple
 
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
 
 from ..utils.exchange_service import ExchangeRateService
+from ..utils.raw_payload_store import RawPayloadStore, encode_payload
+from ..utils.payload_size import estimate_payload_bytes
 from ..const.config import Config
 from ..const.defaults import Defaults
+from ..const.currencies import CurrencyInfo
 from ..const.display import DisplayUnit
-from ..const.time import TimeInterval
 from ..const.sources import Source
-from ..const.attributes import Attributes
 from ..const.energy import EnergyUnit
 from ..timezone.service import TimezoneService
-from ..api.base.data_structure import PriceStatistics
+from ..timezone.cycle_context import CycleContext
 from ..timezone.timezone_converter import TimezoneConverter
 from ..price.currency_converter import CurrencyConverter
+from ..price.price_profiles import parse_price_profiles, profiles_version
+from ..price.price_transform import compile_export_transform, transform_interval_prices
+from ..price.tariff_schedule import TariffSchedule
 from ..api.base.price_parser import BasePriceParser
-from .data_validity import DataValidity, calculate_data_validity, parse_interval_key
-from .data_models import IntervalPriceData
-
-# Parser imports for get_parser method
-from ..api.parsers.entsoe_parser import EntsoeParser
-from ..api.parsers.nordpool_parser import NordpoolParser
-from ..api.parsers.stromligning_parser import StromligningParser
-from ..api.parsers.energi_data_parser import EnergiDataParser
-from ..api.parsers.omie_parser import OmieParser
-from ..api.parsers.aemo_parser import AemoParser
-from ..api.parsers.energy_charts_parser import EnergyChartsParser
-from ..api.parsers.comed_parser import ComedParser
-from ..api.parsers.amber_parser import AmberParser
+from .data_models import IntervalPriceData, PriceDataSnapshot
+from .processing_memo import PROCESSING_MEMO, payload_digest
 
-_LOGGER = logging.getLogger(__name__)
+from ..api.parsers.registry import get_parser
 
-# Note: parse_interval_key is imported from data_validity module above
+_LOGGER = logging.getLogger(__name__)
 
 
 # NOTE: All API modules should return raw, unprocessed data in this standardized format:
@@ -67,6 +60,7 @@ class DataProcessor:
         tz_service: TimezoneService,
         # Accept the manager initially, get exchange_service later
         manager: Any,
+        raw_payload_store: Optional[RawPayloadStore] = None,
     ):
         """Initialize the data processor.
 
@@ -77,6 +71,8 @@ class DataProcessor:
             config: Configuration dictionary
             tz_service: Timezone service instance
             manager: Manager instance to retrieve services
+            raw_payload_store: Optional store that raw API payloads are offloaded
+                to, so processed results only carry a reference
         """
         self.hass = hass
         self.area = area
@@ -86,6 +82,7 @@ class DataProcessor:
         # Store manager to get exchange_service later
         self._manager = manager
         self._exchange_service: Optional[ExchangeRateService] = None
+        self._raw_payload_store = raw_payload_store
 
         # Extract config settings needed for processing
         # VAT is already stored as a decimal rate (e.g., 0.25 for 25%), not as a percentage
@@ -101,10 +98,25 @@ class DataProcessor:
             Config.ADDITIONAL_TARIFF, Defaults.ADDITIONAL_TARIFF
         )
         self.energy_tax = config.get(Config.ENERGY_TAX, Defaults.ENERGY_TAX)
+        # Time-of-use tariffs replacing additional_tariff where a rule matches
+        try:
+            self.tariff_schedule = TariffSchedule.from_config(
+                config.get(Config.TARIFF_SCHEDULE, Defaults.TARIFF_SCHEDULE),
+                default=self.additional_tariff,
+            )
+        except ValueError as e:
+            _LOGGER.error(
+                f"[{area}] Invalid tariff schedule, using the fixed additional tariff: {e}"
+            )
+            self.tariff_schedule = None
         self.display_unit = config.get(Config.DISPLAY_UNIT, Defaults.DISPLAY_UNIT)
         self.use_subunit = self.display_unit == DisplayUnit.CENTS
         # Use Defaults.PRECISION instead of DEFAULT_PRICE_PRECISION
         self.precision = config.get(Config.PRECISION, Defaults.PRECISION)
+        # Fresh payloads this large are parsed/normalized in the executor
+        self.parse_offload_bytes = config.get(
+            Config.PARSE_OFFLOAD_BYTES, Defaults.PARSE_OFFLOAD_BYTES
+        )
 
         # Export/Production price configuration
         # Export prices use formula: (spot_price × multiplier + offset) × (1 + export_vat)
@@ -114,6 +126,14 @@ class DataProcessor:
         )
         self.export_offset = config.get(Config.EXPORT_OFFSET, Defaults.EXPORT_OFFSET)
         self.export_vat = config.get(Config.EXPORT_VAT, Defaults.EXPORT_VAT)
+        # Extra named formulas evaluated in the same pass as export prices
+        try:
+            self.price_profiles = parse_price_profiles(
+                config.get(Config.PRICE_PROFILES, Defaults.PRICE_PROFILES)
+            )
+        except ValueError as e:
+            _LOGGER.error(f"[{area}] Invalid price profiles, ignoring them: {e}")
+            self.price_profiles = ()
 
         # Log import price configuration
         if self.import_multiplier != 1.0:
@@ -184,11 +204,20 @@ class DataProcessor:
             _LOGGER.error("Failed to initialize currency converter")
             raise RuntimeError("Currency converter could not be initialized.")
 
-    async def process(self, data: Dict[str, Any]) -> IntervalPriceData:
+    async def process(
+        self,
+        data: Dict[str, Any],
+        context: Optional[CycleContext] = None,
+        timestamp_axes: Optional[Dict[Hashable, Any]] = None,
+    ) -> IntervalPriceData:
         """Process raw API data and return IntervalPriceData.
 
         Args:
             data: Raw data from API adapter
+            context: Time context of the update cycle; every step reads "now"
+                from it (defaults to a new context at the current time)
+            timestamp_axes: Day-split timestamp axes shared with other areas
+                (see process_many)
 
         Returns:
             IntervalPriceData instance with processed prices and metadata
@@ -196,6 +225,8 @@ class DataProcessor:
         # Accepts raw data from API adapter (e.g. entsoe.py)
         # Expects keys: 'interval_raw', 'timezone', 'currency', 'source_name', ...
         await self._ensure_exchange_service()
+        cycle = context or CycleContext(self._tz_service)
+        today = self._cycle_today(cycle)
 
         source_name = data.get("data_source") or data.get("source")
         is_cached_data = data.get("using_cached_data", False)
@@ -203,8 +234,6 @@ class DataProcessor:
         input_interval_raw: Optional[Dict[str, Any]] = None
         input_source_timezone: Optional[str] = None
         input_source_currency: Optional[str] = None
-        parser_current_price: Optional[float] = None
-        parser_next_price: Optional[float] = None
 
         # Initialize these early to avoid possibly-used-before-assignment errors
         # They will be set properly in either the cached data path or fresh data path
@@ -229,6 +258,23 @@ class DataProcessor:
                 data, error="Missing source identifier"
             )
 
+        # Whether hashing, parsing and normalization run in the executor
+        # (large fresh payloads)
+        offload = not is_cached_data and self._should_offload(data, source_name)
+
+        # --- Step 0: Reuse the result of an identical earlier run ---
+        memo_key = await self._memo_key(data, today, offload)
+        if memo_key is not None:
+            snapshot = PROCESSING_MEMO.get(memo_key)
+            if snapshot is not None:
+                _LOGGER.debug(
+                    f"[{self.area}] Input from '{source_name}' unchanged since it was "
+                    f"last processed, reusing the result"
+                )
+                return await self._price_data_from_memo(
+                    snapshot, data, raw_api_data_for_result, offload
+                )
+
         # --- Step 1: Extract Raw Data (from cache or fresh API) ---
         if is_cached_data:
             _LOGGER.debug(
@@ -278,7 +324,7 @@ class DataProcessor:
 
             try:
                 # Pass the entire raw dictionary from FallbackManager/API Adapter to the parser
-                parsed_data = parser.parse(data)
+                parsed_data = await self._run_step(offload, parser.parse, data)
                 _LOGGER.debug(
                     f"[{self.area}] Parser {parser.__class__.__name__} output keys: {list(parsed_data.keys())}"
                 )
@@ -299,9 +345,6 @@ class DataProcessor:
                 input_interval_raw = parsed_data.get("interval_raw")
                 input_source_timezone = parsed_data.get("timezone")
                 input_source_currency = parsed_data.get("currency")
-                # Preserve parser-provided current/next prices (for real-time APIs like ComEd)
-                parser_current_price = parsed_data.get("current_price")
-                parser_next_price = parsed_data.get("next_interval_price")
                 # If parser extracted metadata (like raw_data from within), use it
                 if parsed_data.get("raw_data"):
                     raw_api_data_for_result = parsed_data.get("raw_data")
@@ -344,15 +387,13 @@ class DataProcessor:
         # --- Step 3: Normalize Timezones ---
         # Always normalize - converts ISO timestamps to 'HH:MM' keys in target timezone
         try:
-            normalized_prices = self._tz_converter.normalize_interval_prices(
+            normalized_today, normalized_tomorrow = await self._run_step(
+                offload,
+                self._normalize_and_split,
                 input_interval_raw,
                 input_source_timezone,
-                preserve_date=True,  # Keep date for today/tomorrow split
-            )
-
-            # Split into today/tomorrow
-            normalized_today, normalized_tomorrow = (
-                self._tz_converter.split_into_today_tomorrow(normalized_prices)
+                today,
+                timestamp_axes,
             )
 
             _LOGGER.debug(
@@ -383,6 +424,7 @@ class DataProcessor:
                     interval_prices=normalized_today,
                     source_currency=input_source_currency,
                     source_unit=source_unit,
+                    tariffs=self._day_tariffs(0, today),
                 )
             )
             final_today_prices = converted_today
@@ -397,6 +439,7 @@ class DataProcessor:
                     interval_prices=normalized_tomorrow,
                     source_currency=input_source_currency,
                     source_unit=source_unit,
+                    tariffs=self._day_tariffs(1, today),
                 )
             )
             final_tomorrow_prices = converted_tomorrow
@@ -406,414 +449,434 @@ class DataProcessor:
                 ecb_updated = rate_ts
 
         # --- Step 5: Build Result ---
-        processed_result = {
-            "source": source_name,  # Use source_name identified earlier
-            "area": self.area,
-            "source_currency": input_source_currency,  # Store the actual source currency used
-            "target_currency": self.target_currency,
-            "source_timezone": input_source_timezone,  # Store the actual source timezone used
-            "target_timezone": (
-                str(self._tz_service.target_timezone) if self._tz_service else None
-            ),
-            "today_interval_prices": final_today_prices,
-            "tomorrow_interval_prices": final_tomorrow_prices,
-            "today_raw_prices": raw_today_prices,  # Raw prices without VAT/taxes/tariffs
-            "tomorrow_raw_prices": raw_tomorrow_prices,  # Raw prices without VAT/taxes/tariffs
-            "raw_interval_prices_original": input_interval_raw,  # Store the raw prices that went INTO normalization
-            "current_price": None,
-            "next_interval_price": None,
-            "current_interval_key": None,
-            "next_interval_key": None,
-            "statistics": PriceStatistics().to_dict(),
-            "tomorrow_statistics": PriceStatistics().to_dict(),
-            "vat_rate": self.vat_rate * 100 if self.include_vat else 0,
-            "vat_included": self.include_vat,
-            "display_unit": self.display_unit,
-            # Stamp the exact price-affecting config applied, so the coordinator can
-            # detect option changes and reprocess instead of serving stale cache.
-            "applied_vat_rate": self.vat_rate,
-            "applied_include_vat": self.include_vat,
-            "applied_import_multiplier": self.import_multiplier,
-            "applied_additional_tariff": self.additional_tariff,
-            "applied_energy_tax": self.energy_tax,
-            "raw_data": raw_api_data_for_result,  # Store original raw API data (XML, JSON, etc.)
-            "ecb_rate": ecb_rate,
-            "ecb_updated": ecb_updated,
-            "has_tomorrow_prices": bool(final_tomorrow_prices),
-            "attempted_sources": data.get("attempted_sources", []),
-            "fallback_sources": data.get("fallback_sources", []),
-            "using_cached_data": is_cached_data,  # Reflect if this cycle used cache
-            "fetched_at": data.get("fetched_at"),
-            # Export/Production price data
-            "export_enabled": self.export_enabled,
-            "export_today_prices": {},
-            "export_tomorrow_prices": {},
-        }
-
-        # --- Calculate Export Prices (if enabled) ---
-        if self.export_enabled:
-            # Calculate export prices from raw prices (without import VAT/taxes)
+        # Offload the raw API response so it does not stay in memory with the prices
+        raw_data_ref = None
+        if self._raw_payload_store is not None and raw_api_data_for_result:
+            raw_data_ref = await self._store_raw_payload(
+                raw_api_data_for_result, offload
+            )
+            raw_api_data_for_result = None
+
+        # --- Calculate Export and Profile Prices (if configured) ---
+        export_today_prices: Dict[str, Any] = {}
+        export_tomorrow_prices: Dict[str, Any] = {}
+        profile_today_prices: Dict[str, Any] = {}
+        profile_tomorrow_prices: Dict[str, Any] = {}
+        if self.export_enabled or self.price_profiles:
+            # Calculate from raw prices (without import VAT/taxes), one pass per day
             # Note: raw_prices are already in display units (e.g., cents if use_subunit)
-            processed_result["export_today_prices"] = self._calculate_export_prices(
+            export_today_prices, profile_today_prices = self._calculate_derived_prices(
                 raw_today_prices
             )
-            processed_result["export_tomorrow_prices"] = self._calculate_export_prices(
-                raw_tomorrow_prices
+            export_tomorrow_prices, profile_tomorrow_prices = (
+                self._calculate_derived_prices(raw_tomorrow_prices)
             )
 
             _LOGGER.debug(
-                f"[{self.area}] Calculated export prices: today={len(processed_result['export_today_prices'])}, "
-                f"tomorrow={len(processed_result['export_tomorrow_prices'])}"
+                f"[{self.area}] Calculated export prices: today={len(export_today_prices)}, "
+                f"tomorrow={len(export_tomorrow_prices)}, "
+                f"profiles={len(self.price_profiles)}"
             )
 
         # --- Add Stromligning Attribution ---
+        data_source_attribution = None
         if source_name == Source.STROMLIGNING:
-            processed_result[Attributes.DATA_SOURCE_ATTRIBUTION] = (
+            data_source_attribution = (
                 "Data provided by Strømligning. https://stromligning.dk"
             )
         # --- End Attribution ---
 
-        # Initialize tomorrow_valid flag
-        processed_result["tomorrow_valid"] = False
-
-        # --- Step 6: Calculate Statistics and Current/Next Prices ---
-        try:
-            # Calculate Today's Statistics and Current/Next Prices
-            if final_today_prices:
-                current_interval_key = self._tz_service.get_current_interval_key()
-                next_interval_key = self._tz_service.get_next_interval_key()
-                processed_result["current_interval_key"] = current_interval_key
-                processed_result["next_interval_key"] = next_interval_key
-
-                # Use parser-provided current price if available (for real-time APIs like ComEd)
-                # Otherwise, look up the price for the current interval key
-                if (
-                    not is_cached_data
-                    and "parser_current_price" in locals()
-                    and parser_current_price is not None
-                ):
-                    processed_result["current_price"] = parser_current_price
-                    _LOGGER.debug(
-                        f"[{self.area}] Using parser-provided current price: {parser_current_price} "
-                        f"(source: {source_name})"
-                    )
-                else:
-                    processed_result["current_price"] = final_today_prices.get(
-                        current_interval_key
-                    )
-
-                # Use parser-provided next price if available
-                if (
-                    not is_cached_data
-                    and "parser_next_price" in locals()
-                    and parser_next_price is not None
-                ):
-                    processed_result["next_interval_price"] = parser_next_price
-                else:
-                    processed_result["next_interval_price"] = final_today_prices.get(
-                        next_interval_key
-                    )
-
-                # Fallback for interval-based pricing when current interval doesn't exist yet
-                # This handles cases where we have interval data but the current interval is incomplete
-                if (
-                    processed_result["current_price"] is None
-                    and source_name == Source.COMED
-                ):
-                    if final_today_prices:
-                        # Get the most recent available price (latest time key)
-                        most_recent_key = max(final_today_prices.keys())
-                        processed_result["current_price"] = final_today_prices[
-                            most_recent_key
-                        ]
-                        _LOGGER.debug(
-                            f"[{self.area}] ComEd: Current interval '{current_interval_key}' not available. "
-                            f"Using most recent price from interval '{most_recent_key}': {processed_result['current_price']}"
-                        )
-
-                today_keys = set(self._tz_service.get_today_range())
-                found_keys = set(final_today_prices.keys())
-                # Allow statistics if at least 80% of intervals are present
-                # Use DST-aware interval counting for today's date
-                today_date = dt_util.now(self._tz_service.area_timezone)
-                expected_intervals = TimeInterval.get_expected_intervals_for_date(
-                    today_date, self._tz_service.area_timezone
-                )
-                today_complete_enough = len(found_keys) >= math.ceil(
-                    expected_intervals * 0.8
-                )
-
-                if today_complete_enough:
-                    stats = self._calculate_statistics(final_today_prices, day_offset=0)
-                    # Mark as complete only if all intervals are present
-                    processed_result["statistics"] = stats.to_dict()
-                    _LOGGER.debug(
-                        f"Calculated today's statistics for {self.area}: {processed_result['statistics']}"
-                    )  # Log today's stats
-                else:
-                    missing_keys = sorted(list(today_keys - found_keys))
-                    # Update warning message threshold
-                    _LOGGER.info(
-                        f"Insufficient data for today ({len(found_keys)}/{len(today_keys)} keys found, need {math.ceil(expected_intervals * 0.8)}), skipping statistics calculation for {self.area}. Missing: {missing_keys[:10]}{'...' if len(missing_keys) > 10 else ''}"
-                    )
-                    processed_result["statistics"] = PriceStatistics().to_dict()
-            else:
-                _LOGGER.info(
-                    f"No final prices for today available after processing for area {self.area}, skipping stats."
-                )
-                processed_result["statistics"] = PriceStatistics().to_dict()
-
-            # Calculate Tomorrow's Statistics
-            if final_tomorrow_prices:
-                tomorrow_keys = set(self._tz_service.get_tomorrow_range())
-                found_keys = set(final_tomorrow_prices.keys())
-                # Allow statistics if at least 80% of intervals are present
-                # Use DST-aware interval counting for tomorrow's date
-                tomorrow_date = dt_util.now(self._tz_service.area_timezone) + timedelta(
-                    days=1
-                )
-                # Reconvert to timezone to update DST offset after timedelta
-                # Only reconvert if area_timezone is a real timezone object (not a Mock)
-                if hasattr(self._tz_service.area_timezone, "tzname"):
-                    tomorrow_date = tomorrow_date.astimezone(
-                        self._tz_service.area_timezone
-                    )
-                expected_intervals = TimeInterval.get_expected_intervals_for_date(
-                    tomorrow_date, self._tz_service.area_timezone
-                )
-                tomorrow_complete_enough = len(found_keys) >= math.ceil(
-                    expected_intervals * 0.8
-                )
-
-                if tomorrow_complete_enough:
-                    stats = self._calculate_statistics(
-                        final_tomorrow_prices, day_offset=1
-                    )
-                    # Mark as complete only if all intervals are present
-                    processed_result["tomorrow_statistics"] = stats.to_dict()
-                    # Set tomorrow_valid if we have enough data for stats, even if not fully complete
-                    processed_result["tomorrow_valid"] = True
-                    _LOGGER.debug(
-                        f"Calculated tomorrow's statistics for {self.area}: {processed_result['tomorrow_statistics']}"
-                    )  # Log tomorrow's stats
-                else:
-                    missing_keys = sorted(list(tomorrow_keys - found_keys))
-
-                    # Time-aware validation: Use DEBUG before publication time, WARNING after.
-                    # source_name was resolved at the top of process() from
-                    # data["data_source"] or data["source"]; DataProcessor itself is
-                    # source-agnostic so we look up the per-source schedule each call.
-                    now_utc = dt_util.utcnow()
-                    publication_hour_utc = Source.get_publication_time_utc(
-                        source_name or "unknown"
-                    )
-                    data_should_be_available = now_utc.hour >= publication_hour_utc
-
-                    log_message = (
-                        f"Insufficient data for tomorrow ({len(found_keys)}/{len(tomorrow_keys)} keys found, "
-                        f"need {math.ceil(expected_intervals * 0.8)}), skipping statistics calculation for {self.area}. "
-                        f"Missing: {missing_keys[:10]}{'...' if len(missing_keys) > 10 else ''}"
-                    )
-
-                    if data_should_be_available:
-                        # After publication time - this is concerning
-                        _LOGGER.warning(
-                            f"{log_message} (after expected publication time {publication_hour_utc}:00 UTC)"
-                        )
-                    else:
-                        # Before publication time - this is expected
-                        _LOGGER.debug(
-                            f"{log_message} (before publication time {publication_hour_utc}:00 UTC, this is normal)"
-                        )
-
-                    processed_result["tomorrow_statistics"] = (
-                        PriceStatistics().to_dict()
-                    )
-            else:
-                # No tomorrow prices, ensure stats reflect incompleteness
-                processed_result["tomorrow_statistics"] = PriceStatistics().to_dict()
-
-        except Exception as e:
-            _LOGGER.error(
-                f"Error during data processing for area {self.area}: {e}", exc_info=True
-            )
-            # Ensure exchange service is ready even on error path
-            try:
-                await self._ensure_exchange_service()
-            except Exception as init_err:
-                _LOGGER.error(
-                    f"Failed to ensure exchange service during error handling: {init_err}"
-                )
-            # Return structure with error, preserving original raw data if possible
-            error_result = self._generate_empty_processed_result(data, error=str(e))
-            error_result["raw_interval_prices_original"] = (
-                input_interval_raw  # Keep original raw input
-            )
-            return error_result
+        # --- Step 6: Check Completeness ---
+        # Statistics, current/next prices and data validity are computed from
+        # the prices by IntervalPriceData when read; only incomplete days are
+        # reported here.
+        self._log_incomplete_days(
+            cycle, source_name, final_today_prices, final_tomorrow_prices
+        )
 
-        # Ensure source_timezone is always set in processed_result
-        if not processed_result.get("source_timezone"):
+        # Ensure source_timezone is always set in the result
+        has_error = not input_source_timezone
+        if has_error:
             _LOGGER.error(
                 f"Source timezone ('source_timezone') is missing in the processed result for area {self.area} after processing. This indicates an issue."
             )
-            processed_result["error"] = (
-                processed_result.get("error", "")
-                + " Missing source timezone after processing."
-            )
 
-        # --- Step 7: Calculate Data Validity ---
-        # This tracks how far into the future we have valid price data
-        try:
-            now = dt_util.now()
-            current_interval_key = (
-                processed_result.get("current_interval_key")
-                or self._tz_service.get_current_interval_key()
-            )
-            # The interval_prices keys are already in target_timezone, so use that for validity timestamps
-            target_timezone = str(self._tz_service.target_timezone)
+        _LOGGER.info(
+            f"Successfully processed data for area {self.area}. Source: {source_name}, Today Prices: {len(final_today_prices)}, Tomorrow Prices: {len(final_tomorrow_prices)}, Cached: {is_cached_data}"
+        )
+        price_data = IntervalPriceData(
+            today_interval_prices=final_today_prices,
+            tomorrow_interval_prices=final_tomorrow_prices,
+            today_raw_prices=raw_today_prices,  # Raw prices without VAT/taxes/tariffs
+            tomorrow_raw_prices=raw_tomorrow_prices,  # Raw prices without VAT/taxes/tariffs
+            export_today_prices=export_today_prices,
+            export_tomorrow_prices=export_tomorrow_prices,
+            export_enabled=self.export_enabled,
+            profile_today_prices=profile_today_prices,
+            profile_tomorrow_prices=profile_tomorrow_prices,
+            source=source_name,
+            area=self.area,
+            source_currency=input_source_currency,  # The actual source currency used
+            target_currency=self.target_currency,
+            source_timezone=input_source_timezone,  # The actual source timezone used
+            target_timezone=(
+                str(self._tz_service.target_timezone) if self._tz_service else None
+            ),
+            ecb_rate=ecb_rate,
+            ecb_updated=ecb_updated,
+            vat_rate=self.vat_rate * 100 if self.include_vat else 0,
+            vat_included=self.include_vat,
+            display_unit=self.display_unit,
+            # Stamp the exact price-affecting config applied, so the coordinator can
+            # detect option changes and reprocess instead of serving stale cache.
+            applied_vat_rate=self.vat_rate,
+            applied_include_vat=self.include_vat,
+            applied_import_multiplier=self.import_multiplier,
+            applied_additional_tariff=self.additional_tariff,
+            applied_energy_tax=self.energy_tax,
+            applied_tariff_schedule=self.tariff_schedule_version,
+            applied_price_profiles=self.price_profiles_version,
+            fetched_at=data.get("fetched_at"),
+            attempted_sources=data.get("attempted_sources", []),
+            fallback_sources=data.get("fallback_sources", []),
+            using_cached_data=is_cached_data,  # Reflect if this cycle used cache
+            data_source_attribution=data_source_attribution,
+            raw_data=raw_api_data_for_result,  # Original raw API data (XML, JSON, etc.)
+            raw_data_ref=raw_data_ref
+            or data.get("raw_data_ref"),  # Reference into the raw payload store
+            raw_interval_prices_original=input_interval_raw,  # The raw prices that went INTO normalization
+            _tz_service=self._tz_service,
+        )
+        if memo_key is not None and not has_error:
+            PROCESSING_MEMO.put(memo_key, PriceDataSnapshot.from_price_data(price_data))
+        return price_data
 
-            validity = calculate_data_validity(
-                interval_prices=processed_result["today_interval_prices"],
-                tomorrow_interval_prices=processed_result["tomorrow_interval_prices"],
-                now=now,
-                current_interval_key=current_interval_key,
-                target_timezone=target_timezone,  # Keys are in this timezone
-            )
+    @staticmethod
+    async def process_many(
+        jobs: Sequence[Tuple["DataProcessor", Dict[str, Any]]],
+        now: Optional[datetime] = None,
+    ) -> List[IntervalPriceData]:
+        """Process the data of several areas as one batch.
 
-            processed_result["data_validity"] = validity.to_dict()
-            _LOGGER.info(f"Data validity for {self.area}: {validity}")
+        Areas served by the same source in the same timezone (Nordpool zones,
+        ENTSO-E CET areas) receive identical timestamp lists. The batch parses
+        and maps each distinct timestamp axis to today/tomorrow keys once;
+        every area then only places its own values on that axis before the
+        per-area currency conversion, statistics and validity steps.
 
-        except Exception as e:
-            _LOGGER.error(
-                f"Error calculating data validity for {self.area}: {e}", exc_info=True
+        Args:
+            jobs: (processor, raw data) pairs, one per area
+            now: Instant of the batch (defaults to the current time); all
+                areas are processed as of this one instant
+
+        Returns:
+            IntervalPriceData for each job, in the order of jobs
+        """
+        now = now or dt_util.utcnow()
+        timestamp_axes: Dict[Hashable, Any] = {}
+        results = []
+        for processor, data in jobs:
+            results.append(
+                await processor.process(
+                    data,
+                    context=CycleContext(processor._tz_service, now),
+                    timestamp_axes=timestamp_axes,
+                )
             )
-            # Add empty validity on error
-            processed_result["data_validity"] = DataValidity().to_dict()
+        _LOGGER.debug(
+            f"Processed {len(results)} areas over {len(timestamp_axes)} timestamp axes"
+        )
+        return results
+
+    @property
+    def config_stamp(self) -> Tuple[Any, ...]:
+        """Every setting the processed prices depend on (see the processing memo)."""
+        return (
+            self.target_currency,
+            self.display_unit,
+            self.precision,
+            self.vat_rate,
+            self.include_vat,
+            self.import_multiplier,
+            self.additional_tariff,
+            self.energy_tax,
+            self.tariff_schedule_version,
+            self.export_enabled,
+            self.export_multiplier,
+            self.export_offset,
+            self.export_vat,
+            self.price_profiles_version,
+        )
 
-        _LOGGER.info(
-            f"Successfully processed data for area {self.area}. Source: {source_name}, Today Prices: {len(processed_result['today_interval_prices'])}, Tomorrow Prices: {len(processed_result['tomorrow_interval_prices'])}, Cached: {processed_result['using_cached_data']}"
+    @staticmethod
+    def _cycle_today(cycle: CycleContext) -> Optional[date]:
+        """Today's date in the display timezone, or None if it cannot be told."""
+        try:
+            return cycle.today
+        except (AttributeError, TypeError):
+            # No real timezone (e.g. a mocked service)
+            return None
+
+    async def _memo_key(
+        self, data: Dict[str, Any], local_date: Optional[date], offload: bool = False
+    ) -> Optional[Tuple[Any, ...]]:
+        """Key of an input in the processing memo, or None to always process it.
+
+        Results depend on the input, the exchange rate from its currency to
+        the target currency, the price config and the local date (which
+        intervals are today and tomorrow). The input is hashed in the
+        executor when offloading.
+        """
+        if local_date is None or self._exchange_service is None:
+            # Cannot tell the day apart, or the rate the result depends on
+            return None
+
+        digest = await self._run_step(offload, payload_digest, data)
+        if digest is None:
+            return None
+
+        # The rates conversion will use (get_rates refreshes aged-out rates)
+        rates = await self._exchange_service.get_rates()
+        rate_stamp = (
+            getattr(self._exchange_service, "last_update", None),
+            self._effective_rate(rates, self._input_currency(data)),
         )
-        # Convert to IntervalPriceData and return it directly (not converted to dict)
-        price_data = IntervalPriceData.from_cache_dict(
-            processed_result, self._tz_service
+        return (
+            self.area,
+            str(self._tz_service.target_timezone),
+            local_date,
+            digest,
+            rate_stamp,
+            self.config_stamp,
+        )
+
+    def _input_currency(self, data: Dict[str, Any]) -> Optional[str]:
+        """Currency of an unprocessed input (as the parser will report it)."""
+        return (
+            data.get("source_currency")
+            or data.get("currency")
+            or CurrencyInfo.REGION_TO_CURRENCY.get(self.area)
         )
+
+    def _effective_rate(
+        self, rates: Any, source_currency: Optional[str]
+    ) -> Optional[float]:
+        """Rate converting source_currency to the target currency, if known."""
+        if not isinstance(rates, dict) or not source_currency:
+            return None
+        if source_currency == self.target_currency:
+            return 1.0
+        source_rate = rates.get(source_currency)
+        target_rate = rates.get(self.target_currency)
+        if not source_rate or target_rate is None:
+            return None
+        return target_rate / source_rate
+
+    async def _price_data_from_memo(
+        self,
+        snapshot: PriceDataSnapshot,
+        data: Dict[str, Any],
+        raw_payload: Any,
+        offload: bool,
+    ) -> IntervalPriceData:
+        """Rebuild a memoized result with the fetch details of this input.
+
+        The raw payload the result refers to may have aged out of the raw
+        payload store since it was memoized, so it is refreshed there, or
+        stored again from this input.
+        """
+        price_data = snapshot.to_price_data(self._tz_service)
+        price_data.attempted_sources = data.get("attempted_sources", [])
+        price_data.fallback_sources = data.get("fallback_sources", [])
+        price_data.fetched_at = data.get("fetched_at")
+        raw_data_ref = price_data.raw_data_ref
+        if self._raw_payload_store is not None and not self._raw_payload_store.touch(
+            raw_data_ref
+        ):
+            raw_data_ref = (
+                await self._store_raw_payload(raw_payload, offload)
+                if raw_payload
+                else None
+            )
+        price_data.raw_data_ref = raw_data_ref or data.get("raw_data_ref")
         return price_data
 
-    def _get_parser(self, source_name: str) -> Optional[BasePriceParser]:
-        """Get the appropriate parser instance based on the source name."""
-
-        parser_map = {
-            # Use lowercase source names from Source constants
-            Source.NORDPOOL: NordpoolParser,
-            Source.ENTSOE: EntsoeParser,
-            Source.STROMLIGNING: StromligningParser,
-            Source.ENERGI_DATA_SERVICE: EnergiDataParser,
-            Source.OMIE: OmieParser,
-            Source.AEMO: AemoParser,
-            Source.ENERGY_CHARTS: EnergyChartsParser,
-            Source.COMED: ComedParser,
-            Source.AMBER: AmberParser,
-            # ... add mappings for other sources using Source.* constants ...
-        }
+    @property
+    def tariff_schedule_version(self) -> str:
+        """Version of the applied tariff schedule ("" when there is none)."""
+        return self.tariff_schedule.version if self.tariff_schedule else ""
 
-        parser_class = parser_map.get(source_name)
-        if parser_class:
-            # Pass timezone_service if needed by the parser's base class
-            return parser_class(timezone_service=self._tz_service)
-        return None
+    @property
+    def price_profiles_version(self) -> str:
+        """Version of the applied price profiles ("" when there are none)."""
+        return profiles_version(self.price_profiles)
 
-    def _calculate_statistics(
-        self, interval_prices: Dict[str, float], day_offset: int = 0
-    ) -> PriceStatistics:
-        """Calculate price statistics from a dictionary of interval prices (HH:MM keys).
+    def _day_tariffs(
+        self, day_offset: int, today: Optional[date] = None
+    ) -> Optional[Mapping[str, float]]:
+        """Time-of-use tariffs for today (0) or tomorrow (1), keyed by interval.
 
-        Also calculates timestamps for min/max values by finding the interval key with those values.
-        The timestamps are derived from the specified day (today + day_offset) in the HA timezone.
+        Compiled once per date and schedule (see TariffSchedule), so every
+        update cycle of the day reuses the same vector.
 
         Args:
-            interval_prices: Dictionary of interval prices with HH:MM keys
-            day_offset: Number of days offset from today (0=today, 1=tomorrow)
+            day_offset: 0 for today, 1 for tomorrow
+            today: Today's date in the display timezone (defaults to the
+                current date there)
         """
-        prices = [p for p in interval_prices.values() if p is not None]
-        if not prices:
-            return PriceStatistics()
-
-        min_price = min(prices)
-        max_price = max(prices)
-        avg_price = sum(prices) / len(prices)
-
-        # Find timestamps for min and max prices
-        # Get the first occurrence of min/max values
-        min_timestamp = None
-        max_timestamp = None
-
-        # Get the target date based on day_offset
-        now = dt_util.now()
-        target_date = (now + timedelta(days=day_offset)).date()
-
-        for interval_key, price in interval_prices.items():
-            if price == min_price and min_timestamp is None:
-                # Convert HH:MM key to full timestamp using target date
-                try:
-                    # Use the validation function that handles DST suffixes
-                    hour, minute = parse_interval_key(interval_key)
-                    timestamp_dt = datetime.combine(
-                        target_date,
-                        datetime.min.time().replace(hour=hour, minute=minute),
-                    )
-                    # Make it timezone-aware using the HA timezone
-                    timestamp_dt = now.replace(
-                        year=target_date.year,
-                        month=target_date.month,
-                        day=target_date.day,
-                        hour=hour,
-                        minute=minute,
-                        second=0,
-                        microsecond=0,
-                    )
-                    min_timestamp = timestamp_dt.isoformat()
-                except (ValueError, AttributeError) as e:
-                    _LOGGER.warning(
-                        f"Failed to convert interval key '{interval_key}' to timestamp: {e}"
-                    )
+        if self.tariff_schedule is None:
+            return None
+        target_tz = self._tz_service.target_timezone
+        today = today or datetime.now(target_tz).date()
+        day = today + timedelta(days=day_offset)
+        return self.tariff_schedule.tariffs_for_day(day, target_tz)
+
+    def _should_offload(self, data: Dict[str, Any], source: str) -> bool:
+        """Decide whether a fresh payload is processed in the executor.
+
+        Large payloads (several ENTSO-E XML documents, AEMO CSV, OMIE text)
+        take tens of milliseconds to hash, parse and normalize, which would
+        stall the event loop when many areas refresh at once.
+        """
+        if self.hass is None:
+            return False
+        size = estimate_payload_bytes(data)
+        if size < self.parse_offload_bytes:
+            return False
+        _LOGGER.debug(
+            f"[{self.area}] Processing {size} byte payload from {source} in executor"
+        )
+        return True
 
-            if price == max_price and max_timestamp is None:
-                # Convert HH:MM key to full timestamp using target date
-                try:
-                    # Use the validation function that handles DST suffixes
-                    hour, minute = parse_interval_key(interval_key)
-                    timestamp_dt = datetime.combine(
-                        target_date,
-                        datetime.min.time().replace(hour=hour, minute=minute),
-                    )
-                    # Make it timezone-aware using the HA timezone
-                    timestamp_dt = now.replace(
-                        year=target_date.year,
-                        month=target_date.month,
-                        day=target_date.day,
-                        hour=hour,
-                        minute=minute,
-                        second=0,
-                        microsecond=0,
-                    )
-                    max_timestamp = timestamp_dt.isoformat()
-                except (ValueError, AttributeError) as e:
-                    _LOGGER.warning(
-                        f"Failed to convert interval key '{interval_key}' to timestamp: {e}"
-                    )
+    async def _store_raw_payload(self, payload: Any, offload: bool) -> Optional[str]:
+        """Put a raw payload in the raw payload store.
+
+        When offloading, the payload is serialized, hashed and compressed in
+        the executor; only the insert into the store runs on the event loop.
+
+        Returns:
+            Reference into the store, or None if nothing was stored
+        """
+        if not offload:
+            return self._raw_payload_store.put(payload)
+        encoded = await self.hass.async_add_executor_job(encode_payload, payload)
+        if encoded is None:
+            return None
+        return self._raw_payload_store.put_encoded(*encoded)
+
+    async def _run_step(self, offload: bool, func, *args) -> Any:
+        """Run a synchronous processing step, in the executor if offloading."""
+        if offload:
+            return await self.hass.async_add_executor_job(func, *args)
+        return func(*args)
+
+    def _normalize_and_split(
+        self,
+        interval_raw: Dict[str, Any],
+        source_timezone: str,
+        today: Optional[date] = None,
+        timestamp_axes: Optional[Dict[Hashable, Any]] = None,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Normalize raw prices to target-timezone keys and split by day.
+
+        Both stages run in one pass (TimezoneConverter.split_by_day): each
+        interval goes straight into its day's dict, without a full normalized
+        copy of the payload in between. Only reads the timezone converter, so
+        it can run in a worker thread.
+
+        With shared timestamp_axes (a batch of areas), the timestamps are
+        mapped once per distinct axis and this area's values are placed on
+        the stored layout by position.
 
-            # Stop if we found both
-            if min_timestamp and max_timestamp:
-                break
+        Returns:
+            Tuple of (today prices, tomorrow prices) keyed by "HH:MM"
+        """
+        if timestamp_axes is not None and today is not None:
+            timestamps = tuple(interval_raw)
+            axis_key = (
+                timestamps,
+                source_timezone,
+                str(self._tz_service.target_timezone),
+                today,
+            )
+            layout = timestamp_axes.get(axis_key)
+            if layout is None:
+                layout = self._tz_converter.split_axis_by_day(
+                    timestamps, source_timezone, today
+                )
+                timestamp_axes[axis_key] = layout
+            values = list(interval_raw.values())
+            return tuple(
+                {key: values[i] for key, i in day_layout.items()}
+                for day_layout in layout
+            )
 
-        return PriceStatistics(
-            avg=avg_price,
-            min=min_price,
-            max=max_price,
-            min_timestamp=min_timestamp,
-            max_timestamp=max_timestamp,
+        return self._tz_converter.split_by_day(interval_raw, source_timezone, today)
+
+    def _get_parser(self, source_name: str) -> Optional[BasePriceParser]:
+        """Get the shared parser instance for the source name."""
+        return get_parser(source_name, self._tz_service)
+
+    def _log_incomplete_days(
+        self,
+        cycle: CycleContext,
+        source_name: str,
+        today_prices: Dict[str, Any],
+        tomorrow_prices: Dict[str, Any],
+    ) -> None:
+        """Log days with fewer than 80% of their intervals (DST-aware).
+
+        A short tomorrow is logged as a warning only after the source's
+        publication time; before it, missing prices are expected.
+        """
+        if not today_prices:
+            _LOGGER.info(
+                f"No final prices for today available after processing for area {self.area}, skipping stats."
+            )
+        else:
+            # Use DST-aware interval counting for today's date
+            expected_intervals = cycle.expected_intervals_today
+            needed = math.ceil(expected_intervals * 0.8)
+            if len(today_prices) < needed:
+                today_table = cycle.today_table
+                missing_keys = today_table.missing(today_prices)
+                _LOGGER.info(
+                    f"Insufficient data for today ({len(today_prices)}/{today_table.expected_intervals} keys found, need {needed}), skipping statistics calculation for {self.area}. Missing: {missing_keys[:10]}{'...' if len(missing_keys) > 10 else ''}"
+                )
+
+        if not tomorrow_prices:
+            return
+        # Use DST-aware interval counting for tomorrow's date
+        expected_intervals = cycle.expected_intervals_tomorrow
+        needed = math.ceil(expected_intervals * 0.8)
+        if len(tomorrow_prices) >= needed:
+            return
+        tomorrow_table = cycle.tomorrow_table
+        missing_keys = tomorrow_table.missing(tomorrow_prices)
+
+        # Time-aware validation: Use DEBUG before publication time, WARNING after.
+        # DataProcessor itself is source-agnostic so we look up the per-source
+        # schedule each call.
+        publication_hour_utc = Source.get_publication_time_utc(source_name or "unknown")
+        data_should_be_available = cycle.now_utc.hour >= publication_hour_utc
+
+        log_message = (
+            f"Insufficient data for tomorrow ({len(tomorrow_prices)}/{tomorrow_table.expected_intervals} keys found, "
+            f"need {needed}), skipping statistics calculation for {self.area}. "
+            f"Missing: {missing_keys[:10]}{'...' if len(missing_keys) > 10 else ''}"
         )
 
+        if data_should_be_available:
+            # After publication time - this is concerning
+            _LOGGER.warning(
+                f"{log_message} (after expected publication time {publication_hour_utc}:00 UTC)"
+            )
+        else:
+            # Before publication time - this is expected
+            _LOGGER.debug(
+                f"{log_message} (before publication time {publication_hour_utc}:00 UTC, this is normal)"
+            )
+
     def _generate_empty_processed_result(self, data, error=None):
         """Generate empty IntervalPriceData when processing fails.
 
@@ -877,27 +940,42 @@ class DataProcessor:
         Returns:
             Dictionary of export prices with same keys as raw_prices
         """
-        if not self.export_enabled or not raw_prices:
+        if not self.export_enabled:
             return {}
+        return self._calculate_derived_prices(raw_prices)[0]
 
-        export_prices = {}
-        for key, raw_price in raw_prices.items():
-            if raw_price is None:
-                continue
-
-            # Formula: (spot_price × multiplier + offset) × (1 + export_vat)
-            # Note: raw_price is already in target currency and display units
-            # So offset should be in same display units as raw_price
+    def _calculate_derived_prices(
+        self,
+        raw_prices: Dict[str, float],
+    ) -> Tuple[Dict[str, float], Dict[str, Dict[str, float]]]:
+        """Calculate export and price profile prices in one pass over raw prices.
 
-            # Apply multiplier
-            price = raw_price * self.export_multiplier
+        The export formula and every profile formula are compiled into affine
+        transforms and applied to the same raw series together.
 
-            # Add offset (offset is entered in same unit as display format)
-            price += self.export_offset
+        Args:
+            raw_prices: Dictionary of raw interval prices (already currency-converted but without VAT/taxes)
 
-            # Apply export VAT (often 0% for feed-in)
-            price *= 1 + self.export_vat
+        Returns:
+            Tuple of (export prices, {profile name: prices}), each keyed like raw_prices
+        """
+        if not raw_prices or not (self.export_enabled or self.price_profiles):
+            return {}, {}
 
-            export_prices[key] = price
+        # Note: raw_price is already in target currency and display units,
+        # so offsets are in the same display units as raw_price
+        transforms = [profile.transform for profile in self.price_profiles]
+        if self.export_enabled:
+            transforms.append(
+                compile_export_transform(
+                    self.export_multiplier, self.export_offset, self.export_vat
+                )
+            )
+        results = transform_interval_prices(raw_prices, transforms, drop_missing=True)
 
-        return export_prices
+        profile_prices = {
+            profile.name: prices
+            for profile, prices in zip(self.price_profiles, results)
+        }
+        export_prices = results[-1] if self.export_enabled else {}
+        return export_prices, profile_prices
@@ -14,6 +14,7 @@ from zoneinfo import ZoneInfo
 from homeassistant.util import dt as dt_util
 
 from ..const.time import TimeInterval
+from ..utils.interval_series import IntervalSeries
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -194,6 +195,64 @@ class DataValidity:
         )
 
 
+@dataclass(frozen=True, slots=True)
+class FrozenDataValidity:
+    """Immutable, slotted DataValidity for results that are shared once computed.
+
+    Reads exactly like DataValidity (same fields and methods); use thaw() for
+    a mutable copy. Data without any intervals shares EMPTY_DATA_VALIDITY.
+    """
+
+    last_valid_interval: Optional[datetime] = None
+    data_valid_until: Optional[datetime] = None
+    interval_count: int = 0
+    today_interval_count: int = 0
+    tomorrow_interval_count: int = 0
+    has_current_interval: bool = False
+    has_minimum_data: bool = False
+
+    def __post_init__(self):
+        """Set data_valid_until to last_valid_interval if not provided."""
+        if self.last_valid_interval and not self.data_valid_until:
+            object.__setattr__(self, "data_valid_until", self.last_valid_interval)
+
+    # Read-only behaviour is shared with the mutable class
+    intervals_remaining = DataValidity.intervals_remaining
+    is_valid = DataValidity.is_valid
+    to_dict = DataValidity.to_dict
+    __str__ = DataValidity.__str__
+
+    @classmethod
+    def from_validity(cls, validity: DataValidity) -> "FrozenDataValidity":
+        """Create a frozen copy of a DataValidity."""
+        if validity == DataValidity():
+            return EMPTY_DATA_VALIDITY
+        return cls(
+            last_valid_interval=validity.last_valid_interval,
+            data_valid_until=validity.data_valid_until,
+            interval_count=validity.interval_count,
+            today_interval_count=validity.today_interval_count,
+            tomorrow_interval_count=validity.tomorrow_interval_count,
+            has_current_interval=validity.has_current_interval,
+            has_minimum_data=validity.has_minimum_data,
+        )
+
+    def thaw(self) -> DataValidity:
+        """Create a mutable DataValidity copy."""
+        return DataValidity(
+            last_valid_interval=self.last_valid_interval,
+            data_valid_until=self.data_valid_until,
+            interval_count=self.interval_count,
+            today_interval_count=self.today_interval_count,
+            tomorrow_interval_count=self.tomorrow_interval_count,
+            has_current_interval=self.has_current_interval,
+            has_minimum_data=self.has_minimum_data,
+        )
+
+
+EMPTY_DATA_VALIDITY = FrozenDataValidity()
+
+
 def calculate_data_validity(
     interval_prices: Dict[str, float],
     tomorrow_interval_prices: Dict[str, float],
@@ -235,73 +294,38 @@ def calculate_data_validity(
         or current_interval_key in tomorrow_interval_prices
     )
 
-    # Find the last valid interval timestamp
-    all_intervals = []
-
     # Determine which timezone to use for localizing interval keys
     # The interval keys (e.g. "04:15") are ALREADY in the target timezone
+    tz = None
     if target_timezone:
         try:
             tz = ZoneInfo(target_timezone)
             _LOGGER.debug(
                 f"Using target timezone for validity calculation: {target_timezone}"
             )
-            # Get today's date in the TARGET timezone, not from 'now' which might be in a different TZ
-            now_in_target_tz = now.astimezone(tz)
-            today_date = now_in_target_tz.date()
         except Exception as e:
             _LOGGER.warning(
                 f"Invalid target timezone '{target_timezone}': {e}. Falling back to HA timezone."
             )
-            tz = None
-            today_date = now.date()
-    else:
-        tz = None
-        today_date = now.date()
+    if tz is None:
+        tz = dt_util.DEFAULT_TIME_ZONE
 
-    # Parse today's intervals
-    for interval_key in interval_prices.keys():
-        try:
-            # Use the validation function that handles DST suffixes
-            hour, minute = parse_interval_key(interval_key)
-            interval_dt = datetime.combine(
-                today_date, datetime.min.time().replace(hour=hour, minute=minute)
-            )
-            # Make timezone aware using target timezone or HA timezone
-            if tz:
-                interval_dt = interval_dt.replace(tzinfo=tz)
-            else:
-                interval_dt = dt_util.as_local(interval_dt)
-            all_intervals.append(interval_dt)
-        except (ValueError, AttributeError) as e:
-            # Malformed interval key - this IS a data problem
-            _LOGGER.warning(f"Malformed interval key '{interval_key}': {e}")
-            continue
-
-    # Parse tomorrow's intervals
+    # Get today's date in the TARGET timezone, not from 'now' which might be in a different TZ
+    today_date = now.astimezone(tz).date() if now.tzinfo else now.date()
     tomorrow_date = today_date + timedelta(days=1)
-    for interval_key in tomorrow_interval_prices.keys():
-        try:
-            # Use the validation function that handles DST suffixes
-            hour, minute = parse_interval_key(interval_key)
-            interval_dt = datetime.combine(
-                tomorrow_date, datetime.min.time().replace(hour=hour, minute=minute)
-            )
-            # Make timezone aware using target timezone or HA timezone
-            if tz:
-                interval_dt = interval_dt.replace(tzinfo=tz)
-            else:
-                interval_dt = dt_util.as_local(interval_dt)
-            all_intervals.append(interval_dt)
-        except (ValueError, AttributeError) as e:
-            # Malformed interval key - this IS a data problem
-            _LOGGER.warning(f"Malformed interval key '{interval_key}': {e}")
-            continue
-
-    if all_intervals:
-        # Sort to find the last interval
-        all_intervals.sort()
-        validity.last_valid_interval = all_intervals[-1]
+
+    # Place the keys on per-day interval arrays; the last interval is then the
+    # last present slot rather than the maximum of every parsed key
+    today_series = IntervalSeries.from_interval_prices(interval_prices, today_date, tz)
+    tomorrow_series = IntervalSeries.from_interval_prices(
+        tomorrow_interval_prices, tomorrow_date, tz
+    )
+    last_valid_interval = (
+        tomorrow_series.last_present_time() or today_series.last_present_time()
+    )
+
+    if last_valid_interval:
+        validity.last_valid_interval = last_valid_interval
 
         # Add interval duration to get data_valid_until
         interval_minutes = TimeInterval.get_interval_minutes()
@@ -311,11 +335,7 @@ def calculate_data_validity(
 
         # Check if we have minimum data (at least rest of today)
         # This means we have intervals from now until at least end of today
-        end_of_today = datetime.combine(today_date, datetime.max.time())
-        if tz:
-            end_of_today = end_of_today.replace(tzinfo=tz)
-        else:
-            end_of_today = dt_util.as_local(end_of_today)
+        end_of_today = datetime.combine(today_date, datetime.max.time(), tzinfo=tz)
 
         validity.has_minimum_data = (
             validity.has_current_interval
@@ -6,10 +6,10 @@ Instead of asking "do we have complete data?", we ask "how long is our data vali
 
 import logging
 from datetime import datetime
-from typing import Any, Optional, Tuple
+from typing import Any, Optional, Tuple, Union
 
 from ..const.network import Network
-from .data_validity import DataValidity
+from .data_validity import DataValidity, FrozenDataValidity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,7 +33,7 @@ class FetchDecisionMaker:
         self,
         now: datetime,
         last_fetch: Optional[datetime],
-        data_validity: DataValidity,
+        data_validity: Union[DataValidity, FrozenDataValidity],
         fetch_interval_minutes: int = Network.Defaults.MIN_UPDATE_INTERVAL_MINUTES,
         in_grace_period: bool = False,
         is_health_check: bool = False,
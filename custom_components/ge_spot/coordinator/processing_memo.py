@@ -0,0 +1,123 @@
+"""Content-addressed memo of processed price data."""
+
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Mapping, Optional
+
+from ..const.defaults import Defaults
+from .data_models import PriceDataSnapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+# Input keys that describe the fetch rather than the prices. They differ
+# between otherwise identical payloads and are copied onto memo hits instead.
+PER_CALL_KEYS = frozenset(
+    {
+        "fetched_at",
+        "last_updated",
+        "attempted_sources",
+        "fallback_sources",
+        "raw_data_ref",
+    }
+)
+
+
+def payload_digest(data: Mapping[str, Any]) -> Optional[str]:
+    """Hash the price-relevant part of a processor input.
+
+    Strings and bytes (XML documents, CSV text) are fed to the hash as they
+    are, without first serializing the whole input; mapping keys are hashed
+    in sorted order, so equal inputs hash alike whatever their key order.
+
+    Args:
+        data: Input passed to DataProcessor.process
+
+    Returns:
+        Hex digest, or None if the input cannot be hashed
+    """
+    digest = hashlib.sha1()
+    try:
+        _hash_value(digest, {k: v for k, v in data.items() if k not in PER_CALL_KEYS})
+    except (TypeError, RecursionError) as e:
+        _LOGGER.debug(f"Processor input cannot be hashed, not memoizing: {e}")
+        return None
+    return digest.hexdigest()
+
+
+def _hash_value(digest: Any, value: Any) -> None:
+    """Feed a value to the hash, tagged by type and length-prefixed."""
+    if isinstance(value, str):
+        value = value.encode()
+        digest.update(b"s%d:" % len(value))
+        digest.update(value)
+    elif isinstance(value, (bytes, bytearray)):
+        digest.update(b"b%d:" % len(value))
+        digest.update(value)
+    elif isinstance(value, Mapping):
+        digest.update(b"d%d:" % len(value))
+        for key in sorted(value, key=str):
+            _hash_value(digest, str(key))
+            _hash_value(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(b"l%d:" % len(value))
+        for item in value:
+            _hash_value(digest, item)
+    else:
+        # Numbers, None, booleans and anything else by their repr
+        _hash_value(digest, f"{type(value).__name__}:{value!r}")
+
+
+class ProcessingMemo:
+    """Bounded LRU of processed price data keyed by input and config stamps.
+
+    A forced refresh, a health-check fetch or a reload often hands the
+    processor a payload identical to one it has already processed. When the
+    payload digest, exchange rate, price config and local date all match, the
+    previous result is valid as is; it is kept here as an immutable
+    PriceDataSnapshot so every hit gets its own containers.
+    """
+
+    def __init__(self, max_entries: int = Defaults.PROCESSING_MEMO_ENTRIES):
+        """Initialize an empty memo.
+
+        Args:
+            max_entries: Results kept before the least recently used is evicted
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, PriceDataSnapshot]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable) -> Optional[PriceDataSnapshot]:
+        """Get the result stored for a key, refreshing its age."""
+        snapshot = self._entries.get(key)
+        if snapshot is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return snapshot
+
+    def put(self, key: Hashable, snapshot: PriceDataSnapshot) -> None:
+        """Store a result, evicting the least recently used beyond the limit."""
+        self._entries[key] = snapshot
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all stored results."""
+        self._entries.clear()
+
+    def get_info(self) -> Dict[str, int]:
+        """Get memo statistics for diagnostics."""
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+
+# Shared by every DataProcessor, so results survive an entry reload
+PROCESSING_MEMO = ProcessingMemo()
@@ -0,0 +1,145 @@
+"""Process-wide store for source-level price data shared across config entries."""
+
+import logging
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from ..const import DOMAIN
+from ..utils.byte_budget import ByteBudget, get_byte_budget
+from ..utils.raw_payload_store import RawPayloadStore
+
+_LOGGER = logging.getLogger(__name__)
+
+# Key under hass.data[DOMAIN] (alongside the per-entry coordinators)
+SHARED_STORE_KEY = "shared_price_store"
+
+
+class SharedPriceStore:
+    """Source-level price series shared by every entry in this HA instance.
+
+    Two entries for the same area and source fetch and parse the same upstream
+    data; only VAT, tariffs, display unit and target timezone differ. The parsed
+    series (ISO timestamps in source currency/unit) and the raw payload are
+    stored here once, keyed by (source, area, date), so another entry can build
+    its own processed view from them without fetching.
+    """
+
+    def __init__(
+        self,
+        hass: Optional[HomeAssistant] = None,
+        budget: Optional[ByteBudget] = None,
+    ):
+        """Initialize the shared store.
+
+        Args:
+            hass: Optional Home Assistant instance
+            budget: Optional integration-wide byte budget for raw payloads
+        """
+        self.hass = hass
+        self.raw_payloads = RawPayloadStore(hass, budget=budget)
+        self._records: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+
+    def put_source_data(
+        self,
+        source: str,
+        area: str,
+        target_date: date,
+        record: Dict[str, Any],
+    ) -> None:
+        """Store the source-level series for a source/area/date.
+
+        Args:
+            source: Source identifier
+            area: Area code
+            target_date: Date (in the area timezone) the data was fetched for
+            record: Parsed series and metadata (raw_interval_prices_original,
+                source_timezone, source_currency, source_unit, raw_data_ref, ...)
+        """
+        key = (source, area, target_date.isoformat())
+        self._records[key] = {**record, "stored_at": dt_util.utcnow()}
+
+        # Only today and yesterday (for the midnight rollover) are useful
+        oldest = (target_date - timedelta(days=1)).isoformat()
+        stale_keys = [
+            k
+            for k in self._records
+            if k[0] == source and k[1] == area and k[2] < oldest
+        ]
+        for stale_key in stale_keys:
+            del self._records[stale_key]
+
+        _LOGGER.debug(f"Shared source data stored for {source}/{area}/{target_date}")
+
+    def get_source_data(
+        self,
+        source: str,
+        area: str,
+        target_date: date,
+        max_age_minutes: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Get the source-level series for a source/area/date.
+
+        Args:
+            source: Source identifier
+            area: Area code
+            target_date: Date (in the area timezone) to look up
+            max_age_minutes: Optional maximum age of the record in minutes
+
+        Returns:
+            Copy of the stored record, or None if missing or too old
+        """
+        record = self._records.get((source, area, target_date.isoformat()))
+        if record is None:
+            return None
+
+        if max_age_minutes is not None:
+            stored_at: datetime = record["stored_at"]
+            if dt_util.utcnow() - stored_at > timedelta(minutes=max_age_minutes):
+                return None
+
+        return {k: v for k, v in record.items() if k != "stored_at"}
+
+    def clear(self, area: Optional[str] = None) -> None:
+        """Drop shared records, optionally only for one area."""
+        if area is None:
+            self._records.clear()
+            return
+        for key in [k for k in self._records if k[1] == area]:
+            del self._records[key]
+
+    def get_info(self) -> Dict[str, Any]:
+        """Get information about the shared store.
+
+        Returns:
+            Dictionary with store information
+        """
+        return {
+            "total_records": len(self._records),
+            "records": sorted("/".join(key) for key in self._records),
+            "raw_payloads": self.raw_payloads.get_info(),
+        }
+
+
+def get_shared_store(
+    hass: Optional[HomeAssistant], config: Optional[Dict[str, Any]] = None
+) -> SharedPriceStore:
+    """Get the shared price store for this Home Assistant instance.
+
+    The store lives in hass.data[DOMAIN] so every config entry sees the same
+    one; its raw payloads are charged to the integration's byte budget (see
+    get_byte_budget for config). Without a usable hass.data (standalone
+    scripts), a private store is returned.
+    """
+    domain_data = getattr(hass, "data", None)
+    if not isinstance(domain_data, dict):
+        return SharedPriceStore(hass)
+
+    domain_data = domain_data.setdefault(DOMAIN, {})
+    store = domain_data.get(SHARED_STORE_KEY)
+    if store is None:
+        store = SharedPriceStore(hass, get_byte_budget(hass, config))
+        domain_data[SHARED_STORE_KEY] = store
+    return store
@@ -2,7 +2,7 @@
 
 import logging
 from datetime import timedelta, datetime, date
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 import asyncio  # Added for rate limiting
 
 from homeassistant.core import HomeAssistant
@@ -15,15 +15,19 @@ from ..const.sources import Source
 from ..const.defaults import Defaults
 from ..const.display import DisplayUnit
 from ..const.network import Network
+from ..const.energy import EnergyUnit
 from ..const.time import ValidationRetry, DSTTransitionType
 from ..const.errors import Errors, ErrorDetails
 from ..api import get_sources_for_region
 from ..timezone.service import TimezoneService  # Added import
+from ..timezone.cycle_context import CycleContext
 from ..utils.exchange_service import ExchangeRateService, get_exchange_service
+from ..utils.price_archive import archive_series
 from .data_processor import DataProcessor
 from .fallback_manager import FallbackManager  # Import the new FallbackManager
 from .cache_manager import CacheManager  # Import CacheManager
-from .data_models import IntervalPriceData  # Import IntervalPriceData
+from .shared_store import get_shared_store
+from .data_models import IntervalPriceData, PriceDataEnvelope
 
 # Import all API implementations here to have them available
 from ..api.nordpool import NordpoolAPI
@@ -113,14 +117,20 @@ class UnifiedPriceManager:
             hass=hass, area=area, config=config
         )  # Initialize with all parameters
         self._fallback_manager = FallbackManager()
+        # Source-level data shared with other entries (same area/source)
+        self._shared_store = get_shared_store(hass, config)
         self._cache_manager = CacheManager(
-            hass=hass, config=config
+            hass=hass,
+            config=config,
+            raw_payload_store=self._shared_store.raw_payloads,
         )  # Instantiate CacheManager
         # Set timezone service on cache manager for midnight migration validity recalculation
         self._cache_manager._timezone_service = self._tz_service
         self._exchange_service: ExchangeRateService | None = (
             None  # Initialize exchange service attribute
         )
+        # Last week's archived prices, as (target date, series, summary)
+        self._price_history: Optional[Tuple[date, str, Dict[str, Any]]] = None
 
         # Data processor
         self._data_processor = DataProcessor(
@@ -130,6 +140,7 @@ class UnifiedPriceManager:
             config,
             self._tz_service,  # Pass the instantiated service
             self,  # Pass self to DataProcessor, it will get exchange_service later
+            raw_payload_store=self._cache_manager.raw_payloads,
         )
         # Store rate limiter context information instead of creating an instance
         # Rate limiting is now handled by a simple lock and timestamp check
@@ -540,6 +551,9 @@ class UnifiedPriceManager:
                 )
                 > tol
                 or abs(cached_price_data.applied_energy_tax - dp.energy_tax) > tol
+                or cached_price_data.applied_tariff_schedule
+                != dp.tariff_schedule_version
+                or cached_price_data.applied_price_profiles != dp.price_profiles_version
             )
         except (TypeError, AttributeError):
             # Config values not comparable (e.g. mocked in tests, or missing):
@@ -579,6 +593,8 @@ class UnifiedPriceManager:
             Dictionary with processed data
         """
         now = dt_util.now()
+        # One "now" for the whole cycle, processing included
+        context = CycleContext(self._tz_service, now)
         today_date = self._today_in_target_tz(now)  # "Today" in the display tz
         area_key = self.area  # Key for rate limiting
 
@@ -612,18 +628,24 @@ class UnifiedPriceManager:
                                 f"[{self.area}] Cached tomorrow data is stale (fetched {fetched_at.date()}), "
                                 f"clearing it to force fresh fetch"
                             )
-                            # Clear tomorrow prices to force fetch
-                            cached_price_data.tomorrow_interval_prices = {}
-                            cached_price_data.tomorrow_raw_prices = {}
+                            # Clear tomorrow prices to force fetch. The cached
+                            # object is shared by CacheManager, so copy it.
+                            from dataclasses import replace
+
+                            cached_price_data = replace(
+                                cached_price_data,
+                                tomorrow_interval_prices={},
+                                tomorrow_raw_prices={},
+                            )
             except Exception as e:
                 _LOGGER.debug(
                     f"[{self.area}] Error checking tomorrow data staleness: {e}"
                 )
 
         # Extract data validity from cache if available
-        from .data_validity import DataValidity
+        from .data_validity import EMPTY_DATA_VALIDITY
 
-        data_validity = DataValidity()  # Default: no valid data
+        data_validity = EMPTY_DATA_VALIDITY  # Default: no valid data
 
         if cached_price_data:
             # Data validity is computed automatically as a property!
@@ -669,20 +691,34 @@ class UnifiedPriceManager:
                 self.area,
             )
 
+        # Another entry for this area may already hold the source-level data we
+        # need. When this entry has nothing usable cached (startup, reload, or a
+        # price config change), build our own view from it instead of fetching.
+        if (
+            not force
+            and not self._health_check_in_progress
+            and (cached_price_data is None or price_config_changed)
+        ):
+            shared_data = await self._use_shared_source_data(
+                now,
+                max_age_minutes=(
+                    Network.Defaults.MIN_UPDATE_INTERVAL_MINUTES
+                    if should_fetch_from_api
+                    else None
+                ),
+                context=context,
+            )
+            if shared_data is not None:
+                return shared_data
+
         if not force and not price_config_changed and not should_fetch_from_api:
             _LOGGER.debug(f"Skipping API fetch for area {self.area}: {fetch_reason}")
             if cached_price_data:
                 _LOGGER.debug("Returning cached data for %s", self.area)
-                # Return cached IntervalPriceData directly - no conversion or reprocessing needed
+                # Serve cached IntervalPriceData without copying - no conversion or reprocessing needed
                 # The cached data is already fully processed (currency converted, VAT applied, etc.)
-                # Just update the using_cached_data flag and timestamp
-                from dataclasses import replace
-
-                return replace(
-                    cached_price_data,
-                    using_cached_data=True,
-                    last_updated=dt_util.now().isoformat(),
-                )
+                # Only the using_cached_data flag and timestamp change per update
+                return self._serve_cached(cached_price_data)
             else:
                 # No cache available - this can happen when:
                 # 1. Rate-limited with no current interval data (common after config reload/HA restart)
@@ -821,14 +857,8 @@ class UnifiedPriceManager:
                         _LOGGER.warning(
                             "No APIs configured for %s, using cached data.", self.area
                         )
-                        # Return cached data directly - no conversion needed
-                        from dataclasses import replace
-
-                        return replace(
-                            cached_data,
-                            using_cached_data=True,
-                            last_updated=dt_util.now().isoformat(),
-                        )
+                        # Serve cached data directly - no conversion needed
+                        return self._serve_cached(cached_data)
                     return await self._generate_empty_result(
                         error=error_msg, error_code=Errors.NO_SOURCES_CONFIGURED
                     )
@@ -856,20 +886,13 @@ class UnifiedPriceManager:
                         _LOGGER.info(
                             "All sources disabled, using cached data for %s.", self.area
                         )
-                        # Return cached data directly - no conversion needed
-                        # Note: We can't add error/error_code to IntervalPriceData via replace()
-                        # since they're not dataclass fields. We use dynamic attributes instead.
-                        from dataclasses import replace
-
-                        result = replace(
+                        # Serve cached data directly, with error info indicating the
+                        # temporary situation carried by the envelope
+                        return self._serve_cached(
                             cached_data,
-                            using_cached_data=True,
-                            last_updated=dt_util.now().isoformat(),
+                            error=error_msg,
+                            error_code=Errors.ALL_SOURCES_DISABLED,
                         )
-                        # Add error info as dynamic attributes to indicate temporary situation
-                        setattr(result, "_error", error_msg)
-                        setattr(result, "_error_code", Errors.ALL_SOURCES_DISABLED)
-                        return result
                     return await self._generate_empty_result(
                         error=error_msg, error_code=Errors.ALL_SOURCES_DISABLED
                     )
@@ -909,7 +932,7 @@ class UnifiedPriceManager:
                 )
 
                 # Process the raw result (this is where parsing happens)
-                processed_data = await self._process_result(result)
+                processed_data = await self._process_result(result, context=context)
 
                 # Check data completeness with interval count validation
                 from ..const.time import TimeInterval
@@ -1171,7 +1194,7 @@ class UnifiedPriceManager:
                                 and "error" not in retry_result
                             ):
                                 processed_retry = await self._process_result(
-                                    retry_result
+                                    retry_result, context=context
                                 )
                                 has_today_retry = processed_retry and bool(
                                     processed_retry.today_interval_prices
@@ -1458,7 +1481,9 @@ class UnifiedPriceManager:
                             isinstance(retry_result, dict)
                             and "error" not in retry_result
                         ):
-                            processed_retry = await self._process_result(retry_result)
+                            processed_retry = await self._process_result(
+                                retry_result, context=context
+                            )
                             has_today_retry = processed_retry and bool(
                                 processed_retry.today_interval_prices
                             )
@@ -1609,14 +1634,8 @@ class UnifiedPriceManager:
                     self.area,
                 )
                 self._using_cached_data = True
-                # Return cached data directly - no conversion needed
-                from dataclasses import replace
-
-                return replace(
-                    cached_data,
-                    using_cached_data=True,
-                    last_updated=dt_util.now().isoformat(),
-                )
+                # Serve cached data directly - no conversion needed
+                return self._serve_cached(cached_data)
             else:
                 # Format the list of attempted sources for user-friendly error message
                 attempted_sources_str = (
@@ -1659,28 +1678,145 @@ class UnifiedPriceManager:
                     "Using cached data for %s due to unexpected error: %s", self.area, e
                 )
                 self._using_cached_data = True
-                # Return cached data directly - no conversion needed
-                from dataclasses import replace
-
-                return replace(
-                    cached_data,
-                    using_cached_data=True,
-                    last_updated=dt_util.now().isoformat(),
-                )
+                # Serve cached data directly - no conversion needed
+                return self._serve_cached(cached_data)
             else:
                 # Generate empty result if no cache
                 return await self._generate_empty_result(
                     error=f"Unexpected error: {str(e)}", error_code=Errors.API_ERROR
                 )
 
+    def _serve_cached(
+        self,
+        cached_data: IntervalPriceData,
+        error: Optional[str] = None,
+        error_code: Optional[str] = None,
+    ) -> PriceDataEnvelope:
+        """Wrap cached data for this update without copying it.
+
+        The cached object is shared with CacheManager (and across updates), so
+        per-update metadata goes on a PriceDataEnvelope instead of a replace()
+        copy of the whole dataclass.
+
+        Args:
+            cached_data: Cached price data
+            error: Optional error message for this update
+            error_code: Optional error code for this update
+
+        Returns:
+            Envelope reading through to the cached data
+        """
+        return PriceDataEnvelope(
+            cached_data,
+            using_cached_data=True,
+            last_updated=dt_util.now().isoformat(),
+            error=error,
+            error_code=error_code,
+        )
+
+    def _today_in_area_tz(self, now: datetime) -> date:
+        """Return 'today' in the area timezone (the shared store's date key).
+
+        Entries for the same area can use different display timezones, so the
+        shared store files data by the area's own calendar day.
+        """
+        area_tz = getattr(self._tz_service, "area_timezone", None)
+        if area_tz is None:
+            return self._today_in_target_tz(now)
+        try:
+            return now.astimezone(area_tz).date()
+        except (TypeError, ValueError, AttributeError):
+            return self._today_in_target_tz(now)
+
+    def _publish_shared_source_data(
+        self, result: Dict[str, Any], price_data: IntervalPriceData
+    ) -> None:
+        """Publish freshly fetched source-level data for other entries."""
+        if not price_data.source or not price_data.raw_interval_prices_original:
+            return
+        self._shared_store.put_source_data(
+            source=price_data.source,
+            area=self.area,
+            target_date=self._today_in_area_tz(dt_util.now()),
+            record={
+                "data_source": price_data.source,
+                "raw_interval_prices_original": price_data.raw_interval_prices_original,
+                "source_timezone": price_data.source_timezone,
+                "source_currency": price_data.source_currency,
+                "source_unit": result.get("source_unit", EnergyUnit.MWH),
+                "raw_data_ref": price_data.raw_data_ref,
+                "fetched_at": price_data.fetched_at,
+                "attempted_sources": price_data.attempted_sources,
+            },
+        )
+
+    async def _use_shared_source_data(
+        self,
+        now: datetime,
+        max_age_minutes: Optional[int] = None,
+        context: Optional[CycleContext] = None,
+    ) -> Optional[IntervalPriceData]:
+        """Build this entry's processed data from the shared store, if possible.
+
+        Sources are tried in this entry's priority order. The shared series is
+        run through this entry's DataProcessor (its VAT, tariffs, unit and
+        timezone), cached, and returned; no API request is made.
+
+        Args:
+            now: Current time
+            max_age_minutes: Optional maximum age of the shared record
+            context: Time context of the update cycle
+
+        Returns:
+            Processed IntervalPriceData, or None if no usable shared data exists
+        """
+        area_date = self._today_in_area_tz(now)
+        for api_class in self._api_classes:
+            source_name = api_class.SOURCE_TYPE
+            record = self._shared_store.get_source_data(
+                source_name, self.area, area_date, max_age_minutes=max_age_minutes
+            )
+            if not record:
+                continue
+
+            processed = await self._process_result(
+                record, is_cached=True, context=context
+            )
+            if (
+                not processed
+                or not processed.today_interval_prices
+                or getattr(processed, "_error", None)
+            ):
+                continue
+
+            _LOGGER.info(
+                f"[{self.area}] Using source data shared by another entry "
+                f"({source_name}) - no API fetch needed"
+            )
+            self._active_source = processed.source
+            self._cache_manager.store(
+                data=processed,
+                area=self.area,
+                source=processed.source,
+                timestamp=now,
+            )
+            return processed
+
+        return None
+
     async def _process_result(
-        self, result: Dict[str, Any], is_cached: bool = False
+        self,
+        result: Dict[str, Any],
+        is_cached: bool = False,
+        context: Optional[CycleContext] = None,
     ) -> Dict[str, Any]:
         """Process raw result data (either fresh or cached).
 
         Args:
             result: Raw result data from fetch or cache.
             is_cached: Flag indicating if the data came from cache.
+            context: Time context of the update cycle (one "now" for all
+                processing); the processor builds its own if omitted.
 
         Returns:
             Processed data dictionary.
@@ -1707,7 +1843,9 @@ class UnifiedPriceManager:
 
         # Use data processor to generate final result
         try:
-            processed_price_data = await self._data_processor.process(result)
+            processed_price_data = await self._data_processor.process(
+                result, context=context
+            )
 
             # Check if processor returned None (validation failure)
             if processed_price_data is None:
@@ -1751,6 +1889,10 @@ class UnifiedPriceManager:
                     entry["source"]: entry for entry in failed_source_details
                 }
 
+            # Share the source-level series with other entries for this area
+            if not is_cached:
+                self._publish_shared_source_data(result, processed_price_data)
+
             # Return IntervalPriceData directly - sensors will access properties
             return processed_price_data
         except Exception as proc_err:
@@ -1814,6 +1956,41 @@ class UnifiedPriceManager:
 
         return empty_data
 
+    async def async_get_price_history(
+        self, price_data: IntervalPriceData
+    ) -> Dict[str, Any]:
+        """Get last week's archived prices for comparison with today's.
+
+        Past days are final, so the summary is read from the archive once per
+        day (retried each update until the archive has data). Only days
+        archived with the same settings as price_data are compared.
+
+        Args:
+            price_data: Current processed prices (selects the archive series)
+
+        Returns:
+            PriceArchive.get_last_week summary, or an empty dict on error
+        """
+        today = self._today_in_target_tz(dt_util.now())
+        series = archive_series(self.area, price_data)
+        if self._price_history is not None and self._price_history[:2] == (
+            today,
+            series,
+        ):
+            return self._price_history[2]
+
+        try:
+            history = await self._cache_manager.archive.async_get_last_week(
+                series, today
+            )
+        except (OSError, ValueError) as e:
+            _LOGGER.debug(f"[{self.area}] Could not read price history: {e}")
+            return {}
+
+        if history["week"] is not None:
+            self._price_history = (today, series, history)
+        return history
+
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get statistics about the data cache.
 
@@ -1872,6 +2049,9 @@ class UnifiedPriceManager:
         # Close the exchange service session if it was initialized
         if self._exchange_service:
             await self._exchange_service.close()
+
+        # Finish pending archive writes and unmap the archive files
+        await self._cache_manager.async_close()
         # Note: aiohttp session passed to APIs is managed by HA and shouldn't be closed here.
 
 
@@ -1929,6 +2109,8 @@ class UnifiedPriceCoordinator(DataUpdateCoordinator):
         self.price_manager = UnifiedPriceManager(
             hass=hass, area=area, currency=currency, config=config
         )
+        # Last week's archived prices, refreshed with every update
+        self.price_history: Dict[str, Any] = {}
 
     async def _async_update_data(self):
         """Fetch data from price manager.
@@ -1939,6 +2121,7 @@ class UnifiedPriceCoordinator(DataUpdateCoordinator):
         try:
             # Fetch data using the manager's logic (includes rate limiting, fallback, caching)
             data = await self.price_manager.fetch_data()
+            self.price_history = await self.price_manager.async_get_price_history(data)
             # Manager returns IntervalPriceData; check has_data property for success
             if not hasattr(data, "today_interval_prices") or (
                 not data.today_interval_prices and not data.tomorrow_interval_prices
@@ -0,0 +1,35 @@
+"""Diagnostics support for GE-Spot."""
+
+from typing import Any, Dict
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .const.config import Config
+
+TO_REDACT = {Config.API_KEY}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> Dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Includes the cache statistics (hit/miss/eviction counters, bytes and
+    persistence latency per area and source) used to size the cache.
+    """
+    diagnostics: Dict[str, Any] = {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        }
+    }
+
+    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if coordinator is not None:
+        diagnostics["area"] = coordinator.area
+        diagnostics["cache"] = coordinator.price_manager.get_cache_stats()
+
+    return diagnostics
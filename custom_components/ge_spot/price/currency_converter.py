@@ -1,12 +1,18 @@
 """Currency conversion utilities."""
 
 import logging
-from typing import Dict, Optional, Tuple
+from typing import Dict, Mapping, Optional, Tuple
 
 from ..const.energy import EnergyUnit
 from ..const.display import DisplayUnit
 from ..utils.exchange_service import ExchangeRateService
-from ..utils.unit_conversion import convert_energy_price, get_display_unit_multiplier
+from ..utils.unit_conversion import get_display_unit_multiplier
+from .price_transform import (
+    AffineTransform,
+    compile_energy_price_transform,
+    fee_scale,
+    transform_interval_prices,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,6 +42,11 @@ class CurrencyConverter:
         self.import_multiplier = import_multiplier
         # Use cents display format when explicitly set to DisplayUnit.CENTS
         self.use_subunit = display_unit == DisplayUnit.CENTS
+        # Compiled (import, raw) transforms by (source unit, exchange rate)
+        self._transforms: Dict[
+            Tuple[str, Optional[float]],
+            Tuple[Optional[AffineTransform], Optional[AffineTransform]],
+        ] = {}
         _LOGGER.debug(
             "CurrencyConverter initialized with display_unit=%s, use_subunit=%s",
             display_unit,
@@ -47,6 +58,7 @@ class CurrencyConverter:
         interval_prices: Dict[str, float],  # Prices in source currency/unit
         source_currency: str,
         source_unit: str = EnergyUnit.MWH,  # Assume MWh default if not specified
+        tariffs: Optional[Mapping[str, float]] = None,
     ) -> Tuple[Dict[str, float], Dict[str, float], Optional[float], Optional[str]]:
         """Converts interval prices to target currency and display unit.
 
@@ -54,6 +66,8 @@ class CurrencyConverter:
             interval_prices: Dict of {'HH:MM': price} in source currency/unit.
             source_currency: Currency code of source prices (e.g. 'EUR').
             source_unit: Energy unit of source prices (e.g. 'MWh').
+            tariffs: Optional time-of-use additional tariffs per interval
+                (see TariffSchedule), replacing the scalar tariff where given.
 
         Returns:
             Tuple containing:
@@ -82,8 +96,6 @@ class CurrencyConverter:
             self.use_subunit,
         )
 
-        converted_prices = {}
-        raw_prices = {}  # Store raw prices (currency + unit converted, no VAT/taxes)
         exchange_rate = None
         rate_timestamp = None
 
@@ -131,67 +143,38 @@ class CurrencyConverter:
                 source_currency,
             )
 
-        # Determine display unit multiplier (e.g. cents/øre if requested)
-        display_unit_multiplier = (
-            get_display_unit_multiplier(self.display_unit) if self.use_subunit else 1
+        import_transform, raw_transform = self._get_transforms(
+            source_unit, exchange_rate
         )
+        if import_transform is None:
+            # Unknown energy unit: nothing can be converted
+            return (
+                dict.fromkeys(interval_prices),
+                dict.fromkeys(interval_prices),
+                exchange_rate,
+                rate_timestamp,
+            )
 
-        for interval_key, price in interval_prices.items():
-            if price is None:
-                converted_prices[interval_key] = None
-                raw_prices[interval_key] = None
-                continue
-
-            try:
-                # Handle price if it's a dictionary (e.g. {'price': 8.06})
-                if isinstance(price, dict) and "price" in price:
-                    price = price["price"]
-
-                # Apply currency conversion if needed
-                converted_value = price
-                if needs_currency_conversion and exchange_rate is not None:
-                    converted_value = price * exchange_rate
-
-                # RAW price (currency + unit conversion, NO VAT/taxes/tariffs)
-                raw_price = convert_energy_price(
-                    price=converted_value,
-                    source_unit=source_unit,
-                    target_unit=EnergyUnit.KWH,
-                    vat_rate=0.0,  # No VAT for raw price
-                    display_unit_multiplier=display_unit_multiplier,
-                    additional_tariff=0.0,  # No tariff for raw price
-                    energy_tax=0.0,  # No tax for raw price
-                    tariff_in_subunit=False,
-                    import_multiplier=1.0,  # No multiplier for raw price
-                )
-                raw_prices[interval_key] = raw_price
-
-                # Calculate FINAL price (with VAT, taxes, tariffs, multiplier)
-                converted_price = convert_energy_price(
-                    price=converted_value,
-                    source_unit=source_unit,
-                    target_unit=EnergyUnit.KWH,
-                    vat_rate=self.vat_rate if self.include_vat else 0.0,
-                    display_unit_multiplier=display_unit_multiplier,
-                    additional_tariff=self.additional_tariff,
-                    energy_tax=self.energy_tax,
-                    tariff_in_subunit=self.use_subunit,  # Tariff matches display format
-                    import_multiplier=self.import_multiplier,
-                )
-                converted_prices[interval_key] = converted_price
-
-            except Exception as e:
-                _LOGGER.error(
-                    "Error converting price for interval %s (Value: %s): %s",
-                    interval_key,
-                    price,
-                    e,
-                    exc_info=True,
-                )
-                converted_prices[interval_key] = (
-                    None  # Mark as None on conversion error
-                )
-                raw_prices[interval_key] = None
+        # Time-of-use tariffs: the difference to the scalar tariff compiled
+        # into the import transform, scaled like any fee
+        tariff_offsets = None
+        if tariffs:
+            scale = fee_scale(
+                self.vat_rate if self.include_vat else 0.0,
+                self._display_unit_multiplier(),
+                self.use_subunit,
+            )
+            tariff_offsets = {
+                key: (tariff - self.additional_tariff) * scale
+                for key, tariff in tariffs.items()
+            }
+
+        # Both series come from one batched pass over the source prices
+        converted_prices, raw_prices = transform_interval_prices(
+            interval_prices,
+            (import_transform, raw_transform),
+            extra_offsets=(tariff_offsets, None),
+        )
 
         _LOGGER.debug(
             "Conversion complete. Example converted price for first interval: %s",
@@ -199,3 +182,47 @@ class CurrencyConverter:
         )
 
         return converted_prices, raw_prices, exchange_rate, rate_timestamp
+
+    def _get_transforms(
+        self, source_unit: str, exchange_rate: Optional[float]
+    ) -> Tuple[Optional[AffineTransform], Optional[AffineTransform]]:
+        """Get the compiled (import, raw) transforms for a source unit and rate.
+
+        The import transform covers the whole chain (exchange rate, unit,
+        import multiplier, tariff, energy tax, VAT, subunit); the raw one only
+        exchange rate, unit and subunit. Both are compiled once and reused for
+        today and tomorrow, and for later cycles while the rate is unchanged.
+        """
+        key = (source_unit, exchange_rate)
+        transforms = self._transforms.get(key)
+        if transforms is None:
+            display_unit_multiplier = self._display_unit_multiplier()
+            import_transform = compile_energy_price_transform(
+                source_unit=source_unit,
+                target_unit=EnergyUnit.KWH,
+                vat_rate=self.vat_rate if self.include_vat else 0.0,
+                display_unit_multiplier=display_unit_multiplier,
+                additional_tariff=self.additional_tariff,
+                energy_tax=self.energy_tax,
+                tariff_in_subunit=self.use_subunit,  # Tariff matches display format
+                import_multiplier=self.import_multiplier,
+                exchange_rate=exchange_rate,
+            )
+            raw_transform = compile_energy_price_transform(
+                source_unit=source_unit,
+                target_unit=EnergyUnit.KWH,
+                display_unit_multiplier=display_unit_multiplier,
+                exchange_rate=exchange_rate,
+            )
+            transforms = (import_transform, raw_transform)
+            if len(self._transforms) >= 8:
+                # Old exchange rates are not needed again
+                self._transforms.clear()
+            self._transforms[key] = transforms
+        return transforms
+
+    def _display_unit_multiplier(self) -> int:
+        """Multiplier to the display subunit (e.g. 100 for cents), else 1."""
+        if self.use_subunit:
+            return get_display_unit_multiplier(self.display_unit)
+        return 1
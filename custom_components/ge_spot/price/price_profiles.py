@@ -0,0 +1,136 @@
+"""Named import/export price formula profiles evaluated alongside export prices."""
+
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Any, Mapping, Tuple
+
+from .price_transform import AffineTransform, compile_export_transform
+
+PROFILE_KIND_EXPORT = "export"
+PROFILE_KIND_IMPORT = "import"
+_KINDS = (PROFILE_KIND_EXPORT, PROFILE_KIND_IMPORT)
+_PARAMETERS = ("multiplier", "offset", "vat")
+_NAME_RE = re.compile(r"^[a-z0-9_]+$")
+
+
+@dataclass(frozen=True, slots=True)
+class PriceProfile:
+    """A named price formula applied to the raw spot price series.
+
+    Every profile uses the export formula (raw × multiplier + offset) × (1 + vat)
+    on the currency-converted raw prices (in display units), so one contract
+    can be compared with another without refetching or renormalizing.
+    The kind only decides how its sensors are labelled.
+    """
+
+    name: str
+    kind: str = PROFILE_KIND_EXPORT
+    multiplier: float = 1.0
+    offset: float = 0.0
+    vat: float = 0.0
+
+    @property
+    def transform(self) -> AffineTransform:
+        """The profile formula compiled into one affine transform."""
+        return compile_export_transform(self.multiplier, self.offset, self.vat)
+
+
+def parse_price_profiles(value: Any) -> Tuple[PriceProfile, ...]:
+    """Build price profiles from their config value.
+
+    A profile is written one per line (or separated by ";"):
+
+        spot_hedge: import multiplier=1.0 offset=0.05 vat=0.25
+        feed_in: export multiplier=0.9 offset=-0.02
+
+    Omitted parameters use the defaults (kind export, multiplier 1, offset 0,
+    vat 0). Lists of dicts with the same keys plus "name" are accepted too.
+
+    Args:
+        value: Profile text or a list of profile dicts
+
+    Returns:
+        The profiles in configured order (empty if none are configured)
+
+    Raises:
+        ValueError: If a profile cannot be parsed or a name is repeated
+    """
+    if not value:
+        return ()
+    if isinstance(value, str):
+        profiles = tuple(
+            _parse_profile(line)
+            for line in value.replace(";", "\n").splitlines()
+            if line.split("#", 1)[0].strip()
+        )
+    else:
+        profiles = tuple(_profile_from_dict(item) for item in value)
+
+    names = [profile.name for profile in profiles]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate price profile names: {', '.join(duplicates)}")
+    return profiles
+
+
+def profiles_version(profiles: Tuple[PriceProfile, ...]) -> str:
+    """Short stable hash of the profiles, stamped on processed prices."""
+    if not profiles:
+        return ""
+    return hashlib.sha1(repr(profiles).encode()).hexdigest()[:12]
+
+
+def _profile_from_dict(item: Mapping[str, Any]) -> PriceProfile:
+    """Build a profile from a dict with "name" and optional formula parameters."""
+    try:
+        name = str(item["name"])
+    except (KeyError, TypeError) as err:
+        raise ValueError(f"Price profile without a name: {item!r}") from err
+    params = {key: item[key] for key in ("kind", *_PARAMETERS) if key in item}
+    return _build_profile(name, params)
+
+
+def _parse_profile(line: str) -> PriceProfile:
+    """Parse one "<name>: [kind] [multiplier=..] [offset=..] [vat=..]" line."""
+    name, sep, spec = line.split("#", 1)[0].partition(":")
+    if not sep:
+        raise ValueError(
+            f"Missing ':' after the name in price profile '{line.strip()}'"
+        )
+
+    params = {}
+    for token in spec.split():
+        key, eq, number = token.partition("=")
+        if not eq:
+            params["kind"] = token
+        else:
+            params[key.lower()] = number
+    return _build_profile(name, params)
+
+
+def _build_profile(name: str, params: Mapping[str, Any]) -> PriceProfile:
+    """Validate a profile name and parameters."""
+    name = name.strip().lower()
+    if not _NAME_RE.match(name):
+        raise ValueError(
+            f"Invalid price profile name '{name}' (use letters, digits and _)"
+        )
+
+    kind = str(params.get("kind", PROFILE_KIND_EXPORT)).lower()
+    if kind not in _KINDS:
+        raise ValueError(f"Unknown kind '{kind}' in price profile '{name}'")
+
+    values = {}
+    for key, number in params.items():
+        if key == "kind":
+            continue
+        if key not in _PARAMETERS:
+            raise ValueError(f"Unknown parameter '{key}' in price profile '{name}'")
+        try:
+            values[key] = float(number)
+        except (TypeError, ValueError) as err:
+            raise ValueError(
+                f"Invalid {key} '{number}' in price profile '{name}'"
+            ) from err
+    return PriceProfile(name=name, kind=kind, **values)
@@ -0,0 +1,229 @@
+"""Price conversion chains compiled into affine transforms."""
+
+import logging
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from ..const.energy import EnergyUnit
+
+try:  # NumPy ships with Home Assistant but is not a requirement of ge_spot
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+_LOGGER = logging.getLogger(__name__)
+
+# Below this many values the NumPy round trip costs more than it saves
+_NUMPY_MIN_VALUES = 16
+
+
+@dataclass(frozen=True, slots=True)
+class AffineTransform:
+    """A price transform of the form price * scale + offset.
+
+    Every step of the conversion chain (exchange rate, energy unit, import
+    multiplier, tariff and tax, VAT, display subunit; or the export formula)
+    is either a multiplication or an addition, so the whole chain collapses
+    into one scale and one offset that can be computed once per cycle.
+    """
+
+    scale: float = 1.0
+    offset: float = 0.0
+
+    def __call__(self, price: float) -> float:
+        """Apply the transform to one price."""
+        return price * self.scale + self.offset
+
+    def then(self, other: "AffineTransform") -> "AffineTransform":
+        """Compose: apply this transform, then other."""
+        return AffineTransform(
+            scale=self.scale * other.scale,
+            offset=self.offset * other.scale + other.offset,
+        )
+
+    def apply_many(self, values: Sequence[float]) -> List[float]:
+        """Apply the transform to a sequence of prices."""
+        return apply_transforms(values, (self,))[0]
+
+
+IDENTITY = AffineTransform()
+
+
+def energy_unit_factor(source_unit: str, target_unit: str) -> Optional[float]:
+    """Factor converting a price per source_unit to a price per target_unit.
+
+    Returns:
+        The factor, or None if either unit is unknown
+    """
+    if source_unit == target_unit:
+        return 1.0
+    if source_unit == EnergyUnit.MWH and target_unit == EnergyUnit.KWH:
+        return 1 / 1000
+    if source_unit == EnergyUnit.KWH and target_unit == EnergyUnit.MWH:
+        return 1000.0
+
+    source_factor = EnergyUnit.CONVERSION.get(source_unit)
+    target_factor = EnergyUnit.CONVERSION.get(target_unit)
+    if not source_factor or target_factor is None:
+        _LOGGER.error(
+            f"Invalid energy unit specified: source='{source_unit}', target='{target_unit}'"
+        )
+        return None
+    return source_factor / target_factor
+
+
+def compile_energy_price_transform(
+    source_unit: str,
+    target_unit: str = EnergyUnit.TARGET,
+    vat_rate: float = 0.0,
+    display_unit_multiplier: int = 1,
+    additional_tariff: float = 0.0,
+    energy_tax: float = 0.0,
+    tariff_in_subunit: bool = False,
+    import_multiplier: float = 1.0,
+    exchange_rate: Optional[float] = None,
+) -> Optional[AffineTransform]:
+    """Compile the convert_energy_price chain (plus exchange rate) into one transform.
+
+    Follows the same order as utils.unit_conversion.convert_energy_price:
+    exchange rate, energy unit, import multiplier, tariff and tax, VAT, then
+    the display subunit.
+
+    Returns:
+        The compiled transform, or None if the units cannot be converted
+    """
+    unit_factor = energy_unit_factor(source_unit, target_unit)
+    if unit_factor is None:
+        return None
+
+    after_fees = (1 + vat_rate) * display_unit_multiplier
+    spot_scale = (exchange_rate if exchange_rate is not None else 1.0) * unit_factor
+    return AffineTransform(
+        scale=spot_scale * import_multiplier * after_fees,
+        offset=(additional_tariff + energy_tax)
+        * fee_scale(vat_rate, display_unit_multiplier, tariff_in_subunit),
+    )
+
+
+def fee_scale(
+    vat_rate: float, display_unit_multiplier: int, tariff_in_subunit: bool
+) -> float:
+    """Factor a per-kWh tariff or tax is multiplied by in the final price.
+
+    Fees are added before VAT and the display subunit; fees entered in the
+    subunit are first converted back to the main unit.
+    """
+    scale = (1 + vat_rate) * display_unit_multiplier
+    if tariff_in_subunit and display_unit_multiplier > 1:
+        scale /= display_unit_multiplier
+    return scale
+
+
+def compile_export_transform(
+    multiplier: float, offset: float, vat: float
+) -> AffineTransform:
+    """Compile the export formula (raw × multiplier + offset) × (1 + VAT)."""
+    return AffineTransform(scale=multiplier * (1 + vat), offset=offset * (1 + vat))
+
+
+def apply_transforms(
+    values: Sequence[float],
+    transforms: Iterable[AffineTransform],
+    extra_offsets: Optional[Sequence[Optional[Sequence[float]]]] = None,
+) -> List[List[float]]:
+    """Apply several transforms to the same prices in one batch.
+
+    With NumPy the values become one array and every transform is a single
+    vectorized multiply-add; without it each transform is one pass over a
+    float array.
+
+    Args:
+        values: Prices (floats)
+        transforms: Transforms to apply
+        extra_offsets: Optional per-value offsets for each transform (None
+            where a transform has none), e.g. a time-of-use tariff vector
+
+    Returns:
+        One list of results per transform, in the order of values
+    """
+    transforms = tuple(transforms)
+    extras = tuple(extra_offsets or ()) + (None,) * len(transforms)
+    if np is not None and len(values) >= _NUMPY_MIN_VALUES:
+        vector = np.asarray(values, dtype=float)
+        results = []
+        for t, extra in zip(transforms, extras):
+            result = vector * t.scale + t.offset
+            if extra is not None:
+                result += np.asarray(extra, dtype=float)
+            results.append(result.tolist())
+        return results
+
+    vector = array("d", values)
+    results = []
+    for t, extra in zip(transforms, extras):
+        result = [value * t.scale + t.offset for value in vector]
+        if extra is not None:
+            result = [value + offset for value, offset in zip(result, extra)]
+        results.append(result)
+    return results
+
+
+def transform_interval_prices(
+    interval_prices: Dict[str, float],
+    transforms: Iterable[AffineTransform],
+    extra_offsets: Optional[Sequence[Optional[Mapping[str, float]]]] = None,
+    drop_missing: bool = False,
+) -> Tuple[Dict[str, Optional[float]], ...]:
+    """Apply transforms to interval prices, keeping keys and missing values.
+
+    Prices given as {"price": value} are unwrapped; None and non-numeric
+    prices come out as None in every result (or are left out with
+    drop_missing). Each result dict is built once, in input order.
+
+    Args:
+        interval_prices: Prices keyed by interval
+        transforms: Transforms to apply
+        extra_offsets: Optional per-interval offsets for each transform (None
+            where a transform has none); intervals missing from a mapping get 0
+        drop_missing: Leave missing prices out instead of mapping them to None
+
+    Returns:
+        One dict per transform with the same keys as interval_prices
+    """
+    transforms = tuple(transforms)
+    keys = []
+    values = []
+    missing = set()
+    for key, price in interval_prices.items():
+        if isinstance(price, dict) and "price" in price:
+            price = price["price"]
+        if price is None:
+            missing.add(key)
+            continue
+        try:
+            values.append(float(price))
+        except (TypeError, ValueError):
+            _LOGGER.error(f"Error converting price for interval {key} (Value: {price})")
+            missing.add(key)
+            continue
+        keys.append(key)
+
+    per_value = [
+        None if offsets is None else [offsets.get(key, 0.0) for key in keys]
+        for offsets in (extra_offsets or ())
+    ]
+    results = []
+    for converted in apply_transforms(values, transforms, per_value):
+        if not missing or drop_missing:
+            results.append(dict(zip(keys, converted)))
+            continue
+        # Keep the input order, with None in the gaps
+        converted = iter(converted)
+        results.append(
+            {
+                key: None if key in missing else next(converted)
+                for key in interval_prices
+            }
+        )
+    return tuple(results)
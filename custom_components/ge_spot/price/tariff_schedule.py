@@ -0,0 +1,241 @@
+"""Time-of-use tariff schedules compiled into per-interval tariff vectors."""
+
+import hashlib
+import logging
+from dataclasses import dataclass
+from datetime import date, tzinfo
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, FrozenSet, Mapping, Optional, Tuple
+
+from ..utils.interval_series import IntervalSeries
+
+_LOGGER = logging.getLogger(__name__)
+
+_MINUTES_PER_DAY = 24 * 60
+_WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+_MONTHS = (
+    "jan",
+    "feb",
+    "mar",
+    "apr",
+    "may",
+    "jun",
+    "jul",
+    "aug",
+    "sep",
+    "oct",
+    "nov",
+    "dec",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class TariffRule:
+    """One time-of-use rule: a tariff for a time window on some days.
+
+    The window is [start, end) in minutes after local midnight; a window with
+    start >= end wraps past midnight (e.g. 22:00-06:00). Empty weekday or month
+    sets match every day.
+    """
+
+    tariff: float
+    start: int = 0
+    end: int = _MINUTES_PER_DAY
+    weekdays: FrozenSet[int] = frozenset()  # 0 = Monday
+    months: FrozenSet[int] = frozenset()  # 1 = January
+
+    def matches_day(self, day: date) -> bool:
+        """Whether the rule applies on a local date."""
+        return (not self.weekdays or day.weekday() in self.weekdays) and (
+            not self.months or day.month in self.months
+        )
+
+    def matches_minute(self, minute: int) -> bool:
+        """Whether a local time (minutes after midnight) is in the window."""
+        if self.start < self.end:
+            return self.start <= minute < self.end
+        return minute >= self.start or minute < self.end
+
+
+@dataclass(frozen=True, slots=True)
+class TariffSchedule:
+    """Ordered time-of-use rules with a fallback tariff.
+
+    The first rule matching an interval's local start time sets its tariff;
+    intervals no rule covers get the default (the scalar additional tariff).
+    Tariffs are in the same unit as the configured price display format.
+
+    A schedule is written one rule per line (or separated by ";"):
+
+        17:00-20:00 mon-fri nov-mar = 0.80
+        06:00-22:00 mon-fri = 0.45
+        * = 0.25
+
+    Each rule has optional time window, weekday and month parts before the
+    "=". Weekdays and months accept ranges (mon-fri, nov-mar) and lists
+    (sat,sun).
+    """
+
+    rules: Tuple[TariffRule, ...] = ()
+    default: float = 0.0
+
+    @classmethod
+    def from_config(
+        cls, value: Any, default: float = 0.0
+    ) -> Optional["TariffSchedule"]:
+        """Build a schedule from its config value.
+
+        Args:
+            value: Schedule text (see class docstring), or a list of rule dicts
+                with "tariff" and optional "start", "end", "weekdays", "months"
+            default: Tariff for intervals no rule covers
+
+        Returns:
+            The schedule, or None if no rules are configured
+
+        Raises:
+            ValueError: If the schedule cannot be parsed
+        """
+        if not value:
+            return None
+        if isinstance(value, str):
+            rules = tuple(
+                _parse_rule(line)
+                for line in value.replace(";", "\n").splitlines()
+                if line.split("#", 1)[0].strip()
+            )
+        else:
+            rules = tuple(_rule_from_dict(item) for item in value)
+        if not rules:
+            return None
+        return cls(rules=rules, default=float(default))
+
+    @property
+    def version(self) -> str:
+        """Short stable hash of the rules, stamped on processed prices."""
+        text = repr(
+            [
+                (r.tariff, r.start, r.end, sorted(r.weekdays), sorted(r.months))
+                for r in self.rules
+            ]
+        )
+        return hashlib.sha1(text.encode()).hexdigest()[:12]
+
+    def tariff_at(self, day: date, minute: int) -> float:
+        """Tariff for a local date and time (minutes after midnight)."""
+        for rule in self.rules:
+            if rule.matches_day(day) and rule.matches_minute(minute):
+                return rule.tariff
+        return self.default
+
+    def vector(
+        self, day: date, tz: tzinfo, resolution_seconds: Optional[int] = None
+    ) -> Tuple[float, ...]:
+        """Per-interval tariffs for a local day, aligned with IntervalSeries slots."""
+        return _compile_day(self, day, tz, resolution_seconds)[0]
+
+    def tariffs_for_day(
+        self, day: date, tz: tzinfo, resolution_seconds: Optional[int] = None
+    ) -> Mapping[str, float]:
+        """Per-interval tariffs for a local day keyed like normalized prices."""
+        return _compile_day(self, day, tz, resolution_seconds)[1]
+
+
+@lru_cache(maxsize=32)
+def _compile_day(
+    schedule: TariffSchedule,
+    day: date,
+    tz: tzinfo,
+    resolution_seconds: Optional[int],
+) -> Tuple[Tuple[float, ...], Mapping[str, float]]:
+    """Compile a schedule for one day (cached by schedule, date and timezone).
+
+    Schedules are compared by value, so entries sharing a schedule share the
+    compiled day, and an edited schedule never hits a stale entry.
+    """
+    series = IntervalSeries(day, tz, resolution_seconds)
+    tariffs = []
+    for index in range(len(series)):
+        local = series.time_of(index)
+        tariffs.append(schedule.tariff_at(day, local.hour * 60 + local.minute))
+
+    by_key = {series.key_of(index): tariff for index, tariff in enumerate(tariffs)}
+    _LOGGER.debug(
+        f"Compiled tariff schedule {schedule.version} for {day} ({len(tariffs)} intervals)"
+    )
+    return tuple(tariffs), MappingProxyType(by_key)
+
+
+def _parse_minutes(text: str) -> int:
+    """Parse "HH:MM" (up to 24:00) into minutes after midnight."""
+    hour, sep, minute = text.strip().partition(":")
+    if not sep or not hour.isdigit() or not minute.isdigit():
+        raise ValueError(f"Invalid time '{text}'")
+    minutes = int(hour) * 60 + int(minute)
+    if int(minute) >= 60 or minutes > _MINUTES_PER_DAY:
+        raise ValueError(f"Invalid time '{text}'")
+    return minutes
+
+
+def _parse_names(text: str, names: Tuple[str, ...], first: int) -> FrozenSet[int]:
+    """Parse a list of names and wrapping ranges (e.g. "sat,sun" or "nov-mar")."""
+    values = set()
+    for part in text.lower().split(","):
+        start, sep, end = part.strip().partition("-")
+        if start not in names or (sep and end not in names):
+            raise ValueError(f"Unknown day or month '{part}'")
+        i, j = names.index(start), names.index(end if sep else start)
+        span = (j - i) % len(names)
+        values.update(first + (i + k) % len(names) for k in range(span + 1))
+    return frozenset(values)
+
+
+def _parse_rule(line: str) -> TariffRule:
+    """Parse one "<window> <weekdays> <months> = <tariff>" line."""
+    spec, sep, tariff = line.split("#", 1)[0].partition("=")
+    if not sep:
+        raise ValueError(f"Missing '=' in tariff rule '{line.strip()}'")
+    try:
+        rule = {"tariff": float(tariff)}
+    except ValueError as err:
+        raise ValueError(f"Invalid tariff in rule '{line.strip()}'") from err
+
+    for token in spec.split():
+        token = token.lower()
+        if token == "*":
+            continue
+        if ":" in token:
+            start, _, end = token.partition("-")
+            rule["start"], rule["end"] = _parse_minutes(start), _parse_minutes(end)
+        elif token.split("-")[0].split(",")[0] in _WEEKDAYS:
+            rule["weekdays"] = _parse_names(token, _WEEKDAYS, 0)
+        else:
+            rule["months"] = _parse_names(token, _MONTHS, 1)
+    return TariffRule(**rule)
+
+
+def _rule_from_dict(item: Mapping[str, Any]) -> TariffRule:
+    """Build a rule from a dict with "HH:MM" times and name or number lists."""
+    try:
+        tariff = float(item["tariff"])
+    except (KeyError, TypeError, ValueError) as err:
+        raise ValueError(f"Invalid tariff in rule {item!r}") from err
+
+    def _days(values, names, first):
+        if not values:
+            return frozenset()
+        if isinstance(values, str):
+            return _parse_names(values, names, first)
+        return frozenset(
+            int(v) if not isinstance(v, str) else names.index(v.lower()) + first
+            for v in values
+        )
+
+    return TariffRule(
+        tariff=tariff,
+        start=_parse_minutes(item.get("start", "00:00")),
+        end=_parse_minutes(item.get("end", "24:00")),
+        weekdays=_days(item.get("weekdays"), _WEEKDAYS, 0),
+        months=_days(item.get("months"), _MONTHS, 1),
+    )
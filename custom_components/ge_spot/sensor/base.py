@@ -1,7 +1,8 @@
 """Base sensor for electricity prices."""
 
 import logging
-from datetime import datetime, timedelta
+from datetime import timedelta
+from typing import Any, Dict, List
 
 from homeassistant.components.sensor import (
     SensorEntity,
@@ -14,7 +15,7 @@ from ..const.config import Config
 from ..const.currencies import CurrencyInfo
 from ..const.defaults import Defaults
 from ..const.display import DisplayUnit
-from ..coordinator.data_processor import parse_interval_key
+from ..utils.interval_series import IntervalSeries
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -243,98 +244,78 @@ class BaseElectricityPriceSensor(SensorEntity):
         # Get target timezone (interval keys are area-local; see _target_timezone)
         target_tz = self._target_timezone
 
+        # Interval keys are placed on per-day slot arrays (IntervalSeries), so
+        # each interval's time comes from its slot index - DST-correct, with
+        # no per-key parsing; "HH:MM" keys are only used to look up raw prices.
+        data = self.coordinator.data
+        now = dt_util.now().astimezone(target_tz)
+        attrs["today_interval_prices"] = []
+        attrs["tomorrow_interval_prices"] = []
+
         # Convert today's prices from HH:MM dict to list of datetime objects
-        if self.coordinator.data and self.coordinator.data.today_interval_prices:
-            today_prices = self.coordinator.data.today_interval_prices
-            today_raw_prices = self.coordinator.data.today_raw_prices
-
-            if isinstance(today_prices, dict) and today_prices:
-                now = dt_util.now().astimezone(target_tz)
-                today_date = now.date()
-
-                today_list = []
-                for hhmm_key in sorted(today_prices.keys()):
-                    try:
-                        hour, minute = parse_interval_key(hhmm_key)
-                        dt = datetime(
-                            today_date.year,
-                            today_date.month,
-                            today_date.day,
-                            hour,
-                            minute,
-                            0,
-                            tzinfo=target_tz,
-                        )
-                        price = today_prices[hhmm_key]
-                        raw_price = today_raw_prices.get(hhmm_key)
-
-                        entry = {
-                            "time": dt,  # datetime object (not ISO string!)
-                            "value": round(float(price), 4),
-                        }
-
-                        # Add raw_value if available (Issue #40)
-                        if raw_price is not None:
-                            entry["raw_value"] = round(float(raw_price), 4)
-
-                        today_list.append(entry)
-                    except (ValueError, AttributeError) as e:
-                        _LOGGER.warning(f"Failed to convert interval {hhmm_key}: {e}")
-                        continue
-
-                attrs["today_interval_prices"] = today_list
-            else:
-                attrs["today_interval_prices"] = []
-        else:
-            attrs["today_interval_prices"] = []
+        if data and isinstance(data.today_interval_prices, dict):
+            attrs["today_interval_prices"] = self._interval_price_list(
+                self._day_series(data, "today_series", now.date(), target_tz),
+                data.today_raw_prices,
+            )
 
         # Convert tomorrow's prices from HH:MM dict to list of datetime objects
-        if self.coordinator.data and self.coordinator.data.tomorrow_interval_prices:
-            tomorrow_prices = self.coordinator.data.tomorrow_interval_prices
-            tomorrow_raw_prices = self.coordinator.data.tomorrow_raw_prices
-
-            if isinstance(tomorrow_prices, dict) and tomorrow_prices:
-                now = dt_util.now().astimezone(target_tz)
-                tomorrow_date = (now + timedelta(days=1)).date()
-
-                tomorrow_list = []
-                for hhmm_key in sorted(tomorrow_prices.keys()):
-                    try:
-                        hour, minute = parse_interval_key(hhmm_key)
-                        dt = datetime(
-                            tomorrow_date.year,
-                            tomorrow_date.month,
-                            tomorrow_date.day,
-                            hour,
-                            minute,
-                            0,
-                            tzinfo=target_tz,
-                        )
-                        price = tomorrow_prices[hhmm_key]
-                        raw_price = tomorrow_raw_prices.get(hhmm_key)
-
-                        entry = {
-                            "time": dt,  # datetime object (not ISO string!)
-                            "value": round(float(price), 4),
-                        }
-
-                        # Add raw_value if available (Issue #40)
-                        if raw_price is not None:
-                            entry["raw_value"] = round(float(raw_price), 4)
-
-                        tomorrow_list.append(entry)
-                    except (ValueError, AttributeError) as e:
-                        _LOGGER.warning(f"Failed to convert interval {hhmm_key}: {e}")
-                        continue
-
-                attrs["tomorrow_interval_prices"] = tomorrow_list
-            else:
-                attrs["tomorrow_interval_prices"] = []
-        else:
-            attrs["tomorrow_interval_prices"] = []
+        if data and isinstance(data.tomorrow_interval_prices, dict):
+            attrs["tomorrow_interval_prices"] = self._interval_price_list(
+                self._day_series(
+                    data,
+                    "tomorrow_series",
+                    (now + timedelta(days=1)).date(),
+                    target_tz,
+                ),
+                data.tomorrow_raw_prices,
+            )
 
         return attrs
 
+    @staticmethod
+    def _day_series(data, name: str, day, target_tz) -> IntervalSeries:
+        """Get the data's memoized series for a day, or build it for target_tz."""
+        series = getattr(data, name, None)
+        if (
+            isinstance(series, IntervalSeries)
+            and series.day == day
+            and series.tz == target_tz
+        ):
+            return series
+        prices = (
+            data.today_interval_prices
+            if name == "today_series"
+            else data.tomorrow_interval_prices
+        )
+        return IntervalSeries.from_interval_prices(prices, day, target_tz)
+
+    @staticmethod
+    def _interval_price_list(
+        series: IntervalSeries, raw_prices: Dict[str, float]
+    ) -> List[Dict[str, Any]]:
+        """Render a series as [{"time": datetime, "value": float}, ...].
+
+        External integrations (EV Smart Charging) expect this format.
+        """
+        result = []
+        for index in series.present_indices():
+            entry = {
+                "time": series.time_of(index),  # datetime object (not ISO string!)
+                "value": round(series.values[index], 4),
+            }
+
+            # Add raw_value if available (Issue #40)
+            raw_price = raw_prices.get(series.key_of(index)) if raw_prices else None
+            if raw_price is not None:
+                try:
+                    entry["raw_value"] = round(float(raw_price), 4)
+                except (TypeError, ValueError):
+                    pass
+
+            result.append(entry)
+        return result
+
     async def async_added_to_hass(self):
         """When entity is added to hass."""
         self.async_on_remove(
@@ -24,6 +24,7 @@ from .price import (
 from ..const.attributes import Attributes
 from ..const.defaults import Defaults
 from ..const.display import DisplayUnit
+from ..price.price_profiles import PriceProfile, parse_price_profiles
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -398,5 +399,101 @@ async def async_setup_entry(
         _LOGGER.debug(f"Added export price sensors for area {coordinator.area}")
     # --- End Export Price Sensors ---
 
+    # --- Price Profile Sensors ---
+    # One set per named import/export formula, all computed in the same pass
+    try:
+        price_profiles = parse_price_profiles(
+            options.get(
+                Config.PRICE_PROFILES,
+                data.get(Config.PRICE_PROFILES, Defaults.PRICE_PROFILES),
+            )
+        )
+    except ValueError as e:
+        _LOGGER.error(f"Invalid price profiles for area {coordinator.area}: {e}")
+        price_profiles = ()
+
+    for profile in price_profiles:
+        entities.extend(
+            _create_profile_sensors(coordinator, config_data, profile, get_base_attrs)
+        )
+    if price_profiles:
+        _LOGGER.debug(
+            f"Added sensors for {len(price_profiles)} price profiles for area {coordinator.area}"
+        )
+    # --- End Price Profile Sensors ---
+
     # Add all entities
     async_add_entities(entities)
+
+
+def _create_profile_sensors(
+    coordinator, config_data, profile: PriceProfile, base_attrs
+):
+    """Create the current, average, peak, off-peak and tomorrow sensors of a profile."""
+    name = profile.name
+    prefix = f"{profile.kind}_{name}"
+    label = f"{profile.kind.title()} {name.replace('_', ' ').title()}"
+
+    def get_profile_attrs(data):
+        """Get profile attributes including interval prices for automations."""
+        attrs = {"tomorrow_valid": data.tomorrow_valid if data else False}
+        for day, prices in (
+            ("today", data.profile_today_prices.get(name) if data else None),
+            ("tomorrow", data.profile_tomorrow_prices.get(name) if data else None),
+        ):
+            attrs[f"{day}_interval_prices"] = [
+                {"time": key, "value": round(float(prices[key]), 4)}
+                for key in sorted(prices or {})
+                if prices[key] is not None
+            ]
+        return attrs
+
+    def statistic(stat_type, day_offset=0):
+        return lambda data: (
+            getattr(data.profile_statistics(name, day_offset), stat_type)
+            if data
+            else None
+        )
+
+    return [
+        PriceValueSensor(
+            coordinator,
+            config_data,
+            f"{prefix}_current_price",
+            f"{label} Current Price",
+            lambda data: data.profile_current_price(name) if data else None,
+            get_profile_attrs,
+        ),
+        PriceValueSensor(
+            coordinator,
+            config_data,
+            f"{prefix}_average_price",
+            f"{label} Average Price",
+            statistic("avg"),
+            None,
+        ),
+        PriceValueSensor(
+            coordinator,
+            config_data,
+            f"{prefix}_peak_price",
+            f"{label} Peak Price",
+            statistic("max"),
+            None,
+        ),
+        PriceValueSensor(
+            coordinator,
+            config_data,
+            f"{prefix}_off_peak_price",
+            f"{label} Off-Peak Price",
+            statistic("min"),
+            None,
+        ),
+        TomorrowAveragePriceSensor(
+            coordinator,
+            config_data,
+            f"tomorrow_{prefix}_average_price",
+            f"Tomorrow {label} Average Price",
+            statistic("avg", day_offset=1),
+            additional_attrs=base_attrs,
+        ),
+    ]
@@ -174,6 +174,9 @@ class PriceStatisticSensor(PriceValueSensor):
 
     device_class = SensorDeviceClass.MONETARY
     state_class = None
+    _unrecorded_attributes = BaseElectricityPriceSensor._unrecorded_attributes | {
+        "same_day_last_week_prices"
+    }
 
     def __init__(self, coordinator, config_data, sensor_type, name_suffix, stat_type):
         """Initialize the price statistic sensor."""
@@ -217,6 +220,33 @@ class PriceStatisticSensor(PriceValueSensor):
     def native_unit_of_measurement(self):
         return super().native_unit_of_measurement
 
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes, with last week's prices for comparison."""
+        attrs = super().extra_state_attributes
+        history = getattr(self.coordinator, "price_history", None)
+        if attrs and isinstance(history, dict) and history.get("week"):
+            attrs.update(self._last_week_attributes(history))
+        return attrs
+
+    @staticmethod
+    def _last_week_attributes(history: Dict[str, Any]) -> Dict[str, Any]:
+        """Render PriceArchive.get_last_week output as sensor attributes."""
+        week = history["week"]
+        return {
+            "last_week_average": round(week["avg"], 4),
+            "last_week_min": round(week["min"], 4),
+            "last_week_max": round(week["max"], 4),
+            "last_week_daily_averages": {
+                day: round(rollup["avg"], 4)
+                for day, rollup in history.get("daily", {}).items()
+            },
+            "same_day_last_week_prices": [
+                {"time": moment, "value": round(price, 4)}
+                for moment, price in history.get("same_day", [])
+            ],
+        }
+
 
 class PriceDifferenceSensor(PriceValueSensor):
     """Sensor for price difference between two values."""
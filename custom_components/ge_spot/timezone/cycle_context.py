@@ -0,0 +1,92 @@
+"""One consistent view of the current time for an update cycle."""
+
+from datetime import date, datetime, timedelta, timezone
+from functools import cached_property
+from typing import Any, Optional
+
+from homeassistant.util import dt as dt_util
+
+from ..const.time import TimeInterval
+from .interval_table import IntervalTable, get_interval_table
+
+
+class CycleContext:
+    """Snapshot of "now" shared by every step of one update cycle.
+
+    A cycle (fetch decision, parsing, conversion, statistics, validity) used
+    to read the clock and convert it to each timezone many times over; a cycle
+    running across midnight or an interval boundary could then split today
+    and tomorrow with one date and pick the current interval with another.
+    Here the clock is read once and everything else is derived from that
+    instant, each at most once and only when first needed.
+    """
+
+    def __init__(self, tz_service: Any, now: Optional[datetime] = None):
+        """Initialize the context.
+
+        Args:
+            tz_service: TimezoneService of the area being processed
+            now: Instant of the cycle (defaults to the current time)
+        """
+        self._tz_service = tz_service
+        self.now_utc: datetime = (now or dt_util.utcnow()).astimezone(timezone.utc)
+
+    @cached_property
+    def now_ha(self) -> datetime:
+        """The cycle instant in the Home Assistant timezone."""
+        return self.now_utc.astimezone(dt_util.get_default_time_zone())
+
+    @cached_property
+    def now_area(self) -> datetime:
+        """The cycle instant in the area timezone (HA timezone if unknown)."""
+        area_tz = self._tz_service.area_timezone
+        return self.now_utc.astimezone(area_tz) if area_tz else self.now_ha
+
+    @cached_property
+    def now_target(self) -> datetime:
+        """The cycle instant in the display timezone prices are keyed in."""
+        return self.now_utc.astimezone(self._tz_service.target_timezone)
+
+    @cached_property
+    def today(self) -> date:
+        """Today's date in the display timezone."""
+        return self.now_target.date()
+
+    @cached_property
+    def tomorrow(self) -> date:
+        """Tomorrow's date in the display timezone."""
+        return self.today + timedelta(days=1)
+
+    @cached_property
+    def current_interval_key(self) -> str:
+        """Key of the interval containing the cycle instant."""
+        return self._tz_service.get_current_interval_key(now=self.now_utc)
+
+    @cached_property
+    def next_interval_key(self) -> str:
+        """Key of the interval after the current one."""
+        return self._tz_service.get_next_interval_key(now=self.now_utc)
+
+    @cached_property
+    def today_table(self) -> IntervalTable:
+        """DST-aware interval table of today in the display timezone."""
+        return get_interval_table(self.today, self._tz_service.target_timezone)
+
+    @cached_property
+    def tomorrow_table(self) -> IntervalTable:
+        """DST-aware interval table of tomorrow in the display timezone."""
+        return get_interval_table(self.tomorrow, self._tz_service.target_timezone)
+
+    @cached_property
+    def expected_intervals_today(self) -> int:
+        """Expected interval count of today in the area timezone (92/96/100)."""
+        return TimeInterval.get_expected_intervals_for_date(
+            self.now_area, self._tz_service.area_timezone
+        )
+
+    @cached_property
+    def expected_intervals_tomorrow(self) -> int:
+        """Expected interval count of tomorrow in the area timezone."""
+        area_tz = self._tz_service.area_timezone
+        tomorrow = self.now_area + timedelta(days=1)
+        return TimeInterval.get_expected_intervals_for_date(tomorrow, area_tz)
@@ -1,7 +1,9 @@
 """Interval calculation utilities."""
 
 import logging
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
 
 from homeassistant.util import dt as dt_util
 
@@ -16,6 +18,20 @@ from ..const.network import Network
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class IntervalWindow:
+    """The current interval and its successor, valid until the next boundary."""
+
+    start_utc: datetime
+    end_utc: datetime
+    current_key: str
+    next_key: str
+
+    def contains(self, moment: datetime) -> bool:
+        """Whether an aware instant falls inside the window."""
+        return self.start_utc <= moment < self.end_utc
+
+
 class IntervalCalculator:
     """Calculator for time interval operations."""
 
@@ -35,6 +51,8 @@ class IntervalCalculator:
         # Store timezone reference mode
         self.timezone_reference = timezone_reference
         self.dst_handler = DSTHandler(self.timezone)
+        # Current/next keys, reused until the next interval boundary
+        self._window: Optional[IntervalWindow] = None
 
     def _round_to_interval(self, dt: datetime) -> datetime:
         """Round datetime to nearest interval boundary.
@@ -46,27 +64,70 @@ class IntervalCalculator:
         minute = (dt.minute // interval_minutes) * interval_minutes
         return dt.replace(minute=minute, second=0, microsecond=0)
 
-    def get_current_interval_key(self) -> str:
-        """Get the current interval formatted as HH:MM."""
-        # Get current time in the specified timezone
-        now = dt_util.now(self.timezone)
-        now_display = now  # Initialize now_display with a default value
+    def get_current_window(self, now: Optional[datetime] = None) -> IntervalWindow:
+        """Get the window of the interval containing an instant.
+
+        Every sensor state write, IntervalPriceData property and fetch
+        decision asks for the current key. The keys only change at interval
+        boundaries, so they are derived once per interval; until the window
+        ends, a lookup is a clock read and one comparison.
+
+        Args:
+            now: Instant to use instead of the current time (e.g. a cycle's)
 
+        Returns:
+            IntervalWindow with the current and next interval keys
+        """
+        now_utc = (now or dt_util.now()).astimezone(timezone.utc)
+        window = self._window
+        if window is None or not window.contains(now_utc):
+            window = self._window = self._build_window(now_utc)
+        return window
+
+    def get_current_interval_key(self, now: Optional[datetime] = None) -> str:
+        """Get the current interval formatted as HH:MM.
+
+        Args:
+            now: Instant to use instead of the current time (e.g. a cycle's)
+        """
+        return self.get_current_window(now).current_key
+
+    def _build_window(self, now_utc: datetime) -> IntervalWindow:
+        """Derive the keys and bounds of the interval containing now_utc."""
+        current_key, start = self._current_interval(now_utc)
+        start_utc = start.astimezone(timezone.utc)
+        end_utc = start_utc + timedelta(minutes=TimeInterval.get_interval_minutes())
+        window = IntervalWindow(
+            start_utc=start_utc,
+            end_utc=end_utc,
+            current_key=current_key,
+            next_key=self.get_interval_key_for_datetime(end_utc),
+        )
         _LOGGER.debug(
-            f"IntervalCalculator input: timezone={self.timezone}, system_timezone={self.system_timezone}, area_timezone={self.area_timezone}, timezone_reference={self.timezone_reference}"
+            f"Interval window {start_utc.isoformat()} - {end_utc.isoformat()}: "
+            f"current={window.current_key}, next={window.next_key} "
+            f"(timezone_reference={self.timezone_reference})"
         )
+        return window
+
+    def _current_interval(self, now_utc: datetime) -> Tuple[str, datetime]:
+        """Get the current interval key and the start of the interval.
+
+        Args:
+            now_utc: Instant to get the interval of
+
+        Returns:
+            Tuple of (HH:MM key, aware start of the interval)
+        """
+        now = now_utc.astimezone(self.timezone)
+        now_display = now  # Initialize now_display with a default value
 
         # If using Home Assistant Time mode, we need to compensate for timezone differences
         if self.timezone_reference == TimezoneReference.HOME_ASSISTANT:
             if self.area_timezone and self.area_timezone != self.system_timezone:
                 # Get the current time in both timezones to calculate the correct offset
-                now_system = datetime.now(self.system_timezone)
-                now_area = datetime.now(self.area_timezone)
-
-                # Log the actual times for debugging
-                _LOGGER.debug(
-                    f"System time: {now_system.isoformat()}, Area time: {now_area.isoformat()}"
-                )
+                now_system = now.astimezone(self.system_timezone)
+                now_area = now.astimezone(self.area_timezone)
 
                 # Calculate total seconds difference to handle DST and other edge cases
                 time_diff_seconds = (
@@ -76,10 +137,6 @@ class IntervalCalculator:
                     time_diff_seconds / Network.Defaults.SECONDS_PER_HOUR
                 )  # Convert to hours and round to nearest hour
 
-                _LOGGER.debug(
-                    f"IntervalCalculator compensation: now_system={now_system}, now_area={now_area}, hour_diff={hour_diff}"
-                )
-
                 # Round to interval and apply the offset
                 rounded = self._round_to_interval(now)
                 adjusted_hour = (rounded.hour - hour_diff) % 24
@@ -87,7 +144,7 @@ class IntervalCalculator:
                 _LOGGER.debug(
                     f"Applied timezone compensation of {-hour_diff} hours: {rounded.hour}:{rounded.minute:02d} → {interval_key}"
                 )
-                return interval_key
+                return interval_key, rounded
 
         # If area timezone is provided and using Local Area Time mode, use it for determining the current interval
         elif (
@@ -96,15 +153,9 @@ class IntervalCalculator:
         ):
             # Use astimezone to properly convert the time to the area timezone
             now_display = now.astimezone(self.area_timezone)
-            _LOGGER.debug(
-                f"IntervalCalculator using area_timezone: now_display={now_display}, area_timezone={self.area_timezone}"
-            )
         else:
             # Otherwise use system timezone for display
             now_display = now.astimezone(self.system_timezone)
-            _LOGGER.debug(
-                f"IntervalCalculator using system_timezone: now_display={now_display}, system_timezone={self.system_timezone}"
-            )
 
         # Round to interval boundary
         rounded = self._round_to_interval(now_display)
@@ -112,10 +163,6 @@ class IntervalCalculator:
         # Check for DST transition
         is_transition, transition_type = self.dst_handler.is_dst_transition_day(now)
 
-        _LOGGER.debug(
-            f"IntervalCalculator DST: is_transition={is_transition}, transition_type={transition_type}, now={now}"
-        )
-
         # Special handling for fall back transition during the ambiguous hour
         if (
             is_transition
@@ -130,21 +177,16 @@ class IntervalCalculator:
                 _LOGGER.debug(
                     "Current interval during fall back DST transition: first 02:XX"
                 )
-                return f"02:{rounded.minute:02d}"
+                return f"02:{rounded.minute:02d}", rounded
             else:
                 # Second time through 2:00 (DST ended)
                 _LOGGER.debug(
                     "Current interval during fall back DST transition: second 02:XX (03:XX)"
                 )
-                return f"03:{rounded.minute:02d}"
+                return f"03:{rounded.minute:02d}", rounded
 
         # Normal case - use the current interval in the appropriate timezone
-        interval_key = f"{rounded.hour:02d}:{rounded.minute:02d}"
-        display_tz = self.area_timezone if self.area_timezone else self.system_timezone
-        _LOGGER.debug(
-            f"IntervalCalculator result: interval_key={interval_key}, rounded={rounded}, display_tz={display_tz}"
-        )
-        return interval_key
+        return f"{rounded.hour:02d}:{rounded.minute:02d}", rounded
 
     def get_next_interval_key(self) -> str:
         """Get the next interval formatted as HH:MM."""
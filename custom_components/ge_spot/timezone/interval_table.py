@@ -0,0 +1,81 @@
+"""Precomputed DST-aware interval key tables, one per local day."""
+
+import logging
+from dataclasses import dataclass
+from datetime import date, tzinfo
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple, Union
+from zoneinfo import ZoneInfo
+
+from ..const.time import TimeInterval
+from .dst_handler import get_day_hours
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class IntervalTable:
+    """Interval slots of one local day in one timezone.
+
+    Slots follow get_day_hours: 96 quarter-hours on a normal day, 92 on a
+    spring-forward day (hour 2 skipped) and 100 on a fall-back day (hour 2
+    as "HH:MM_1" and "HH:MM_2"). Tables are immutable and shared between
+    callers through get_interval_table.
+    """
+
+    day: date
+    tz: tzinfo
+    interval_minutes: int
+    keys: Tuple[str, ...]
+
+    @property
+    def expected_intervals(self) -> int:
+        """Number of intervals in the day (92, 96 or 100 for quarter-hours)."""
+        return len(self.keys)
+
+    def missing(self, found: Iterable[str]) -> List[str]:
+        """Keys of the day that are not in found, in time order."""
+        found = found if isinstance(found, (set, frozenset, dict)) else set(found)
+        return [key for key in self.keys if key not in found]
+
+
+def get_interval_table(
+    day: date, tz: Union[str, tzinfo], interval_minutes: Optional[int] = None
+) -> IntervalTable:
+    """Get the interval table of a local day.
+
+    Args:
+        day: Local date
+        tz: Timezone (name or tzinfo) defining the local day
+        interval_minutes: Interval length (defaults to TimeInterval)
+
+    Returns:
+        Shared, immutable IntervalTable
+    """
+    if isinstance(tz, str):
+        tz = ZoneInfo(tz)
+    return _build_table(
+        day, tz, interval_minutes or TimeInterval.get_interval_minutes()
+    )
+
+
+@lru_cache(maxsize=16)
+def _build_table(day: date, tz: tzinfo, interval_minutes: int) -> IntervalTable:
+    """Build the table of a day (cached by date, timezone and interval length).
+
+    Each update cycle asks for today and tomorrow in the display and area
+    timezones, so a handful of entries covers every area.
+    """
+    keys = tuple(
+        f"{hour_info['hour']:02d}:{minute:02d}{hour_info.get('suffix', '')}"
+        for hour_info in get_day_hours(day, tz)
+        for minute in range(0, 60, interval_minutes)
+    )
+
+    _LOGGER.debug(f"Built interval table for {day} in {tz} ({len(keys)} intervals)")
+    return IntervalTable(
+        day=day,
+        tz=tz,
+        interval_minutes=interval_minutes,
+        keys=keys,
+    )
@@ -13,9 +13,10 @@ from homeassistant.util import dt as dt_util
 # Import Timezone class instead of AREA_TIMEZONES directly
 from ..const.areas import Timezone
 from ..const.config import Config
-from ..const.time import TimezoneConstants, TimezoneReference, TimeInterval
+from ..const.time import TimezoneConstants, TimezoneReference
 from .timezone_converter import TimezoneConverter
-from .dst_handler import DSTHandler, get_day_hours
+from .dst_handler import DSTHandler
+from .interval_table import get_interval_table
 from .interval_calculator import IntervalCalculator
 from .parser import TimestampParser
 from .timezone_utils import get_source_timezone, get_timezone_object
@@ -304,131 +305,69 @@ class TimezoneService:
             )
             return None
 
-    def get_current_interval_key(self):
-        """Get the current interval key in the appropriate timezone based on the timezone reference setting."""
-        # Get current time in different timezones for debugging
-        now_utc = datetime.now(timezone.utc)
-        now_ha = datetime.now(self.ha_timezone)
-        now_area = datetime.now(self.area_timezone) if self.area_timezone else None
+    def get_current_interval_key(self, now: Optional[datetime] = None):
+        """Get the current interval key in the appropriate timezone based on the timezone reference setting.
 
-        # Fix typo: now_tc -> now_utc
-        _LOGGER.debug(
-            f"Current time - UTC: {now_utc.strftime('%H:%M:%S')}, HA: {now_ha.strftime('%H:%M:%S')}"
-            + (
-                f", Area ({self.area}): {now_area.strftime('%H:%M:%S')}"
-                if now_area
-                else ""
-            )
-        )
-
-        interval_key = self.interval_calculator.get_current_interval_key()
-
-        # Log which timezone is being used based on the timezone reference setting
-        if (
-            self.timezone_reference == TimezoneReference.LOCAL_AREA
-            and self.area_timezone
-        ):
-            used_tz = self.area_timezone
-            _LOGGER.debug(
-                f"Using area timezone {used_tz} for interval key (Local Area Time mode)"
-            )
-        else:
-            used_tz = self.ha_timezone
-            _LOGGER.debug(
-                f"Using HA timezone {used_tz} for interval key (Home Assistant Time mode)"
-            )
-
-        _LOGGER.debug(
-            f"Current interval key from calculator: {interval_key} (timezone: {used_tz}, area: {self.area})"
-        )
-        return interval_key
+        Args:
+            now: Instant to use instead of the current time (e.g. a cycle's)
+        """
+        # Cached until the next interval boundary (see IntervalCalculator)
+        return self.interval_calculator.get_current_interval_key(now=now)
 
     def is_dst_transition_day(self, dt=None):
         """Check if today is a DST transition day."""
         return self.dst_handler.is_dst_transition_day(dt)
 
-    def get_next_interval_key(self) -> str:
+    def get_next_interval_key(self, now: Optional[datetime] = None) -> str:
         """Get key for the next interval in target timezone.
 
+        Args:
+            now: Instant to use instead of the current time (e.g. a cycle's)
+
         Returns:
             String key in format HH:MM
         """
-        # Delegate to interval calculator for consistent handling
-        now = dt_util.now()
-        interval_minutes = TimeInterval.get_interval_minutes()
-        next_interval = now + timedelta(minutes=interval_minutes)
-
-        # Use the interval calculator for consistent timezone handling based on timezone_reference
-        return self.interval_calculator.get_interval_key_for_datetime(next_interval)
+        # Derived with the current interval and cached until its boundary
+        return self.interval_calculator.get_current_window(now).next_key
 
-    def get_today_range(self) -> List[str]:
+    def get_today_range(self, now: Optional[datetime] = None) -> List[str]:
         """Get list of interval keys for today.
 
         Returns DST-aware interval keys:
         - Normal day: 96 intervals (00:00 to 23:45)
         - DST fall-back: 100 intervals (includes 02:00_1, 02:15_1, etc. and 02:00_2, 02:15_2, etc.)
         - DST spring-forward: 92 intervals (02:00-02:45 are skipped)
+
+        Args:
+            now: Instant to use instead of the current time (e.g. a cycle's)
         """
         # Get today's date in the target timezone
-        now = dt_util.now()
+        now = now or dt_util.now()
         if hasattr(now, "tzinfo") and now.tzinfo:
             today = now.astimezone(self.target_timezone).date()
         else:
             today = now.date()
 
-        # Use the timezone provider to get DST-aware intervals
-        day_hours = get_day_hours(today, self.target_timezone)
-
-        # Generate interval keys for all hours
-        interval_minutes = TimeInterval.get_interval_minutes()
-        intervals_per_hour = TimeInterval.get_intervals_per_hour()
-        result = []
-
-        for hour_info in day_hours:
-            hour = hour_info["hour"]
-            suffix = hour_info.get("suffix", "")
+        # Shared, precomputed table of the day's keys
+        return list(get_interval_table(today, self.target_timezone).keys)
 
-            for i in range(intervals_per_hour):
-                minute = i * interval_minutes
-                key = f"{hour:02d}:{minute:02d}"
-                if suffix:
-                    key += suffix
-                result.append(key)
-
-        return result
-
-    def get_tomorrow_range(self) -> List[str]:
+    def get_tomorrow_range(self, now: Optional[datetime] = None) -> List[str]:
         """Get list of interval keys for tomorrow.
 
         Returns DST-aware interval keys:
         - Normal day: 96 intervals (00:00 to 23:45)
         - DST fall-back: 100 intervals (includes 02:00_1, 02:15_1, etc. and 02:00_2, 02:15_2, etc.)
         - DST spring-forward: 92 intervals (02:00-02:45 are skipped)
+
+        Args:
+            now: Instant to use instead of the current time (e.g. a cycle's)
         """
         # Get tomorrow's date in the target timezone
-        now = dt_util.now()
+        now = now or dt_util.now()
         if hasattr(now, "tzinfo") and now.tzinfo:
             tomorrow = (now.astimezone(self.target_timezone) + timedelta(days=1)).date()
         else:
             tomorrow = (now + timedelta(days=1)).date()
 
-        # Use the timezone provider to get DST-aware intervals
-        day_hours = get_day_hours(tomorrow, self.target_timezone)
-
-        # Generate interval keys for all hours
-        interval_minutes = TimeInterval.get_interval_minutes()
-        intervals_per_hour = TimeInterval.get_intervals_per_hour()
-        result = []
-
-        for hour_info in day_hours:
-            hour = hour_info["hour"]
-            suffix = hour_info.get("suffix", "")
-
-            for i in range(intervals_per_hour):
-                minute = i * interval_minutes
-                key = f"{hour:02d}:{minute:02d}"
-                if suffix:
-                    key += suffix
-                result.append(key)
-
-        return result
+        # Shared, precomputed table of the day's keys
+        return list(get_interval_table(tomorrow, self.target_timezone).keys)
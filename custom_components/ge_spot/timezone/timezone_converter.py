@@ -1,6 +1,8 @@
 import logging
-from typing import Any, Dict, Optional
-from datetime import datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Sequence, Tuple
+from datetime import date, datetime, time, timedelta, tzinfo
 
 # Importing timezone_utils directly instead of from ..timezone to avoid circular import
 from .timezone_utils import get_timezone_object
@@ -8,6 +10,75 @@ from ..const.time import TimeInterval
 
 _LOGGER = logging.getLogger(__name__)
 
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_SECONDS_PER_DAY = 86400
+
+
+@lru_cache(maxsize=8)
+def _day_slots(
+    target_tz: tzinfo, today: date, interval_seconds: int
+) -> Tuple[int, int, Mapping[int, Tuple[int, str]], bool]:
+    """Interval starts of today and tomorrow in a timezone, by UTC epoch.
+
+    The UTC offset changes of the two days are applied here, once per date:
+    each slot start maps to its day (0 today, 1 tomorrow) and 'HH:MM' key.
+
+    Returns:
+        Tuple of (first epoch, end epoch, slot by epoch, whether a key
+        repeats within a day, i.e. a DST fall-back)
+    """
+    start = int(datetime.combine(today, time(0), tzinfo=target_tz).timestamp())
+    end = int(
+        datetime.combine(
+            today + timedelta(days=2), time(0), tzinfo=target_tz
+        ).timestamp()
+    )
+    slots = {}
+    for epoch in range(start, end, interval_seconds):
+        local = datetime.fromtimestamp(epoch, target_tz)
+        slots[epoch] = (
+            0 if local.date() == today else 1,
+            f"{local.hour:02d}:{local.minute:02d}",
+        )
+    repeats = len(set(slots.values())) < len(slots)
+    return start, end, MappingProxyType(slots), repeats
+
+
+def _iso_layout(iso_key: str) -> Optional[Tuple[int, bool]]:
+    """Layout of an ISO key: end of its 'HH:MM[:SS]' part and whether it is naive."""
+    if len(iso_key) < 16 or iso_key[10] not in "T " or iso_key[13] != ":":
+        return None
+    time_end = 19 if len(iso_key) >= 19 and iso_key[16] == ":" else 16
+    return time_end, len(iso_key) == time_end
+
+
+@lru_cache(maxsize=1024)
+def _clock_seconds(clock: str, naive: bool) -> int:
+    """Seconds after UTC midnight of a 'HH:MM[:SS][Z|+HH:MM]' key tail.
+
+    Naive tails are returned as local seconds; their offset depends on the
+    date (see TimezoneConverter._split_by_day_fast). Tails repeat every day,
+    so they are parsed once per process.
+    """
+    if naive:
+        time_part, suffix = clock, ""
+    elif clock.endswith("Z"):
+        time_part, suffix = clock[:-1], "Z"
+    else:
+        time_part, suffix = clock[:-6], clock[-6:]
+    if len(time_part) not in (5, 8) or time_part[2] != ":":
+        raise ValueError(f"Unexpected time '{clock}'")
+
+    seconds = int(time_part[:2]) * 3600 + int(time_part[3:5]) * 60
+    if len(time_part) == 8:
+        seconds += int(time_part[6:8])
+    if suffix in ("", "Z"):
+        return seconds
+    if suffix[0] not in "+-" or suffix[3] != ":":
+        raise ValueError(f"Unsupported UTC offset '{suffix}'")
+    offset = int(suffix[1:3]) * 3600 + int(suffix[4:6]) * 60
+    return seconds + offset if suffix[0] == "-" else seconds - offset
+
 
 class TimezoneConverter:
     """Handles centralized timezone normalization for price data."""
@@ -171,6 +242,231 @@ class TimezoneConverter:
 
         return normalized_prices
 
+    def iter_normalized_intervals(
+        self,
+        interval_prices: Dict[str, Any],
+        source_timezone_str: Optional[str] = None,
+    ) -> Iterator[Tuple[date, str, Any]]:
+        """Stream interval prices converted to the target timezone.
+
+        The streaming counterpart of normalize_interval_prices: instead of
+        building a dict of date-prefixed keys, it yields one interval at a
+        time for the next stage (see split_stream_by_day).
+
+        Args:
+            interval_prices: Raw interval prices with ISO timestamps as keys.
+            source_timezone_str: Optional timezone string if known from the source API.
+
+        Yields:
+            Tuples of (local date, 'HH:MM' key, price) in the target timezone,
+            in input order
+        """
+        target_tz = self._tz_service.target_timezone
+        for iso_key, price in interval_prices.items():
+            dt = self.parse_datetime_with_tz(iso_key, source_timezone_str)
+            if dt is None:
+                _LOGGER.warning(f"Skipping entry with invalid timestamp: {iso_key}")
+                continue
+            target_dt = dt.astimezone(target_tz)
+            yield target_dt.date(), f"{target_dt.hour:02d}:{target_dt.minute:02d}", price
+
+    def split_stream_by_day(
+        self,
+        intervals: Iterable[Tuple[date, str, Any]],
+        today: Optional[date] = None,
+    ) -> tuple[Dict[str, Any], Dict[str, Any]]:
+        """Collect streamed intervals straight into today and tomorrow buckets.
+
+        Intervals on other days are dropped as they arrive, so no dict of the
+        full (possibly multi-day) payload is ever built. A key seen twice on
+        the same day is a DST fall-back repeat: the first occurrence becomes
+        'HH:MM_1' and the second 'HH:MM_2', as in normalize_interval_prices.
+
+        Args:
+            intervals: (local date, 'HH:MM' key, price) tuples, e.g. from
+                iter_normalized_intervals
+            today: Today's date in the target timezone (defaults to the
+                current date there)
+
+        Returns:
+            Tuple of (today_prices, tomorrow_prices) dictionaries
+        """
+        today_date = today or datetime.now(self._tz_service.target_timezone).date()
+        tomorrow_date = today_date + timedelta(days=1)
+        buckets = {today_date: {}, tomorrow_date: {}}
+
+        for local_date, key, price in intervals:
+            bucket = buckets.get(local_date)
+            if bucket is None:
+                continue
+            if key in bucket:
+                _LOGGER.debug(f"DST fall-back: storing repeated {key} as {key}_1/_2")
+                bucket[f"{key}_1"] = bucket.pop(key)
+                key = f"{key}_2"
+            elif f"{key}_1" in bucket:
+                key = f"{key}_2"
+            bucket[key] = price
+
+        today_prices, tomorrow_prices = buckets[today_date], buckets[tomorrow_date]
+        _LOGGER.debug(
+            f"Split prices into today ({len(today_prices)} intervals) and tomorrow ({len(tomorrow_prices)} intervals)"
+        )
+        return today_prices, tomorrow_prices
+
+    def split_by_day(
+        self,
+        interval_prices: Dict[str, Any],
+        source_timezone_str: Optional[str] = None,
+        today: Optional[date] = None,
+    ) -> tuple[Dict[str, Any], Dict[str, Any]]:
+        """Normalize raw interval prices and split them into today and tomorrow.
+
+        Uses the bulk fast path when the timestamps allow it and the
+        streaming path (iter_normalized_intervals + split_stream_by_day)
+        otherwise; both give the same result.
+
+        Args:
+            interval_prices: Raw interval prices with ISO timestamps as keys.
+            source_timezone_str: Optional timezone string if known from the source API.
+            today: Today's date in the target timezone (defaults to the
+                current date there)
+
+        Returns:
+            Tuple of (today_prices, tomorrow_prices) dictionaries
+        """
+        today = today or datetime.now(self._tz_service.target_timezone).date()
+        split = self._split_by_day_fast(interval_prices, source_timezone_str, today)
+        if split is not None:
+            return split
+        return self.split_stream_by_day(
+            self.iter_normalized_intervals(interval_prices, source_timezone_str),
+            today,
+        )
+
+    def _split_by_day_fast(
+        self,
+        interval_prices: Dict[str, Any],
+        source_timezone_str: Optional[str],
+        today: date,
+    ) -> Optional[tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Bulk path of split_by_day for uniform ISO timestamps.
+
+        The key layout is detected once from the first key. Each distinct
+        date and each distinct time-of-day (with its UTC offset) is parsed
+        once into seconds, so a key costs two lookups and an integer sum to
+        get its UTC epoch, and one lookup in the cached slot table of today
+        and tomorrow (see _day_slots) to get its day and 'HH:MM' key.
+
+        Returns:
+            Tuple of (today_prices, tomorrow_prices), or None if a timestamp
+            is not in the detected layout, not on an interval start or maps
+            onto an interval already seen; the caller then falls back to the
+            general path
+        """
+        if not interval_prices:
+            return None
+        layout = _iso_layout(next(iter(interval_prices)))
+        if layout is None:
+            return None
+        time_end, naive = layout
+        if naive and not source_timezone_str:
+            return None
+
+        start, end, slots, repeats = _day_slots(
+            self._tz_service.target_timezone,
+            today,
+            TimeInterval.get_interval_seconds(),
+        )
+        source_tz = None
+        day_seconds: Dict[str, int] = {}
+        # Naive local times take their UTC offset from the source timezone,
+        # which can only change on the hour
+        hour_offsets: Dict[str, int] = {}
+        today_prices: Dict[str, Any] = {}
+        tomorrow_prices: Dict[str, Any] = {}
+        buckets = (today_prices, tomorrow_prices)
+        placed = 0
+
+        try:
+            if naive:
+                source_tz = get_timezone_object(source_timezone_str)
+            for iso_key, price in interval_prices.items():
+                day = day_seconds.get(iso_key[:11])
+                if day is None:
+                    if iso_key[10] not in "T ":
+                        return None
+                    day = (
+                        date.fromisoformat(iso_key[:10]).toordinal() - _EPOCH_ORDINAL
+                    ) * _SECONDS_PER_DAY
+                    day_seconds[iso_key[:11]] = day
+
+                epoch = day + _clock_seconds(iso_key[11:], naive)
+                if naive:
+                    offset = hour_offsets.get(iso_key[:13])
+                    if offset is None:
+                        local = datetime.fromisoformat(iso_key[:time_end])
+                        offset = int(
+                            local.replace(tzinfo=source_tz).utcoffset().total_seconds()
+                        )
+                        hour_offsets[iso_key[:13]] = offset
+                    epoch -= offset
+
+                slot = slots.get(epoch)
+                if slot is None:
+                    if start <= epoch < end:
+                        # Inside the two days but not on an interval start
+                        return None
+                    continue
+
+                bucket = buckets[slot[0]]
+                key = slot[1]
+                if repeats:
+                    # DST fall-back repeat, as in split_stream_by_day
+                    if key in bucket:
+                        bucket[f"{key}_1"] = bucket.pop(key)
+                        key = f"{key}_2"
+                    elif f"{key}_1" in bucket:
+                        key = f"{key}_2"
+                bucket[key] = price
+                placed += 1
+        except (ValueError, TypeError, AttributeError, IndexError) as e:
+            _LOGGER.debug(f"Bulk timestamp normalization not applicable: {e}")
+            return None
+
+        if placed != len(today_prices) + len(tomorrow_prices):
+            # Two timestamps for one interval: leave it to the general path
+            return None
+
+        _LOGGER.debug(
+            f"Split prices into today ({len(today_prices)} intervals) and tomorrow ({len(tomorrow_prices)} intervals)"
+        )
+        return today_prices, tomorrow_prices
+
+    def split_axis_by_day(
+        self,
+        timestamps: Sequence[str],
+        source_timezone_str: Optional[str] = None,
+        today: Optional[date] = None,
+    ) -> tuple[Dict[str, int], Dict[str, int]]:
+        """Map a timestamp axis to today and tomorrow keys, once for many series.
+
+        Areas fetched from the same source usually share their timestamps;
+        parsing and converting them once gives a layout that each area's
+        values are then placed into by position.
+
+        Args:
+            timestamps: ISO timestamps, in the order of the price values
+            source_timezone_str: Optional timezone string if known from the source API.
+            today: Today's date in the target timezone (defaults to the
+                current date there)
+
+        Returns:
+            Tuple of (today, tomorrow) dictionaries mapping 'HH:MM' keys to
+            positions on the axis, in the order split_stream_by_day gives
+        """
+        positions = {timestamp: i for i, timestamp in enumerate(timestamps)}
+        return self.split_by_day(positions, source_timezone_str, today)
+
     def split_into_today_tomorrow(
         self, normalized_prices: Dict[str, Any]
     ) -> tuple[Dict[str, Any], Dict[str, Any]]:
@@ -1,16 +1,21 @@
 """Advanced caching system for price data."""
 
+import heapq
 import logging
 import json
 import os
+import time
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from homeassistant.core import HomeAssistant
 
 from ..const.config import Config
 from ..const.defaults import Defaults
 from ..const.network import Network
+from .byte_budget import ByteBudget
+from .cache_stats import CacheStats
+from .payload_size import estimate_payload_bytes
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,6 +42,18 @@ class CacheEntry:
         self.metadata = metadata or {}
         self.access_count = 0
         self.last_accessed = self.created_at
+        # Estimated in-memory size, set by the cache when the entry is stored
+        self.size_bytes = 0
+        # GreedyDual-Size priority, set by the cache on store and on each hit
+        self.priority = 0.0
+
+    @property
+    def stats_group(self) -> Optional[str]:
+        """Statistics group of the entry ("<area>/<source>"), if known."""
+        area = self.metadata.get("area")
+        if not area:
+            return None
+        return f"{area}/{self.metadata.get('source', 'unknown')}"
 
     @property
     def age(self) -> float:
@@ -63,6 +80,7 @@ class CacheEntry:
             "is_expired": self.is_expired,
             "access_count": self.access_count,
             "last_accessed": self.last_accessed.isoformat(),
+            "size_bytes": self.size_bytes,
             "metadata": self.metadata,
         }
 
@@ -105,12 +123,15 @@ class AdvancedCache:
         self,
         hass: Optional[HomeAssistant] = None,
         config: Optional[Dict[str, Any]] = None,
+        budget: Optional[ByteBudget] = None,
     ):
         """Initialize the cache.
 
         Args:
             hass: Optional Home Assistant instance
             config: Optional configuration
+            budget: Optional (shared) byte budget to charge; a private one of
+                CACHE_MAX_BYTES is created if not given
         """
         self.hass = hass
         self.config = config or {}
@@ -119,6 +140,14 @@ class AdvancedCache:
         self.max_entries = self.config.get(
             Config.CACHE_MAX_ENTRIES, Defaults.CACHE_MAX_ENTRIES
         )
+        self.budget = (
+            budget
+            if budget is not None
+            else ByteBudget(
+                self.config.get(Config.CACHE_MAX_BYTES, Defaults.CACHE_MAX_BYTES)
+            )
+        )
+        self._budget_key = self.budget.register("price_cache")
         self.default_ttl = self.config.get(Config.CACHE_TTL, Defaults.CACHE_TTL)
         self.persist_cache = self.config.get(
             Config.PERSIST_CACHE, Defaults.PERSIST_CACHE
@@ -128,6 +157,15 @@ class AdvancedCache:
         # Cache storage
         self._cache: Dict[str, CacheEntry] = {}
 
+        # Observability: hit/miss/expiry/eviction counters and I/O timings
+        self.stats = CacheStats()
+        self._disk_bytes = 0
+
+        # Byte accounting (mirrored into the budget) and the GreedyDual-Size
+        # inflation value (the priority of the last entry evicted for it)
+        self._total_bytes = 0
+        self._inflation = 0.0
+
         # Load cache from disk if enabled. Run on the executor so the blocking
         # file I/O (open/os.stat) never runs on the event loop.
         if self.persist_cache and hass:
@@ -144,6 +182,7 @@ class AdvancedCache:
             Cached value or default
         """
         if key not in self._cache:
+            self.stats.record("misses")
             return default
 
         entry = self._cache[key]
@@ -151,14 +190,31 @@ class AdvancedCache:
         # Check if expired
         if entry.is_expired:
             # Remove expired entry
-            del self._cache[key]
+            self._remove(key)
+            self.stats.record("expirations", entry.stats_group)
+            self.stats.record("misses", entry.stats_group)
             return default
 
         # Update access stats
         entry.access()
+        entry.priority = self._gds_priority(entry)
+        self.stats.record("hits", entry.stats_group)
 
         return entry.data
 
+    def peek(self, key: str, default: Any = None) -> Any:
+        """Get a stored value without expiry handling or access tracking.
+
+        Args:
+            key: Cache key
+            default: Default value if key not found
+
+        Returns:
+            Stored value or default
+        """
+        entry = self._cache.get(key)
+        return entry.data if entry is not None else default
+
     def set(
         self,
         key: str,
@@ -179,12 +235,16 @@ class AdvancedCache:
 
         # Create cache entry
         entry = CacheEntry(value, ttl, metadata)
+        entry.size_bytes = estimate_payload_bytes(value)
+        entry.priority = self._gds_priority(entry)
 
         # Add to cache
-        self._cache[key] = entry
+        self._remove(key)
+        self._add(key, entry)
+        self.stats.record("sets", entry.stats_group)
 
-        # Check if we need to evict entries
-        self._evict_if_needed()
+        # Check if we need to evict entries (never the one just stored)
+        self._evict_if_needed(protect_key=key)
 
         # Persist cache if enabled. Schedule on the executor so the blocking
         # file I/O never runs on the event loop.
@@ -201,7 +261,8 @@ class AdvancedCache:
             True if key was found and deleted, False otherwise
         """
         if key in self._cache:
-            del self._cache[key]
+            entry = self._remove(key)
+            self.stats.record("deletes", entry.stats_group)
 
             # Persist cache if enabled. Schedule on the executor so the blocking
             # file I/O never runs on the event loop.
@@ -215,6 +276,8 @@ class AdvancedCache:
     def clear(self) -> None:
         """Clear the cache."""
         self._cache.clear()
+        self._total_bytes = 0
+        self.budget.update(self._budget_key, 0)
 
         # Persist cache if enabled. Schedule on the executor so the blocking
         # file I/O never runs on the event loop.
@@ -233,6 +296,11 @@ class AdvancedCache:
         return {
             "total_entries": len(self._cache),
             "expired_entries": expired_count,
+            "memory_bytes": self._total_bytes,
+            "max_bytes": self.budget.max_bytes,
+            "largest_entries": self.get_largest_entries(),
+            "disk_bytes": self._disk_bytes,
+            "stats": self.stats.as_dict(),
             "max_entries": self.max_entries,
             "default_ttl": self.default_ttl,
             "persist_cache": self.persist_cache,
@@ -240,15 +308,60 @@ class AdvancedCache:
             "entries": {key: entry.info for key, entry in self._cache.items()},
         }
 
-    def _evict_if_needed(self) -> None:
-        """Evict entries if the cache is full."""
-        if len(self._cache) <= self.max_entries:
+    def get_largest_entries(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """Get the largest entries by estimated size.
+
+        Args:
+            limit: Maximum number of entries to return
+
+        Returns:
+            List of {"key", "size_bytes"} dicts, largest first
+        """
+        largest = heapq.nlargest(
+            limit, self._cache.items(), key=lambda item: item[1].size_bytes
+        )
+        return [{"key": key, "size_bytes": entry.size_bytes} for key, entry in largest]
+
+    def _add(self, key: str, entry: CacheEntry) -> None:
+        """Insert an entry, keeping the byte total in step."""
+        self._cache[key] = entry
+        self._total_bytes += entry.size_bytes
+        self.budget.update(self._budget_key, self._total_bytes)
+
+    def _remove(self, key: str) -> Optional[CacheEntry]:
+        """Remove an entry if present, keeping the byte total in step."""
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size_bytes
+            self.budget.update(self._budget_key, self._total_bytes)
+        return entry
+
+    def _gds_priority(self, entry: CacheEntry) -> float:
+        """GreedyDual-Size priority: inflation + cost / size (cost 1).
+
+        Large entries get low priorities and are evicted first; the inflation
+        value rises with every eviction, so entries that are not read again
+        age out regardless of size.
+        """
+        return self._inflation + 1.0 / max(entry.size_bytes, 1)
+
+    def _evict_if_needed(self, protect_key: Optional[str] = None) -> None:
+        """Evict entries if over the entry count or the (shared) byte budget.
+
+        Only this cache's entries are evicted, so the cache that grows pays for
+        the integration-wide overflow.
+
+        Args:
+            protect_key: Key that must not be evicted (the entry just stored)
+        """
+        if len(self._cache) <= self.max_entries and not self.budget.overflow():
             return
 
         # First, remove expired entries
         expired_keys = [key for key, entry in self._cache.items() if entry.is_expired]
         for key in expired_keys:
-            del self._cache[key]
+            entry = self._remove(key)
+            self.stats.record("expirations", entry.stats_group)
 
         # If still too many entries, remove least recently used
         if len(self._cache) > self.max_entries:
@@ -260,7 +373,37 @@ class AdvancedCache:
             # Remove oldest entries
             to_remove = len(self._cache) - self.max_entries
             for key in sorted_keys[:to_remove]:
-                del self._cache[key]
+                self._evict(key)
+
+        # If still over the byte budget, evict by GreedyDual-Size priority
+        if self.budget.overflow():
+            candidates = [
+                (entry.priority, key)
+                for key, entry in self._cache.items()
+                if key != protect_key
+            ]
+            heapq.heapify(candidates)
+            while self.budget.overflow() and candidates:
+                priority, key = heapq.heappop(candidates)
+                self._inflation = priority
+                self._evict(key)
+
+            if self.budget.overflow():
+                _LOGGER.debug(
+                    f"Byte budget still exceeded after evicting down to "
+                    f"{protect_key} ({self.budget.total_bytes} > "
+                    f"{self.budget.max_bytes})"
+                )
+
+    def _evict(self, key: str) -> None:
+        """Evict one entry, recording it in the statistics."""
+        entry = self._remove(key)
+        self.stats.record("evictions", entry.stats_group)
+        self.stats.record("evicted_bytes", entry.stats_group, entry.size_bytes)
+
+    def close(self) -> None:
+        """Stop charging the byte budget (the owning entry was unloaded)."""
+        self.budget.release(self._budget_key)
 
     def _get_cache_file_path(self) -> str:
         """Get the path to the cache file."""
@@ -282,6 +425,7 @@ class AdvancedCache:
         if not self.hass:
             return
 
+        start = time.perf_counter()
         try:
             # Get cache file path
             cache_file = self._get_cache_file_path()
@@ -293,10 +437,15 @@ class AdvancedCache:
                 if not entry.is_expired  # Only save non-expired entries
             }
 
-            # Save to file
+            # Serialize, then save to file (timed separately)
+            serialize_start = time.perf_counter()
+            payload = json.dumps(cache_data)
+            self.stats.record_timing("serialize", time.perf_counter() - serialize_start)
             with open(cache_file, "w") as f:
-                json.dump(cache_data, f)
+                f.write(payload)
 
+            self._disk_bytes = os.path.getsize(cache_file)
+            self.stats.record_timing("save", time.perf_counter() - start)
             _LOGGER.debug(f"Cache saved to {cache_file}")
 
         except Exception as e:
@@ -307,6 +456,7 @@ class AdvancedCache:
         if not self.hass:
             return
 
+        start = time.perf_counter()
         try:
             # Get cache file path
             cache_file = self._get_cache_file_path()
@@ -326,10 +476,15 @@ class AdvancedCache:
 
                     # Only add non-expired entries
                     if not entry.is_expired:
-                        self._cache[key] = entry
+                        entry.size_bytes = estimate_payload_bytes(entry.data)
+                        entry.priority = self._gds_priority(entry)
+                        self._remove(key)
+                        self._add(key, entry)
                 except Exception as e:
                     _LOGGER.warning(f"Failed to load cache entry {key}: {e}")
 
+            self._disk_bytes = os.path.getsize(cache_file)
+            self.stats.record_timing("load", time.perf_counter() - start)
             _LOGGER.debug(f"Cache loaded from {cache_file}")
 
         except Exception as e:
@@ -0,0 +1,113 @@
+"""Integration-wide memory budget shared by caches and stores."""
+
+import itertools
+from typing import Any, Dict, Optional, Set
+
+from homeassistant.core import HomeAssistant
+
+from ..const import DOMAIN
+from ..const.config import Config
+from ..const.defaults import Defaults
+
+# Key under hass.data[DOMAIN] (alongside the per-entry coordinators)
+BYTE_BUDGET_KEY = "byte_budget"
+
+
+class ByteBudget:
+    """Byte accountant for every cache and store in this HA instance.
+
+    Each consumer (the price cache of an entry, the raw payload store, an
+    archive) registers once and reports its current in-memory size. An
+    evictable consumer that grows checks overflow() and evicts its own
+    entries until the evictable consumers together fit. Consumers registered
+    as not evictable are bounded by caps of their own; they are reported in
+    the totals but do not count against the ceiling, so they never force the
+    price caches to evict.
+    """
+
+    def __init__(self, max_bytes: int = Defaults.CACHE_MAX_BYTES):
+        """Initialize the budget.
+
+        Args:
+            max_bytes: Ceiling for the summed usage of all consumers
+        """
+        self.max_bytes = max_bytes
+        self._usage: Dict[str, int] = {}
+        self._fixed: Set[str] = set()
+        self._ids = itertools.count(1)
+
+    def register(self, label: str, evictable: bool = True) -> str:
+        """Register a consumer.
+
+        Args:
+            label: Consumer kind, e.g. "price_cache"
+            evictable: Whether the consumer evicts to keep within the ceiling;
+                if not, it must bound its own size
+
+        Returns:
+            Key to report usage under (unique per consumer)
+        """
+        key = f"{label}#{next(self._ids)}"
+        self._usage[key] = 0
+        if not evictable:
+            self._fixed.add(key)
+        return key
+
+    def update(self, key: str, used_bytes: int) -> None:
+        """Report the current usage of a consumer."""
+        self._usage[key] = used_bytes
+
+    def release(self, key: str) -> None:
+        """Forget a consumer (its entry was unloaded)."""
+        self._usage.pop(key, None)
+        self._fixed.discard(key)
+
+    @property
+    def total_bytes(self) -> int:
+        """Summed usage of all consumers."""
+        return sum(self._usage.values())
+
+    @property
+    def evictable_bytes(self) -> int:
+        """Summed usage of the consumers that evict to fit the ceiling."""
+        return sum(used for key, used in self._usage.items() if key not in self._fixed)
+
+    def overflow(self) -> int:
+        """Bytes the evictable consumers are over the budget (0 when within)."""
+        return max(self.evictable_bytes - self.max_bytes, 0)
+
+    def get_info(self) -> Dict[str, Any]:
+        """Get information about the budget.
+
+        Returns:
+            Dictionary with the ceiling, totals and per-consumer usage
+        """
+        return {
+            "max_bytes": self.max_bytes,
+            "total_bytes": self.total_bytes,
+            "evictable_bytes": self.evictable_bytes,
+            "consumers": dict(self._usage),
+        }
+
+
+def get_byte_budget(
+    hass: Optional[HomeAssistant], config: Optional[Dict[str, Any]] = None
+) -> ByteBudget:
+    """Get the byte budget for this Home Assistant instance.
+
+    The budget lives in hass.data[DOMAIN] so every config entry charges the
+    same one; its ceiling is taken from the config of the first caller.
+    Without a usable hass.data (standalone scripts), a private budget is
+    returned.
+    """
+    max_bytes = (config or {}).get(Config.CACHE_MAX_BYTES, Defaults.CACHE_MAX_BYTES)
+    domain_data = getattr(hass, "data", None)
+    if not isinstance(domain_data, dict):
+        return ByteBudget(max_bytes)
+
+    domain_data = domain_data.setdefault(DOMAIN, {})
+    budget = domain_data.get(BYTE_BUDGET_KEY)
+    if budget is None:
+        budget = ByteBudget(max_bytes)
+        domain_data[BYTE_BUDGET_KEY] = budget
+    return budget
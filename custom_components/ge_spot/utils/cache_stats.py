@@ -0,0 +1,75 @@
+"""Running counters and timings for cache observability."""
+
+from typing import Any, Dict, Optional
+
+
+class CacheStats:
+    """Counters and latency summaries, in total and per group.
+
+    Groups are free-form labels, normally "<area>/<source>", so cache sizing
+    and TTLs can be judged per area and source rather than globally.
+    """
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self._totals: Dict[str, int] = {}
+        self._groups: Dict[str, Dict[str, int]] = {}
+        self._timings: Dict[str, Dict[str, float]] = {}
+
+    def record(self, counter: str, group: Optional[str] = None, amount: int = 1):
+        """Increment a counter.
+
+        Args:
+            counter: Counter name (e.g. "hits", "evictions")
+            group: Optional group label, usually "<area>/<source>"
+            amount: Amount to add
+        """
+        self._totals[counter] = self._totals.get(counter, 0) + amount
+        if group:
+            counters = self._groups.setdefault(group, {})
+            counters[counter] = counters.get(counter, 0) + amount
+
+    def record_timing(self, name: str, seconds: float) -> None:
+        """Add one duration sample.
+
+        Args:
+            name: Timing name (e.g. "save", "serialize")
+            seconds: Measured duration in seconds
+        """
+        timing = self._timings.setdefault(
+            name, {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "last_ms": 0.0}
+        )
+        ms = seconds * 1000
+        timing["count"] += 1
+        timing["total_ms"] += ms
+        timing["max_ms"] = max(timing["max_ms"], ms)
+        timing["last_ms"] = ms
+
+    def get(self, counter: str, group: Optional[str] = None) -> int:
+        """Get a counter value, in total or for one group."""
+        if group:
+            return self._groups.get(group, {}).get(counter, 0)
+        return self._totals.get(counter, 0)
+
+    def reset(self) -> None:
+        """Reset all counters and timings."""
+        self._totals.clear()
+        self._groups.clear()
+        self._timings.clear()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the statistics as a serializable dictionary."""
+        hits = self._totals.get("hits", 0)
+        lookups = hits + self._totals.get("misses", 0)
+        return {
+            "totals": dict(self._totals),
+            "hit_ratio": round(hits / lookups, 3) if lookups else None,
+            "by_group": {group: dict(c) for group, c in self._groups.items()},
+            "timings": {
+                name: {
+                    **{k: round(v, 3) for k, v in timing.items()},
+                    "avg_ms": round(timing["total_ms"] / timing["count"], 3),
+                }
+                for name, timing in self._timings.items()
+            },
+        }
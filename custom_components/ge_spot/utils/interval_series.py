@@ -0,0 +1,250 @@
+"""Array-backed interval prices for one local day."""
+
+import logging
+from array import array
+from collections.abc import Mapping
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from typing import Dict, Iterator, Optional, Union
+from zoneinfo import ZoneInfo
+
+from ..const.time import TimeInterval
+
+_LOGGER = logging.getLogger(__name__)
+
+_SECONDS_PER_DAY = 86400
+
+
+def key_to_datetime(day: date, key: str, tz: tzinfo) -> Optional[datetime]:
+    """Convert an "HH:MM"/"HH:MM_1"/"HH:MM_2" key on a local date to a datetime.
+
+    Args:
+        day: Local date the key belongs to
+        key: Interval key
+        tz: Timezone the key is in
+
+    Returns:
+        Timezone-aware start of the interval, or None if the key is malformed
+        or falls in a spring-forward gap
+    """
+    base_key, _, suffix = key.partition("_")
+    try:
+        hour, minute = (int(part) for part in base_key.split(":"))
+        local = datetime.combine(day, time(hour, minute), tzinfo=tz)
+    except (ValueError, TypeError):
+        return None
+
+    # The second occurrence of a repeated (fall-back) hour is fold=1
+    local = local.replace(fold=1 if suffix == "2" else 0)
+
+    # Times inside a spring-forward gap do not exist
+    round_trip = local.astimezone(timezone.utc).astimezone(tz)
+    if round_trip.replace(tzinfo=None) != local.replace(tzinfo=None):
+        return None
+    return local
+
+
+class IntervalSeries:
+    """Interval prices for one local day as a float array with a missing mask.
+
+    Slot i covers [start + i * resolution, start + (i + 1) * resolution), where
+    start is local midnight as a UTC instant. The slot count follows the real
+    length of the day, so DST days get 92 or 100 quarter-hour slots and every
+    interval, including a repeated fall-back hour, has its own slot. Looking a
+    price up by time is a subtraction and a division.
+
+    String keys are only needed at the edges: from_interval_prices() builds a
+    series from a "HH:MM" dict and view gives a read-only dict-compatible view
+    back, for code that still expects one.
+    """
+
+    __slots__ = ("day", "tz", "start", "resolution", "values", "mask", "_uniform")
+
+    def __init__(self, day: date, tz: tzinfo, resolution_seconds: Optional[int] = None):
+        """Initialize an empty series.
+
+        Args:
+            day: Local date covered by the series
+            tz: Timezone defining the local day
+            resolution_seconds: Interval length (defaults to TimeInterval)
+        """
+        self.day = day
+        self.tz = tz
+        self.resolution = resolution_seconds or TimeInterval.get_interval_seconds()
+
+        self.start = datetime.combine(day, time(0), tzinfo=tz).astimezone(timezone.utc)
+        end = datetime.combine(day + timedelta(days=1), time(0), tzinfo=tz)
+        length = int((end.astimezone(timezone.utc) - self.start).total_seconds())
+        slots = length // self.resolution
+
+        self.values = array("d", bytes(8 * slots))
+        self.mask = bytearray(slots)  # 1 where a price is present
+        # Without a DST transition, key <-> slot is plain arithmetic
+        self._uniform = length == _SECONDS_PER_DAY
+
+    @classmethod
+    def from_interval_prices(
+        cls,
+        prices: Dict[str, float],
+        day: date,
+        tz: Union[str, tzinfo],
+        resolution_seconds: Optional[int] = None,
+    ) -> "IntervalSeries":
+        """Build a series from prices keyed by "HH:MM".
+
+        Args:
+            prices: Prices keyed by "HH:MM" (DST fall-back duplicates as
+                "HH:MM_1"/"HH:MM_2") in tz
+            day: Local date the prices are for
+            tz: Timezone (name or tzinfo) the keys are in
+            resolution_seconds: Interval length (defaults to TimeInterval)
+
+        Returns:
+            Series with a slot set for every key that maps onto the day
+        """
+        if isinstance(tz, str):
+            tz = ZoneInfo(tz)
+        series = cls(day, tz, resolution_seconds)
+        for key, price in prices.items():
+            if price is None:
+                continue
+            index = series.index_of_key(key)
+            if index is None:
+                _LOGGER.warning(f"Malformed interval key '{key}' for {day}")
+                continue
+            try:
+                series.set(index, float(price))
+            except (TypeError, ValueError):
+                _LOGGER.warning(f"Invalid price {price!r} for interval '{key}'")
+        return series
+
+    def __len__(self) -> int:
+        """Number of slots in the day (present or not)."""
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        """Short representation for logging."""
+        return (
+            f"IntervalSeries(day={self.day}, tz={self.tz}, "
+            f"slots={len(self)}, present={self.count})"
+        )
+
+    @property
+    def count(self) -> int:
+        """Number of slots holding a price."""
+        return self.mask.count(1)
+
+    @property
+    def view(self) -> "IntervalSeriesView":
+        """Read-only mapping of "HH:MM" keys to present prices."""
+        return IntervalSeriesView(self)
+
+    # ========== INDEXING ==========
+
+    def index_of(self, moment: datetime) -> int:
+        """Slot index of an aware datetime (may be out of range)."""
+        elapsed = (moment - self.start).total_seconds()
+        return int(elapsed // self.resolution)
+
+    def index_of_key(self, key: str) -> Optional[int]:
+        """Slot index of an interval key, or None if it is not on this day."""
+        if self._uniform and "_" not in key:
+            hour, sep, minute = key.partition(":")
+            if sep and hour.isdigit() and minute.isdigit():
+                hour_value, minute_value = int(hour), int(minute)
+                if hour_value < 24 and minute_value < 60:
+                    return (hour_value * 3600 + minute_value * 60) // self.resolution
+            return None
+
+        moment = key_to_datetime(self.day, key, self.tz)
+        if moment is None:
+            return None
+        index = self.index_of(moment)
+        return index if 0 <= index < len(self) else None
+
+    def time_of(self, index: int) -> datetime:
+        """Local start time of a slot."""
+        moment = self.start + timedelta(seconds=index * self.resolution)
+        return moment.astimezone(self.tz)
+
+    def key_of(self, index: int) -> str:
+        """Interval key of a slot, with a DST suffix in a repeated hour."""
+        if self._uniform:
+            minutes = index * self.resolution // 60
+            return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+        local = self.time_of(index)
+        key = f"{local.hour:02d}:{local.minute:02d}"
+        if local.replace(fold=1 - local.fold).utcoffset() != local.utcoffset():
+            key += "_2" if local.fold else "_1"
+        return key
+
+    # ========== VALUES ==========
+
+    def set(self, index: int, price: float) -> None:
+        """Store a price in a slot and mark it present."""
+        self.values[index] = price
+        self.mask[index] = 1
+
+    def get(self, index: int) -> Optional[float]:
+        """Price in a slot, or None if missing or out of range."""
+        if 0 <= index < len(self) and self.mask[index]:
+            return self.values[index]
+        return None
+
+    def value_at(self, moment: datetime) -> Optional[float]:
+        """Price of the interval containing an aware datetime."""
+        return self.get(self.index_of(moment))
+
+    def present_indices(self) -> Iterator[int]:
+        """Indices of slots holding a price, in time order."""
+        mask = self.mask
+        index = mask.find(1)
+        while index != -1:
+            yield index
+            index = mask.find(1, index + 1)
+
+    def last_present_index(self) -> Optional[int]:
+        """Index of the last slot holding a price."""
+        index = self.mask.rfind(1)
+        return None if index == -1 else index
+
+    def last_present_time(self) -> Optional[datetime]:
+        """Local start time of the last interval holding a price."""
+        index = self.last_present_index()
+        return None if index is None else self.time_of(index)
+
+    def to_dict(self) -> Dict[str, float]:
+        """Present prices as a plain "HH:MM"-keyed dict."""
+        return dict(self.view)
+
+
+class IntervalSeriesView(Mapping):
+    """Read-only "HH:MM"-keyed mapping over an IntervalSeries.
+
+    Lookups go through the series index; iteration yields keys of present
+    slots in time order. Nothing is copied.
+    """
+
+    __slots__ = ("_series",)
+
+    def __init__(self, series: IntervalSeries):
+        """Initialize the view."""
+        self._series = series
+
+    def __getitem__(self, key: str) -> float:
+        """Price for an interval key."""
+        index = self._series.index_of_key(key) if isinstance(key, str) else None
+        price = None if index is None else self._series.get(index)
+        if price is None:
+            raise KeyError(key)
+        return price
+
+    def __iter__(self) -> Iterator[str]:
+        """Keys of present slots in time order."""
+        series = self._series
+        for index in series.present_indices():
+            yield series.key_of(index)
+
+    def __len__(self) -> int:
+        """Number of present prices."""
+        return self._series.count
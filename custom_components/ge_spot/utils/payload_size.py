@@ -0,0 +1,42 @@
+"""Cheap size estimate for raw API payloads and cached values."""
+
+from typing import Any
+
+# Nesting deeper than this is not walked (raw payloads are shallow)
+_MAX_DEPTH = 8
+
+
+def estimate_payload_bytes(payload: Any) -> int:
+    """Estimate the size of a payload or cached value without serializing it.
+
+    Sums the lengths of the strings and bytes it contains (XML documents,
+    CSV text, JSON keys and values); numbers count as 8 bytes. Objects
+    referenced more than once, such as the same XML response kept under
+    both "xml_responses" and "raw_data", are counted once.
+
+    Args:
+        payload: Raw data as handed to DataProcessor.process, or a cache value
+
+    Returns:
+        Estimated size in bytes
+    """
+    seen = set()
+    total = 0
+    stack = [(payload, 0)]
+    while stack:
+        value, depth = stack.pop()
+        if isinstance(value, (str, bytes, bytearray)):
+            total += len(value)
+        elif isinstance(value, (int, float)):
+            total += 8
+        elif isinstance(value, (dict, list, tuple)) and depth < _MAX_DEPTH:
+            if id(value) in seen:
+                continue
+            seen.add(id(value))
+            if isinstance(value, dict):
+                for key, item in value.items():
+                    stack.append((key, depth + 1))
+                    stack.append((item, depth + 1))
+            else:
+                stack.extend((item, depth + 1) for item in value)
+    return total
@@ -0,0 +1,667 @@
+"""Compact multi-day price history, stored per archive series and year."""
+
+import asyncio
+import hashlib
+import logging
+import math
+import mmap
+import os
+import struct
+import sys
+import threading
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from homeassistant.core import HomeAssistant
+
+from ..const.config import Config
+from ..const.defaults import Defaults
+from ..const.time import TimeInterval
+from .byte_budget import ByteBudget
+from .interval_series import key_to_datetime
+
+_LOGGER = logging.getLogger(__name__)
+
+
+# Fixed binary layout of one area-year (native byte order, recorded in the
+# header): header | prices f64[n_slots] | day_min, day_max, day_sum f64[n_days]
+# | day_count u16[n_days] | validity bitmap u8[ceil(n_slots / 8)]
+_MAGIC = b"GESPOTPA"
+_VERSION = 1
+_HEADER = struct.Struct("<8sBBHiIqII32s")
+_HEADER_SIZE = 128
+_BYTEORDER_FLAG = 1 if sys.byteorder == "little" else 2
+
+# Persisted writes and queries run on executor threads, and the archives of
+# several entries share the year files, so loaded years and the files behind
+# them are only touched under this lock.
+_ARCHIVE_LOCK = threading.RLock()
+
+
+class _AreaYear:
+    """Fixed-slot prices and daily rollups for one area and year.
+
+    Slots count elapsed intervals since local midnight on 1 January, so a
+    DST fall-back day gets its extra intervals and a spring-forward day simply
+    has fewer; no two intervals ever share a slot. Which slots hold a price is
+    tracked in a validity bitmap.
+
+    All sections are memoryviews over one buffer: a bytearray in memory, or a
+    memory-mapped file when persisting, in which case only the pages a query
+    touches are read from disk.
+    """
+
+    __slots__ = (
+        "year",
+        "tz",
+        "start_utc",
+        "n_slots",
+        "n_days",
+        "path",
+        "prices",
+        "day_min",
+        "day_max",
+        "day_sum",
+        "day_count",
+        "validity",
+        "_buffer",
+        "_views",
+    )
+
+    def __init__(
+        self,
+        year: int,
+        tz: ZoneInfo,
+        buffer: Union[bytearray, mmap.mmap],
+        path: Optional[str] = None,
+    ):
+        self.year = year
+        self.tz = tz
+        self.path = path
+        self.start_utc, self.n_slots, self.n_days = self._dimensions(year, tz)
+        self._buffer = buffer
+
+        base = memoryview(buffer)
+        offset = _HEADER_SIZE
+
+        def section(length: int, fmt: str) -> memoryview:
+            nonlocal offset
+            view = base[offset : offset + length * struct.calcsize(fmt)].cast(fmt)
+            offset += length * struct.calcsize(fmt)
+            return view
+
+        self.prices = section(self.n_slots, "d")
+        self.day_min = section(self.n_days, "d")
+        self.day_max = section(self.n_days, "d")
+        self.day_sum = section(self.n_days, "d")
+        self.day_count = section(self.n_days, "H")
+        self.validity = section((self.n_slots + 7) // 8, "B")
+        self._views = (
+            base,
+            self.prices,
+            self.day_min,
+            self.day_max,
+            self.day_sum,
+            self.day_count,
+            self.validity,
+        )
+
+    @staticmethod
+    def _dimensions(year: int, tz: ZoneInfo) -> Tuple[datetime, int, int]:
+        """Start instant, slot count and day count of a local year."""
+        start_utc = datetime(year, 1, 1, tzinfo=tz).astimezone(timezone.utc)
+        end_utc = datetime(year + 1, 1, 1, tzinfo=tz).astimezone(timezone.utc)
+        n_slots = int((end_utc - start_utc).total_seconds()) // (
+            TimeInterval.get_interval_seconds()
+        )
+        n_days = date(year + 1, 1, 1).toordinal() - date(year, 1, 1).toordinal()
+        return start_utc, n_slots, n_days
+
+    @classmethod
+    def _size(cls, year: int, tz: ZoneInfo) -> int:
+        """Total buffer size of a year in bytes."""
+        _, n_slots, n_days = cls._dimensions(year, tz)
+        return _HEADER_SIZE + n_slots * 8 + n_days * (3 * 8 + 2) + (n_slots + 7) // 8
+
+    @classmethod
+    def _header(cls, year: int, tz: ZoneInfo) -> bytes:
+        """Encoded header for a year."""
+        start_utc, n_slots, n_days = cls._dimensions(year, tz)
+        return _HEADER.pack(
+            _MAGIC,
+            _VERSION,
+            _BYTEORDER_FLAG,
+            0,
+            year,
+            TimeInterval.get_interval_seconds(),
+            int(start_utc.timestamp()),
+            n_slots,
+            n_days,
+            str(tz.key).encode()[:32],
+        )
+
+    @classmethod
+    def in_memory(cls, year: int, tz: ZoneInfo) -> "_AreaYear":
+        """Create an empty year backed by a bytearray."""
+        buffer = bytearray(cls._size(year, tz))
+        header = cls._header(year, tz)
+        buffer[: len(header)] = header
+        return cls(year, tz, buffer)
+
+    @classmethod
+    def open_file(
+        cls, path: str, year: int, tz: Optional[ZoneInfo] = None
+    ) -> Optional["_AreaYear"]:
+        """Memory-map a year file, creating it if needed (blocking I/O).
+
+        An existing file whose header does not match this layout is replaced.
+        Without a timezone, only an existing file can be opened.
+
+        Returns:
+            The mapped year, or None if there is no file and no timezone
+        """
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                header = f.read(_HEADER.size)
+            file_tz = cls._parse_header(header, year)
+            if file_tz is not None and os.path.getsize(path) == cls._size(
+                year, file_tz
+            ):
+                tz = file_tz
+            elif tz is None:
+                return None
+            else:
+                _LOGGER.warning(f"Replacing incompatible price archive file {path}")
+                os.remove(path)
+        elif tz is None:
+            return None
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(cls._header(year, tz))
+                f.truncate(cls._size(year, tz))
+
+        with open(path, "r+b") as f:
+            buffer = mmap.mmap(f.fileno(), 0)
+        return cls(year, tz, buffer, path)
+
+    @staticmethod
+    def _parse_header(header: bytes, year: int) -> Optional[ZoneInfo]:
+        """Timezone of a compatible header, or None."""
+        if len(header) < _HEADER.size:
+            return None
+        magic, version, byteorder, _, file_year, interval, _, _, _, tz_name = (
+            _HEADER.unpack(header)
+        )
+        if (
+            magic != _MAGIC
+            or version != _VERSION
+            or byteorder != _BYTEORDER_FLAG
+            or file_year != year
+            or interval != TimeInterval.get_interval_seconds()
+        ):
+            return None
+        try:
+            return ZoneInfo(tz_name.rstrip(b"\0").decode())
+        except (ZoneInfoNotFoundError, ValueError, UnicodeDecodeError):
+            return None
+
+    def slot_of(self, moment: datetime) -> int:
+        """Slot index of an aware datetime (may be out of range)."""
+        elapsed = moment.astimezone(timezone.utc) - self.start_utc
+        return int(elapsed.total_seconds()) // TimeInterval.get_interval_seconds()
+
+    def is_valid(self, slot: int) -> bool:
+        """Whether a slot holds a price."""
+        return bool(self.validity[slot >> 3] & (1 << (slot & 7)))
+
+    def set_price(self, slot: int, price: float) -> None:
+        """Write a price into a slot and mark it valid."""
+        self.prices[slot] = price
+        self.validity[slot >> 3] |= 1 << (slot & 7)
+
+    def day_index(self, day: date) -> int:
+        """Rollup index of a local date in this year."""
+        return day.toordinal() - date(self.year, 1, 1).toordinal()
+
+    def day_slots(self, day: date) -> Tuple[int, int]:
+        """Slot range [start, end) covering a local date."""
+        start = datetime.combine(day, time(0), tzinfo=self.tz)
+        end = datetime.combine(day + timedelta(days=1), time(0), tzinfo=self.tz)
+        return max(self.slot_of(start), 0), min(self.slot_of(end), self.n_slots)
+
+    def update_rollup(self, day: date) -> None:
+        """Recompute the rollup for one local date from its slots."""
+        start, end = self.day_slots(day)
+        values = [self.prices[s] for s in range(start, end) if self.is_valid(s)]
+        idx = self.day_index(day)
+        self.day_count[idx] = len(values)
+        self.day_min[idx] = min(values) if values else 0.0
+        self.day_max[idx] = max(values) if values else 0.0
+        self.day_sum[idx] = math.fsum(values)
+
+    def flush(self) -> None:
+        """Write dirty pages of a file-backed year to disk."""
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.flush()
+
+    def close(self) -> None:
+        """Release the views and unmap a file-backed year."""
+        for view in reversed(self._views):
+            view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            try:
+                self._buffer.close()
+            except BufferError:
+                # A caller still holds a day view; unmapped once it is dropped
+                pass
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the backing buffer."""
+        return len(self._buffer)
+
+
+class ArchiveDayView:
+    """Zero-copy view of one archived day.
+
+    ``prices`` is a float64 memoryview over the day's slots (directly over the
+    mapped file when persisting); use ``is_valid`` or ``items`` to skip slots
+    without a price.
+    """
+
+    __slots__ = ("day", "prices", "_area_year", "_first_slot")
+
+    def __init__(self, day: date, area_year: _AreaYear):
+        start, end = area_year.day_slots(day)
+        self.day = day
+        self.prices = area_year.prices[start:end]
+        self._area_year = area_year
+        self._first_slot = start
+
+    def is_valid(self, index: int) -> bool:
+        """Whether the day's index-th interval holds a price."""
+        return self._area_year.is_valid(self._first_slot + index)
+
+    def items(self) -> Iterator[Tuple[datetime, float]]:
+        """(interval start, price) of the intervals that hold one, in time order."""
+        area_year = self._area_year
+        step = timedelta(seconds=TimeInterval.get_interval_seconds())
+        for index, price in enumerate(self.prices):
+            if self.is_valid(index):
+                moment = area_year.start_utc + (self._first_slot + index) * step
+                yield moment.astimezone(area_year.tz), price
+
+
+def archive_series(area: str, price_data: Any) -> str:
+    """Archive series of an entry's processed prices.
+
+    Archived prices are final values (currency, display unit, VAT, tariffs
+    and profiles applied), so days computed with different settings must not
+    be mixed. The series is the area plus a short digest of those settings:
+    entries for the same area with the same settings share it, and changing
+    the options starts a new one.
+
+    Args:
+        area: Area code
+        price_data: IntervalPriceData whose prices are archived or compared
+
+    Returns:
+        Series key to pass as the archive's area
+    """
+    settings = (
+        price_data.target_currency,
+        price_data.display_unit,
+        price_data.applied_vat_rate,
+        bool(price_data.applied_include_vat),
+        price_data.applied_import_multiplier,
+        price_data.applied_additional_tariff,
+        price_data.applied_energy_tax,
+        price_data.applied_tariff_schedule,
+        price_data.applied_price_profiles,
+    )
+    digest = hashlib.sha1(repr(settings).encode()).hexdigest()[:10]
+    return f"{area}_{digest}"
+
+
+class PriceArchive:
+    """Archive of finalized daily prices for range and aggregate queries.
+
+    The cache only holds today and tomorrow. The archive keeps older days in
+    one fixed-size block of interval slots per series and year (plus daily
+    min/max/sum/count rollups), so memory depends only on the number of
+    area-years kept, not on how often days are written. Years older than the
+    retention window are dropped. The "area" of every method is the series
+    from archive_series, so prices with different settings are kept apart.
+
+    With cache persistence enabled each area-year is a memory-mapped file
+    under ``<cache_dir>/archive``; writes then run on the executor, and queries
+    may open files, so call them from the executor (or use async_get_last_week).
+    All access to loaded years and files is serialized by a module-wide lock;
+    call async_close when the entry unloads.
+    """
+
+    def __init__(
+        self,
+        hass: Optional[HomeAssistant] = None,
+        config: Optional[Dict[str, Any]] = None,
+        budget: Optional[ByteBudget] = None,
+    ):
+        """Initialize the archive.
+
+        Args:
+            hass: Optional Home Assistant instance
+            config: Optional configuration
+            budget: Optional integration-wide byte budget to report in-memory
+                years to, as a non-evictable consumer bounded by the retention
+                (mapped files are page cache and are not charged)
+        """
+        self.hass = hass
+        config = config or {}
+        self.retention_years = config.get(
+            Config.ARCHIVE_RETENTION_YEARS, Defaults.ARCHIVE_RETENTION_YEARS
+        )
+        self.persist = bool(
+            hass and config.get(Config.PERSIST_CACHE, Defaults.PERSIST_CACHE)
+        )
+        self.cache_dir = config.get(Config.CACHE_DIR, Defaults.CACHE_DIR)
+        self._years: Dict[Tuple[str, int], _AreaYear] = {}
+        # Scheduled executor writes, awaited by async_close
+        self._pending: Set[asyncio.Future] = set()
+        self.budget = budget
+        self._budget_key = (
+            budget.register("archive", evictable=False) if budget else None
+        )
+
+    def archive_day(
+        self,
+        area: str,
+        day: date,
+        interval_prices: Dict[str, float],
+        timezone_name: str,
+    ) -> int:
+        """Write one day of interval prices into the archive.
+
+        Writing the same day again overwrites its slots, so this can be called
+        whenever a day's prices are stored. When persisting, the write to the
+        mapped file is scheduled on the executor.
+
+        Args:
+            area: Area code
+            day: Local date the prices are for
+            interval_prices: Prices keyed by "HH:MM" (DST fall-back duplicates
+                as "HH:MM_1"/"HH:MM_2") in timezone_name
+            timezone_name: Timezone the interval keys are in
+
+        Returns:
+            Number of intervals to be written
+        """
+        if not interval_prices:
+            return 0
+        try:
+            tz = ZoneInfo(timezone_name)
+        except (ZoneInfoNotFoundError, ValueError, TypeError):
+            _LOGGER.warning(
+                f"Cannot archive {area}/{day}: unknown timezone {timezone_name}"
+            )
+            return 0
+
+        writes = []
+        for key, price in interval_prices.items():
+            moment = key_to_datetime(day, key, tz)
+            if moment is not None and price is not None:
+                writes.append((moment, float(price)))
+
+        if self.persist:
+            job = self.hass.async_add_executor_job(
+                self._write_day, area, day, tz, writes
+            )
+            if asyncio.isfuture(job):
+                self._pending.add(job)
+                job.add_done_callback(self._pending.discard)
+        else:
+            self._write_day(area, day, tz, writes)
+        return len(writes)
+
+    def _write_day(
+        self,
+        area: str,
+        day: date,
+        tz: ZoneInfo,
+        writes: List[Tuple[datetime, float]],
+    ) -> None:
+        """Write a day's prices and rollup, flushing file-backed years."""
+        try:
+            with _ARCHIVE_LOCK:
+                area_year = self._get_year(area, day.year, tz)
+                if area_year is None:
+                    return
+                for moment, price in writes:
+                    slot = area_year.slot_of(moment)
+                    if 0 <= slot < area_year.n_slots:
+                        area_year.set_price(slot, price)
+                area_year.update_rollup(day)
+                area_year.flush()
+                self._prune_years(area)
+            _LOGGER.debug(f"Archived {len(writes)} intervals for {area}/{day}")
+        except (OSError, ValueError) as e:
+            _LOGGER.error(f"Failed to archive prices for {area}/{day}: {e}")
+
+    def get_day_view(self, area: str, day: date) -> Optional[ArchiveDayView]:
+        """Get a zero-copy view of one archived day.
+
+        Args:
+            area: Area code
+            day: Local date
+
+        Returns:
+            View over the day's slots, or None if the year is not archived
+        """
+        with _ARCHIVE_LOCK:
+            area_year = self._get_year(area, day.year)
+            if area_year is None:
+                return None
+            return ArchiveDayView(day, area_year)
+
+    def get_daily_rollups(
+        self, area: str, start_date: date, end_date: date
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get precomputed daily statistics for a date range.
+
+        Args:
+            area: Area code
+            start_date: First date (inclusive)
+            end_date: Last date (inclusive)
+
+        Returns:
+            Mapping of ISO date to min/max/avg/count, for days with data
+        """
+        rollups: Dict[str, Dict[str, Any]] = {}
+        with _ARCHIVE_LOCK:
+            for day, area_year in self._iter_days(area, start_date, end_date):
+                idx = area_year.day_index(day)
+                count = area_year.day_count[idx]
+                if not count:
+                    continue
+                rollups[day.isoformat()] = {
+                    "min": area_year.day_min[idx],
+                    "max": area_year.day_max[idx],
+                    "avg": area_year.day_sum[idx] / count,
+                    "count": count,
+                }
+        return rollups
+
+    def aggregate(
+        self, area: str, start_date: date, end_date: date
+    ) -> Optional[Dict[str, Any]]:
+        """Aggregate statistics over a date range from the daily rollups.
+
+        Args:
+            area: Area code
+            start_date: First date (inclusive)
+            end_date: Last date (inclusive)
+
+        Returns:
+            Dictionary with min, max, avg, count and days, or None if no data
+        """
+        total = 0.0
+        count = 0
+        days = 0
+        low = math.inf
+        high = -math.inf
+        with _ARCHIVE_LOCK:
+            for day, area_year in self._iter_days(area, start_date, end_date):
+                idx = area_year.day_index(day)
+                if not area_year.day_count[idx]:
+                    continue
+                days += 1
+                count += area_year.day_count[idx]
+                total += area_year.day_sum[idx]
+                low = min(low, area_year.day_min[idx])
+                high = max(high, area_year.day_max[idx])
+
+        if not count:
+            return None
+        return {
+            "min": low,
+            "max": high,
+            "avg": total / count,
+            "count": count,
+            "days": days,
+        }
+
+    def get_last_week(self, area: str, today: date) -> Dict[str, Any]:
+        """Summarize the seven days before today, for comparing current prices.
+
+        Args:
+            area: Area code
+            today: Current local date (not included)
+
+        Returns:
+            Dictionary with "week" (aggregate, or None without data), "daily"
+            (rollups by ISO date) and "same_day" ((interval start, price)
+            pairs of the same weekday last week)
+        """
+        start = today - timedelta(days=7)
+        end = today - timedelta(days=1)
+        with _ARCHIVE_LOCK:
+            view = self.get_day_view(area, start)
+            return {
+                "week": self.aggregate(area, start, end),
+                "daily": self.get_daily_rollups(area, start, end),
+                "same_day": list(view.items()) if view is not None else [],
+            }
+
+    async def async_get_last_week(self, area: str, today: date) -> Dict[str, Any]:
+        """Summarize last week without blocking the event loop."""
+        if self.persist:
+            return await self.hass.async_add_executor_job(
+                self.get_last_week, area, today
+            )
+        return self.get_last_week(area, today)
+
+    def clear(self, area: Optional[str] = None) -> None:
+        """Drop loaded years, optionally only for one area.
+
+        Files on disk are kept; they are reopened on the next query.
+        """
+        with _ARCHIVE_LOCK:
+            for key in [k for k in self._years if area is None or k[0] == area]:
+                self._years.pop(key).close()
+            self._report_usage()
+
+    def close(self) -> None:
+        """Unmap all file-backed years."""
+        self.clear()
+        if self.budget is not None:
+            self.budget.release(self._budget_key)
+
+    async def async_close(self) -> None:
+        """Wait for scheduled writes, then unmap all file-backed years."""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        if self.persist:
+            await self.hass.async_add_executor_job(self.close)
+        else:
+            self.close()
+
+    def get_info(self) -> Dict[str, Any]:
+        """Get information about the archive.
+
+        Returns:
+            Dictionary with archive information
+        """
+        with _ARCHIVE_LOCK:
+            years = dict(self._years)
+        return {
+            "area_years": sorted(f"{area}/{year}" for area, year in years),
+            "total_bytes": sum(y.nbytes for y in years.values()),
+            "retention_years": self.retention_years,
+            "persist": self.persist,
+        }
+
+    def _report_usage(self) -> None:
+        """Report the size of in-memory years to the byte budget, if any."""
+        if self.budget is not None:
+            self.budget.update(
+                self._budget_key,
+                sum(y.nbytes for y in self._years.values() if y.path is None),
+            )
+
+    def _get_archive_dir(self) -> str:
+        """Get the directory holding the year files."""
+        return os.path.join(self.hass.config.path(), self.cache_dir, "archive")
+
+    def _get_year_path(self, area: str, year: int) -> str:
+        """Get the file path of an area-year."""
+        return os.path.join(self._get_archive_dir(), f"{area}_{year}.bin")
+
+    def _get_year(
+        self, area: str, year: int, tz: Optional[ZoneInfo] = None
+    ) -> Optional[_AreaYear]:
+        """Get an area-year, opening its file or creating it if tz is given."""
+        area_year = self._years.get((area, year))
+        if area_year is not None:
+            return area_year
+
+        if self.persist:
+            area_year = _AreaYear.open_file(self._get_year_path(area, year), year, tz)
+        elif tz is not None:
+            area_year = _AreaYear.in_memory(year, tz)
+
+        if area_year is not None:
+            self._years[(area, year)] = area_year
+            self._report_usage()
+        return area_year
+
+    def _prune_years(self, area: str) -> None:
+        """Drop years of an area that fall outside the retention window."""
+        latest_year = max(year for year_area, year in self._years if year_area == area)
+        oldest = latest_year - self.retention_years + 1
+        for key in [k for k in self._years if k[0] == area and k[1] < oldest]:
+            self._years.pop(key).close()
+        self._report_usage()
+
+        if not self.persist:
+            return
+        archive_dir = self._get_archive_dir()
+        for name in os.listdir(archive_dir):
+            file_area, _, year = name[: -len(".bin")].rpartition("_")
+            if file_area == area and year.isdigit() and int(year) < oldest:
+                os.remove(os.path.join(archive_dir, name))
+
+    def _iter_days(
+        self, area: str, start_date: date, end_date: date
+    ) -> Iterator[Tuple[date, _AreaYear]]:
+        """Dates in a range together with their archived year."""
+        day = start_date
+        while day <= end_date:
+            area_year = self._get_year(area, day.year)
+            if area_year is None:
+                # Skip straight to the next year
+                day = date(day.year + 1, 1, 1)
+                continue
+            yield day, area_year
+            day += timedelta(days=1)
@@ -0,0 +1,284 @@
+"""Compressed, size-capped store for raw API payloads."""
+
+import hashlib
+import json
+import logging
+import os
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+
+from ..const.config import Config
+from ..const.defaults import Defaults
+from .byte_budget import ByteBudget
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _serialize(payload: Any) -> Optional[bytes]:
+    """Serialize a payload canonically (sorted keys), or None if it cannot be."""
+    try:
+        return json.dumps(payload, sort_keys=True, default=str).encode()
+    except (TypeError, ValueError) as e:
+        _LOGGER.warning(f"Raw payload is not serializable, dropping it: {e}")
+        return None
+
+
+def encode_payload(payload: Any) -> Optional[Tuple[str, bytes]]:
+    """Serialize, hash and compress a payload for RawPayloadStore.put_encoded.
+
+    Touches no store state, so large payloads can be encoded in the executor
+    and only the insert done on the event loop.
+
+    Args:
+        payload: JSON-serializable raw payload
+
+    Returns:
+        Tuple of (reference, compressed payload), or None if there is nothing
+        to store
+    """
+    if not payload:
+        return None
+    encoded = _serialize(payload)
+    if encoded is None:
+        return None
+    return hashlib.sha1(encoded).hexdigest(), zlib.compress(encoded)
+
+
+class RawPayloadStore:
+    """Store for raw upstream responses (XML, JSON, CSV metadata).
+
+    Raw payloads are only needed for diagnostics and reparsing, but they are
+    by far the largest part of a price entry. They are kept here compressed,
+    addressed by content hash, and evicted oldest-first once the store's own
+    byte cap is exceeded. The price cache keeps only the returned reference.
+    """
+
+    def __init__(
+        self,
+        hass: Optional[HomeAssistant] = None,
+        config: Optional[Dict[str, Any]] = None,
+        budget: Optional[ByteBudget] = None,
+    ):
+        """Initialize the store.
+
+        Args:
+            hass: Optional Home Assistant instance
+            config: Optional configuration
+            budget: Optional integration-wide byte budget to report to (as a
+                non-evictable consumer, bounded by this store's own cap)
+        """
+        self.hass = hass
+        self.config = config or {}
+
+        self.max_bytes = self.config.get(
+            Config.RAW_PAYLOAD_MAX_BYTES, Defaults.RAW_PAYLOAD_MAX_BYTES
+        )
+        self.persist = self.config.get(Config.PERSIST_CACHE, Defaults.PERSIST_CACHE)
+        self.cache_dir = self.config.get(Config.CACHE_DIR, Defaults.CACHE_DIR)
+
+        # ref -> compressed payload, oldest first
+        self._blobs: "OrderedDict[str, bytes]" = OrderedDict()
+        self._total_bytes = 0
+        self.budget = budget
+        self._budget_key = (
+            budget.register("raw_payloads", evictable=False) if budget else None
+        )
+
+    def put(self, payload: Any) -> Optional[str]:
+        """Compress and store a payload.
+
+        Args:
+            payload: JSON-serializable raw payload
+
+        Returns:
+            Reference to pass to get(), or None if nothing was stored
+        """
+        if not payload:
+            return None
+
+        encoded = _serialize(payload)
+        if encoded is None:
+            return None
+
+        ref = hashlib.sha1(encoded).hexdigest()
+        if ref in self._blobs:
+            # Same payload again (e.g. unchanged refetch): just refresh its age
+            self._blobs.move_to_end(ref)
+            return ref
+        return self.put_encoded(ref, zlib.compress(encoded))
+
+    def put_encoded(self, ref: str, blob: bytes) -> Optional[str]:
+        """Store a payload encoded with encode_payload.
+
+        Args:
+            ref: Reference of the payload
+            blob: Compressed payload
+
+        Returns:
+            Reference to pass to get(), or None if nothing was stored
+        """
+        if ref in self._blobs:
+            # Same payload again (e.g. unchanged refetch): just refresh its age
+            self._blobs.move_to_end(ref)
+            return ref
+
+        if len(blob) > self.max_bytes:
+            _LOGGER.debug(
+                f"Raw payload of {len(blob)} compressed bytes exceeds budget "
+                f"of {self.max_bytes}, not storing it"
+            )
+            return None
+
+        self._blobs[ref] = blob
+        self._total_bytes += len(blob)
+        self._evict_if_needed()
+
+        # Persist on the executor so blocking file I/O never runs on the loop
+        if self.persist and self.hass:
+            self.hass.async_add_executor_job(self._save_blob, ref, blob)
+
+        return ref
+
+    def get(self, ref: Optional[str]) -> Any:
+        """Load and decompress a payload.
+
+        Falls back to the on-disk copy when persistence is enabled, so call
+        this from the executor (or use async_get) in that case.
+
+        Args:
+            ref: Reference returned by put()
+
+        Returns:
+            The original payload, or None if it is no longer available
+        """
+        if not ref:
+            return None
+
+        blob = self._blobs.get(ref)
+        if blob is None and self.persist and self.hass:
+            blob = self._load_blob(ref)
+        if blob is None:
+            return None
+
+        try:
+            return json.loads(zlib.decompress(blob))
+        except (zlib.error, ValueError) as e:
+            _LOGGER.warning(f"Failed to decode raw payload {ref}: {e}")
+            return None
+
+    async def async_get(self, ref: Optional[str]) -> Any:
+        """Load a payload without blocking the event loop."""
+        if self.hass:
+            return await self.hass.async_add_executor_job(self.get, ref)
+        return self.get(ref)
+
+    def touch(self, ref: Optional[str]) -> bool:
+        """Refresh the age of a payload held in memory.
+
+        Args:
+            ref: Reference returned by put()
+
+        Returns:
+            True if the payload is held in memory
+        """
+        if not ref or ref not in self._blobs:
+            return False
+        self._blobs.move_to_end(ref)
+        return True
+
+    def delete(self, ref: str) -> bool:
+        """Delete a payload from memory.
+
+        Args:
+            ref: Reference returned by put()
+
+        Returns:
+            True if the payload was held in memory and removed
+        """
+        blob = self._blobs.pop(ref, None)
+        if blob is None:
+            return False
+        self._total_bytes -= len(blob)
+        self._report_usage()
+        return True
+
+    def clear(self) -> None:
+        """Drop all in-memory payloads."""
+        self._blobs.clear()
+        self._total_bytes = 0
+        self._report_usage()
+
+    def get_info(self) -> Dict[str, Any]:
+        """Get information about the store.
+
+        Returns:
+            Dictionary with store information
+        """
+        return {
+            "total_payloads": len(self._blobs),
+            "total_bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "persist": self.persist,
+        }
+
+    def _evict_if_needed(self) -> None:
+        """Evict the oldest payloads until this store fits its byte cap.
+
+        The payload just stored is kept, as the price cache references it.
+        """
+        self._report_usage()
+        while len(self._blobs) > 1 and self._total_bytes > self.max_bytes:
+            ref, blob = self._blobs.popitem(last=False)
+            self._total_bytes -= len(blob)
+            self._report_usage()
+            _LOGGER.debug(f"Evicted raw payload {ref} ({len(blob)} bytes)")
+
+    def _report_usage(self) -> None:
+        """Report the in-memory size to the byte budget, if any."""
+        if self.budget is not None:
+            self.budget.update(self._budget_key, self._total_bytes)
+
+    def _get_payload_dir(self) -> str:
+        """Get the directory holding persisted payloads."""
+        return os.path.join(self.hass.config.path(), self.cache_dir, "raw_payloads")
+
+    def _save_blob(self, ref: str, blob: bytes) -> None:
+        """Write a compressed payload to disk."""
+        try:
+            payload_dir = self._get_payload_dir()
+            os.makedirs(payload_dir, exist_ok=True)
+            with open(os.path.join(payload_dir, f"{ref}.zlib"), "wb") as f:
+                f.write(blob)
+            self._prune_disk(payload_dir)
+        except Exception as e:
+            _LOGGER.error(f"Failed to save raw payload {ref}: {e}")
+
+    def _prune_disk(self, payload_dir: str) -> None:
+        """Delete the oldest persisted payloads beyond the byte budget."""
+        files = []
+        for name in os.listdir(payload_dir):
+            path = os.path.join(payload_dir, name)
+            stat = os.stat(path)
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+    def _load_blob(self, ref: str) -> Optional[bytes]:
+        """Read a compressed payload from disk."""
+        try:
+            path = os.path.join(self._get_payload_dir(), f"{ref}.zlib")
+            if not os.path.exists(path):
+                return None
+            with open(path, "rb") as f:
+                return f.read()
+        except Exception as e:
+            _LOGGER.error(f"Failed to load raw payload {ref}: {e}")
+            return None
@@ -0,0 +1,123 @@
+"""Single-pass summary statistics for interval price series."""
+
+import math
+from dataclasses import dataclass
+from typing import Mapping, Optional, Sequence, Tuple
+
+from ..api.base.data_structure import EMPTY_PRICE_STATISTICS, FrozenPriceStatistics
+
+
+@dataclass(frozen=True, slots=True)
+class SeriesSummary:
+    """Summary of one price series.
+
+    argmin/argmax are the keys of the first occurrence of the minimum and
+    maximum, in the series' iteration order. std is the population standard
+    deviation. The median and percentiles are only set when summarize() was
+    asked for them; they interpolate linearly between the closest ranks.
+    """
+
+    count: int = 0
+    min: Optional[float] = None
+    max: Optional[float] = None
+    mean: Optional[float] = None
+    argmin: Optional[str] = None
+    argmax: Optional[str] = None
+    median: Optional[float] = None
+    std: Optional[float] = None
+    percentiles: Tuple[Tuple[int, float], ...] = ()
+
+    def percentile(self, p: int) -> Optional[float]:
+        """Get a computed percentile, or None if it was not requested."""
+        for rank, value in self.percentiles:
+            if rank == p:
+                return value
+        return None
+
+    def to_price_statistics(self) -> FrozenPriceStatistics:
+        """Get the avg/min/max view used by IntervalPriceData and sensors."""
+        if not self.count:
+            return EMPTY_PRICE_STATISTICS
+        return FrozenPriceStatistics.create(
+            avg=self.mean,
+            min=self.min,
+            max=self.max,
+            min_timestamp=self.argmin,
+            max_timestamp=self.argmax,
+        )
+
+
+EMPTY_SUMMARY = SeriesSummary()
+
+
+def summarize(
+    prices: Mapping[str, Optional[float]],
+    percentiles: Optional[Sequence[int]] = None,
+) -> SeriesSummary:
+    """Summarize a series in one pass over its values.
+
+    Min, max, their keys, the sum (for the mean) and the variance (Welford)
+    are accumulated together. Only when percentiles are requested are the
+    values sorted once for them and the median. Missing (None) prices are
+    skipped.
+
+    Args:
+        prices: Prices keyed by interval
+        percentiles: Percentiles (0-100) to compute besides the median;
+            None (the default) skips the sort, leaving median unset
+
+    Returns:
+        SeriesSummary, or EMPTY_SUMMARY if there are no prices
+    """
+    values = []
+    total = 0.0
+    mean = 0.0
+    m2 = 0.0
+    min_value = max_value = None
+    argmin = argmax = None
+
+    for key, price in prices.items():
+        if price is None:
+            continue
+        values.append(price)
+        total += price
+        if min_value is None or price < min_value:
+            min_value, argmin = price, key
+        if max_value is None or price > max_value:
+            max_value, argmax = price, key
+        delta = price - mean
+        mean += delta / len(values)
+        m2 += delta * (price - mean)
+
+    count = len(values)
+    if not count:
+        return EMPTY_SUMMARY
+
+    median = None
+    ranked: Tuple[Tuple[int, float], ...] = ()
+    if percentiles is not None:
+        values.sort()
+        median = _ranked(values, 50)
+        ranked = tuple((p, _ranked(values, p)) for p in percentiles)
+
+    return SeriesSummary(
+        count=count,
+        min=min_value,
+        max=max_value,
+        # sum/len rather than the running mean, to match plain averages exactly
+        mean=total / count,
+        argmin=argmin,
+        argmax=argmax,
+        median=median,
+        std=math.sqrt(m2 / count),
+        percentiles=ranked,
+    )
+
+
+def _ranked(sorted_values: Sequence[float], p: float) -> float:
+    """Percentile of sorted values, interpolating between closest ranks."""
+    position = (len(sorted_values) - 1) * p / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    low, high = sorted_values[lower], sorted_values[upper]
+    return low + (high - low) * (position - lower)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Manual benchmark for the bulk ISO-timestamp normalization fast path.
+
+Times TimezoneConverter._split_by_day_fast against the streaming path
+(iter_normalized_intervals + split_stream_by_day) on 300 fifteen-minute
+intervals in several ISO layouts, and prints both timings. Nothing is
+asserted: wall-clock ratios vary too much between machines to gate CI on.
+tests/pytest/unit/test_bulk_normalization.py covers correctness.
+
+Usage:
+    python tests/manual/benchmarks/bulk_normalization.py [--number N] [--repeat R]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from datetime import date, datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+from custom_components.ge_spot.timezone.service import TimezoneService
+from custom_components.ge_spot.timezone.timezone_converter import TimezoneConverter
+from tests.lib.mocks.hass import MockHass
+
+INTERVALS = 300
+TODAY = date(2025, 6, 1)
+
+# Layout name -> (timestamp formatter, source timezone for naive layouts)
+LAYOUTS = {
+    "offset": (lambda t: t.isoformat(), None),
+    "cet": (
+        lambda t: t.astimezone(timezone(timedelta(hours=1))).isoformat(),
+        None,
+    ),
+    "zulu": (lambda t: t.strftime("%Y-%m-%dT%H:%M:%SZ"), None),
+    "naive": (lambda t: t.strftime("%Y-%m-%dT%H:%M:%S"), "Etc/UTC"),
+}
+
+
+def build_payload(today: date, layout: str) -> dict:
+    """300 quarter-hour prices from the evening before today."""
+    fmt, _ = LAYOUTS[layout]
+    start = datetime.combine(today, datetime.min.time(), tzinfo=timezone.utc)
+    start -= timedelta(hours=4)
+    return {fmt(start + timedelta(minutes=15 * i)): float(i) for i in range(INTERVALS)}
+
+
+def best_of(func, number: int, repeat: int) -> float:
+    """Best average seconds per call over the repeats."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--number", type=int, default=20, help="calls per repeat")
+    parser.add_argument("--repeat", type=int, default=15, help="repeats per path")
+    args = parser.parse_args()
+
+    converter = TimezoneConverter(TimezoneService(MockHass(), "SE4"))
+    print(f"{INTERVALS} intervals, best of {args.repeat} x {args.number} calls")
+    for layout, (_, source_tz) in LAYOUTS.items():
+        payload = build_payload(TODAY, layout)
+        # Warm the per-day caches so both paths are timed steady-state
+        converter._split_by_day_fast(payload, source_tz, TODAY)
+
+        fast = best_of(
+            lambda: converter._split_by_day_fast(payload, source_tz, TODAY),
+            args.number,
+            args.repeat,
+        )
+        stream = best_of(
+            lambda: converter.split_stream_by_day(
+                converter.iter_normalized_intervals(payload, source_tz), TODAY
+            ),
+            args.number,
+            args.repeat,
+        )
+        print(
+            f"  {layout:<7} fast path {fast * 1e6:7.0f} us, "
+            f"stream {stream * 1e6:7.0f} us ({stream / fast:.1f}x)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""Shared fixtures for the unit tests."""
+
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+
+from custom_components.ge_spot.coordinator.data_processor import DataProcessor
+from custom_components.ge_spot.coordinator.processing_memo import PROCESSING_MEMO
+from custom_components.ge_spot.timezone.service import TimezoneService
+from tests.lib.mocks.hass import MockHass
+
+_DEFAULT_HASS = object()
+
+
+@pytest.fixture(autouse=True)
+def _empty_processing_memo():
+    """Start and end every test with an empty process-wide processing memo.
+
+    Memoized results would otherwise hide the processing under test, or let
+    one test's results leak into another.
+    """
+    PROCESSING_MEMO.clear()
+    yield
+    PROCESSING_MEMO.clear()
+
+
+@pytest.fixture
+def make_processor():
+    """Factory for DataProcessors with an identity currency conversion.
+
+    Keyword arguments:
+        area: Area code (default "SE4")
+        hass: Home Assistant instance (default a fresh MockHass)
+        target_currency: Target currency (default "EUR")
+        config: Processor config (default empty)
+        exchange: Exchange service (default one reporting EUR 1.0)
+        rate: Exchange rate the converter reports (default None)
+        rate_timestamp: Rate timestamp the converter reports (default None)
+    """
+
+    def _make(
+        area: str = "SE4",
+        hass=_DEFAULT_HASS,
+        target_currency: str = "EUR",
+        config=None,
+        exchange=None,
+        rate=None,
+        rate_timestamp=None,
+    ) -> DataProcessor:
+        if hass is _DEFAULT_HASS:
+            hass = MockHass()
+        processor = DataProcessor(
+            hass=hass,
+            area=area,
+            target_currency=target_currency,
+            config=config or {},
+            tz_service=TimezoneService(hass, area),
+            manager=MagicMock(),
+        )
+        processor._manager.is_in_grace_period = Mock(return_value=False)
+        if exchange is None:
+            exchange = AsyncMock()
+            exchange.get_rates = AsyncMock(return_value={"EUR": 1.0})
+        processor._exchange_service = exchange
+        processor._currency_converter = AsyncMock()
+        processor._currency_converter.convert_interval_prices = AsyncMock(
+            side_effect=lambda interval_prices, **kwargs: (
+                interval_prices,
+                interval_prices,
+                rate,
+                rate_timestamp,
+            )
+        )
+        return processor
+
+    return _make
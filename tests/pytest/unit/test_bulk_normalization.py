@@ -0,0 +1,113 @@
+"""Tests for the bulk ISO-timestamp normalization fast path."""
+
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from custom_components.ge_spot.timezone.service import TimezoneService
+from custom_components.ge_spot.timezone.timezone_converter import (
+    TimezoneConverter,
+    _clock_seconds,
+)
+from tests.lib.mocks.hass import MockHass
+
+INTERVALS = 300
+BERLIN = ZoneInfo("Europe/Berlin")
+# Stockholm: normal day, spring-forward and fall-back
+DAYS = [date(2025, 6, 1), date(2025, 3, 30), date(2025, 10, 26)]
+
+
+def _converter() -> TimezoneConverter:
+    return TimezoneConverter(TimezoneService(MockHass(), "SE4"))
+
+
+def _payload(today: date, layout: str, minutes: int = 15) -> dict:
+    """300 prices from the evening before today, keyed in one ISO layout."""
+    start = datetime.combine(today, datetime.min.time(), tzinfo=timezone.utc)
+    start -= timedelta(hours=4)
+    stamps = [start + timedelta(minutes=minutes * i) for i in range(INTERVALS)]
+    formats = {
+        "offset": lambda t: t.isoformat(),
+        "cet": lambda t: t.astimezone(timezone(timedelta(hours=1))).isoformat(),
+        "zulu": lambda t: t.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "minutes": lambda t: t.strftime("%Y-%m-%dT%H:%M+00:00"),
+        "naive": lambda t: t.strftime("%Y-%m-%dT%H:%M:%S"),
+        "naive_berlin": lambda t: t.astimezone(BERLIN).strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    return {formats[layout](t): float(i) for i, t in enumerate(stamps)}
+
+
+def _stream(converter, payload, source_tz, today):
+    return converter.split_stream_by_day(
+        converter.iter_normalized_intervals(payload, source_tz), today
+    )
+
+
+@pytest.mark.parametrize("today", DAYS)
+@pytest.mark.parametrize(
+    "layout,source_tz",
+    [
+        ("offset", None),
+        ("cet", None),
+        ("zulu", None),
+        ("minutes", None),
+        ("naive", "Etc/UTC"),
+        ("naive_berlin", "Europe/Berlin"),
+    ],
+)
+def test_fast_path_matches_stream(today, layout, source_tz):
+    """The fast path gives the same keys, values and order as the stream."""
+    converter = _converter()
+    payload = _payload(today, layout)
+
+    fast = converter._split_by_day_fast(payload, source_tz, today)
+
+    assert fast is not None
+    assert fast == _stream(converter, payload, source_tz, today)
+    assert [list(day) for day in fast] == [
+        list(day) for day in _stream(converter, payload, source_tz, today)
+    ]
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        # Not on an interval start
+        _payload(DAYS[0], "offset", minutes=5),
+        # Fractional seconds
+        {"2025-06-01T10:00:00.000+00:00": 1.0},
+        # Unparseable key
+        {"2025-06-01T10:00:00+00:00": 1.0, "bogus": 2.0},
+        # Two timestamps for one interval
+        {"2025-06-01T10:00:00+00:00": 1.0, "2025-06-01T12:00:00+02:00": 2.0},
+    ],
+)
+def test_unsupported_input_falls_back(payload):
+    """Inputs the fast path cannot place exactly go through the stream."""
+    converter = _converter()
+    today = DAYS[0]
+
+    assert converter._split_by_day_fast(payload, "Etc/UTC", today) is None
+    assert converter.split_by_day(payload, "Etc/UTC", today) == _stream(
+        converter, payload, "Etc/UTC", today
+    )
+
+
+def test_fast_path_parses_each_time_of_day_once():
+    """300 intervals are placed without parsing a datetime per timestamp."""
+    converter = _converter()
+    today = DAYS[0]
+    payload = _payload(today, "offset")
+    _clock_seconds.cache_clear()
+
+    with patch.object(
+        TimezoneConverter, "parse_datetime_with_tz", side_effect=AssertionError
+    ) as parse:
+        result = converter.split_by_day(payload, None, today)
+
+    parse.assert_not_called()
+    # One parse per distinct 'HH:MM:SS+00:00' tail, not per timestamp
+    assert _clock_seconds.cache_info().misses == 24 * 4
+    assert result == _stream(converter, payload, None, today)
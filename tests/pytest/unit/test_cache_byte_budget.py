@@ -0,0 +1,186 @@
+"""Tests for byte-budgeted (GreedyDual-Size) eviction in AdvancedCache."""
+
+import os
+from datetime import date
+from unittest.mock import patch
+
+from custom_components.ge_spot.const import DOMAIN
+from custom_components.ge_spot.const.config import Config
+from custom_components.ge_spot.coordinator.cache_manager import CacheManager
+from custom_components.ge_spot.coordinator.data_models import IntervalPriceData
+from custom_components.ge_spot.coordinator.shared_store import get_shared_store
+from custom_components.ge_spot.utils.advanced_cache import AdvancedCache
+from custom_components.ge_spot.utils.byte_budget import BYTE_BUDGET_KEY, ByteBudget
+from custom_components.ge_spot.utils.raw_payload_store import RawPayloadStore
+from tests.lib.mocks.hass import MockHass
+
+
+def _cache(max_bytes: int) -> AdvancedCache:
+    """In-memory cache limited only by bytes."""
+    return AdvancedCache(config={Config.CACHE_MAX_BYTES: max_bytes})
+
+
+def test_total_bytes_tracked():
+    """Replacing and deleting entries keeps the byte total exact."""
+    cache = _cache(10_000)
+    cache.set("a", "x" * 100)
+    cache.set("a", "x" * 50)
+    cache.set("b", "y" * 30)
+    assert cache.get_info()["memory_bytes"] == 50 + 30
+
+    cache.delete("a")
+    assert cache.get_info()["memory_bytes"] == 30
+
+
+def test_stays_within_budget():
+    """Storing beyond the budget evicts until it fits."""
+    cache = _cache(1_000)
+    for i in range(20):
+        cache.set(f"k{i}", "x" * 98)
+
+    info = cache.get_info()
+    assert info["memory_bytes"] <= 1_000
+    assert info["stats"]["totals"]["evictions"] == 10
+    assert cache.get("k19") is not None
+
+
+def test_large_entries_evicted_before_small():
+    """A large entry is evicted before several small ones."""
+    cache = _cache(1_000)
+    cache.set("big", "x" * 600)
+    for i in range(3):
+        cache.set(f"small{i}", "x" * 98)
+    cache.set("new", "x" * 200)
+
+    assert cache.peek("big") is None
+    assert all(cache.peek(f"small{i}") for i in range(3))
+
+
+def test_unread_entries_age_out():
+    """Inflation lets new entries displace small ones that are never read."""
+    cache = _cache(500)
+    cache.set("small_old", "x" * 48)
+    for i in range(20):
+        cache.set(f"big{i}", "x" * 398)
+
+    assert cache.peek("small_old") is None
+
+
+def test_just_stored_entry_is_kept():
+    """An entry larger than the budget is kept rather than dropped at once."""
+    cache = _cache(100)
+    cache.set("small", "x" * 10)
+    cache.set("huge", "x" * 500)
+
+    assert cache.peek("huge") is not None
+    assert cache.peek("small") is None
+
+
+def test_largest_entries_reported():
+    """get_info lists the largest entries first."""
+    cache = _cache(10_000)
+    cache.set("a", "x" * 10)
+    cache.set("b", "x" * 300)
+    cache.set("c", "x" * 100)
+
+    largest = cache.get_info()["largest_entries"]
+    assert [item["key"] for item in largest] == ["b", "c", "a"]
+    assert largest[0]["size_bytes"] == 300
+
+
+def test_caches_share_one_budget():
+    """Caches charging one budget stay within it together."""
+    budget = ByteBudget(1_000)
+    first = AdvancedCache(budget=budget)
+    second = AdvancedCache(budget=budget)
+    first.set("a", "x" * 600)
+    second.set("b", "x" * 300)
+    second.set("c", "x" * 300)
+
+    assert budget.total_bytes <= 1_000
+    # The cache that grew pays for the overflow
+    assert first.peek("a") is not None
+    assert second.peek("b") is None
+
+    second.close()
+    assert budget.get_info()["consumers"] == {"price_cache#1": 600}
+
+
+def test_entries_are_sized_without_serializing():
+    """Storing an entry walks it rather than encoding it as JSON."""
+    cache = _cache(10_000)
+    with patch("custom_components.ge_spot.utils.advanced_cache.json.dumps") as dumps:
+        cache.set("k", {"today_interval_prices": {"00:00": 1.0}})
+
+    dumps.assert_not_called()
+    assert cache.get_info()["memory_bytes"] == len("today_interval_prices") + 5 + 8
+
+
+def test_entries_of_one_instance_share_budget():
+    """Cache managers, raw payloads and archives charge hass.data's budget."""
+    hass = MockHass()
+    config = {Config.CACHE_MAX_BYTES: 50_000}
+    first = CacheManager(hass, config, get_shared_store(hass, config).raw_payloads)
+    second = CacheManager(hass, config, get_shared_store(hass, config).raw_payloads)
+    data = IntervalPriceData(
+        area="SE3",
+        source="nordpool",
+        target_timezone="Europe/Stockholm",
+        today_interval_prices={"00:00": 1.0},
+        raw_data={"xml": "<doc/>" * 100},
+    )
+    first.store("SE3", "nordpool", data, target_date=date(2025, 3, 10))
+    second.store("SE3", "nordpool", data, target_date=date(2025, 3, 10))
+
+    budget = hass.data[DOMAIN][BYTE_BUDGET_KEY]
+    assert first.budget is second.budget is budget
+    assert budget.max_bytes == 50_000
+    consumers = budget.get_info()["consumers"]
+    assert sorted(key.split("#")[0] for key in consumers) == [
+        "archive",
+        "archive",
+        "price_cache",
+        "price_cache",
+        "raw_payloads",
+    ]
+    assert first.get_cache_stats()["byte_budget"]["total_bytes"] == sum(
+        consumers.values()
+    )
+
+
+def test_non_evictable_usage_does_not_evict_price_cache():
+    """Consumers with their own caps never force the price cache to evict."""
+    budget = ByteBudget(8 * 1024 * 1024)
+    archive = budget.register("archive", evictable=False)
+    budget.update(archive, 9 * 1024 * 1024)
+    cache = AdvancedCache(budget=budget)
+
+    for index in range(5):
+        cache.set(f"k{index}", "x" * 1_000)
+
+    assert [key for key in ("k0", "k1", "k2", "k3", "k4") if cache.peek(key)] == [
+        "k0",
+        "k1",
+        "k2",
+        "k3",
+        "k4",
+    ]
+    assert budget.overflow() == 0
+    assert budget.total_bytes > budget.max_bytes
+
+
+def test_raw_payloads_keep_to_their_own_cap():
+    """The raw payload store evicts for its own cap, not for the budget."""
+    budget = ByteBudget(1_000)
+    other = budget.register("price_cache")
+    store = RawPayloadStore(config={Config.RAW_PAYLOAD_MAX_BYTES: 2_000}, budget=budget)
+    old = store.put({"xml": os.urandom(800).hex()})
+    budget.update(other, 990)
+
+    new = store.put({"xml": os.urandom(800).hex()})
+    assert store.get(old) is not None
+    assert budget.overflow() == 0
+
+    store.put({"xml": os.urandom(800).hex()})
+    assert store.get(old) is None
+    assert store.get(new) is not None
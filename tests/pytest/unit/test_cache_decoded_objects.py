@@ -0,0 +1,111 @@
+"""Tests for the decoded IntervalPriceData cache in CacheManager."""
+
+from datetime import date, datetime, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from custom_components.ge_spot.coordinator.cache_manager import CacheManager
+from custom_components.ge_spot.coordinator.data_models import IntervalPriceData
+
+
+@pytest.fixture
+def cache_manager():
+    """Create a cache manager without persistence."""
+    hass = Mock()
+    hass.config = Mock()
+    hass.config.time_zone = "UTC"
+    return CacheManager(hass=hass, config={"cache_ttl": 60})
+
+
+def _price_data(offset: float = 0.0) -> IntervalPriceData:
+    """Build a small IntervalPriceData for cache round-trips."""
+    return IntervalPriceData(
+        area="SE3",
+        source="nordpool",
+        today_interval_prices={"00:00": 1.0 + offset, "00:15": 2.0 + offset},
+    )
+
+
+class TestDecodedObjectCache:
+    """Repeated reads should reuse the decoded object until invalidated."""
+
+    def test_repeated_reads_skip_decoding(self, cache_manager):
+        """Second get_data returns the same object without from_cache_dict."""
+        today = date.today()
+        cache_manager.store("SE3", "nordpool", _price_data(), target_date=today)
+
+        first = cache_manager.get_data(area="SE3", target_date=today)
+        with patch.object(
+            IntervalPriceData, "from_cache_dict", side_effect=AssertionError
+        ):
+            second = cache_manager.get_data(area="SE3", target_date=today)
+            by_source = cache_manager.get_data(
+                area="SE3", target_date=today, source="nordpool"
+            )
+
+        assert first is second
+        assert first is by_source
+        assert first.today_interval_prices == {"00:00": 1.0, "00:15": 2.0}
+
+    def test_store_invalidates(self, cache_manager):
+        """Storing new data for the same key yields a freshly decoded object."""
+        today = date.today()
+        cache_manager.store("SE3", "nordpool", _price_data(), target_date=today)
+        first = cache_manager.get_data(area="SE3", target_date=today)
+
+        cache_manager.store("SE3", "nordpool", _price_data(10.0), target_date=today)
+        second = cache_manager.get_data(area="SE3", target_date=today)
+
+        assert second is not first
+        assert second.today_interval_prices["00:00"] == 11.0
+
+    def test_clear_invalidates(self, cache_manager):
+        """Cleared entries are dropped from the decoded cache too."""
+        today = date.today()
+        cache_manager.store("SE3", "nordpool", _price_data(), target_date=today)
+        cache_manager.get_data(area="SE3", target_date=today)
+
+        assert cache_manager.clear("SE3") is True
+        assert cache_manager._decoded_cache == {}
+        assert cache_manager.get_data(area="SE3", target_date=today) is None
+
+    def test_timezone_service_change_redecodes(self, cache_manager):
+        """Objects decoded before the timezone service was wired are not reused."""
+        today = date.today()
+        cache_manager.store("SE3", "nordpool", _price_data(), target_date=today)
+        first = cache_manager.get_data(area="SE3", target_date=today)
+
+        cache_manager._timezone_service = Mock(target_timezone=timezone.utc)
+        second = cache_manager.get_data(area="SE3", target_date=today)
+
+        assert second is not first
+        assert second._tz_service is cache_manager._timezone_service
+
+    def test_migration_result_is_cached_after_store(self, cache_manager):
+        """Midnight migration stores today's entry, which is then reused."""
+        today = date(2025, 1, 15)
+        yesterday = date(2025, 1, 14)
+        data = _price_data()
+        data.tomorrow_interval_prices = {"00:00": 5.0, "00:15": 6.0}
+        cache_manager.store(
+            "SE3",
+            "nordpool",
+            data,
+            timestamp=datetime(2025, 1, 14, 14, 0, tzinfo=timezone.utc),
+            target_date=yesterday,
+        )
+
+        with patch(
+            "custom_components.ge_spot.coordinator.cache_manager.dt_util"
+        ) as mock_dt:
+            mock_dt.now.return_value = datetime(2025, 1, 15, 0, 5, tzinfo=timezone.utc)
+            mock_dt.utcnow.return_value = mock_dt.now.return_value
+            migrated = cache_manager.get_data(area="SE3", target_date=today)
+
+        assert migrated.migrated_from_tomorrow is True
+        assert migrated.today_interval_prices == {"00:00": 5.0, "00:15": 6.0}
+
+        again = cache_manager.get_data(area="SE3", target_date=today)
+        assert again.today_interval_prices == migrated.today_interval_prices
+        assert cache_manager.get_data(area="SE3", target_date=today) is again
@@ -20,12 +20,16 @@ class _DataProcessorStub:
         import_multiplier=1.0,
         additional_tariff=0.0,
         energy_tax=0.0,
+        tariff_schedule_version="",
+        price_profiles_version="",
     ):
         self.vat_rate = vat_rate
         self.include_vat = include_vat
         self.import_multiplier = import_multiplier
         self.additional_tariff = additional_tariff
         self.energy_tax = energy_tax
+        self.tariff_schedule_version = tariff_schedule_version
+        self.price_profiles_version = price_profiles_version
 
 
 def _manager(dp):
@@ -74,6 +78,18 @@ def test_tariff_and_tax_changes_invalidate():
     )
 
 
+def test_tariff_schedule_change_invalidates():
+    mgr = _manager(_DataProcessorStub(tariff_schedule_version="abc123"))
+    assert mgr._price_config_changed(_cached()) is True
+    assert mgr._price_config_changed(_cached(applied_tariff_schedule="abc123")) is False
+
+
+def test_price_profiles_change_invalidates():
+    mgr = _manager(_DataProcessorStub(price_profiles_version="def456"))
+    assert mgr._price_config_changed(_cached()) is True
+    assert mgr._price_config_changed(_cached(applied_price_profiles="def456")) is False
+
+
 def test_include_vat_toggle_invalidates():
     mgr = _manager(_DataProcessorStub(include_vat=False, vat_rate=0.0))
     assert mgr._price_config_changed(_cached(applied_include_vat=True)) is True
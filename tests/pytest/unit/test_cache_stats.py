@@ -0,0 +1,138 @@
+"""Tests for cache observability counters and diagnostics."""
+
+from datetime import date
+from unittest.mock import Mock
+
+import pytest
+
+from custom_components.ge_spot.const import DOMAIN
+from custom_components.ge_spot.const.config import Config
+from custom_components.ge_spot.coordinator.cache_manager import CacheManager
+from custom_components.ge_spot.coordinator.data_models import IntervalPriceData
+from custom_components.ge_spot.diagnostics import async_get_config_entry_diagnostics
+from custom_components.ge_spot.utils.advanced_cache import AdvancedCache
+from custom_components.ge_spot.utils.cache_stats import CacheStats
+from tests.lib.mocks.hass import MockHass
+
+META = {"area": "SE3", "source": "nordpool"}
+
+
+class TestCacheStats:
+    """Counter and timing bookkeeping."""
+
+    def test_totals_and_groups(self):
+        """Counters add up in total and per group."""
+        stats = CacheStats()
+        stats.record("hits", "SE3/nordpool")
+        stats.record("hits", "SE4/entsoe")
+        stats.record("misses")
+
+        result = stats.as_dict()
+        assert result["totals"] == {"hits": 2, "misses": 1}
+        assert result["by_group"]["SE3/nordpool"] == {"hits": 1}
+        assert result["hit_ratio"] == pytest.approx(0.667)
+
+    def test_timings(self):
+        """Timings keep count, average and maximum in milliseconds."""
+        stats = CacheStats()
+        stats.record_timing("save", 0.002)
+        stats.record_timing("save", 0.004)
+
+        save = stats.as_dict()["timings"]["save"]
+        assert save["count"] == 2
+        assert save["avg_ms"] == pytest.approx(3.0)
+        assert save["max_ms"] == pytest.approx(4.0)
+
+
+class TestAdvancedCacheCounters:
+    """AdvancedCache records hits, misses, expirations and evictions."""
+
+    def test_hits_misses_and_bytes(self):
+        """Hits are grouped by area/source; bytes track serialized size."""
+        cache = AdvancedCache(config={Config.CACHE_TTL: 60})
+        cache.set("k", {"prices": [1.0] * 10}, metadata=META)
+        cache.get("k")
+        cache.get("missing")
+
+        info = cache.get_info()
+        assert cache.stats.get("hits", "SE3/nordpool") == 1
+        assert cache.stats.get("misses") == 1
+        assert info["memory_bytes"] == info["entries"]["k"]["size_bytes"] > 0
+        # Nothing is persisted, so there is no serialization to time
+        assert "serialize" not in info["stats"]["timings"]
+
+    def test_expiration_counted(self):
+        """Reading an expired entry counts an expiration and a miss."""
+        cache = AdvancedCache(config={Config.CACHE_TTL: 60})
+        cache.set("k", {"v": 1}, ttl=-1, metadata=META)
+
+        assert cache.get("k") is None
+        assert cache.stats.get("expirations", "SE3/nordpool") == 1
+        assert cache.stats.get("misses", "SE3/nordpool") == 1
+
+    def test_eviction_counted(self):
+        """Entries dropped to stay within max_entries count as evictions."""
+        cache = AdvancedCache(config={Config.CACHE_MAX_ENTRIES: 1})
+        cache.set("a", {"v": 1}, metadata=META)
+        cache.set("b", {"v": 2}, metadata=META)
+
+        assert cache.stats.get("evictions") == 1
+        assert cache.stats.get("evicted_bytes", "SE3/nordpool") > 0
+
+    def test_save_and_load_latency(self, tmp_path):
+        """Persistence records save/load timings and on-disk bytes."""
+        hass = Mock()
+        hass.config.path.return_value = str(tmp_path)
+        hass.async_add_executor_job = Mock(side_effect=lambda func, *a: func(*a))
+        config = {Config.PERSIST_CACHE: True, Config.CACHE_DIR: "cache"}
+
+        cache = AdvancedCache(hass, config)
+        cache.set("k", {"v": 1}, metadata=META)
+        info = cache.get_info()
+        assert info["disk_bytes"] > 0
+        timings = info["stats"]["timings"]
+        assert timings["save"]["count"] == timings["serialize"]["count"] == 1
+
+        reloaded = AdvancedCache(hass, config)
+        timings = reloaded.get_info()["stats"]["timings"]
+        assert timings["load"]["count"] == 1
+        assert reloaded.get("k") == {"v": 1}
+
+
+def test_cache_manager_lookup_stats():
+    """CacheManager reports get_data outcomes per area/source."""
+    hass = Mock()
+    hass.config = Mock()
+    cache_manager = CacheManager(hass=hass, config={"cache_ttl": 60})
+    today = date.today()
+    data = IntervalPriceData(
+        area="SE3", source="nordpool", today_interval_prices={"00:00": 1.0}
+    )
+    cache_manager.store("SE3", "nordpool", data, target_date=today)
+
+    cache_manager.get_data(area="SE3", target_date=today)
+    cache_manager.get_data(area="SE3", target_date=today)
+    cache_manager.get_data(area="SE4", target_date=today)
+
+    lookups = cache_manager.get_cache_stats()["lookups"]
+    assert lookups["by_group"]["SE3/nordpool"] == {"hits": 2, "decoded_reuses": 1}
+    assert lookups["by_group"]["SE4/*"] == {"misses": 1}
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_include_cache_stats():
+    """Config entry diagnostics expose cache stats and redact the API key."""
+    hass = MockHass()
+    entry = Mock(
+        entry_id="abc",
+        data={Config.AREA: "SE3", Config.API_KEY: "secret"},
+        options={},
+    )
+    coordinator = Mock(area="SE3")
+    coordinator.price_manager.get_cache_stats.return_value = {"total_entries": 1}
+    hass.data[DOMAIN] = {"abc": coordinator}
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["entry"]["data"][Config.API_KEY] == "**REDACTED**"
+    assert diagnostics["cache"] == {"total_entries": 1}
@@ -0,0 +1,184 @@
+"""Tests and tracemalloc benchmark for the frozen, slotted model variants."""
+
+import dataclasses
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from custom_components.ge_spot.api.base.data_structure import (
+    EMPTY_PRICE_STATISTICS,
+    FrozenPriceStatistics,
+    PriceStatistics,
+)
+from custom_components.ge_spot.coordinator.data_models import (
+    IntervalPriceData,
+    PriceDataSnapshot,
+)
+from custom_components.ge_spot.coordinator.data_validity import (
+    EMPTY_DATA_VALIDITY,
+    DataValidity,
+    FrozenDataValidity,
+)
+
+AREAS = 50
+COPIES = 4
+
+
+def _price_data(area: str) -> IntervalPriceData:
+    """Typical one-day price data for an area."""
+    prices = {f"{i // 4:02d}:{i % 4 * 15:02d}": i / 100 for i in range(96)}
+    return IntervalPriceData(
+        today_interval_prices=prices,
+        today_raw_prices=dict(prices),
+        source="nordpool",
+        area=area,
+        target_timezone="Europe/Stockholm",
+        display_unit="SEK/kWh",
+    )
+
+
+def _allocated(build) -> int:
+    """Bytes still allocated by what build() returns."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        kept = build()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del kept
+    return size
+
+
+class TestFrozenVariants:
+    """Behaviour of the frozen variants."""
+
+    def test_statistics_frozen_and_shared_empty(self):
+        """Frozen statistics reject writes; empty ones share one instance."""
+        stats = FrozenPriceStatistics.create(avg=1.0, min=0.5, max=2.0)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            stats.avg = 3.0
+        assert FrozenPriceStatistics.create() is EMPTY_PRICE_STATISTICS
+        assert (
+            FrozenPriceStatistics.from_statistics(PriceStatistics())
+            is EMPTY_PRICE_STATISTICS
+        )
+        assert stats.to_dict()["max"] == 2.0
+        assert not hasattr(stats, "__dict__")
+
+    def test_computed_statistics_are_frozen(self):
+        """IntervalPriceData memoizes statistics as frozen objects."""
+        data = _price_data("SE3")
+        assert isinstance(data.statistics, FrozenPriceStatistics)
+        assert data.tomorrow_statistics is EMPTY_PRICE_STATISTICS
+
+    def test_validity_round_trip(self):
+        """Frozen validity reads like DataValidity and thaws back to it."""
+        start = datetime(2025, 3, 10, 23, 45, tzinfo=timezone.utc)
+        validity = DataValidity(last_valid_interval=start, interval_count=96)
+        frozen = FrozenDataValidity.from_validity(validity)
+
+        assert frozen.data_valid_until == start
+        assert frozen.is_valid()
+        assert frozen.intervals_remaining(start - timedelta(hours=1)) == 4
+        assert frozen.to_dict() == validity.to_dict()
+        assert str(frozen) == str(validity)
+        assert frozen.thaw() == validity
+        assert FrozenDataValidity.from_validity(DataValidity()) is EMPTY_DATA_VALIDITY
+
+    def test_snapshot_round_trip(self):
+        """A snapshot is read-only and converts back to equal price data."""
+        data = _price_data("SE3")
+        data.attempted_sources = ["nordpool"]
+        snapshot = PriceDataSnapshot.from_price_data(data)
+
+        with pytest.raises(TypeError):
+            snapshot.today_interval_prices["00:00"] = 1.0
+        assert snapshot.attempted_sources == ("nordpool",)
+        assert snapshot.export_today_prices is snapshot.tomorrow_raw_prices
+
+        restored = snapshot.to_price_data()
+        assert restored == data
+        assert restored.today_interval_prices is not data.today_interval_prices
+        assert restored.statistics == data.statistics
+
+    def test_snapshot_freezes_nested_values(self):
+        """Profile dicts and raw_data are frozen and copied, not shared."""
+        data = _price_data("SE3")
+        data.profile_today_prices = {"night": {"00:00": 0.1}}
+        data.raw_data = {"entries": [{"price": 1.0}]}
+        snapshot = PriceDataSnapshot.from_price_data(data)
+
+        data.profile_today_prices["night"]["00:00"] = 9.0
+        data.raw_data["entries"].append({"price": 2.0})
+        assert snapshot.profile_today_prices["night"]["00:00"] == 0.1
+        assert snapshot.raw_data["entries"] == ({"price": 1.0},)
+        with pytest.raises(TypeError):
+            snapshot.profile_today_prices["night"]["00:00"] = 9.0
+
+        restored = snapshot.to_price_data()
+        restored.profile_today_prices["night"]["00:00"] = 5.0
+        restored.raw_data["entries"][0]["price"] = 5.0
+        assert snapshot.profile_today_prices["night"]["00:00"] == 0.1
+        assert snapshot.raw_data["entries"][0]["price"] == 1.0
+
+    def test_computed_validity_is_frozen(self):
+        """IntervalPriceData memoizes validity as a frozen object."""
+        assert IntervalPriceData().data_validity is EMPTY_DATA_VALIDITY
+
+    def test_snapshot_interns_keys_and_metadata(self):
+        """Keys and metadata strings are shared across snapshots."""
+        first = PriceDataSnapshot.from_price_data(_price_data("SE3"))
+        second = PriceDataSnapshot.from_price_data(_price_data("SE4"))
+
+        assert first.display_unit is second.display_unit
+        key_a = next(iter(first.today_interval_prices))
+        key_b = next(iter(second.today_interval_prices))
+        assert key_a is key_b
+
+
+def test_snapshot_memory_benchmark():
+    """Snapshots and their replace() copies use less memory (tracemalloc)."""
+    sources = [_price_data(f"A{i}") for i in range(AREAS)]
+
+    def build_regular():
+        copies = []
+        for data in sources:
+            own = dataclasses.replace(
+                data,
+                today_interval_prices=dict(data.today_interval_prices),
+                today_raw_prices=dict(data.today_raw_prices),
+            )
+            copies.append(own)
+            copies.extend(
+                dataclasses.replace(own, using_cached_data=True) for _ in range(COPIES)
+            )
+        return copies
+
+    def build_compact():
+        copies = []
+        for data in sources:
+            own = PriceDataSnapshot.from_price_data(data)
+            copies.append(own)
+            copies.extend(
+                dataclasses.replace(own, using_cached_data=True) for _ in range(COPIES)
+            )
+        return copies
+
+    regular = _allocated(build_regular)
+    compact = _allocated(build_compact)
+    assert compact < regular * 0.8
+
+
+def test_statistics_memory_benchmark():
+    """Frozen statistics are smaller than regular ones (tracemalloc)."""
+    count = 1000
+    regular = _allocated(
+        lambda: [PriceStatistics(avg=i, min=i, max=i) for i in range(count)]
+    )
+    frozen = _allocated(
+        lambda: [FrozenPriceStatistics(avg=i, min=i, max=i) for i in range(count)]
+    )
+    assert frozen < regular
@@ -0,0 +1,70 @@
+"""Tests for the per-cycle time context."""
+
+from datetime import date, datetime, timezone
+from unittest.mock import MagicMock
+
+from custom_components.ge_spot.timezone.cycle_context import CycleContext
+from custom_components.ge_spot.timezone.service import TimezoneService
+from custom_components.ge_spot.timezone.timezone_converter import TimezoneConverter
+from tests.lib.mocks.hass import MockHass
+
+# 23:59:30 in Stockholm, the evening before the spring DST change
+INSTANT = datetime(2025, 3, 29, 22, 59, 30, tzinfo=timezone.utc)
+
+
+def _service() -> TimezoneService:
+    return TimezoneService(MockHass(), "SE4")
+
+
+def test_values_derive_from_one_instant():
+    """Dates, interval keys and counts all follow the cycle instant."""
+    context = CycleContext(_service(), INSTANT)
+
+    assert context.today == date(2025, 3, 29)
+    assert context.tomorrow == date(2025, 3, 30)
+    assert context.current_interval_key == "23:45"
+    assert context.next_interval_key == "00:00"
+    assert context.today_table.day == context.today
+    assert context.today_table.expected_intervals == 96
+    assert context.expected_intervals_today == 96
+    assert context.tomorrow_table.expected_intervals == 92
+    assert context.expected_intervals_tomorrow == 92
+
+
+def test_values_are_computed_once_and_on_demand():
+    """Nothing is converted until read, and each value only once."""
+    tz_service = MagicMock()
+    context = CycleContext(tz_service, INSTANT)
+
+    tz_service.get_current_interval_key.assert_not_called()
+    assert context.current_interval_key is context.current_interval_key
+
+    tz_service.get_current_interval_key.assert_called_once_with(now=INSTANT)
+    tz_service.get_today_range.assert_not_called()
+
+
+def test_service_keys_accept_an_instant():
+    """The service answers for a given instant instead of the clock."""
+    tz_service = _service()
+
+    assert tz_service.get_current_interval_key(now=INSTANT) == "23:45"
+    assert tz_service.get_next_interval_key(now=INSTANT) == "00:00"
+    assert len(tz_service.get_tomorrow_range(now=INSTANT)) == 92
+
+
+def test_split_uses_the_cycle_date():
+    """A cycle that started before midnight keeps splitting by its own date."""
+    tz_service = _service()
+    context = CycleContext(tz_service, INSTANT)
+    converter = TimezoneConverter(tz_service)
+
+    today_prices, tomorrow_prices = converter.split_stream_by_day(
+        [
+            (date(2025, 3, 29), "23:45", 1.0),
+            (date(2025, 3, 30), "00:00", 2.0),
+        ],
+        context.today,
+    )
+
+    assert today_prices == {"23:45": 1.0}
+    assert tomorrow_prices == {"00:00": 2.0}
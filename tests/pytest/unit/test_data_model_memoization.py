@@ -0,0 +1,108 @@
+"""Tests for memoized computed properties on IntervalPriceData."""
+
+from dataclasses import replace
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.ge_spot.coordinator import data_models
+from custom_components.ge_spot.coordinator.data_models import IntervalPriceData
+
+NOW = datetime(2025, 3, 10, 12, 5, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def tz_service():
+    """Timezone service at 12:00 (current) / 12:15 (next)."""
+    service = MagicMock()
+    service.get_current_interval_key.return_value = "12:00"
+    service.get_next_interval_key.return_value = "12:15"
+    return service
+
+
+@pytest.fixture
+def price_data(tz_service):
+    """Price data with two intervals today."""
+    return IntervalPriceData(
+        today_interval_prices={"12:00": 1.0, "12:15": 2.0},
+        target_timezone="UTC",
+        _tz_service=tz_service,
+    )
+
+
+@pytest.fixture
+def frozen_now():
+    """Pin dt_util.now() used by the data model."""
+    with patch.object(data_models.dt_util, "now", return_value=NOW) as now:
+        yield now
+
+
+def test_validity_computed_once_per_interval(price_data, frozen_now):
+    """Repeated reads in one interval calculate validity once."""
+    with patch.object(
+        data_models,
+        "calculate_data_validity",
+        wraps=data_models.calculate_data_validity,
+    ) as calc:
+        first = price_data.data_validity
+        for _ in range(10):
+            assert price_data.data_validity is first
+        assert calc.call_count == 1
+
+        # Next interval: recomputed once more
+        frozen_now.return_value = NOW.replace(minute=20)
+        price_data._tz_service.get_current_interval_key.return_value = "12:15"
+        assert price_data.data_validity is not first
+        assert calc.call_count == 2
+
+
+def test_interval_values_follow_current_interval(price_data, frozen_now):
+    """current_price/next_interval_price change at the interval boundary."""
+    assert price_data.current_price == 1.0
+    assert price_data.next_interval_price == 2.0
+
+    frozen_now.return_value = NOW.replace(minute=20)
+    price_data._tz_service.get_current_interval_key.return_value = "12:15"
+    price_data._tz_service.get_next_interval_key.return_value = "12:30"
+    assert price_data.current_price == 2.0
+    assert price_data.next_interval_price is None
+
+
+def test_statistics_memoized_until_prices_change(price_data):
+    """Statistics are reused until a price field is reassigned."""
+    stats = price_data.statistics
+    assert price_data.statistics is stats
+    assert stats.avg == 1.5
+
+    price_data.last_updated = "2025-03-10T12:06:00+00:00"
+    assert price_data.statistics is stats
+
+    price_data.today_interval_prices = {"12:00": 3.0}
+    assert price_data.statistics.avg == 3.0
+
+
+def test_migration_invalidates(price_data, frozen_now):
+    """Midnight migration drops memoized results."""
+    price_data.tomorrow_interval_prices = {"12:00": 5.0}
+    assert price_data.current_price == 1.0
+
+    price_data.migrate_to_new_day()
+    assert price_data.current_price == 5.0
+    assert price_data.statistics.avg == 5.0
+
+
+def test_copies_do_not_share_results(price_data):
+    """replace() copies compute their own results."""
+    assert price_data.statistics.avg == 1.5
+    copy = replace(price_data, today_interval_prices={"12:00": 9.0})
+
+    assert copy.statistics.avg == 9.0
+    assert price_data.statistics.avg == 1.5
+
+
+def test_equality_ignores_memo(price_data):
+    """Memoized state does not affect dataclass equality."""
+    other = replace(price_data)
+    _ = price_data.statistics
+    assert price_data == other
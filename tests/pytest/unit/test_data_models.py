@@ -6,7 +6,7 @@ from unittest.mock import Mock
 from zoneinfo import ZoneInfo
 
 from custom_components.ge_spot.coordinator.data_models import IntervalPriceData
-from custom_components.ge_spot.coordinator.data_validity import DataValidity
+from custom_components.ge_spot.coordinator.data_validity import FrozenDataValidity
 from custom_components.ge_spot.api.base.data_structure import PriceStatistics
 
 
@@ -269,7 +269,7 @@ class TestComputedProperties:
 
         validity = data.data_validity
 
-        assert isinstance(validity, DataValidity)
+        assert isinstance(validity, FrozenDataValidity)
         assert validity.today_interval_count == 96
         assert validity.tomorrow_interval_count == 96
         assert validity.interval_count == 192
@@ -281,7 +281,7 @@ class TestComputedProperties:
 
         validity = data.data_validity
 
-        assert isinstance(validity, DataValidity)
+        assert isinstance(validity, FrozenDataValidity)
         assert validity.interval_count == 0
 
 
@@ -35,7 +35,6 @@ from custom_components.ge_spot.const.config import Config
 from custom_components.ge_spot.const.defaults import Defaults
 from custom_components.ge_spot.const.currencies import Currency
 from custom_components.ge_spot.const.energy import EnergyUnit
-from custom_components.ge_spot.api.base.data_structure import PriceStatistics
 from tests.lib.mocks.hass import MockHass
 
 # Sample test data for processing
@@ -415,11 +414,6 @@ class TestDataProcessor:
             manager=mock_manager,
         )
 
-        # Create mock statistics that's properly set up
-        mock_statistics = PriceStatistics(
-            min=1.5, max=2.0, avg=1.75
-        )  # Use 'avg' not 'average'
-
         # Define the target timezone for the test
         target_tz = zoneinfo.ZoneInfo("Europe/Stockholm")
 
@@ -431,13 +425,8 @@ class TestDataProcessor:
                 spec=True,
             ) as mock_tz_converter_cls:
                 mock_tz_converter = mock_tz_converter_cls.return_value
-                # FIX: Return datetime keys localized to the target timezone
-                mock_tz_converter.normalize_interval_prices.return_value = {
-                    datetime(2024, 1, 1, 10, 0, tzinfo=target_tz): 1.5,
-                    datetime(2024, 1, 1, 11, 0, tzinfo=target_tz): 2.0,
-                }
-                # Mock split_into_today_tomorrow to return today and tomorrow dicts
-                mock_tz_converter.split_into_today_tomorrow.return_value = (
+                # Mock split_by_day to return today and tomorrow dicts
+                mock_tz_converter.split_by_day.return_value = (
                     {datetime(2024, 1, 1, 10, 0, tzinfo=target_tz): 1.5},  # today
                     {datetime(2024, 1, 1, 11, 0, tzinfo=target_tz): 2.0},  # tomorrow
                 )
@@ -456,32 +445,28 @@ class TestDataProcessor:
                 processor._currency_converter = mock_currency_converter
                 processor._exchange_service = mock_exchange_service
 
-                # Patch the statistics calculation
-                with patch.object(
-                    processor, "_calculate_statistics", return_value=mock_statistics
-                ):
-                    # Act
-                    result = await processor.process(SAMPLE_RAW_DATA)
-
-                    # Assert
-                    assert result is not None, "Process should return a result"
-                    assert isinstance(
-                        result, IntervalPriceData
-                    ), f"Result should be IntervalPriceData, got: {type(result)}"
-                    assert result.today_interval_prices == {
-                        "10:00": 1.5,
-                        "11:00": 2.0,
-                    }, f"Result should have correctly processed interval_prices, got: {result.today_interval_prices}"
-                    # Note: current_price and next_interval_price require tz_service to calculate
-                    # so we can't test them here easily
-                    assert (
-                        result.source_currency == "SEK"
-                    ), f"Source currency should be set, got: {result.source_currency}"
-                    assert (
-                        result.target_currency == "SEK"
-                    ), f"Target currency should be set, got: {result.target_currency}"
-                    # Note: statistics are in computed properties which we can't easily test without tz_service
-                    # Note: complete_data will be False because we only have 2 prices, but that's OK for this unit test
+                # Act
+                result = await processor.process(SAMPLE_RAW_DATA)
+
+                # Assert
+                assert result is not None, "Process should return a result"
+                assert isinstance(
+                    result, IntervalPriceData
+                ), f"Result should be IntervalPriceData, got: {type(result)}"
+                assert result.today_interval_prices == {
+                    "10:00": 1.5,
+                    "11:00": 2.0,
+                }, f"Result should have correctly processed interval_prices, got: {result.today_interval_prices}"
+                # Note: current_price and next_interval_price require tz_service to calculate
+                # so we can't test them here easily
+                assert (
+                    result.source_currency == "SEK"
+                ), f"Source currency should be set, got: {result.source_currency}"
+                assert (
+                    result.target_currency == "SEK"
+                ), f"Target currency should be set, got: {result.target_currency}"
+                # Note: statistics are in computed properties which we can't easily test without tz_service
+                # Note: complete_data will be False because we only have 2 prices, but that's OK for this unit test
 
     @pytest.mark.asyncio
     async def test_validation_failure_triggers_fallback(
@@ -0,0 +1,96 @@
+"""Tests for the array-backed IntervalSeries."""
+
+from datetime import date, datetime, timezone
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+from custom_components.ge_spot.coordinator import data_models
+from custom_components.ge_spot.coordinator.data_models import IntervalPriceData
+from custom_components.ge_spot.utils.interval_series import IntervalSeries
+
+STOCKHOLM = ZoneInfo("Europe/Stockholm")
+NORMAL_DAY = date(2025, 3, 10)
+SPRING_DAY = date(2025, 3, 30)
+FALL_DAY = date(2025, 10, 26)
+
+
+def test_slot_count_follows_day_length():
+    """Normal and DST days get 96, 92 and 100 quarter-hour slots."""
+    assert len(IntervalSeries(NORMAL_DAY, STOCKHOLM, 900)) == 96
+    assert len(IntervalSeries(SPRING_DAY, STOCKHOLM, 900)) == 92
+    assert len(IntervalSeries(FALL_DAY, STOCKHOLM, 900)) == 100
+
+
+def test_lookup_by_time():
+    """Any moment inside an interval resolves to its slot."""
+    series = IntervalSeries.from_interval_prices(
+        {"00:00": 1.0, "14:15": 2.5}, NORMAL_DAY, "Europe/Stockholm", 900
+    )
+    inside = datetime(2025, 3, 10, 13, 20, tzinfo=timezone.utc)  # 14:20 local
+
+    assert series.index_of(inside) == 57
+    assert series.value_at(inside) == 2.5
+    assert series.value_at(datetime(2025, 3, 10, 0, 0, tzinfo=STOCKHOLM)) == 1.0
+    assert series.value_at(datetime(2025, 3, 11, 0, 0, tzinfo=STOCKHOLM)) is None
+    assert series.get(1) is None
+    assert series.count == 2
+
+
+def test_fall_back_keys_get_separate_slots():
+    """ "HH:MM_1"/"HH:MM_2" land in consecutive hours and round-trip."""
+    prices = {"02:00_1": 1.0, "02:00_2": 2.0, "03:00": 3.0}
+    series = IntervalSeries.from_interval_prices(prices, FALL_DAY, STOCKHOLM, 900)
+
+    assert list(series.present_indices()) == [8, 12, 16]
+    assert series.time_of(12).fold == 1
+    assert series.to_dict() == prices
+
+
+def test_spring_forward_gap_is_rejected():
+    """Keys in the skipped hour do not map to a slot."""
+    series = IntervalSeries.from_interval_prices(
+        {"02:15": 1.0, "03:00": 2.0}, SPRING_DAY, STOCKHOLM, 900
+    )
+    assert series.to_dict() == {"03:00": 2.0}
+    assert series.index_of_key("03:00") == 8
+
+
+def test_view_is_dict_compatible():
+    """The view behaves like the "HH:MM" dict it was built from."""
+    prices = {"00:15": 0.5, "00:00": 0.25, "23:45": 0.75}
+    view = IntervalSeries.from_interval_prices(prices, NORMAL_DAY, STOCKHOLM).view
+
+    assert view == prices
+    assert list(view) == ["00:00", "00:15", "23:45"]
+    assert view["00:15"] == 0.5
+    assert view.get("12:00") is None
+    assert "bad" not in view
+    assert len(view) == 3
+
+
+def test_last_present_time():
+    """The last present slot gives the end of data coverage."""
+    series = IntervalSeries.from_interval_prices(
+        {"10:00": 1.0, "23:45": 2.0}, NORMAL_DAY, STOCKHOLM, 900
+    )
+    assert series.last_present_time() == datetime(2025, 3, 10, 23, 45, tzinfo=STOCKHOLM)
+    assert IntervalSeries(NORMAL_DAY, STOCKHOLM).last_present_time() is None
+
+
+def test_price_data_series_properties():
+    """IntervalPriceData exposes its prices as series for today and tomorrow."""
+    data = IntervalPriceData(
+        today_interval_prices={"12:00": 1.0},
+        tomorrow_interval_prices={"00:00": 2.0},
+        target_timezone="Europe/Stockholm",
+    )
+    now = datetime(2025, 3, 10, 12, 0, tzinfo=STOCKHOLM)
+    with patch.object(data_models.dt_util, "now", return_value=now):
+        today = data.today_series
+        assert today.day == NORMAL_DAY
+        assert data.today_series is today
+        assert data.tomorrow_series.day == date(2025, 3, 11)
+        assert data.tomorrow_series.view == {"00:00": 2.0}
+
+        data.today_interval_prices = {"13:00": 3.0}
+        assert data.today_series.view == {"13:00": 3.0}
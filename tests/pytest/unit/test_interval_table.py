@@ -0,0 +1,106 @@
+"""Tests for the cached DST-aware interval key tables."""
+
+import logging
+from datetime import date, datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from custom_components.ge_spot.const.sources import Source
+from custom_components.ge_spot.const.time import TimeInterval
+from custom_components.ge_spot.timezone.cycle_context import CycleContext
+from custom_components.ge_spot.timezone.dst_handler import get_day_hours
+from custom_components.ge_spot.timezone.interval_table import get_interval_table
+from custom_components.ge_spot.timezone.service import TimezoneService
+from tests.lib.mocks.hass import MockHass
+
+STOCKHOLM = ZoneInfo("Europe/Stockholm")
+
+
+def _keys_from_day_hours(day: date, tz) -> list:
+    """Keys as get_today_range built them before the table existed."""
+    return [
+        f"{info['hour']:02d}:{minute:02d}{info.get('suffix', '')}"
+        for info in get_day_hours(day, tz)
+        for minute in range(0, 60, TimeInterval.get_interval_minutes())
+    ]
+
+
+@pytest.mark.parametrize(
+    "day,expected",
+    [
+        (date(2025, 6, 1), 96),
+        (date(2025, 3, 30), 92),
+        (date(2025, 10, 26), 100),
+    ],
+)
+def test_table_matches_day_hours(day, expected):
+    """Keys and counts match the DST-aware hour list of the day."""
+    table = get_interval_table(day, STOCKHOLM)
+
+    assert list(table.keys) == _keys_from_day_hours(day, STOCKHOLM)
+    assert table.expected_intervals == expected
+    assert (
+        TimeInterval.get_expected_intervals_for_date(
+            datetime.combine(day, datetime.min.time()), STOCKHOLM
+        )
+        == expected
+    )
+
+
+def test_tables_are_shared():
+    """Repeated lookups return the same immutable table."""
+    table = get_interval_table(date(2025, 6, 1), "Europe/Stockholm")
+
+    assert get_interval_table(date(2025, 6, 1), STOCKHOLM) is table
+    with pytest.raises(AttributeError):
+        table.keys = ()
+
+
+def test_missing_keys_in_time_order():
+    """Completeness checks list the absent keys in slot order."""
+    table = get_interval_table(date(2025, 6, 1), STOCKHOLM)
+    found = {key: 1.0 for key in table.keys if key != "23:45" and key != "00:15"}
+
+    assert table.missing(found) == ["00:15", "23:45"]
+
+
+def test_service_ranges_use_tables():
+    """Today/tomorrow ranges are copies of the table keys."""
+    service = TimezoneService(MockHass(), "SE4")
+    now = datetime(2025, 3, 29, 12, 0, tzinfo=timezone.utc)
+
+    today = service.get_today_range(now=now)
+    today.append("mutated")
+
+    assert service.get_today_range(now=now) == list(
+        get_interval_table(date(2025, 3, 29), service.target_timezone).keys
+    )
+    assert len(service.get_tomorrow_range(now=now)) == 92
+
+
+@pytest.mark.asyncio
+async def test_processor_logs_missing_keys_from_table(make_processor, caplog):
+    """Incomplete days report the absent keys of the day's table, in order."""
+    processor = make_processor()
+    cycle = CycleContext(processor._tz_service)
+    table = cycle.today_table
+    start = datetime.combine(cycle.today, time(0), tzinfo=table.tz)
+    prices = {
+        (start + timedelta(hours=hour)).astimezone(timezone.utc).isoformat(): 1.0
+        for hour in range(12, 14)
+    }
+    data = {
+        "source": Source.NORDPOOL,
+        "using_cached_data": True,
+        "raw_interval_prices_original": prices,
+        "source_timezone": "Etc/UTC",
+        "source_currency": "EUR",
+    }
+
+    with caplog.at_level(logging.INFO):
+        await processor.process(data, context=cycle)
+
+    message = next(r.message for r in caplog.records if "for today" in r.message)
+    assert f"(2/{table.expected_intervals} keys found" in message
+    assert f"Missing: {table.missing({'12:00': 1, '13:00': 1})[:10]}..." in message
@@ -0,0 +1,81 @@
+"""Tests for the boundary-cached current/next interval keys."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from custom_components.ge_spot.const.time import TimezoneReference
+from custom_components.ge_spot.timezone.interval_calculator import IntervalCalculator
+
+STOCKHOLM = ZoneInfo("Europe/Stockholm")
+HELSINKI = ZoneInfo("Europe/Helsinki")
+
+
+def _calculator(reference=TimezoneReference.LOCAL_AREA) -> IntervalCalculator:
+    return IntervalCalculator(
+        timezone=STOCKHOLM,
+        system_timezone=STOCKHOLM,
+        area_timezone=HELSINKI,
+        timezone_reference=reference,
+    )
+
+
+def _at(hour, minute, second=0, day=10, month=7):
+    return datetime(2024, month, day, hour, minute, second, tzinfo=timezone.utc)
+
+
+def test_keys_are_derived_once_per_interval():
+    """Lookups inside one interval reuse the window; the boundary refreshes it."""
+    calculator = _calculator()
+
+    with patch.object(
+        calculator, "_current_interval", wraps=calculator._current_interval
+    ) as derive:
+        keys = [
+            calculator.get_current_interval_key(now=_at(10, minute, second))
+            for minute, second in ((0, 0), (7, 30), (14, 59))
+        ]
+        assert derive.call_count == 1
+
+        assert calculator.get_current_interval_key(now=_at(10, 15)) == "13:15"
+        assert derive.call_count == 2
+
+    # 10:00 UTC is 13:00 in Helsinki
+    assert keys == ["13:00"] * 3
+
+
+def test_earlier_instant_refreshes_window():
+    """An instant before the cached window is not answered from it."""
+    calculator = _calculator()
+    calculator.get_current_interval_key(now=_at(10, 20))
+
+    assert calculator.get_current_interval_key(now=_at(9, 50)) == "12:45"
+
+
+@pytest.mark.parametrize(
+    "reference", [TimezoneReference.LOCAL_AREA, TimezoneReference.HOME_ASSISTANT]
+)
+@pytest.mark.parametrize(
+    "now",
+    [
+        _at(10, 7),
+        _at(23, 52),
+        # Around the 2024 spring-forward and fall-back changes
+        datetime(2024, 3, 31, 0, 50, tzinfo=timezone.utc),
+        datetime(2024, 10, 27, 0, 50, tzinfo=timezone.utc),
+        datetime(2024, 10, 27, 1, 5, tzinfo=timezone.utc),
+    ],
+)
+def test_window_keys_match_direct_derivation(reference, now):
+    """Cached keys equal the per-call derivation they replace."""
+    window = _calculator(reference).get_current_window(now)
+    fresh = _calculator(reference)
+
+    assert window.contains(now)
+    assert window.current_key == fresh._current_interval(now)[0]
+    assert window.next_key == fresh.get_interval_key_for_datetime(
+        now + timedelta(minutes=15)
+    )
+    assert window.end_utc - window.start_utc == timedelta(minutes=15)
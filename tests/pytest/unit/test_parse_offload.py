@@ -0,0 +1,129 @@
+"""Tests for offloading large payload parsing to the executor."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from custom_components.ge_spot.api.parsers.registry import get_parser
+from custom_components.ge_spot.const.config import Config
+from custom_components.ge_spot.const.sources import Source
+from custom_components.ge_spot.utils.payload_size import estimate_payload_bytes
+from tests.lib.mocks.hass import MockHass
+
+
+def _entsoe_payload() -> dict:
+    """ENTSO-E XML payload with 24 hourly prices starting today (UTC)."""
+    start = datetime.now(timezone.utc).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    points = "\n".join(
+        f"<Point><position>{i + 1}</position>"
+        f"<price.amount>{50.0 + i}</price.amount></Point>"
+        for i in range(24)
+    )
+    xml = f"""<?xml version="1.0" encoding="UTF-8"?>
+<Publication_MarketDocument xmlns="urn:iec62325.351:tc57wg16:451-3:publicationdocument:7:3">
+    <TimeSeries>
+        <businessType>A44</businessType>
+        <currency_Unit.name>EUR</currency_Unit.name>
+        <Period>
+            <timeInterval>
+                <start>{start.strftime('%Y-%m-%dT%H:%M')}Z</start>
+                <end>{(start + timedelta(days=1)).strftime('%Y-%m-%dT%H:%M')}Z</end>
+            </timeInterval>
+            <resolution>PT60M</resolution>
+            {points}
+        </Period>
+    </TimeSeries>
+</Publication_MarketDocument>"""
+    return {
+        "source": Source.ENTSOE,
+        "data_source": Source.ENTSOE,
+        "area": "SE4",
+        "currency": "EUR",
+        "timezone": "Etc/UTC",
+        "raw_data": xml,
+        "xml_responses": [xml],
+    }
+
+
+def _executor_hass():
+    """MockHass whose executor runs jobs inline, recording them."""
+    hass = MockHass()
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
+    return hass
+
+
+def test_estimate_payload_bytes():
+    """Strings count by length, numbers as 8 bytes, shared objects once."""
+    xml = "x" * 1000
+    payload = {"raw_data": xml, "xml_responses": [xml, xml], "n": 1}
+    keys = len("raw_data") + len("xml_responses") + len("n")
+
+    assert estimate_payload_bytes(payload) == 3000 + 8 + keys
+    assert estimate_payload_bytes(None) == 0
+
+
+def test_small_payloads_stay_on_loop(make_processor):
+    """Payloads below the threshold are parsed inline."""
+    processor = make_processor(
+        hass=_executor_hass(), config={Config.PARSE_OFFLOAD_BYTES: 10**6}
+    )
+    assert not processor._should_offload(_entsoe_payload(), Source.ENTSOE)
+
+
+def test_stromligning_parser_is_stateless():
+    """Price components come back in the result, so the shared parser can offload."""
+    parser = get_parser(Source.STROMLIGNING)
+    payload = {
+        "prices": [
+            {
+                "date": "2025-03-10T00:00:00Z",
+                "price": {"value": 1.5},
+                "details": {"electricity": {"value": 0.9}},
+            }
+        ]
+    }
+
+    parsed = parser.parse(payload)
+
+    assert parsed["price_components"] == {
+        key: {"electricity": 0.9} for key in parsed["interval_raw"]
+    }
+    assert parsed["interval_raw"]
+    assert parser.parse({})["price_components"] == {}
+    assert vars(parser).keys() == {"source", "timezone_service"}
+
+
+def test_no_offload_without_hass(make_processor):
+    """Without Home Assistant there is no executor to offload to."""
+    processor = make_processor(hass=None, config={Config.PARSE_OFFLOAD_BYTES: 0})
+    processor.hass = None
+    assert not processor._should_offload(_entsoe_payload(), Source.ENTSOE)
+
+
+@pytest.mark.asyncio
+async def test_large_payload_parsed_in_executor(make_processor):
+    """Hashing, parsing and normalization of a large payload run in the executor."""
+    hass = _executor_hass()
+    processor = make_processor(hass=hass, config={Config.PARSE_OFFLOAD_BYTES: 0})
+
+    offloaded = await processor.process(_entsoe_payload())
+
+    jobs = [call.args[0] for call in hass.async_add_executor_job.call_args_list]
+    assert [getattr(job, "__name__", None) for job in jobs] == [
+        "payload_digest",
+        "parse",
+        "_normalize_and_split",
+    ]
+
+    inline_hass = _executor_hass()
+    inline = make_processor(
+        hass=inline_hass, config={Config.PARSE_OFFLOAD_BYTES: 10**9}
+    )
+    expected = await inline.process(_entsoe_payload())
+
+    inline_hass.async_add_executor_job.assert_not_called()
+    assert offloaded.today_interval_prices
+    assert offloaded.today_interval_prices == expected.today_interval_prices
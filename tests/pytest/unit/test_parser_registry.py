@@ -0,0 +1,118 @@
+"""Tests for the shared parser registry."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from custom_components.ge_spot import async_unload_entry
+from custom_components.ge_spot.api.parsers import get_parser_for_source
+from custom_components.ge_spot.api.parsers.amber_parser import AmberParser
+from custom_components.ge_spot.api.parsers.registry import (
+    PARSER_CLASSES,
+    PARSER_REGISTRY,
+    ParserRegistry,
+)
+from custom_components.ge_spot.const import DOMAIN
+from custom_components.ge_spot.coordinator.shared_store import SHARED_STORE_KEY
+from custom_components.ge_spot.utils.byte_budget import BYTE_BUDGET_KEY
+from custom_components.ge_spot.const.config import Config
+from custom_components.ge_spot.const.sources import Source
+from custom_components.ge_spot.const.time import TimezoneReference
+from custom_components.ge_spot.coordinator.data_processor import DataProcessor
+from custom_components.ge_spot.timezone.service import TimezoneService
+
+
+def test_parser_built_once_per_timezone():
+    """Repeated lookups for a source and timezone return the same instance."""
+    registry = ParserRegistry()
+    tz_service = TimezoneService(area="SE3")
+
+    first = registry.get(Source.NORDPOOL, tz_service)
+    second = registry.get(Source.NORDPOOL, tz_service)
+
+    assert first is second
+    assert first.timezone_service is tz_service
+    assert registry.get_info() == {"parsers": 1, "created": 1, "reused": 1}
+
+
+def test_parser_shared_between_matching_timezone_services():
+    """Entries whose timezone services resolve alike share a parser."""
+    registry = ParserRegistry()
+
+    first = registry.get(Source.ENTSOE, TimezoneService(area="SE3"))
+    second = registry.get(Source.ENTSOE, TimezoneService(area="SE4"))
+
+    assert first is second
+
+
+def test_parser_not_shared_across_timezones():
+    """Different target timezones get their own parser instances."""
+    registry = ParserRegistry()
+    config = {Config.TIMEZONE_REFERENCE: TimezoneReference.LOCAL_AREA}
+
+    stockholm = registry.get(Source.ENTSOE, TimezoneService(area="SE3", config=config))
+    helsinki = registry.get(Source.ENTSOE, TimezoneService(area="FI", config=config))
+
+    assert stockholm is not helsinki
+    assert registry.get(Source.NORDPOOL, None) is not stockholm
+
+
+def test_unknown_source():
+    """An unknown source has no parser."""
+    assert ParserRegistry().get("not_a_source") is None
+
+
+def test_all_sources_registered():
+    """Every registered source builds a parser reporting that source."""
+    registry = ParserRegistry()
+    assert Source.AMBER in PARSER_CLASSES
+    for source in PARSER_CLASSES:
+        assert registry.get(source).source == source
+    assert isinstance(get_parser_for_source(Source.AMBER), AmberParser)
+
+
+def test_clear():
+    """Clearing the registry builds fresh parsers afterwards."""
+    registry = ParserRegistry()
+    parser = registry.get(Source.OMIE)
+    registry.clear()
+    assert registry.get(Source.OMIE) is not parser
+
+
+def test_data_processor_reuses_parser():
+    """Processors sharing a timezone service reuse one parser across cycles."""
+    tz_service = TimezoneService(area="SE3")
+    processors = [
+        DataProcessor(Mock(), "SE3", "SEK", {}, tz_service, None) for _ in range(2)
+    ]
+
+    parsers = [p._get_parser(Source.NORDPOOL) for p in processors for _ in range(2)]
+
+    assert all(parser is parsers[0] for parser in parsers)
+
+
+@pytest.mark.asyncio
+async def test_shared_state_dropped_when_last_entry_unloads():
+    """Pooled parsers, the shared store and the budget go with the last entry."""
+    entries = [SimpleNamespace(entry_id=entry_id) for entry_id in ("a", "b")]
+    hass = Mock()
+    hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+    hass.config_entries.async_entries = Mock(return_value=entries)
+    hass.data = {
+        DOMAIN: {
+            "a": Mock(async_close=AsyncMock()),
+            "b": Mock(async_close=AsyncMock()),
+            SHARED_STORE_KEY: object(),
+            BYTE_BUDGET_KEY: object(),
+        }
+    }
+    parser = PARSER_REGISTRY.get(Source.OMIE)
+
+    await async_unload_entry(hass, entries[0])
+    assert PARSER_REGISTRY.get(Source.OMIE) is parser
+    assert set(hass.data[DOMAIN]) == {"b", SHARED_STORE_KEY, BYTE_BUDGET_KEY}
+
+    await async_unload_entry(hass, entries[1])
+    assert PARSER_REGISTRY.get(Source.OMIE) is not parser
+    assert hass.data[DOMAIN] == {}
@@ -0,0 +1,253 @@
+"""Tests for the multi-day price archive."""
+
+import dataclasses
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock, Mock, patch
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from custom_components.ge_spot.const.config import Config
+from custom_components.ge_spot.coordinator.cache_manager import CacheManager
+from custom_components.ge_spot.coordinator.data_models import IntervalPriceData
+from custom_components.ge_spot.coordinator.unified_price_manager import (
+    UnifiedPriceManager,
+)
+from custom_components.ge_spot.sensor.price import PriceStatisticSensor
+from custom_components.ge_spot.utils.price_archive import PriceArchive, archive_series
+from tests.lib.mocks.hass import MockHass
+
+STOCKHOLM = "Europe/Stockholm"
+
+
+def _day_prices(day: date, tz: str = STOCKHOLM, base: float = 0.0):
+    """Full day of "HH:MM" keyed prices, with fall-back duplicates suffixed."""
+    zone = ZoneInfo(tz)
+    start = datetime.combine(day, datetime.min.time(), tzinfo=zone)
+    end = datetime.combine(day + timedelta(days=1), datetime.min.time(), tzinfo=zone)
+    prices = {}
+    moment = start.astimezone(ZoneInfo("UTC"))
+    index = 0
+    while moment < end:
+        local = moment.astimezone(zone)
+        key = local.strftime("%H:%M")
+        if key in prices or f"{key}_1" in prices:
+            prices[f"{key}_1"] = prices.pop(key, prices.get(f"{key}_1"))
+            key = f"{key}_2"
+        prices[key] = base + index
+        moment += timedelta(minutes=15)
+        index += 1
+    return prices
+
+
+class TestPriceArchive:
+    """Slots, rollups and queries."""
+
+    def test_last_week_summary(self):
+        """Last week comes back as an aggregate, daily rollups and a day series."""
+        archive = PriceArchive()
+        today = date(2025, 3, 17)
+        for offset in range(1, 8):
+            day = today - timedelta(days=offset)
+            archive.archive_day("SE3", day, {"00:00": float(offset)}, STOCKHOLM)
+        archive.archive_day("SE3", today - timedelta(days=7), {"00:15": 9.0}, STOCKHOLM)
+        archive.archive_day("SE3", today, {"00:00": 100.0}, STOCKHOLM)
+
+        history = archive.get_last_week("SE3", today)
+
+        assert history["week"]["days"] == 7
+        assert history["week"]["max"] == 9.0
+        assert history["daily"]["2025-03-16"]["avg"] == 1.0
+        assert "2025-03-17" not in history["daily"]
+        tz = ZoneInfo(STOCKHOLM)
+        assert history["same_day"] == [
+            (datetime(2025, 3, 10, 0, 0, tzinfo=tz), 7.0),
+            (datetime(2025, 3, 10, 0, 15, tzinfo=tz), 9.0),
+        ]
+        assert archive.get_last_week("SE4", today) == {
+            "week": None,
+            "daily": {},
+            "same_day": [],
+        }
+
+    @pytest.mark.parametrize(
+        "day, expected",
+        [
+            (date(2025, 3, 30), 92),  # spring forward
+            (date(2025, 10, 26), 100),  # fall back
+            (date(2025, 6, 1), 96),
+        ],
+    )
+    def test_dst_days_keep_every_interval(self, day, expected):
+        """DST days map each interval to its own slot."""
+        archive = PriceArchive()
+        prices = _day_prices(day)
+
+        assert archive.archive_day("SE3", day, prices, STOCKHOLM) == expected
+        rollup = archive.get_daily_rollups("SE3", day, day)[day.isoformat()]
+        assert rollup["count"] == expected
+        assert rollup["min"] == 0
+        assert rollup["max"] == expected - 1
+
+    def test_rewrite_replaces_day(self):
+        """Writing a day again overwrites it rather than accumulating."""
+        archive = PriceArchive()
+        day = date(2025, 5, 5)
+        archive.archive_day("SE3", day, _day_prices(day), STOCKHOLM)
+        archive.archive_day("SE3", day, _day_prices(day, base=100.0), STOCKHOLM)
+
+        rollup = archive.get_daily_rollups("SE3", day, day)[day.isoformat()]
+        assert rollup["count"] == 96
+        assert rollup["min"] == 100.0
+
+    def test_aggregate_over_week(self):
+        """Aggregates combine daily rollups across the range."""
+        archive = PriceArchive()
+        start = date(2025, 5, 1)
+        for offset in range(7):
+            day = start + timedelta(days=offset)
+            archive.archive_day("SE3", day, {"12:00": float(offset)}, STOCKHOLM)
+
+        stats = archive.aggregate("SE3", start, start + timedelta(days=6))
+        assert stats == {"min": 0.0, "max": 6.0, "avg": 3.0, "count": 7, "days": 7}
+        assert archive.aggregate("SE4", start, start) is None
+
+    def test_memory_flat_and_retention(self):
+        """More days do not grow memory; old years are dropped."""
+        archive = PriceArchive(config={Config.ARCHIVE_RETENTION_YEARS: 1})
+        archive.archive_day("SE3", date(2025, 1, 1), {"00:00": 1.0}, STOCKHOLM)
+        size = archive.get_info()["total_bytes"]
+
+        for offset in range(1, 60):
+            day = date(2025, 1, 1) + timedelta(days=offset)
+            archive.archive_day("SE3", day, {"00:00": 1.0}, STOCKHOLM)
+        assert archive.get_info()["total_bytes"] == size
+
+        archive.archive_day("SE3", date(2026, 1, 1), {"00:00": 1.0}, STOCKHOLM)
+        assert archive.get_info()["area_years"] == ["SE3/2026"]
+
+
+def test_cache_manager_archives_stored_days():
+    """Days stored in the cache stay queryable in the archive."""
+    hass = Mock()
+    hass.config = Mock()
+    cache_manager = CacheManager(hass=hass, config={"cache_ttl": 60})
+    day = date(2025, 3, 10)
+    data = IntervalPriceData(
+        area="SE3",
+        source="nordpool",
+        target_timezone=STOCKHOLM,
+        today_interval_prices={"08:00": 0.5, "08:15": 0.7},
+    )
+    cache_manager.store("SE3", "nordpool", data, target_date=day)
+    cache_manager.clear("SE3")
+
+    series = archive_series("SE3", data)
+    assert cache_manager.archive.aggregate(series, day, day)["avg"] == pytest.approx(
+        0.6
+    )
+
+
+def test_settings_keep_archive_series_apart():
+    """Prices processed with other settings go to their own series."""
+    hass = Mock()
+    hass.config = Mock()
+    cache_manager = CacheManager(hass=hass, config={"cache_ttl": 60})
+    day = date(2025, 3, 10)
+    euros = IntervalPriceData(
+        target_timezone=STOCKHOLM,
+        display_unit="EUR/kWh",
+        today_interval_prices={"08:00": 0.5},
+    )
+    cents = dataclasses.replace(
+        euros,
+        display_unit="cents/kWh",
+        applied_vat_rate=0.25,
+        today_interval_prices={"08:00": 62.5},
+    )
+    cache_manager.store("SE3", "nordpool", euros, target_date=day)
+    cache_manager.store("SE3", "nordpool", cents, target_date=day)
+
+    assert archive_series("SE3", euros) != archive_series("SE3", cents)
+    assert archive_series("SE3", euros) == archive_series(
+        "SE3", dataclasses.replace(euros, today_interval_prices={})
+    )
+    for data, avg in ((euros, 0.5), (cents, 62.5)):
+        aggregate = cache_manager.archive.aggregate(
+            archive_series("SE3", data), day, day
+        )
+        assert aggregate["avg"] == avg
+
+
+@pytest.mark.asyncio
+async def test_manager_reads_history_once_per_day():
+    """Last week is read from the archive once it has data for the day."""
+    manager = UnifiedPriceManager(
+        hass=MockHass(), area="SE3", currency="EUR", config={}
+    )
+    archive = manager._cache_manager.archive
+    tz = ZoneInfo(str(manager._tz_service.target_timezone))
+    now = datetime(2025, 3, 17, 12, 0, tzinfo=tz)
+    data = IntervalPriceData(area="SE3", target_timezone=tz.key)
+    series = archive_series("SE3", data)
+
+    with patch(
+        "custom_components.ge_spot.coordinator.unified_price_manager.dt_util.now",
+        return_value=now,
+    ):
+        assert (await manager.async_get_price_history(data))["week"] is None
+
+        archive.archive_day(series, date(2025, 3, 16), {"12:00": 2.0}, tz.key)
+        history = await manager.async_get_price_history(data)
+        assert history["week"]["avg"] == 2.0
+
+        archive.archive_day(series, date(2025, 3, 15), {"12:00": 4.0}, tz.key)
+        assert await manager.async_get_price_history(data) is history
+
+        # Other settings (e.g. after an options change) use another series
+        vat_data = dataclasses.replace(data, applied_vat_rate=0.25)
+        assert (await manager.async_get_price_history(vat_data))["week"] is None
+
+
+@pytest.mark.asyncio
+async def test_manager_close_releases_archive():
+    """Unloading the entry releases the archive's loaded years."""
+    manager = UnifiedPriceManager(
+        hass=MockHass(), area="SE3", currency="EUR", config={}
+    )
+    manager._cache_manager.archive.archive_day(
+        "SE3", date(2025, 3, 16), {"12:00": 2.0}, STOCKHOLM
+    )
+
+    await manager.async_close()
+
+    assert manager._cache_manager.archive.get_info()["area_years"] == []
+
+
+def test_average_sensor_exposes_last_week():
+    """The average price sensor carries last week's prices as attributes."""
+    moment = datetime(2025, 3, 10, 0, 0, tzinfo=ZoneInfo(STOCKHOLM))
+    coordinator = MagicMock()
+    coordinator.price_history = {
+        "week": {"avg": 1.23456, "min": 0.5, "max": 2.0, "count": 2, "days": 1},
+        "daily": {"2025-03-10": {"avg": 1.23456, "min": 0.5, "max": 2.0}},
+        "same_day": [(moment, 0.5)],
+    }
+    sensor = PriceStatisticSensor(
+        coordinator,
+        {"area": "SE3", "currency": "EUR"},
+        "average_price",
+        "Average Price",
+        "avg",
+    )
+
+    with patch(
+        "custom_components.ge_spot.sensor.price.PriceValueSensor.extra_state_attributes",
+        {"area": "SE3"},
+    ):
+        attrs = sensor.extra_state_attributes
+
+    assert attrs["last_week_average"] == 1.2346
+    assert attrs["last_week_daily_averages"] == {"2025-03-10": 1.2346}
+    assert attrs["same_day_last_week_prices"] == [{"time": moment, "value": 0.5}]
+    assert "same_day_last_week_prices" in sensor._unrecorded_attributes
@@ -0,0 +1,161 @@
+"""Tests for the memory-mapped, file-backed price archive."""
+
+import asyncio
+import mmap
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from custom_components.ge_spot.const.config import Config
+from custom_components.ge_spot.utils.price_archive import PriceArchive, _AreaYear
+
+STOCKHOLM = "Europe/Stockholm"
+DAY = date(2025, 3, 10)
+
+
+@pytest.fixture
+def hass(tmp_path):
+    """Hass stub whose executor jobs run inline."""
+    hass = Mock()
+    hass.config.path.return_value = str(tmp_path)
+    hass.async_add_executor_job = Mock(side_effect=lambda func, *args: func(*args))
+    return hass
+
+
+def _archive(hass, **config):
+    """File-backed archive in the test directory."""
+    return PriceArchive(
+        hass, {Config.PERSIST_CACHE: True, Config.CACHE_DIR: "cache", **config}
+    )
+
+
+def _year_file(tmp_path, area="SE3", year=2025):
+    return tmp_path / "cache" / "archive" / f"{area}_{year}.bin"
+
+
+def test_year_file_has_fixed_size(hass, tmp_path):
+    """The file is allocated for the whole year on first write."""
+    archive = _archive(hass)
+    archive.archive_day("SE3", DAY, {"00:00": 1.0}, STOCKHOLM)
+    size = os.path.getsize(_year_file(tmp_path))
+
+    archive.archive_day("SE3", date(2025, 7, 1), {"00:00": 2.0}, STOCKHOLM)
+    assert os.path.getsize(_year_file(tmp_path)) == size
+    # 35,040 quarter-hours of float64 dominate the layout
+    assert size > 35040 * 8
+
+
+def test_reopened_archive_reads_from_file(hass):
+    """A new archive instance (e.g. after restart) reads the mapped file."""
+    archive = _archive(hass)
+    archive.archive_day("SE3", DAY, {"08:00": 0.5, "08:15": 0.7}, STOCKHOLM)
+    archive.close()
+
+    reopened = _archive(hass)
+    assert reopened.get_info()["area_years"] == []
+    rollup = reopened.get_daily_rollups("SE3", DAY, DAY)[DAY.isoformat()]
+    assert rollup["count"] == 2
+    assert rollup["avg"] == pytest.approx(0.6)
+    assert reopened.get_daily_rollups("SE4", DAY, DAY) == {}
+
+
+def test_day_view_is_zero_copy(hass):
+    """Day views are memoryviews straight over the mapped file."""
+    archive = _archive(hass)
+    archive.archive_day("SE3", DAY, {"00:00": 1.0, "00:30": 3.0}, STOCKHOLM)
+
+    view = archive.get_day_view("SE3", DAY)
+    assert isinstance(view.prices, memoryview)
+    assert isinstance(view.prices.obj, mmap.mmap)
+    assert len(view.prices) == 96
+    assert view.is_valid(0) and not view.is_valid(1)
+    assert [price for _, price in view.items()] == [1.0, 3.0]
+
+    # Later writes are visible through an existing view
+    archive.archive_day("SE3", DAY, {"00:15": 2.0}, STOCKHOLM)
+    assert [price for _, price in view.items()] == [1.0, 2.0, 3.0]
+
+
+def test_incompatible_file_is_replaced(hass, tmp_path):
+    """A file with a foreign header is recreated rather than misread."""
+    path = _year_file(tmp_path)
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"not an archive")
+
+    archive = _archive(hass)
+    assert archive.get_daily_rollups("SE3", DAY, DAY) == {}
+    archive.archive_day("SE3", DAY, {"00:00": 1.0}, STOCKHOLM)
+    assert archive.aggregate("SE3", DAY, DAY)["count"] == 1
+
+
+def test_retention_removes_old_files(hass, tmp_path):
+    """Years outside the retention window are unmapped and deleted."""
+    archive = _archive(hass, **{Config.ARCHIVE_RETENTION_YEARS: 1})
+    archive.archive_day("SE3", DAY, {"00:00": 1.0}, STOCKHOLM)
+    archive.archive_day("SE3", date(2026, 1, 5), {"00:00": 1.0}, STOCKHOLM)
+
+    assert not _year_file(tmp_path).exists()
+    assert _year_file(tmp_path, year=2026).exists()
+    assert archive.get_info()["area_years"] == ["SE3/2026"]
+
+
+@pytest.mark.asyncio
+async def test_async_queries_use_executor(hass):
+    """Async queries run on the executor when file-backed."""
+    archive = _archive(hass)
+    archive.archive_day("SE3", DAY, {"00:00": 4.0}, STOCKHOLM)
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
+
+    history = await archive.async_get_last_week("SE3", DAY + timedelta(days=7))
+    assert history["week"]["max"] == 4.0
+    hass.async_add_executor_job.assert_awaited_once()
+
+
+def test_concurrent_writes_share_one_mapping(hass, monkeypatch):
+    """Executor writes for one area-year open its file once."""
+    archive = _archive(hass)
+    days = [date(2025, 3, day) for day in range(1, 9)]
+    opened = []
+    open_file = _AreaYear.open_file
+
+    def slow_open(path, year, tz=None):
+        # Widen the window between the loaded-year lookup and the insert
+        time.sleep(0.01)
+        opened.append(path)
+        return open_file(path, year, tz)
+
+    monkeypatch.setattr(_AreaYear, "open_file", staticmethod(slow_open))
+    with ThreadPoolExecutor(max_workers=len(days)) as pool:
+        list(
+            pool.map(
+                lambda day: archive.archive_day(
+                    "SE3", day, {"12:00": float(day.day)}, STOCKHOLM
+                ),
+                days,
+            )
+        )
+
+    assert len(opened) == 1
+    assert archive.aggregate("SE3", days[0], days[-1])["days"] == len(days)
+
+
+@pytest.mark.asyncio
+async def test_async_close_waits_for_pending_writes(hass):
+    """Closing awaits scheduled writes before unmapping the files."""
+    loop = asyncio.get_running_loop()
+    hass.async_add_executor_job = lambda func, *args: loop.run_in_executor(
+        None, func, *args
+    )
+    archive = _archive(hass)
+    archive.archive_day("SE3", DAY, {"00:00": 1.0}, STOCKHOLM)
+    assert archive._pending
+
+    await archive.async_close()
+
+    assert not archive._pending
+    assert archive.get_info()["area_years"] == []
+    assert _archive(hass).aggregate("SE3", DAY, DAY)["count"] == 1
@@ -0,0 +1,86 @@
+"""Tests for serving cached price data through PriceDataEnvelope."""
+
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.ge_spot.const.errors import Errors
+from custom_components.ge_spot.coordinator.data_models import (
+    IntervalPriceData,
+    PriceDataEnvelope,
+)
+from custom_components.ge_spot.coordinator.unified_price_manager import (
+    UnifiedPriceManager,
+)
+from tests.lib.mocks.hass import MockHass
+
+
+@pytest.fixture
+def cached():
+    """Cached price data shared with the cache manager."""
+    return IntervalPriceData(
+        today_interval_prices={"00:00": 1.0, "00:15": 3.0},
+        source="nordpool",
+        area="SE3",
+        last_updated="2025-03-10T00:00:00+01:00",
+        _error="old error",
+    )
+
+
+class TestPriceDataEnvelope:
+    """Read-through and override behaviour."""
+
+    def test_reads_through_without_copying(self, cached):
+        """Fields and properties come from the wrapped object itself."""
+        envelope = PriceDataEnvelope(cached, last_updated="now")
+
+        assert envelope.price_data is cached
+        assert envelope.today_interval_prices is cached.today_interval_prices
+        assert envelope.statistics is cached.statistics
+        assert envelope.using_cached_data is True
+        assert envelope.last_updated == "now"
+        assert cached.last_updated == "2025-03-10T00:00:00+01:00"
+        assert cached.using_cached_data is False
+
+    def test_error_overrides(self, cached):
+        """Errors set on the envelope override the data's; unset ones fall through."""
+        assert PriceDataEnvelope(cached)._error == "old error"
+        assert PriceDataEnvelope(cached)._error_code is None
+
+        envelope = PriceDataEnvelope(cached, error="disabled", error_code="E1")
+        assert envelope._error == "disabled"
+        assert envelope._error_code == "E1"
+        assert cached._error == "old error"
+
+    def test_unknown_attributes_cannot_be_set(self, cached):
+        """The envelope carries only per-update metadata."""
+        envelope = PriceDataEnvelope(cached)
+        with pytest.raises(AttributeError):
+            envelope.today_interval_prices = {}
+
+    def test_envelopes_do_not_nest(self, cached):
+        """Re-wrapping an envelope wraps the underlying data."""
+        envelope = PriceDataEnvelope(PriceDataEnvelope(cached))
+        assert envelope.price_data is cached
+
+
+def test_manager_serves_cached_data_in_envelope(cached):
+    """The manager serves cached data wrapped, with per-update error info."""
+    with patch(
+        "custom_components.ge_spot.coordinator.unified_price_manager.get_sources_for_region",
+        return_value=["nordpool"],
+    ):
+        manager = UnifiedPriceManager(
+            hass=MockHass(), area="SE3", currency="SEK", config={}
+        )
+
+    result = manager._serve_cached(
+        cached, error="all disabled", error_code=Errors.ALL_SOURCES_DISABLED
+    )
+
+    assert isinstance(result, PriceDataEnvelope)
+    assert result.price_data is cached
+    assert result.using_cached_data is True
+    assert result.last_updated != cached.last_updated
+    assert result._error_code == Errors.ALL_SOURCES_DISABLED
+    assert cached._error == "old error"
@@ -0,0 +1,156 @@
+"""Tests for named import/export price formula profiles."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.ge_spot.const.config import Config
+from custom_components.ge_spot.coordinator.data_models import (
+    IntervalPriceData,
+    PriceDataSnapshot,
+)
+from custom_components.ge_spot.coordinator.data_processor import DataProcessor
+from custom_components.ge_spot.price import price_transform
+from custom_components.ge_spot.price.price_profiles import (
+    PriceProfile,
+    parse_price_profiles,
+    profiles_version,
+)
+
+PROFILES = """
+feed_in: export multiplier=0.9 offset=-0.02  # current contract
+spot_hedge: import offset=0.05 vat=0.25
+"""
+
+
+def _processor(config) -> DataProcessor:
+    return DataProcessor(MagicMock(), "SE3", "SEK", config, MagicMock(), MagicMock())
+
+
+def test_parse_text_profiles():
+    """Profiles are parsed in order with kind and formula parameters."""
+    feed_in, hedge = parse_price_profiles(PROFILES)
+
+    assert feed_in == PriceProfile("feed_in", "export", 0.9, -0.02, 0.0)
+    assert hedge == PriceProfile("spot_hedge", "import", 1.0, 0.05, 0.25)
+    assert parse_price_profiles(
+        [{"name": "feed_in", "multiplier": 0.9, "offset": -0.02}]
+    ) == (feed_in,)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "feed_in export",
+        "Feed In: export",
+        "a: sell",
+        "a: rate=2",
+        "a: multiplier=x",
+        "a: export; a: import",
+    ],
+)
+def test_invalid_profiles_rejected(text):
+    """Unreadable or duplicate profiles raise ValueError."""
+    with pytest.raises(ValueError):
+        parse_price_profiles(text)
+
+
+def test_profiles_version():
+    """The version changes with the profiles and is empty without any."""
+    profiles = parse_price_profiles(PROFILES)
+    assert profiles_version(profiles) == profiles_version(
+        parse_price_profiles(PROFILES)
+    )
+    assert profiles_version(profiles) != profiles_version(profiles[:1])
+    assert profiles_version(()) == ""
+
+
+def test_export_and_profiles_in_one_pass(monkeypatch):
+    """Export and every profile are computed in one batch over the raw prices."""
+    processor = _processor(
+        {
+            Config.EXPORT_ENABLED: True,
+            Config.EXPORT_MULTIPLIER: 0.5,
+            Config.PRICE_PROFILES: PROFILES,
+        }
+    )
+    calls = []
+    original = price_transform.apply_transforms
+
+    def _record(values, transforms, extra_offsets=None):
+        calls.append(len(tuple(transforms)))
+        return original(values, transforms, extra_offsets)
+
+    monkeypatch.setattr(price_transform, "apply_transforms", _record)
+    raw = {"00:00": 1.0, "00:15": None, "00:30": 2.0}
+
+    export, profiles = processor._calculate_derived_prices(raw)
+
+    assert calls == [3]
+    assert export == {"00:00": 0.5, "00:30": 1.0}
+    assert profiles["feed_in"]["00:30"] == pytest.approx(2.0 * 0.9 - 0.02)
+    assert profiles["spot_hedge"]["00:00"] == pytest.approx((1.0 + 0.05) * 1.25)
+    assert processor._calculate_export_prices(raw) == export
+
+
+def test_profiles_without_export():
+    """Profiles are computed even when the main export sensors are disabled."""
+    processor = _processor({Config.PRICE_PROFILES: "feed_in: multiplier=2"})
+
+    export, profiles = processor._calculate_derived_prices({"00:00": 1.5})
+
+    assert export == {}
+    assert profiles == {"feed_in": {"00:00": 3.0}}
+    assert processor.price_profiles_version
+
+
+def test_invalid_profiles_are_ignored():
+    """Unreadable profiles are dropped rather than failing processing."""
+    processor = _processor({Config.PRICE_PROFILES: "bogus"})
+    assert processor.price_profiles == ()
+    assert processor.price_profiles_version == ""
+
+
+def test_profile_statistics_and_migration():
+    """Each profile gets its own statistics and moves to today at midnight."""
+    data = IntervalPriceData(
+        profile_today_prices={"feed_in": {"00:00": 1.0, "00:15": 3.0}},
+        profile_tomorrow_prices={"feed_in": {"00:00": 5.0}},
+    )
+
+    today = data.profile_statistics("feed_in")
+    assert (today.avg, today.min, today.max) == (2.0, 1.0, 3.0)
+    assert data.profile_statistics("feed_in", day_offset=1).avg == 5.0
+    assert data.profile_statistics("unknown").avg is None
+
+    data.migrate_to_new_day()
+
+    assert data.profile_statistics("feed_in").avg == 5.0
+    assert data.profile_tomorrow_prices == {}
+
+
+def test_profile_current_price():
+    """The current price is looked up in the profile's today prices."""
+    tz_service = MagicMock()
+    tz_service.get_current_interval_key.return_value = "00:15"
+    data = IntervalPriceData(
+        profile_today_prices={"feed_in": {"00:15": 1.25}}, _tz_service=tz_service
+    )
+
+    assert data.profile_current_price("feed_in") == 1.25
+    assert data.profile_current_price("unknown") is None
+
+
+def test_profile_prices_survive_cache_and_snapshot():
+    """Profile prices round-trip through the cache dict and snapshots."""
+    data = IntervalPriceData(
+        profile_today_prices={"feed_in": {"00:00": 1.0}},
+        applied_price_profiles="abc",
+    )
+
+    restored = IntervalPriceData.from_cache_dict(data.to_cache_dict())
+    thawed = PriceDataSnapshot.from_price_data(data).to_price_data()
+
+    for copy in (restored, thawed):
+        assert copy.profile_today_prices == {"feed_in": {"00:00": 1.0}}
+        assert copy.applied_price_profiles == "abc"
@@ -0,0 +1,119 @@
+"""Tests for the compiled (affine) price conversion chain."""
+
+import itertools
+from unittest.mock import AsyncMock
+
+import pytest
+
+from custom_components.ge_spot.const.display import DisplayUnit
+from custom_components.ge_spot.const.energy import EnergyUnit
+from custom_components.ge_spot.price import price_transform
+from custom_components.ge_spot.price.currency_converter import CurrencyConverter
+from custom_components.ge_spot.price.price_transform import (
+    AffineTransform,
+    apply_transforms,
+    compile_energy_price_transform,
+    compile_export_transform,
+    transform_interval_prices,
+)
+from custom_components.ge_spot.utils.unit_conversion import convert_energy_price
+
+
+@pytest.mark.parametrize(
+    "source_unit,vat,multiplier,tariff,tax,subunit,import_multiplier",
+    list(
+        itertools.product(
+            [EnergyUnit.MWH, EnergyUnit.KWH, EnergyUnit.WH],
+            [0.0, 0.25],
+            [1, 100],
+            [0.0, 1.5],
+            [0.0, 0.3],
+            [False, True],
+            [1.0, 0.1068],
+        )
+    ),
+)
+def test_compiled_chain_matches_stepwise(
+    source_unit, vat, multiplier, tariff, tax, subunit, import_multiplier
+):
+    """The compiled transform gives the same prices as convert_energy_price."""
+    kwargs = dict(
+        source_unit=source_unit,
+        target_unit=EnergyUnit.KWH,
+        vat_rate=vat,
+        display_unit_multiplier=multiplier,
+        additional_tariff=tariff,
+        energy_tax=tax,
+        tariff_in_subunit=subunit,
+        import_multiplier=import_multiplier,
+    )
+    transform = compile_energy_price_transform(**kwargs, exchange_rate=11.2)
+
+    for price in (-35.5, 0.0, 80.0, 1234.56):
+        expected = convert_energy_price(price=price * 11.2, **kwargs)
+        assert transform(price) == pytest.approx(expected, rel=1e-12, abs=1e-12)
+
+
+def test_unknown_unit_does_not_compile():
+    """Units without a conversion factor give no transform."""
+    assert compile_energy_price_transform("bogus", EnergyUnit.KWH) is None
+
+
+def test_export_and_composition():
+    """Export transform follows (raw × m + o) × (1 + vat) and composes."""
+    export = compile_export_transform(multiplier=0.9, offset=-0.02, vat=0.1)
+    assert export(0.5) == pytest.approx((0.5 * 0.9 - 0.02) * 1.1)
+
+    raw = AffineTransform(scale=0.001)
+    assert raw.then(export)(500.0) == pytest.approx(export(raw(500.0)))
+
+
+def test_numpy_and_fallback_agree(monkeypatch):
+    """The vectorized and plain-loop paths produce the same results."""
+    values = [float(v) for v in range(-50, 250, 3)]
+    transforms = (AffineTransform(0.00125, 0.4), AffineTransform(0.1, 0.0))
+
+    vectorized = apply_transforms(values, transforms)
+    monkeypatch.setattr(price_transform, "np", None)
+    fallback = apply_transforms(values, transforms)
+
+    assert vectorized == fallback
+    assert all(isinstance(v, float) for v in vectorized[0])
+
+
+def test_transform_interval_prices_keeps_keys():
+    """Missing and invalid prices stay None, dict prices are unwrapped."""
+    prices = {"00:00": 10.0, "00:15": None, "00:30": {"price": 20.0}, "00:45": "x"}
+    doubled, shifted = transform_interval_prices(
+        prices, (AffineTransform(2.0), AffineTransform(1.0, 1.0))
+    )
+
+    assert list(doubled) == list(prices)
+    assert doubled == {"00:00": 20.0, "00:15": None, "00:30": 40.0, "00:45": None}
+    assert shifted["00:30"] == 21.0
+
+
+@pytest.mark.asyncio
+async def test_converter_compiles_once_per_rate():
+    """Today and tomorrow reuse the transforms compiled for the same rate."""
+    exchange = AsyncMock()
+    exchange.get_rates = AsyncMock(return_value={"EUR": 1.0, "SEK": 11.0})
+    exchange.last_update = "now"
+    converter = CurrencyConverter(
+        exchange_service=exchange,
+        target_currency="SEK",
+        display_unit=DisplayUnit.CENTS,
+        include_vat=True,
+        vat_rate=0.25,
+        additional_tariff=10.0,
+        energy_tax=5.0,
+    )
+
+    today = {f"{h:02d}:00": 50.0 + h for h in range(24)}
+    converted, raw, rate, _ = await converter.convert_interval_prices(today, "EUR")
+    await converter.convert_interval_prices({"00:00": 1.0}, "EUR")
+
+    assert rate == 11.0
+    assert len(converter._transforms) == 1
+    assert raw["05:00"] == pytest.approx(55.0 * 11.0 / 1000 * 100)
+    assert converted["05:00"] == pytest.approx((55.0 * 11.0 / 1000 + 0.15) * 1.25 * 100)
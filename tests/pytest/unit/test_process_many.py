@@ -0,0 +1,83 @@
+"""Tests for batch processing of several areas over shared timestamp axes."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from custom_components.ge_spot.const.sources import Source
+from custom_components.ge_spot.coordinator.data_processor import DataProcessor
+from custom_components.ge_spot.coordinator.processing_memo import PROCESSING_MEMO
+from custom_components.ge_spot.timezone.timezone_converter import TimezoneConverter
+
+NOW = datetime.now(timezone.utc)
+
+
+def _input(base: float, source_timezone: str = "Etc/UTC") -> dict:
+    """Cached-path input with 15-minute EUR prices from yesterday to tomorrow."""
+    start = NOW.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=1)
+    return {
+        "source": Source.NORDPOOL,
+        "using_cached_data": True,
+        "raw_interval_prices_original": {
+            (start + timedelta(minutes=15 * i)).isoformat(): base + i
+            for i in range(3 * 96)
+        },
+        "source_timezone": source_timezone,
+        "source_currency": "EUR",
+    }
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    """Record the timestamps normalized across all converters."""
+    calls = []
+    original = TimezoneConverter.split_by_day
+
+    def _counting(self, interval_prices, source_timezone_str=None, today=None):
+        calls.extend(interval_prices)
+        return original(self, interval_prices, source_timezone_str, today)
+
+    monkeypatch.setattr(TimezoneConverter, "split_by_day", _counting)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_batch_matches_per_area_processing(make_processor):
+    """Each area gets the same result as when processed on its own."""
+    areas = ["SE3", "SE4"]
+    jobs = [(make_processor(area), _input(100.0 * n)) for n, area in enumerate(areas)]
+
+    batch = await DataProcessor.process_many(jobs, now=NOW)
+    PROCESSING_MEMO.clear()
+
+    for (_, data), result in zip(jobs, batch):
+        single = await make_processor(result.area).process(data)
+        assert result.today_interval_prices == single.today_interval_prices
+        assert result.tomorrow_interval_prices == single.tomorrow_interval_prices
+        assert list(result.today_interval_prices) == list(single.today_interval_prices)
+    assert batch[0].today_interval_prices != batch[1].today_interval_prices
+
+
+@pytest.mark.asyncio
+async def test_shared_axis_is_parsed_once(make_processor, parse_calls):
+    """Identical timestamp lists are parsed once for the whole batch."""
+    jobs = [
+        (make_processor(area), _input(1.0)) for area in ("SE1", "SE2", "SE3", "SE4")
+    ]
+
+    await DataProcessor.process_many(jobs, now=NOW)
+
+    assert len(parse_calls) == 3 * 96
+
+
+@pytest.mark.asyncio
+async def test_different_source_timezones_get_own_axes(make_processor, parse_calls):
+    """Axes are only shared between identical timestamps and timezones."""
+    jobs = [
+        (make_processor("SE3"), _input(1.0)),
+        (make_processor("SE4"), _input(1.0, source_timezone="Europe/Stockholm")),
+    ]
+
+    await DataProcessor.process_many(jobs, now=NOW)
+
+    assert len(parse_calls) == 2 * 3 * 96
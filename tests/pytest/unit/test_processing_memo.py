@@ -0,0 +1,199 @@
+"""Tests for the content-addressed processing memo."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from custom_components.ge_spot.const.config import Config
+from custom_components.ge_spot.const.sources import Source
+from custom_components.ge_spot.coordinator.data_models import PriceDataSnapshot
+from custom_components.ge_spot.coordinator.data_processor import DataProcessor
+from custom_components.ge_spot.coordinator.processing_memo import (
+    PROCESSING_MEMO,
+    ProcessingMemo,
+    payload_digest,
+)
+from custom_components.ge_spot.utils.raw_payload_store import RawPayloadStore
+
+
+def _cached_input(**overrides) -> dict:
+    """Cached-path input with 24 hourly EUR prices starting today (UTC)."""
+    start = datetime.now(timezone.utc).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    data = {
+        "source": Source.NORDPOOL,
+        "data_source": Source.NORDPOOL,
+        "using_cached_data": True,
+        "raw_interval_prices_original": {
+            (start + timedelta(hours=h)).isoformat(): 40.0 + h for h in range(24)
+        },
+        "source_timezone": "Etc/UTC",
+        "source_currency": "EUR",
+        "fetched_at": datetime.now(timezone.utc).isoformat(),
+        "attempted_sources": [Source.NORDPOOL],
+    }
+    data.update(overrides)
+    return data
+
+
+def _exchange(last_update=1000.0, sek=11.0):
+    exchange = AsyncMock()
+    exchange.get_rates = AsyncMock(return_value={"EUR": 1.0, "SEK": sek})
+    exchange.last_update = last_update
+    return exchange
+
+
+@pytest.fixture
+def sek_processor(make_processor):
+    """Factory for SE4 processors converting to SEK at the mocked rate."""
+
+    def _make(config=None, exchange=None) -> DataProcessor:
+        return make_processor(
+            target_currency="SEK",
+            config=config,
+            exchange=exchange or _exchange(),
+            rate=11.0,
+            rate_timestamp="ts",
+        )
+
+    return _make
+
+
+def _conversions(processor) -> int:
+    return processor._currency_converter.convert_interval_prices.await_count
+
+
+def test_digest_ignores_fetch_details():
+    """Fetch metadata does not change the digest; the prices do."""
+    data = _cached_input()
+    refetched = _cached_input(fetched_at="later", attempted_sources=["a", "b"])
+    changed = _cached_input(source_currency="SEK")
+
+    assert payload_digest(data) == payload_digest(refetched)
+    assert payload_digest(data) != payload_digest(changed)
+
+
+def test_digest_hashes_raw_payloads_without_serializing():
+    """Raw documents are hashed as they are; key order does not matter."""
+    xml = "<Point>" * 10_000
+    data = {"source": Source.ENTSOE, "raw_data": xml, "xml_responses": [xml]}
+    reordered = dict(reversed(list(data.items())))
+
+    with patch("json.dumps") as dumps:
+        digest = payload_digest(data)
+
+    dumps.assert_not_called()
+    assert digest == payload_digest(reordered)
+    assert digest != payload_digest({**data, "raw_data": xml + "x"})
+    assert payload_digest({"raw_data": b"1"}) != payload_digest({"raw_data": "1"})
+    assert payload_digest({"a": 1}) != payload_digest({"a": "1"})
+
+
+@pytest.mark.asyncio
+async def test_unchanged_input_reuses_result(sek_processor):
+    """A repeat of the same input skips the pipeline but keeps its own metadata."""
+    processor = sek_processor()
+
+    first = await processor.process(_cached_input())
+    calls = _conversions(processor)
+    second = await processor.process(
+        _cached_input(fetched_at="later", attempted_sources=["x"])
+    )
+
+    assert _conversions(processor) == calls
+    assert second is not first
+    assert second.today_interval_prices == first.today_interval_prices
+    assert second.today_interval_prices is not first.today_interval_prices
+    assert second.fetched_at == "later"
+    assert second.attempted_sources == ["x"]
+    assert PROCESSING_MEMO.get_info()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_memo_survives_new_processor(sek_processor):
+    """A reloaded entry (new processor, same config) reuses the result."""
+    await sek_processor().process(_cached_input())
+
+    reloaded = sek_processor()
+    await reloaded.process(_cached_input())
+
+    assert _conversions(reloaded) == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "config,exchange",
+    [
+        ({Config.VAT: 0.25}, None),
+        ({Config.PRICE_PROFILES: "feed_in: multiplier=0.9"}, None),
+        ({}, _exchange(last_update=2000.0)),
+        ({}, _exchange(sek=11.5)),
+    ],
+)
+async def test_config_or_rate_change_reprocesses(sek_processor, config, exchange):
+    """A different price config or exchange rate is a memo miss."""
+    await sek_processor().process(_cached_input())
+
+    changed = sek_processor(config, exchange)
+    await changed.process(_cached_input())
+
+    assert _conversions(changed) > 0
+
+
+@pytest.mark.asyncio
+async def test_source_rate_change_reprocesses(make_processor):
+    """A new rate of the input currency is a miss even for a EUR target."""
+    await make_processor(exchange=_exchange()).process(
+        _cached_input(source_currency="SEK")
+    )
+
+    changed = make_processor(exchange=_exchange(sek=11.5))
+    await changed.process(_cached_input(source_currency="SEK"))
+
+    assert _conversions(changed) > 0
+
+
+@pytest.mark.asyncio
+async def test_memo_hit_restores_raw_payload(sek_processor):
+    """A reused result refers to a raw payload that is still stored."""
+    processor = sek_processor()
+    processor._raw_payload_store = RawPayloadStore()
+    data = _cached_input(raw_data={"xml": "<doc/>"})
+
+    first = await processor.process(data)
+    calls = _conversions(processor)
+    processor._raw_payload_store.clear()
+    second = await processor.process(data)
+
+    assert _conversions(processor) == calls
+    assert second.raw_data_ref == first.raw_data_ref
+    assert processor._raw_payload_store.get(second.raw_data_ref) == {"xml": "<doc/>"}
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_memoized(sek_processor):
+    """Inputs that fail processing are processed again next time."""
+    processor = sek_processor()
+    data = _cached_input(source_timezone=None)
+
+    await processor.process(data)
+    await processor.process(data)
+
+    assert PROCESSING_MEMO.get_info()["entries"] == 0
+
+
+def test_memo_evicts_least_recently_used():
+    """The memo is bounded and refreshes entries on hits."""
+    memo = ProcessingMemo(max_entries=2)
+    snapshot = PriceDataSnapshot()
+
+    memo.put("a", snapshot)
+    memo.put("b", snapshot)
+    assert memo.get("a") is snapshot
+    memo.put("c", snapshot)
+
+    assert memo.get("b") is None
+    assert memo.get("a") is snapshot
+    assert memo.get_info() == {"entries": 2, "hits": 2, "misses": 1}
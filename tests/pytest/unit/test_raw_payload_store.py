@@ -0,0 +1,124 @@
+"""Tests for the compressed raw payload store."""
+
+from datetime import date
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from custom_components.ge_spot.const.config import Config
+from custom_components.ge_spot.coordinator.cache_manager import CacheManager
+from custom_components.ge_spot.coordinator.data_models import IntervalPriceData
+from custom_components.ge_spot.utils.raw_payload_store import (
+    RawPayloadStore,
+    encode_payload,
+)
+from tests.lib.mocks.hass import MockHass
+
+XML_PAYLOAD = {
+    "xml_responses": [
+        "<Publication_MarketDocument>"
+        + "<Point><position>1</position><price.amount>42.1</price.amount></Point>" * 200
+        + "</Publication_MarketDocument>"
+    ]
+}
+
+
+class TestRawPayloadStore:
+    """Round-trip, dedupe and eviction behaviour."""
+
+    def test_round_trip_is_compressed(self):
+        """Payloads come back unchanged and are stored compressed."""
+        store = RawPayloadStore()
+        ref = store.put(XML_PAYLOAD)
+
+        assert store.get(ref) == XML_PAYLOAD
+        assert store.get_info()["total_bytes"] < len(XML_PAYLOAD["xml_responses"][0])
+
+    def test_identical_payloads_share_a_reference(self):
+        """Refetching an unchanged payload does not grow the store."""
+        store = RawPayloadStore()
+        first = store.put(XML_PAYLOAD)
+        second = store.put({"xml_responses": list(XML_PAYLOAD["xml_responses"])})
+
+        assert first == second
+        assert store.get_info()["total_payloads"] == 1
+
+    def test_evicts_oldest_over_budget(self):
+        """Oldest payloads are evicted once the byte budget is exceeded."""
+        store = RawPayloadStore(config={Config.RAW_PAYLOAD_MAX_BYTES: 100})
+        refs = [store.put({"n": i, "pad": "x" * 20}) for i in range(10)]
+
+        assert store.get_info()["total_bytes"] <= 100
+        assert store.get(refs[0]) is None
+        assert store.get(refs[-1]) == {"n": 9, "pad": "x" * 20}
+
+    def test_empty_payload_not_stored(self):
+        """Empty payloads yield no reference."""
+        store = RawPayloadStore()
+        assert store.put(None) is None
+        assert store.put({}) is None
+        assert store.get(None) is None
+
+
+class TestCacheManagerRawOffload:
+    """The price cache keeps only a reference to the raw payload."""
+
+    @pytest.fixture
+    def cache_manager(self):
+        """Create a cache manager without persistence."""
+        hass = Mock()
+        hass.config = Mock()
+        return CacheManager(hass=hass, config={"cache_ttl": 60})
+
+    def test_store_offloads_raw_data(self, cache_manager):
+        """Stored entries carry raw_data_ref instead of the payload."""
+        today = date.today()
+        data = IntervalPriceData(
+            area="NL",
+            source="entsoe",
+            today_interval_prices={"00:00": 0.1},
+            raw_data=XML_PAYLOAD,
+        )
+        cache_manager.store("NL", "entsoe", data, target_date=today)
+
+        stored = cache_manager._get_data_dict("NL", today)
+        assert stored["raw_data"] is None
+        assert stored["raw_data_ref"]
+
+        cached = cache_manager.get_data(area="NL", target_date=today)
+        assert cached.raw_data is None
+        assert cache_manager.get_raw_payload(cached) == XML_PAYLOAD
+
+
+class TestOffloadedEncoding:
+    """Large payloads are encoded in the executor, stored on the loop."""
+
+    def test_encoded_payload_matches_put(self):
+        """put_encoded stores what put would, under the same reference."""
+        store = RawPayloadStore()
+        ref = store.put_encoded(*encode_payload(XML_PAYLOAD))
+
+        assert ref == RawPayloadStore().put(XML_PAYLOAD)
+        assert store.get(ref) == XML_PAYLOAD
+        assert store.put(XML_PAYLOAD) == ref
+        assert store.get_info()["total_payloads"] == 1
+        assert encode_payload({}) is None
+
+    @pytest.mark.asyncio
+    async def test_processor_encodes_in_executor_when_offloading(self, make_processor):
+        """Serialize/hash/compress run in the executor; the insert does not."""
+        hass = MockHass()
+        hass.async_add_executor_job = AsyncMock(
+            side_effect=lambda func, *args: func(*args)
+        )
+        processor = make_processor(hass=hass)
+        processor._raw_payload_store = RawPayloadStore()
+
+        with patch.object(RawPayloadStore, "put", side_effect=AssertionError) as put:
+            ref = await processor._store_raw_payload(XML_PAYLOAD, offload=True)
+
+        put.assert_not_called()
+        hass.async_add_executor_job.assert_awaited_once_with(
+            encode_payload, XML_PAYLOAD
+        )
+        assert processor._raw_payload_store.get(ref) == XML_PAYLOAD
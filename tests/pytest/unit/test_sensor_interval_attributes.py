@@ -0,0 +1,60 @@
+"""Tests for slot-indexed interval price attributes on sensors."""
+
+from datetime import date, datetime, timezone
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+from custom_components.ge_spot.coordinator.data_models import IntervalPriceData
+from custom_components.ge_spot.sensor.base import BaseElectricityPriceSensor
+from custom_components.ge_spot.utils.interval_series import IntervalSeries
+
+STOCKHOLM = ZoneInfo("Europe/Stockholm")
+FALL_DAY = date(2025, 10, 26)
+
+
+def test_fall_back_intervals_get_distinct_times():
+    """Repeated-hour keys render as two distinct, ordered instants."""
+    prices = {"03:00": 3.0, "02:00_2": 2.0, "02:00_1": 1.0}
+    series = IntervalSeries.from_interval_prices(prices, FALL_DAY, STOCKHOLM)
+
+    entries = BaseElectricityPriceSensor._interval_price_list(series, {"02:00_2": 0.2})
+
+    assert [e["value"] for e in entries] == [1.0, 2.0, 3.0]
+    # Compare instants: same-zone datetime arithmetic is wall-clock based
+    times = [e["time"].timestamp() for e in entries]
+    assert times[1] - times[0] == times[2] - times[1] == 3600
+    entries_offsets = [e["time"].utcoffset() for e in entries]
+    assert entries_offsets[0] != entries_offsets[1]
+    assert "raw_value" not in entries[0]
+    assert entries[1]["raw_value"] == 0.2
+
+
+def test_repeated_hour_slot_time():
+    """A slot in the repeated hour maps to the second (fold=1) occurrence."""
+    series = IntervalSeries(FALL_DAY, STOCKHOLM, 900)
+
+    assert series.time_of(12).timestamp() == series.start.timestamp() + 12 * 900
+    assert series.time_of(12).fold == 1
+
+
+def test_day_series_reuses_memoized_series():
+    """The data's memoized series is reused when day and zone match."""
+    data = IntervalPriceData(
+        today_interval_prices={"12:00": 1.0}, target_timezone="Europe/Stockholm"
+    )
+    now = datetime(2025, 3, 10, 12, 0, tzinfo=STOCKHOLM)
+    with patch(
+        "custom_components.ge_spot.coordinator.data_models.dt_util.now",
+        return_value=now,
+    ):
+        memoized = data.today_series
+        same = BaseElectricityPriceSensor._day_series(
+            data, "today_series", now.date(), STOCKHOLM
+        )
+        other_zone = BaseElectricityPriceSensor._day_series(
+            data, "today_series", now.date(), timezone.utc
+        )
+
+    assert same is memoized
+    assert other_zone is not memoized
+    assert other_zone.view == {"12:00": 1.0}
@@ -0,0 +1,81 @@
+"""Tests for the single-pass series statistics kernel."""
+
+import statistics
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.ge_spot.api.base.data_structure import EMPTY_PRICE_STATISTICS
+from custom_components.ge_spot.coordinator import data_models
+from custom_components.ge_spot.coordinator.data_models import IntervalPriceData
+from custom_components.ge_spot.utils.series_statistics import (
+    EMPTY_SUMMARY,
+    summarize,
+)
+
+PRICES = {"00:00": 3.0, "00:15": 1.0, "00:30": 4.0, "00:45": 1.0, "01:00": 5.0}
+
+
+def test_summary_matches_reference_statistics():
+    """One pass gives the same results as the statistics module."""
+    summary = summarize(PRICES, percentiles=(10, 25, 75, 90))
+    values = list(PRICES.values())
+
+    assert summary.count == 5
+    assert summary.min == 1.0 and summary.argmin == "00:15"
+    assert summary.max == 5.0 and summary.argmax == "01:00"
+    assert summary.mean == sum(values) / len(values)
+    assert summary.median == statistics.median(values)
+    assert summary.std == pytest.approx(statistics.pstdev(values))
+    quartiles = statistics.quantiles(values, n=4, method="inclusive")
+    assert summary.percentile(25) == pytest.approx(quartiles[0])
+    assert summary.percentile(75) == pytest.approx(quartiles[2])
+    assert summary.percentile(50) is None
+
+
+def test_order_statistics_only_on_request():
+    """Without requested percentiles, nothing is sorted and median is unset."""
+    summary = summarize(PRICES)
+
+    assert summary.mean == sum(PRICES.values()) / len(PRICES)
+    assert summary.median is None
+    assert summary.percentiles == ()
+    assert summarize(PRICES, percentiles=()).median == 3.0
+
+
+def test_missing_values_skipped():
+    """None prices are ignored; an empty series gives the shared empty summary."""
+    summary = summarize({"00:00": None, "00:15": 2.0}, percentiles=(90,))
+    assert summary.count == 1
+    assert summary.median == summary.percentile(90) == 2.0
+    assert summary.std == 0.0
+    assert summarize({}) is EMPTY_SUMMARY
+    assert summarize({"00:00": None}).to_price_statistics() is EMPTY_PRICE_STATISTICS
+
+
+def test_price_data_summarizes_all_series_once():
+    """IntervalPriceData summarizes every series together, once per data version."""
+    data = IntervalPriceData(
+        today_interval_prices=PRICES,
+        today_raw_prices={"00:00": 0.5},
+        export_today_prices={"00:00": 0.25},
+        export_enabled=True,
+    )
+    with patch.object(data_models, "summarize", wraps=data_models.summarize) as kernel:
+        assert data.statistics.min_timestamp == "00:15"
+        assert data.export_statistics.avg == 0.25
+        assert data.tomorrow_statistics is EMPTY_PRICE_STATISTICS
+        assert data.summaries["today_raw"].mean == 0.5
+        # today, today_raw and export_today are non-empty
+        assert kernel.call_count == 3
+
+        data.tomorrow_interval_prices = {"00:00": 7.0}
+        assert data.tomorrow_statistics.max == 7.0
+        assert kernel.call_count == 7
+
+
+def test_export_statistics_require_export_enabled():
+    """Export statistics stay empty while export is disabled."""
+    data = IntervalPriceData(export_today_prices={"00:00": 0.25})
+    assert data.export_statistics is EMPTY_PRICE_STATISTICS
+    assert data.summaries["export_today"].count == 1
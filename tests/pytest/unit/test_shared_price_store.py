@@ -0,0 +1,164 @@
+"""Tests for the source-level price store shared across config entries."""
+
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from custom_components.ge_spot.const import DOMAIN
+from custom_components.ge_spot.const.config import Config
+from custom_components.ge_spot.const.sources import Source
+from custom_components.ge_spot.coordinator.data_models import IntervalPriceData
+from custom_components.ge_spot.coordinator.shared_store import (
+    SHARED_STORE_KEY,
+    SharedPriceStore,
+    get_shared_store,
+)
+from custom_components.ge_spot.coordinator.unified_price_manager import (
+    UnifiedPriceManager,
+)
+from tests.lib.mocks.hass import MockHass
+
+TODAY = date(2025, 3, 10)
+RECORD = {
+    "data_source": Source.NORDPOOL,
+    "raw_interval_prices_original": {
+        "2025-03-10T00:00:00+01:00": 42.0,
+        "2025-03-10T00:15:00+01:00": 43.0,
+    },
+    "source_timezone": "Europe/Stockholm",
+    "source_currency": "EUR",
+}
+
+
+class TestSharedPriceStore:
+    """Keying, expiry and pruning of shared records."""
+
+    def test_round_trip_returns_copy(self):
+        """Records come back without internal fields and as a copy."""
+        store = SharedPriceStore()
+        store.put_source_data(Source.NORDPOOL, "SE3", TODAY, RECORD)
+
+        record = store.get_source_data(Source.NORDPOOL, "SE3", TODAY)
+        assert record == RECORD
+        record["data_source"] = "changed"
+        assert store.get_source_data(Source.NORDPOOL, "SE3", TODAY) == RECORD
+
+    def test_keyed_by_source_area_and_date(self):
+        """Other sources, areas and dates do not match."""
+        store = SharedPriceStore()
+        store.put_source_data(Source.NORDPOOL, "SE3", TODAY, RECORD)
+
+        assert store.get_source_data(Source.ENTSOE, "SE3", TODAY) is None
+        assert store.get_source_data(Source.NORDPOOL, "SE4", TODAY) is None
+        assert (
+            store.get_source_data(Source.NORDPOOL, "SE3", TODAY + timedelta(days=1))
+            is None
+        )
+
+    def test_max_age(self):
+        """Records older than max_age_minutes are ignored."""
+        store = SharedPriceStore()
+        store.put_source_data(Source.NORDPOOL, "SE3", TODAY, RECORD)
+
+        later = datetime.now(timezone.utc) + timedelta(minutes=30)
+        with patch(
+            "custom_components.ge_spot.coordinator.shared_store.dt_util.utcnow",
+            return_value=later,
+        ):
+            assert (
+                store.get_source_data(Source.NORDPOOL, "SE3", TODAY, max_age_minutes=15)
+                is None
+            )
+            assert store.get_source_data(
+                Source.NORDPOOL, "SE3", TODAY, max_age_minutes=60
+            )
+
+    def test_old_dates_pruned(self):
+        """Only today and yesterday are kept per source/area."""
+        store = SharedPriceStore()
+        for offset in (3, 1, 0):
+            store.put_source_data(
+                Source.NORDPOOL, "SE3", TODAY - timedelta(days=offset), RECORD
+            )
+
+        assert store.get_info()["total_records"] == 2
+        assert (
+            store.get_source_data(Source.NORDPOOL, "SE3", TODAY - timedelta(days=3))
+            is None
+        )
+
+    def test_one_store_per_hass(self):
+        """The store lives in hass.data[DOMAIN] and is reused."""
+        hass = MockHass()
+        store = get_shared_store(hass)
+
+        assert get_shared_store(hass) is store
+        assert hass.data[DOMAIN][SHARED_STORE_KEY] is store
+        assert get_shared_store(MockHass()) is not store
+
+
+class TestManagersShareSourceData:
+    """A second entry for the same area reuses the first entry's fetch."""
+
+    @pytest.fixture
+    def managers(self):
+        """Two entries for SE3 with different VAT in one HA instance."""
+        hass = MockHass()
+        base = {Config.SOURCE_PRIORITY: [Source.NORDPOOL]}
+        first = UnifiedPriceManager(
+            hass=hass, area="SE3", currency="SEK", config={**base, Config.VAT: 25}
+        )
+        second = UnifiedPriceManager(
+            hass=hass, area="SE3", currency="SEK", config={**base, Config.VAT: 0}
+        )
+        return first, second
+
+    def test_entries_share_raw_payloads(self, managers):
+        """Both entries' caches offload into the same payload store."""
+        first, second = managers
+        assert first._shared_store is second._shared_store
+        assert first._cache_manager.raw_payloads is second._cache_manager.raw_payloads
+
+    @pytest.mark.asyncio
+    async def test_second_entry_processes_shared_series(self, managers):
+        """The shared series is reprocessed by the second entry without a fetch."""
+        first, second = managers
+        now = datetime.now(timezone.utc)
+        fetched = IntervalPriceData(
+            source=Source.NORDPOOL,
+            area="SE3",
+            raw_interval_prices_original=RECORD["raw_interval_prices_original"],
+            source_timezone=RECORD["source_timezone"],
+            source_currency=RECORD["source_currency"],
+        )
+        first._publish_shared_source_data({"source_unit": "MWh"}, fetched)
+
+        processed = IntervalPriceData(
+            source=Source.NORDPOOL,
+            area="SE3",
+            today_interval_prices={"00:00": 0.5},
+        )
+        second._process_result = AsyncMock(return_value=processed)
+        second._cache_manager.store = Mock()
+
+        result = await second._use_shared_source_data(now)
+
+        assert result is processed
+        (record,) = second._process_result.call_args.args
+        assert record["raw_interval_prices_original"] == (
+            RECORD["raw_interval_prices_original"]
+        )
+        assert record["source_unit"] == "MWh"
+        assert second._process_result.call_args.kwargs["is_cached"] is True
+        second._cache_manager.store.assert_called_once()
+        assert second._active_source == Source.NORDPOOL
+
+    @pytest.mark.asyncio
+    async def test_nothing_shared_returns_none(self, managers):
+        """Without a shared record the normal fetch path is used."""
+        _, second = managers
+        second._process_result = AsyncMock()
+
+        assert await second._use_shared_source_data(datetime.now(timezone.utc)) is None
+        second._process_result.assert_not_called()
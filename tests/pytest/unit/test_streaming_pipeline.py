@@ -0,0 +1,112 @@
+"""Tests for the streaming normalize/split stages of the processing pipeline."""
+
+import tracemalloc
+from datetime import datetime, timedelta
+from types import GeneratorType
+
+from custom_components.ge_spot.price.price_transform import (
+    AffineTransform,
+    transform_interval_prices,
+)
+from custom_components.ge_spot.timezone.service import TimezoneService
+from custom_components.ge_spot.timezone.timezone_converter import TimezoneConverter
+from tests.lib.mocks.hass import MockHass
+
+
+def _converter() -> TimezoneConverter:
+    hass = MockHass()
+    return TimezoneConverter(TimezoneService(hass, "SE4"))
+
+
+def _multi_day_payload(converter: TimezoneConverter, days: int = 3) -> dict:
+    """15-minute prices from yesterday through tomorrow (ENTSO-E style)."""
+    tz = converter._tz_service.target_timezone
+    start = datetime.now(tz).replace(hour=0, minute=0, second=0, microsecond=0)
+    start -= timedelta(days=1)
+    return {
+        (start + timedelta(minutes=15 * i)).isoformat(): float(i)
+        for i in range(days * 96)
+    }
+
+
+def _old_path(converter, payload):
+    normalized = converter.normalize_interval_prices(payload, "Etc/UTC")
+    return converter.split_into_today_tomorrow(normalized)
+
+
+def _stream_path(converter, payload):
+    return converter.split_stream_by_day(
+        converter.iter_normalized_intervals(payload, "Etc/UTC")
+    )
+
+
+def _peak_bytes(func, *args) -> int:
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_stream_matches_normalize_then_split():
+    """The streamed stages give the same today/tomorrow series."""
+    converter = _converter()
+    payload = _multi_day_payload(converter)
+
+    today, tomorrow = _stream_path(converter, payload)
+
+    assert (today, tomorrow) == _old_path(converter, payload)
+    assert list(today) == list(_old_path(converter, payload)[0])
+    assert today and tomorrow
+
+
+def test_normalization_is_lazy():
+    """Intervals are produced one at a time, not as a normalized dict."""
+    converter = _converter()
+    stream = converter.iter_normalized_intervals({"bogus": 1.0}, "Etc/UTC")
+
+    assert isinstance(stream, GeneratorType)
+    assert list(stream) == []
+
+
+def test_stream_split_handles_dst_repeat_and_other_days():
+    """A repeated key becomes _1/_2; intervals on other days are dropped."""
+    converter = _converter()
+    today = datetime.now(converter._tz_service.target_timezone).date()
+
+    today_prices, tomorrow_prices = converter.split_stream_by_day(
+        [
+            (today - timedelta(days=1), "02:00", 9.0),
+            (today, "02:00", 1.0),
+            (today, "02:00", 2.0),
+            (today + timedelta(days=1), "00:00", 3.0),
+            (today + timedelta(days=2), "00:00", 9.0),
+        ]
+    )
+
+    assert today_prices == {"02:00_1": 1.0, "02:00_2": 2.0}
+    assert tomorrow_prices == {"00:00": 3.0}
+
+
+def test_stream_lowers_peak_allocation():
+    """No full normalized copy of a multi-day payload is built."""
+    converter = _converter()
+    payload = _multi_day_payload(converter, days=4)
+
+    assert _peak_bytes(_stream_path, converter, payload) < 0.75 * _peak_bytes(
+        _old_path, converter, payload
+    )
+
+
+def test_transform_drop_missing():
+    """Missing prices can be left out instead of kept as None."""
+    prices = {"00:00": 1.0, "00:15": None, "00:30": 2.0}
+
+    (kept,) = transform_interval_prices(prices, (AffineTransform(2.0),))
+    (dropped,) = transform_interval_prices(
+        prices, (AffineTransform(2.0),), drop_missing=True
+    )
+
+    assert kept == {"00:00": 2.0, "00:15": None, "00:30": 4.0}
+    assert dropped == {"00:00": 2.0, "00:30": 4.0}
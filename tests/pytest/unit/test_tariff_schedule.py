@@ -0,0 +1,178 @@
+"""Tests for time-of-use tariff schedules."""
+
+from datetime import date, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from custom_components.ge_spot.const.config import Config
+from custom_components.ge_spot.coordinator.data_processor import DataProcessor
+from custom_components.ge_spot.price.currency_converter import CurrencyConverter
+from custom_components.ge_spot.price.tariff_schedule import TariffSchedule
+from custom_components.ge_spot.utils.interval_series import IntervalSeries
+
+STOCKHOLM = ZoneInfo("Europe/Stockholm")
+
+SCHEDULE = """
+17:00-20:00 mon-fri nov-mar = 0.80  # winter peak
+22:00-06:00 = 0.10
+sat,sun = 0.30
+"""
+
+WINTER_MONDAY = date(2025, 1, 6)
+SUMMER_MONDAY = date(2025, 6, 2)
+WINTER_SATURDAY = date(2025, 1, 4)
+
+
+def test_parse_text_schedule():
+    """Rules are parsed in order with windows, weekdays and months."""
+    schedule = TariffSchedule.from_config(SCHEDULE, default=0.5)
+
+    peak, night, weekend = schedule.rules
+    assert (peak.start, peak.end) == (17 * 60, 20 * 60)
+    assert peak.weekdays == frozenset(range(5))
+    assert peak.months == frozenset({11, 12, 1, 2, 3})
+    assert (night.start, night.end) == (22 * 60, 6 * 60)
+    assert weekend.weekdays == frozenset({5, 6})
+    assert schedule.default == 0.5
+
+
+def test_dict_rules_match_text():
+    """A list of rule dicts builds the same schedule as the text form."""
+    rules = [
+        {
+            "tariff": 0.8,
+            "start": "17:00",
+            "end": "20:00",
+            "weekdays": "mon-fri",
+            "months": [11, 12, 1, 2, 3],
+        },
+        {"tariff": 0.1, "start": "22:00", "end": "06:00"},
+        {"tariff": 0.3, "weekdays": ["sat", "sun"]},
+    ]
+    assert TariffSchedule.from_config(rules) == TariffSchedule.from_config(SCHEDULE)
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["17:00-20:00 0.8", "25:00-26:00 = 1", "mon-xyz = 1", "* = abc"],
+)
+def test_invalid_schedules_rejected(text):
+    """Unreadable rules raise ValueError."""
+    with pytest.raises(ValueError):
+        TariffSchedule.from_config(text)
+
+
+def test_empty_schedule_is_none():
+    """No rules means no schedule."""
+    assert TariffSchedule.from_config("") is None
+    assert TariffSchedule.from_config("  # only a comment\n") is None
+
+
+def test_first_matching_rule_wins():
+    """Rules are tried in order; unmatched times use the default tariff."""
+    schedule = TariffSchedule.from_config(SCHEDULE, default=0.5)
+
+    assert schedule.tariff_at(WINTER_MONDAY, 18 * 60) == 0.80
+    assert schedule.tariff_at(SUMMER_MONDAY, 18 * 60) == 0.5
+    assert schedule.tariff_at(WINTER_SATURDAY, 18 * 60) == 0.30
+    assert schedule.tariff_at(WINTER_SATURDAY, 23 * 60) == 0.10
+    assert schedule.tariff_at(WINTER_MONDAY, 5 * 60 + 45) == 0.10
+    assert schedule.tariff_at(WINTER_MONDAY, 6 * 60) == 0.5
+
+
+def test_day_vector_aligned_with_interval_series():
+    """The day vector has one tariff per interval slot, keyed like prices."""
+    schedule = TariffSchedule.from_config(SCHEDULE, default=0.5)
+
+    vector = schedule.vector(WINTER_MONDAY, STOCKHOLM)
+    tariffs = schedule.tariffs_for_day(WINTER_MONDAY, STOCKHOLM)
+    series = IntervalSeries(WINTER_MONDAY, STOCKHOLM)
+
+    assert len(vector) == len(series) == len(tariffs) == 96
+    assert tariffs["17:00"] == tariffs["19:45"] == 0.80
+    assert tariffs["20:00"] == 0.5
+    assert vector[series.index_of_key("23:15")] == 0.10
+
+
+def test_day_vector_on_dst_fall_back():
+    """A fall-back day gets a tariff for both occurrences of the repeated hour."""
+    schedule = TariffSchedule.from_config("02:00-03:00 = 0.9", default=0.5)
+
+    tariffs = schedule.tariffs_for_day(date(2025, 10, 26), STOCKHOLM)
+
+    assert len(tariffs) == 100
+    assert tariffs["02:00_1"] == tariffs["02:45_2"] == 0.9
+    assert tariffs["03:00"] == 0.5
+
+
+def test_compiled_day_is_cached():
+    """Equal schedules share one compiled vector per day."""
+    first = TariffSchedule.from_config(SCHEDULE, default=0.5)
+    second = TariffSchedule.from_config(SCHEDULE, default=0.5)
+
+    assert first.tariffs_for_day(WINTER_MONDAY, STOCKHOLM) is (
+        second.tariffs_for_day(WINTER_MONDAY, STOCKHOLM)
+    )
+    assert first.version == second.version
+    assert first.version != TariffSchedule.from_config("* = 1").version
+
+
+@pytest.mark.asyncio
+async def test_converter_applies_tariff_vector():
+    """Per-interval tariffs replace the scalar tariff before VAT and subunit."""
+    converter = CurrencyConverter(
+        exchange_service=AsyncMock(),
+        target_currency="EUR",
+        display_unit="cents",
+        include_vat=True,
+        vat_rate=0.25,
+        additional_tariff=5.0,
+        energy_tax=1.0,
+    )
+    prices = {"17:00": 100.0, "12:00": 100.0}
+
+    converted, raw, _, _ = await converter.convert_interval_prices(
+        prices, "EUR", tariffs={"17:00": 80.0}
+    )
+
+    # Tariffs are entered in cents: (0.1 EUR + 0.80 + 0.01) * 1.25 * 100
+    assert converted["17:00"] == pytest.approx((0.1 + 0.80 + 0.01) * 1.25 * 100)
+    assert converted["12:00"] == pytest.approx((0.1 + 0.05 + 0.01) * 1.25 * 100)
+    assert raw["17:00"] == raw["12:00"] == pytest.approx(10.0)
+
+
+def test_data_processor_uses_schedule():
+    """DataProcessor compiles today's tariffs and stamps the schedule version."""
+    tz_service = MagicMock()
+    tz_service.target_timezone = STOCKHOLM
+    processor = DataProcessor(
+        MagicMock(),
+        "SE3",
+        "SEK",
+        {Config.TARIFF_SCHEDULE: SCHEDULE, Config.ADDITIONAL_TARIFF: 0.5},
+        tz_service,
+        MagicMock(),
+    )
+
+    today = datetime.now(STOCKHOLM).date()
+    tomorrow = processor._day_tariffs(1)
+
+    assert processor._day_tariffs(0)["12:00"] == processor.tariff_schedule.tariff_at(
+        today, 12 * 60
+    )
+    assert tomorrow is processor.tariff_schedule.tariffs_for_day(
+        today + timedelta(days=1), STOCKHOLM
+    )
+    assert processor.tariff_schedule_version == processor.tariff_schedule.version
+
+
+def test_invalid_schedule_falls_back_to_scalar_tariff():
+    """An unreadable schedule is ignored rather than failing processing."""
+    processor = DataProcessor(
+        MagicMock(), "SE3", "SEK", {Config.TARIFF_SCHEDULE: "bogus"}, MagicMock(), None
+    )
+    assert processor.tariff_schedule is None
+    assert processor._day_tariffs(0) is None
+    assert processor.tariff_schedule_version == ""
@@ -21,7 +21,7 @@ import sys
 import os
 import asyncio
 import logging
-from unittest.mock import MagicMock, patch, AsyncMock, call
+from unittest.mock import ANY, MagicMock, patch, AsyncMock, call
 from datetime import datetime, timedelta, timezone
 import pytest
 import json
@@ -286,7 +286,7 @@ def auto_mock_core_dependencies():
         # TODO: Update all tests to use IntervalPriceData directly and remove this wrapper
         base_process_mock = AsyncMock(return_value=_get_mock_interval_price_data())
 
-        async def auto_convert_processor(data):
+        async def auto_convert_processor(data, context=None):
             """Auto-convert dict to IntervalPriceData for backward compat during migration."""
             ret_val = base_process_mock.return_value
             if isinstance(ret_val, dict):
@@ -624,7 +624,7 @@ class TestUnifiedPriceManager:
 
         # Verify processor called with fallback data
         mock_processor.assert_awaited_once_with(
-            fallback_success_result
+            fallback_success_result, context=ANY
         ), f"DataProcessor.process should be called with fallback data, got {mock_processor.call_args}"
 
         # Verify cache updated with processed fallback data - store() uses keyword args